@@ -0,0 +1,114 @@
+"""Helpers for building synthetic BXMP traffic used by the benchmarks."""
+from __future__ import annotations
+import dataclasses
+import enum
+import random
+import struct
+import typing
+from ipaddress import (
+    IPv4Address,
+    IPv6Address,
+)
+from typing import Any
+
+from xoa_driver.internals.core.transporter.protocol import _constants as const
+from xoa_driver.internals.core.transporter.protocol.payload import RequestBodyStruct
+from xoa_driver.internals.core.transporter.protocol.payload import types
+from xoa_driver.internals.core.transporter.protocol.payload.utils import resolve_annotations
+from xoa_driver.internals.core.transporter.protocol.struct_header import ProtocolHeader
+
+
+def build_reply(cmd_code: int, request_id: int, payload: bytes, *, module: int = 0, port: int = 0, indices: tuple[int, ...] = ()) -> bytes:
+    """Build a single COMMAND_VALUE reply packet, padded the same way as xenaserver does."""
+    header = ProtocolHeader(
+        magic_word=const.MAGIC_WORD,
+        number_of_indices=len(indices),
+        number_of_value_bytes=len(payload),
+        cmd_code=cmd_code,
+        cmd_type=const.CommandType.COMMAND_VALUE.value,
+        module_index=module,
+        port_index=port,
+        request_identifier=request_id,
+    )
+    body = struct.pack(const.indices_format(len(indices)), *indices) + payload
+    padding = bytes((4 - len(body) % 4) % 4)
+    return bytes(header) + body + padding
+
+
+def build_burst(count: int, *, cmd_code: int = 240, payload_size: int = 32, first_request_id: int = 1) -> bytes:
+    """Build a burst of ``count`` replies as they would arrive in a single TCP read."""
+    payload = bytes(range(payload_size % 256)) + bytes(max(0, payload_size - 256))
+    return b"".join(
+        build_reply(cmd_code, first_request_id + i, payload[:payload_size])
+        for i in range(count)
+    )
+
+
+def split_segments(data: bytes, segment_size: int) -> list[bytes]:
+    """Split the stream into fixed size segments, packets boundaries are not respected."""
+    return [data[i:i + segment_size] for i in range(0, len(data), segment_size)]
+
+
+def _sample_scalar(rnd: random.Random, xmp_type: Any, client_type: Any) -> Any:
+    if isinstance(client_type, type) and issubclass(client_type, enum.Enum):
+        return rnd.choice(list(client_type))
+    if isinstance(xmp_type, types.XmpIPv4Address):
+        return IPv4Address(rnd.getrandbits(32))
+    if isinstance(xmp_type, types.XmpIPv6Address):
+        return IPv6Address(rnd.getrandbits(128))
+    if isinstance(xmp_type, types.XmpHex):
+        size = xmp_type.repetitions if xmp_type.repetitions is not None else rnd.randrange(9)
+        return rnd.randbytes(size).hex()
+    if isinstance(xmp_type, types.XmpStr):
+        return "xena"[:rnd.randrange(5)]
+    if isinstance(xmp_type, types.XmpJson):
+        return {"key": rnd.randrange(10)}
+    bits = struct.calcsize(xmp_type.data_format) * 8
+    return rnd.getrandbits(bits - 1 if xmp_type.data_format.islower() else bits)
+
+
+def sample_kwargs(rnd: random.Random, struct_type: type[RequestBodyStruct]) -> dict[str, Any]:
+    """Build random valid field values of the request body struct."""
+    annotations = resolve_annotations(struct_type.__annotations__, struct_type.__module__)
+    kwargs = {}
+    for name, client_type in annotations.items():
+        xmp_type = struct_type.__dict__[name].specs.xmp_type
+        if not isinstance(xmp_type, types.XmpSequence):
+            kwargs[name] = _sample_scalar(rnd, xmp_type, client_type)
+            continue
+        item_type = typing.get_args(client_type)[0]
+        length = xmp_type.length if xmp_type.length is not None else rnd.randrange(4)
+        if dataclasses.is_dataclass(item_type):
+            fields = dataclasses.fields(item_type)
+            item_annotations = resolve_annotations({f.name: f.type for f in fields}, item_type.__module__)
+            kwargs[name] = [
+                item_type(*(_sample_scalar(rnd, t, item_annotations[f.name]) for t, f in zip(xmp_type.types_chunk, fields)))
+                for _ in range(length)
+            ]
+        else:
+            kwargs[name] = [_sample_scalar(rnd, xmp_type.types_chunk[0], item_type) for _ in range(length)]
+    return kwargs
+
+
+def default_payload(struct_type: type) -> bytes:
+    """
+    Zero filled payload of the static length response body struct, which is valid for every field:
+    the enum fields without the 0 member are filled with the value of their first member.
+    """
+    codec = struct_type._order.codec
+    if codec is None:
+        return b""
+    annotations = resolve_annotations(struct_type.__annotations__, struct_type.__module__)
+    flat = list(codec.struct.unpack(bytes(codec.size)))
+    for client_type, (start, stop, width) in zip(annotations.values(), codec.layout):
+        if width:
+            args = typing.get_args(client_type)
+            client_type = args[0] if len(args) == 1 and width == 1 else None
+        if not (isinstance(client_type, type) and issubclass(client_type, enum.Enum)):
+            continue
+        members = list(client_type)
+        if not members or any(member.value == 0 for member in members):
+            continue
+        stop = stop if width else start + 1
+        flat[start:stop] = [members[0].value] * (stop - start)
+    return codec.struct.pack(*flat)
@@ -0,0 +1,116 @@
+"""
+Benchmark of the download of the capture buffers of many ports.
+
+Extends the tester emulator of ``emulator.py`` with the capture buffers of ``--packets`` packets on every port.
+Compares awaiting ``PC_EXTRA`` and ``PC_PACKET`` of ``obtain_captured`` one by one, port after port,
+with converting the hex strings to bytes, with the ``CaptureExporter`` of all ports at once.
+Both write a pcapng file in to the memory, their packets are compared.
+
+Usage: python benchmarks/bench_capture_export.py [--ports 6] [--packets 2000] [--latency 0.001] [--chunk-size 256] [--repeat 3]
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import io
+import struct
+import time
+
+from xoa_driver import testers
+from xoa_driver import utils
+from xoa_driver.internals.commands import (
+    PC_EXTRA,
+    PC_PACKET,
+    PC_STATS,
+)
+from xoa_driver.internals.hli.ports.port_l23.trafficgen.capture import PortCapture
+from xoa_driver.internals.utils.capture_export import _PcapngWriter
+from emulator import TesterEmulator
+
+
+class CaptureEmulator(TesterEmulator):
+    """Emulator of the ports with ``packets`` captured packets of 64 to 1518 bytes."""
+
+    def __init__(self, *, packets: int, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.packets = packets
+
+    def payload(self, cmd_code: int, module: int, port: int, indices: tuple[int, ...]) -> bytes:
+        if cmd_code == PC_STATS.code:
+            return struct.pack("!qqq", 0, self.packets, 10**18)
+        if cmd_code == PC_EXTRA.code:
+            idx, = indices
+            return struct.pack("!qqqi", 10**18 + idx * 1000, 500, 20, self.length(idx) + 4)
+        if cmd_code == PC_PACKET.code:
+            idx, = indices
+            return bytes((port + idx + i) % 256 for i in range(self.length(idx)))
+        return super().payload(cmd_code, module, port, indices)
+
+    @staticmethod
+    def length(idx: int) -> int:
+        return 64 + idx * 97 % 1455
+
+
+def read_pcapng(data: bytes) -> dict[str, list[tuple[int, int, int, bytes]]]:
+    """Packets of every interface: the timestamp, the captured and original length, and the data."""
+    names: list[str] = []
+    packets: dict[str, list[tuple[int, int, int, bytes]]] = {}
+    offset = 0
+    while offset < len(data):
+        block_type, size = struct.unpack_from("<II", data, offset)
+        if block_type == 1:
+            code, length = struct.unpack_from("<HH", data, offset + 16)
+            names.append(data[offset + 20:offset + 20 + length].decode())
+            packets[names[-1]] = []
+        elif block_type == 6:
+            interface, high, low, captured, original = struct.unpack_from("<IIIII", data, offset + 8)
+            packets[names[interface]].append(((high << 32) | low, captured, original, data[offset + 28:offset + 28 + captured]))
+        offset += size
+    return packets
+
+
+async def one_by_one(captures: list[PortCapture], file: io.BytesIO) -> None:
+    writer = _PcapngWriter(file)
+    for capture in captures:
+        interface = writer.add_interface(f"{capture.stats._module}/{capture.stats._port}")
+        for idx, captured in enumerate(await capture.obtain_captured()):
+            extra = await captured.extra.get()
+            packet = await captured.packet.get()
+            data = bytes.fromhex(packet.hex_data)
+            writer.write(interface, utils.CapturedPacket(0, idx, extra.time_captured, extra.latency, extra.length, data))
+
+
+async def main(args: argparse.Namespace) -> None:
+    async with CaptureEmulator(packets=args.packets, latency=args.latency, port=0) as emulator:
+        tester = await testers.L23Tester(emulator.host, "bench", port=emulator.port)
+        captures = [PortCapture(tester._conn, 0, port) for port in range(args.ports)]
+        total = args.ports * args.packets
+        baseline = None
+        outputs = []
+        for name, case in (
+            ("one by one", lambda file: one_by_one(captures, file)),
+            ("CaptureExporter", lambda file: utils.CaptureExporter(captures, chunk_size=args.chunk_size).export(file)),
+        ):
+            best = float("inf")
+            for _ in range(args.repeat):
+                file = io.BytesIO()
+                begin = time.perf_counter()
+                await case(file)
+                best = min(best, time.perf_counter() - begin)
+            outputs.append(file.getvalue())
+            baseline = baseline or best
+            print(
+                f"{name:<16} {args.ports} ports {total:>7} packets  {best:8.3f} s  {total / best:>9,.0f} packets/s  "
+                f"{baseline / best:6.1f}x  {len(outputs[-1]) / 1e6:.1f} MB"
+            )
+        assert read_pcapng(outputs[0]) == read_pcapng(outputs[1]), "the packets differ"
+        await tester.session.logoff()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ports", type=int, default=6)
+    parser.add_argument("--packets", type=int, default=2000, help="captured packets of every port")
+    parser.add_argument("--latency", type=float, default=0.001, help="seconds the emulator delays the replies by")
+    parser.add_argument("--chunk-size", type=int, default=256)
+    parser.add_argument("--repeat", type=int, default=3)
+    asyncio.run(main(parser.parse_args()))
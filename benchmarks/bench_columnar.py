@@ -0,0 +1,56 @@
+"""
+Benchmark of the columnar export of the statistics replies.
+
+Decodes a batch of PR_TPLDLATENCY reply bodies in to columns with a Python loop
+over the ResponseBodyStruct attributes, with ``to_columns`` on lists and with
+``to_columns`` on NumPy arrays (when NumPy is installed).
+
+Usage: python benchmarks/bench_columnar.py [--replies 100000] [--repeat 5]
+"""
+from __future__ import annotations
+import argparse
+import random
+import time
+
+from xoa_driver.internals.commands import PR_TPLDLATENCY
+from xoa_driver.internals.core.transporter.protocol.payload import columnar
+
+
+def loop_columns(replies: list) -> dict[str, list]:
+    names = PR_TPLDLATENCY.GetDataAttr._order.names
+    columns: dict[str, list] = {name: [] for name in names}
+    for reply in replies:
+        for name in names:
+            columns[name].append(getattr(reply, name))
+    return columns
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--replies", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5, help="the best time of the repeats is reported")
+    args = parser.parse_args()
+
+    struct_type = PR_TPLDLATENCY.GetDataAttr
+    rnd = random.Random(0)
+    replies = [struct_type(rnd.randbytes(struct_type._order.codec.size)) for _ in range(args.replies)]
+
+    cases = {
+        "python loop": lambda: loop_columns(replies),
+        "lists": lambda: columnar.to_columns(replies, use_numpy=False),
+    }
+    if columnar.numpy_module() is not None:
+        cases["numpy"] = lambda: columnar.to_columns(replies, use_numpy=True)
+    for title, case in cases.items():
+        elapsed = float("inf")
+        for _ in range(args.repeat):
+            for reply in replies:
+                reply._values = None
+            begin = time.perf_counter()
+            case()
+            elapsed = min(elapsed, time.perf_counter() - begin)
+        print(f"{title:12s} {args.replies:8d} replies {elapsed * 1e3:10.2f} ms {args.replies / elapsed:14,.0f} replies/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark of the response dispatch modes of the ``PacketsProcessor``.
+
+Feeds synthetic streams of PR_TOTAL replies into the processor the same way
+``TransportationHandler.data_received`` does, and measures the time until every
+request future is resolved, for the INLINE and the TASK dispatch modes.
+
+Usage: python benchmarks/bench_dispatch.py [--replies 50000] [--segment 65536]
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import time
+
+from xoa_driver.internals.commands import PR_TOTAL
+from xoa_driver.internals.core.transporter._stream import FramedStreamReader
+from xoa_driver.internals.core.transporter._processor import (
+    PacketsProcessor,
+    DispatchMode,
+)
+from xoa_driver.internals.core.transporter._publisher import ResponsePublisher
+from xoa_driver.internals.core.transporter.logger import TransportationLogger
+from xoa_driver.internals.core.transporter.protocol.struct_header import ResponseHeader
+from _synthetic import build_burst, split_segments
+
+
+async def run(mode: DispatchMode, replies: int, segments: list[bytes]) -> float:
+    stream = FramedStreamReader(header_struct=ResponseHeader)
+    publisher = ResponsePublisher(logger=TransportationLogger(cid="bench"))
+    processor = PacketsProcessor(stream=stream, publish_func=publisher.publish, mode=mode)
+    futures = []
+    for req_id in range(1, replies + 1):
+        processor.register(req_id=req_id, cmd_code=PR_TOTAL.code)
+        futures.append(publisher.register_request(req_id=req_id, cmd_name=PR_TOTAL.__name__))
+    processor.start()
+
+    begin = time.perf_counter()
+    for segment in segments:
+        stream.feed_data(segment)
+        processor.dispatch()
+        await asyncio.sleep(0)
+    await asyncio.gather(*futures)
+    elapsed = time.perf_counter() - begin
+    processor.stop()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--replies", type=int, default=50_000)
+    parser.add_argument("--segment", type=int, default=65_536, help="size of a single TCP read in bytes")
+    args = parser.parse_args()
+
+    segments = split_segments(build_burst(args.replies, cmd_code=PR_TOTAL.code), args.segment)
+    for mode in (DispatchMode.TASK, DispatchMode.INLINE):
+        elapsed = asyncio.run(run(mode, args.replies, segments))
+        print(f"{mode.name:8s} {args.replies:8d} replies {elapsed * 1e3:10.2f} ms {args.replies / elapsed:14,.0f} replies/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Benchmark of the driver against the tester emulator of ``emulator.py``, without a real tester.
+
+Measures the time to ready of the bootstrap of the tester, the throughput of the queries and the
+configuration sent with ``apply`` and ``apply_pipelined``, and the latency of the statistics polling
+cycles of the ``StatsCollector`` over all ports. The emulator is started in this process,
+unless ``--connect`` points to an emulator, or to a tester, already listening.
+
+Usage: python benchmarks/bench_emulated.py [--modules 12] [--latency 0.0] [--requests 20000] [--cycles 20] [--repeat 5]
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import time
+
+from xoa_driver import testers
+from xoa_driver import utils
+from xoa_driver.internals.commands import (
+    P_COMMENT,
+    PR_TOTAL,
+)
+from emulator import (
+    Inventory,
+    TesterEmulator,
+)
+
+
+async def connect(host: str, port: int) -> testers.L23Tester:
+    return await testers.L23Tester(host, "bench", port=port, enable_logging=False)
+
+
+async def bench_bootstrap(host: str, port: int, repeat: int) -> None:
+    best = None
+    for _ in range(repeat):
+        tester = await connect(host, port)
+        report = tester.bootstrap_report
+        if best is None or report.time_to_ready < best.time_to_ready:
+            best = report
+        ports = sum(len(module.ports) for module in tester.modules)
+        await tester.session.logoff()
+    assert best is not None
+    phases = ", ".join(f"{name} {seconds * 1e3:.1f}" for name, seconds in best.phases.items())
+    print(f"bootstrap      {len(tester.modules):>3} modules {ports:>4} ports  {best.time_to_ready * 1e3:8.1f} ms  {sum(best.requests.values()):>6} requests  ({phases} ms)")
+
+
+async def bench_apply(tester: testers.L23Tester, requests: int, repeat: int) -> None:
+    ports = [port for module in tester.modules for port in module.ports]
+    queries = [PR_TOTAL(tester._conn, *ports[i % len(ports)].kind).get() for i in range(requests)]
+    sets = [P_COMMENT(tester._conn, *ports[i % len(ports)].kind).set(f"port {i}") for i in range(requests)]
+    cases = (
+        ("apply get", lambda: utils.apply(*queries)),
+        ("apply set", lambda: utils.apply(*sets)),
+        ("pipelined get", lambda: _drain(utils.apply_pipelined(queries))),
+        ("pipelined set", lambda: _drain(utils.apply_pipelined(sets))),
+    )
+    for name, case in cases:
+        best = float("inf")
+        for _ in range(repeat):
+            begin = time.perf_counter()
+            await case()
+            best = min(best, time.perf_counter() - begin)
+        print(f"{name:<14} {requests:>7} requests  {best * 1e3:8.1f} ms  {requests / best:>10,.0f} requests/s")
+
+
+async def _drain(replies) -> None:
+    async for _ in replies:
+        pass
+
+
+async def bench_stats(tester: testers.L23Tester, cycles: int) -> None:
+    ports = [port for module in tester.modules for port in module.ports]
+    collector = utils.StatsCollector(ports, (utils.StatsFamily.RX_TOTAL, utils.StatsFamily.TX_TOTAL))
+    await collector.prepare()
+    latencies = sorted([(await collector.collect()).latency for _ in range(cycles)])
+    median = latencies[len(latencies) // 2]
+    print(
+        f"stats polling  {collector.requests_per_cycle:>7} requests  {median * 1e3:8.1f} ms median  "
+        f"{latencies[0] * 1e3:.1f} ms min  {latencies[-1] * 1e3:.1f} ms max  over {cycles} cycles"
+    )
+
+
+async def main(args: argparse.Namespace) -> None:
+    emulator = None
+    if args.connect:
+        host, _, port = args.connect.rpartition(":")
+        port = int(port)
+    else:
+        inventory = Inventory.of(*[args.revision] * args.modules)
+        emulator = TesterEmulator(inventory, latency=args.latency, port=0)
+        host, port = emulator.host, await emulator.start()
+    try:
+        await bench_bootstrap(host, port, args.repeat)
+        tester = await connect(host, port)
+        await bench_apply(tester, args.requests, args.repeat)
+        await bench_stats(tester, args.cycles)
+        await tester.session.logoff()
+    finally:
+        if emulator is not None:
+            print(f"emulator answered {emulator.requests} requests")
+            await emulator.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--connect", metavar="HOST:PORT", help="emulator or tester already listening")
+    parser.add_argument("--modules", type=int, default=12)
+    parser.add_argument("--revision", default="Odin-1G-3S-6P")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds the emulator delays the replies by")
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--cycles", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,115 @@
+"""
+Benchmark of the BER eye acquisition of many serdes.
+
+Extends the tester emulator of ``emulator.py`` with the BER eye measurement: after ``PP_EYEMEASURE`` is started,
+a column of the eye becomes valid every ``column-time`` seconds. Compares reading the columns one by one
+and polling ``valid_column_count``, serdes after serdes, with the ``EyeAcquisition`` of all serdes at once.
+
+Usage: python benchmarks/bench_eye_acquisition.py [--serdes 16] [--x 65] [--y 127] [--column-time 0.002] [--latency 0.005] [--repeat 3]
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import struct
+import time
+
+from xoa_driver import testers
+from xoa_driver import utils
+from xoa_driver.internals.commands import (
+    PP_EYEMEASURE,
+    PP_EYEREAD,
+    PP_EYERESOLUTION,
+)
+from xoa_driver.internals.core.transporter.protocol import _constants as const
+from xoa_driver.internals.hli.ports.port_l23.layer1.eye_diagram import EyeDiagram
+from emulator import TesterEmulator
+
+
+def expected(x: int, y: int, y_resolution: int) -> int:
+    return (x * y_resolution + y) % 1_000_000
+
+
+class EyeEmulator(TesterEmulator):
+    """Emulator of the serdes which measure a column of the eye every ``column_time`` seconds."""
+
+    def __init__(self, *, column_time: float, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.column_time = column_time
+        self.started: dict[tuple[int, int, int], float] = {}
+
+    def answer(self, header, body: bytes) -> bytes:
+        if header.cmd_code == PP_EYEMEASURE.code and header.cmd_type != const.CommandType.COMMAND_QUERY:
+            serdes, status = struct.unpack_from("!iB", body)
+            self.started[(header.module_index, header.port_index, serdes)] = time.monotonic()
+        return super().answer(header, body)
+
+    def payload(self, cmd_code: int, module: int, port: int, indices: tuple[int, ...]) -> bytes:
+        if cmd_code != PP_EYEREAD.code:
+            return super().payload(cmd_code, module, port, indices)
+        serdes, x = indices
+        x_resolution, y_resolution = struct.unpack("!ii", self.payload(PP_EYERESOLUTION.code, module, port, (serdes,)))
+        started = self.started.get((module, port, serdes))
+        valid = 0 if started is None else min(x_resolution, int((time.monotonic() - started) / self.column_time))
+        column = (expected(x, y, y_resolution) for y in range(y_resolution))
+        return struct.pack(f"!3i{y_resolution}i", x_resolution, y_resolution, valid, *column)
+
+
+async def one_by_one(eyes: list[EyeDiagram], poll_interval: float) -> list[list[list[int]]]:
+    """The columns are read in the order they are measured, every read is polled until the column is valid."""
+    for eye in eyes:
+        await eye.measure.set_start()
+    results = []
+    for eye in eyes:
+        x_resolution = len(eye.read_column)
+        columns: list[list[int]] = [[] for _ in range(x_resolution)]
+        for position in range(x_resolution):
+            x = x_resolution - 1 - position
+            while (reply := await eye.read_column[x].get()).valid_column_count <= position:
+                await asyncio.sleep(poll_interval)
+            columns[x] = reply.values
+        results.append(columns)
+    return results
+
+
+async def main(args: argparse.Namespace) -> None:
+    async with EyeEmulator(column_time=args.column_time, latency=args.latency, port=0) as emulator:
+        tester = await testers.L23Tester(emulator.host, "bench", port=emulator.port)
+        eyes = [EyeDiagram(tester._conn, 0, 0, serdes) for serdes in range(args.serdes)]
+        await utils.apply(*(eye.resolution.set(args.x, args.y) for eye in eyes))
+        for eye in eyes:
+            await eye
+        total = args.serdes * args.x
+        measuring = args.x * args.column_time
+        baseline = None
+        for name, case in (
+            ("one by one", lambda: one_by_one(eyes, args.poll_interval)),
+            ("EyeAcquisition", lambda: utils.EyeAcquisition(eyes, poll_interval=args.poll_interval).acquire()),
+        ):
+            best = float("inf")
+            for _ in range(args.repeat):
+                begin = time.perf_counter()
+                result = await case()
+                best = min(best, time.perf_counter() - begin)
+            columns = [[list(column) for column in (eye.values if isinstance(eye, utils.EyeData) else eye)] for eye in result]
+            assert all(
+                columns[s][x] == [expected(x, y, args.y) for y in range(args.y)]
+                for s in range(args.serdes) for x in range(args.x)
+            ), name
+            baseline = baseline or best
+            print(
+                f"{name:<15} {args.serdes} serdes {total:>6} columns  {best:8.3f} s  {total / best:>8,.0f} columns/s  "
+                f"{baseline / best:6.1f}x  (measuring {measuring:.3f} s)"
+            )
+        await tester.session.logoff()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--serdes", type=int, default=16)
+    parser.add_argument("--x", type=int, default=65, help="columns of the eye")
+    parser.add_argument("--y", type=int, default=127, help="sampling points of a column")
+    parser.add_argument("--column-time", type=float, default=0.002, help="seconds the measurement of a column takes")
+    parser.add_argument("--latency", type=float, default=0.005, help="seconds the emulator delays the replies by")
+    parser.add_argument("--poll-interval", type=float, default=0.05)
+    parser.add_argument("--repeat", type=int, default=3)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,76 @@
+"""
+Benchmark of the Hex fields of the bulk binary data, like the captured packets and the packet headers.
+
+Decodes the reply bodies of PC_PACKET and P4_CAPTURE_GET_FIRST and reads their Hex field,
+comparing the hex strings of the default mode with the ``memoryview`` slices of ``raw()``.
+Encodes PS_PACKETHEADER and PS_PAYLOAD from the hex strings and from the bytes.
+
+Usage: python benchmarks/bench_hex_fields.py [--size 1518] [--replies 20000] [--repeat 5]
+"""
+from __future__ import annotations
+import argparse
+import random
+import struct
+import time
+from typing import Any, Callable
+
+from xoa_driver.internals.commands import (
+    P4_CAPTURE_GET_FIRST,
+    PC_PACKET,
+    PS_PACKETHEADER,
+    PS_PAYLOAD,
+)
+from xoa_driver.enums import PayloadType
+from xoa_driver.misc import Hex
+
+
+def best_of(repeat: int, case: Callable[[], Any]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        begin = time.perf_counter()
+        case()
+        best = min(best, time.perf_counter() - begin)
+    return best
+
+
+def report(title: str, count: int, elapsed: float, baseline: float) -> None:
+    print(f"  {title:14s} {count:6d} bodies {elapsed * 1e3:9.2f} ms {elapsed / count * 1e6:9.2f} us/body {baseline / elapsed:6.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=1518, help="bytes of the Hex field")
+    parser.add_argument("--replies", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rnd = random.Random(0)
+    data = [rnd.randbytes(args.size) for _ in range(args.replies)]
+    for cmd, name, header in (
+        (PC_PACKET, "hex_data", b""),
+        (P4_CAPTURE_GET_FIRST, "frame", struct.pack("!5i", 0, 1, 2, args.size, args.size)),
+    ):
+        struct_type = cmd.GetDataAttr
+        bodies = [header + d for d in data]
+        assert bytes.fromhex(getattr(struct_type(bodies[0]), name)) == bytes(getattr(struct_type(bodies[0]).raw(), name)) == data[0]
+        print(f"{cmd.__name__}.{name}: {args.size} bytes")
+        baseline = best_of(args.repeat, lambda: [bytes.fromhex(getattr(struct_type(body), name)) for body in bodies])
+        report("hex to bytes", args.replies, baseline, baseline)
+        report("hex string", args.replies, best_of(args.repeat, lambda: [getattr(struct_type(body), name) for body in bodies]), baseline)
+        report("raw view", args.replies, best_of(args.repeat, lambda: [getattr(struct_type(body).raw(), name) for body in bodies]), baseline)
+        report("raw bytes", args.replies, best_of(args.repeat, lambda: [bytes(getattr(struct_type(body).raw(), name)) for body in bodies]), baseline)
+
+    strings = [Hex(d.hex()) for d in data]
+    for cmd, make in (
+        (PS_PACKETHEADER, lambda value: PS_PACKETHEADER.SetDataAttr(hex_data=value)),
+        (PS_PAYLOAD, lambda value: PS_PAYLOAD.SetDataAttr(payload_type=PayloadType.PATTERN, hex_data=value)),
+    ):
+        assert make(strings[0]).to_bytes() == make(data[0]).to_bytes()
+        print(f"{cmd.__name__}.SetDataAttr: {args.size} bytes")
+        baseline = best_of(args.repeat, lambda: [make(value).to_bytes() for value in strings])
+        report("hex string", args.replies, baseline, baseline)
+        report("bytes", args.replies, best_of(args.repeat, lambda: [make(value).to_bytes() for value in data]), baseline)
+
+
+if __name__ == "__main__":
+    main()
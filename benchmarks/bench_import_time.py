@@ -0,0 +1,82 @@
+"""
+Benchmark of the import time of the public modules, with a regression budget.
+
+Every module is imported in a fresh interpreter with ``python -X importtime``,
+the cumulative time of the module is the best of the repetitions.
+The exit code is 1 if any module is over its budget, or if the lazy commands index is outdated.
+
+Usage: python benchmarks/bench_import_time.py [--repeat 5] [--budget xoa_driver.enums=150] [--no-index-check]
+"""
+from __future__ import annotations
+import argparse
+import os
+import pathlib
+import re
+import subprocess
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+
+BUDGETS_MS = {
+    "xoa_driver.internals.commands": 100.0,
+    "xoa_driver.enums": 200.0,
+    "xoa_driver.utils": 500.0,
+    "xoa_driver.lli": 300.0,
+    "xoa_driver.testers": 2000.0,
+}
+"""Default budget of every module in milliseconds, generous for the slow CI machines."""
+
+_LINE = re.compile(r"^import time:\s+\d+\s+\|\s+(\d+)\s+\|\s*(\S+)\s*$")
+
+
+def import_time_ms(module: str) -> float:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, (str(ROOT), os.environ.get("PYTHONPATH")))))
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    for line in reversed(completed.stderr.splitlines()):
+        match = _LINE.match(line)
+        if match and match.group(2) == module:
+            return int(match.group(1)) / 1000
+    raise RuntimeError(f"No import time of {module} is reported.")
+
+
+def check_index() -> bool:
+    completed = subprocess.run(
+        [sys.executable, "-m", "xoa_driver.internals.commands._generate_index", "--check"],
+        cwd=ROOT,
+    )
+    return completed.returncode == 0
+
+
+def parse_budget(value: str) -> tuple[str, float]:
+    module, _, budget = value.partition("=")
+    return module, float(budget)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget", type=parse_budget, action="append", default=[], metavar="MODULE=MS")
+    parser.add_argument("--no-index-check", action="store_true")
+    args = parser.parse_args()
+
+    budgets = BUDGETS_MS | dict(args.budget)
+    failed = False
+    print(f"{'module':<32} {'best ms':>10} {'budget ms':>10}")
+    for module, budget in budgets.items():
+        best = min(import_time_ms(module) for _ in range(args.repeat))
+        over = best > budget
+        failed |= over
+        print(f"{module:<32} {best:>10.1f} {budget:>10.1f}{'  OVER BUDGET' if over else ''}")
+    if not args.no_index_check and not check_index():
+        failed = True
+    return int(failed)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""
+Benchmark of the provisioning of many streams on many ports.
+
+Creates ``--streams`` streams on every port of the tester emulator of ``emulator.py`` and configures them:
+the enable state, the rate, the packet header, the TPLD ID and the comment. Compares ``create`` and
+the configuration commands awaited one by one, port after port, with ``create_many`` of all ports concurrently.
+
+Usage: python benchmarks/bench_index_provisioning.py [--ports 6] [--streams 256] [--latency 0.001] [--repeat 3]
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import time
+from typing import Any
+
+from xoa_driver import enums
+from xoa_driver import testers
+from xoa_driver.internals.core.token import Token
+from xoa_driver.internals.hli.indices.streams.genuine_stream import GenuineStreamIdx
+from xoa_driver.internals.utils.indices.index_manager import IndexManager
+from emulator import TesterEmulator
+
+HEADER = bytes.fromhex("ffffffffffff000000000000" "0800" "4500002e000000004011" "0000c0a80001c0a80002")
+
+
+def configure(stream: GenuineStreamIdx) -> tuple[Token[Any], ...]:
+    return (
+        stream.enable.set(enums.OnOffWithSuppress.ON),
+        stream.rate.pps.set(1000),
+        stream.packet.header.data.set(HEADER),
+        stream.tpld_id.set(stream.idx),
+        stream.comment.set(f"stream {stream.idx}"),
+    )
+
+
+async def one_by_one(managers: list[IndexManager[GenuineStreamIdx]], count: int) -> None:
+    for manager in managers:
+        for _ in range(count):
+            stream = await manager.create()
+            for token in configure(stream):
+                await token
+
+
+async def bulk(managers: list[IndexManager[GenuineStreamIdx]], count: int) -> None:
+    await asyncio.gather(*(manager.create_many(count, configure) for manager in managers))
+
+
+async def main(args: argparse.Namespace) -> None:
+    async with TesterEmulator(latency=args.latency, port=0) as emulator:
+        tester = await testers.L23Tester(emulator.host, "bench", port=emulator.port)
+        total = args.ports * args.streams
+        baseline = None
+        for name, case in (("one by one", one_by_one), ("create_many", bulk)):
+            best = float("inf")
+            for _ in range(args.repeat):
+                managers = [IndexManager(tester._conn, GenuineStreamIdx, 0, port) for port in range(args.ports)]
+                begin = time.perf_counter()
+                await case(managers, args.streams)
+                best = min(best, time.perf_counter() - begin)
+                assert all([s.idx for s in manager] == list(range(args.streams)) for manager in managers), name
+            baseline = baseline or best
+            print(f"{name:<12} {args.ports} ports {total:>6} streams  {best:8.3f} s  {total / best:>9,.0f} streams/s  {baseline / best:6.1f}x")
+        await tester.session.logoff()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ports", type=int, default=6)
+    parser.add_argument("--streams", type=int, default=256, help="streams of every port")
+    parser.add_argument("--latency", type=float, default=0.001, help="seconds the emulator delays the replies by")
+    parser.add_argument("--repeat", type=int, default=3)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,101 @@
+"""
+Benchmark of the debug logging of the packets on the way of the requests and responses.
+
+Sends pipelined queries to the tester emulator of ``emulator.py`` without logging, with the logging
+formatted in the event loop, and with the deferred logging at several sampling rates.
+The log records are written to a file, the time of the event loop is measured until the last response,
+and the longest stall of the event loop while the connection is closed, the deferred records are still
+emitted by the background thread after it.
+
+Usage: python benchmarks/bench_logging.py [--requests 20000] [--repeat 5]
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import logging
+import os
+import tempfile
+import threading
+import time
+
+from xoa_driver import testers
+from xoa_driver import utils
+from xoa_driver.internals.commands import PR_TOTAL
+from emulator import TesterEmulator
+
+
+def file_logger(path: str) -> logging.Logger:
+    logger = logging.getLogger(f"bench_logging.{os.path.basename(path)}")
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    handler = logging.FileHandler(path, mode="w")
+    handler.setFormatter(logging.Formatter("%(asctime)s | %(levelname)-8s | %(message)s"))
+    logger.addHandler(handler)
+    return logger
+
+
+def join_logging_threads() -> None:
+    for thread in threading.enumerate():
+        if thread.name == "xoa-deferred-logging":
+            thread.join()
+
+
+async def longest_stall(seconds: float) -> float:
+    """Longest delay of the event loop over ``seconds``, measured by sleeping in the steps of 1 ms."""
+    stall = 0.0
+    end = time.perf_counter() + seconds
+    while (begin := time.perf_counter()) < end:
+        await asyncio.sleep(0.001)
+        stall = max(stall, time.perf_counter() - begin - 0.001)
+    return stall
+
+
+async def run(emulator: TesterEmulator, requests: int, repeat: int, **kwargs) -> tuple[float, float]:
+    tester = await testers.L23Tester(emulator.host, "bench", port=emulator.port, **kwargs)
+    port = tester.modules.obtain(0).ports.obtain(0)
+    tokens = [PR_TOTAL(tester._conn, *port.kind).get() for _ in range(requests)]
+    best = float("inf")
+    for _ in range(repeat):
+        begin = time.perf_counter()
+        async for _ in utils.apply_pipelined(tokens):
+            pass
+        best = min(best, time.perf_counter() - begin)
+    stall = asyncio.create_task(longest_stall(0.2))
+    await tester.session.logoff()
+    tester._conn.close()
+    return best, await stall
+
+
+async def main(args: argparse.Namespace) -> None:
+    directory = tempfile.mkdtemp()
+    cases = [
+        ("off", {}),
+        ("eager", {"enable_logging": True}),
+        *(
+            (f"deferred {rate:g}", {"deferred_logging": utils.DeferredLogging(sample_rate=rate, queue_size=4 * args.requests)})
+            for rate in (1.0, 0.1, 0.01)
+        ),
+        ("deferred PR_TOTAL off", {"deferred_logging": utils.DeferredLogging(command_rates={"PR_TOTAL": 0.0})}),
+    ]
+    async with TesterEmulator(port=0) as emulator:
+        baseline = None
+        for name, kwargs in cases:
+            path = os.path.join(directory, f"{name.replace(' ', '_')}.log")
+            if kwargs:
+                kwargs["custom_logger"] = file_logger(path)
+            seconds, stall = await run(emulator, args.requests, args.repeat, **kwargs)
+            baseline = baseline or seconds
+            # The background thread is still emitting the deferred records.
+            await asyncio.to_thread(join_logging_threads)
+            lines = sum(1 for _ in open(path)) if os.path.exists(path) else 0
+            print(
+                f"{name:<22} {seconds * 1e3:8.1f} ms  {seconds / args.requests * 1e6:6.2f} us/request  "
+                f"{(seconds / baseline - 1) * 100:+7.1f}%  {lines:>8} log lines  {stall * 1e3:6.1f} ms close stall"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,79 @@
+"""
+Benchmark of the commands of many testers sent with the ``TesterOrchestrator``.
+
+Starts one tester emulator of ``emulator.py`` per tester, with the round trip ``latency``.
+Compares the queries of all ports sent tester by tester with ``apply_pipelined``,
+with sending them by the orchestrator, and measures the skew of the synchronized start of the traffic.
+
+Usage: python benchmarks/bench_orchestrator.py [--testers 8] [--modules 4] [--latency 0.01] [--requests 1000] [--repeat 5]
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import time
+
+from xoa_driver import testers
+from xoa_driver import utils
+from emulator import (
+    Inventory,
+    TesterEmulator,
+)
+
+
+async def sequential(tokens_of_testers: list[list]) -> list:
+    results = []
+    for tokens in tokens_of_testers:
+        results.extend([r async for r in utils.apply_pipelined(tokens)])
+    return results
+
+
+async def main(args: argparse.Namespace) -> None:
+    inventory = Inventory.of(*["Odin-1G-3S-6P"] * args.modules)
+    emulators = [TesterEmulator(inventory, latency=args.latency, port=0) for _ in range(args.testers)]
+    for emulator in emulators:
+        await emulator.start()
+    try:
+        connected = await asyncio.gather(*(testers.L23Tester(e.host, "bench", port=e.port) for e in emulators))
+        ports_of_testers = [[port for module in tester.modules for port in module.ports] for tester in connected]
+        tokens_of_testers = [
+            [ports[i % len(ports)].statistics.rx.total.get() for i in range(args.requests)]
+            for ports in ports_of_testers
+        ]
+        # Interleaved, as the caller would build them port by port across the testers.
+        mixed = [token for tokens in zip(*tokens_of_testers) for token in tokens]
+        orchestrator = utils.TesterOrchestrator()
+        total = len(mixed)
+        for name, case in (
+            ("tester by tester", lambda: sequential(tokens_of_testers)),
+            ("orchestrator", lambda: orchestrator.apply(*mixed)),
+        ):
+            best = float("inf")
+            for _ in range(args.repeat):
+                begin = time.perf_counter()
+                await case()
+                best = min(best, time.perf_counter() - begin)
+            print(f"{name:<17} {args.testers} testers {total:>7} requests  {best * 1e3:8.1f} ms  {total / best:>10,.0f} requests/s")
+
+        start = [port.traffic.state.set_start() for ports in ports_of_testers for port in ports]
+        reports = [await orchestrator.synchronized(*start) for _ in range(args.repeat * 4)]
+        send_skew = sorted(r.send_skew for r in reports)
+        max_skew = sorted(r.max_skew for r in reports)
+        print(
+            f"synchronized      {args.testers} testers {len(start):>7} commands  send skew {send_skew[len(reports) // 2] * 1e6:.0f} us median  "
+            f"{send_skew[-1] * 1e6:.0f} us max, execution skew bound {max_skew[len(reports) // 2] * 1e3:.2f} ms median"
+        )
+        for tester in connected:
+            await tester.session.logoff()
+    finally:
+        for emulator in emulators:
+            await emulator.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--testers", type=int, default=8)
+    parser.add_argument("--modules", type=int, default=4)
+    parser.add_argument("--latency", type=float, default=0.01, help="seconds the emulators delay the replies by")
+    parser.add_argument("--requests", type=int, default=1000, help="queries of every tester")
+    parser.add_argument("--repeat", type=int, default=5)
+    asyncio.run(main(parser.parse_args()))
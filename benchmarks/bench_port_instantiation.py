@@ -0,0 +1,97 @@
+"""
+Benchmark of the construction of the modules and ports of a large tester.
+
+Builds the module objects of a tester (12 modules of 12 ports by default, mixed families)
+without connection, then touches a few attributes of every port and finally all lazy attributes.
+Reports the best time of the repetitions and the memory allocated by every step.
+
+Usage: python benchmarks/bench_port_instantiation.py [--modules 12] [--ports 12] [--repeat 5]
+"""
+from __future__ import annotations
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from xoa_driver import modules as _modules  # noqa: F401, registers the module revisions
+from xoa_driver.internals.hli import revisions
+from xoa_driver.internals.utils.attributes import LazyAttribute
+from xoa_driver.internals.utils.managers.modules_manager import L23ModuleData
+
+REVISIONS = (
+    "Odin-10G-1S-12P",
+    "Freya-800G-4S-1P[a]",
+    "Loki-100G-5S-2P",
+    "Thor-400G-7S-1P[b]",
+)
+"""Module revisions of the slots, in turn."""
+
+
+class _Connection:
+    """The objects only keep the connection, nothing is sent."""
+
+
+def build_modules(modules: int, ports: int) -> list[Any]:
+    conn = _Connection()
+    built = []
+    for slot in range(modules):
+        revision = REVISIONS[slot % len(REVISIONS)]
+        built.append(revisions.VALKYRIE_MODULES[revision](conn, L23ModuleData(slot, ports, revision)))
+    return built
+
+
+def all_ports(modules: list[Any]) -> list[Any]:
+    return [port for module in modules for port in module.ports]
+
+
+def touch_common(ports: list[Any]) -> None:
+    for port in ports:
+        port.speed, port.traffic, port.statistics.rx.total, port.streams
+
+
+def touch_all(ports: list[Any]) -> None:
+    for port in ports:
+        for name in dir(type(port)):
+            if isinstance(getattr(type(port), name, None), LazyAttribute):
+                getattr(port, name)
+
+
+def measure(step: Callable[[], Any], repeat: int, prepare: Callable[[], Any] = lambda: None) -> tuple[float, int]:
+    elapsed = float("inf")
+    for _ in range(repeat):
+        arg = prepare()
+        gc.collect()
+        begin = time.perf_counter()
+        step(arg)
+        elapsed = min(elapsed, time.perf_counter() - begin)
+    arg = prepare()
+    gc.collect()
+    tracemalloc.start()
+    step(arg)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, allocated
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modules", type=int, default=12)
+    parser.add_argument("--ports", type=int, default=12, help="ports of every module")
+    parser.add_argument("--repeat", type=int, default=5, help="the best time of the repeats is reported")
+    args = parser.parse_args()
+
+    build_modules(args.modules, args.ports)  # warm up the imports and caches of the classes
+    ports_count = len(all_ports(build_modules(args.modules, args.ports)))
+    steps = {
+        "construct": measure(lambda _: build_modules(args.modules, args.ports), args.repeat),
+        "touch common": measure(touch_common, args.repeat, lambda: all_ports(build_modules(args.modules, args.ports))),
+        "touch all": measure(touch_all, args.repeat, lambda: all_ports(build_modules(args.modules, args.ports))),
+    }
+    print(f"{args.modules} modules, {ports_count} ports")
+    for title, (elapsed, allocated) in steps.items():
+        print(f"{title:14s} {elapsed * 1e3:10.2f} ms {allocated / 1e6:10.2f} MB {allocated / ports_count / 1e3:10.1f} KB/port")
+
+
+if __name__ == "__main__":
+    main()
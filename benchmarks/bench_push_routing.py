@@ -0,0 +1,96 @@
+"""
+Benchmark of the push notifications routing of the ``ResponsePublisher``.
+
+Every port of a synthetic tester subscribes on P_RECEIVESYNC the same way
+``PortLocalState`` does, and the pushes of random ports are published.
+Compares the callbacks subscribed on any port and filtered by the identity check
+(the legacy behaviour), with the callbacks subscribed on their own module and port.
+
+Usage: python benchmarks/bench_push_routing.py [--modules 12] [--ports 32] [--pushes 2000]
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import random
+import time
+
+from xoa_driver.internals.commands import P_RECEIVESYNC
+from xoa_driver.internals.core.transporter._publisher import ResponsePublisher
+from xoa_driver.internals.core.transporter.logger import TransportationLogger
+from xoa_driver.internals.core.transporter.protocol.struct_header import ResponseHeader
+from xoa_driver.internals.core.transporter.protocol.struct_response import Response
+from _synthetic import build_reply
+
+
+class Counters:
+    __slots__ = ("invoked", "accepted")
+
+    def __init__(self) -> None:
+        self.invoked = 0
+        self.accepted = 0
+
+
+def make_callback(counters: Counters, module: int, port: int):
+    async def _on_sync(response: Response) -> None:
+        counters.invoked += 1
+        if response.header.module_index == module and response.header.port_index == port:
+            counters.accepted += 1
+    return _on_sync
+
+
+def build_push(module: int, port: int) -> Response:
+    packet = build_reply(P_RECEIVESYNC.code, 0, bytes(4), module=module, port=port)
+    header = ResponseHeader.from_buffer_copy(packet)
+    return Response(
+        class_name=P_RECEIVESYNC.__name__,
+        header=header,
+        buffer=packet[ResponseHeader.size:],
+        response_struct=P_RECEIVESYNC.GetDataAttr,
+    )
+
+
+async def run(scoped: bool, modules: int, ports: int, pushes: list[Response]) -> tuple[float, Counters]:
+    publisher = ResponsePublisher(logger=TransportationLogger(cid="bench"))
+    counters = Counters()
+    for module in range(modules):
+        for port in range(ports):
+            callback = make_callback(counters, module, port)
+            if scoped:
+                publisher.subscribe(P_RECEIVESYNC.code, callback, module, port)
+            else:
+                publisher.subscribe(P_RECEIVESYNC.code, callback)
+
+    begin = time.perf_counter()
+    for response in pushes:
+        publisher.publish(response)
+        await asyncio.sleep(0)
+    while counters.invoked < len(pushes) * (1 if scoped else modules * ports):
+        await asyncio.sleep(0)
+    return time.perf_counter() - begin, counters
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modules", type=int, default=12)
+    parser.add_argument("--ports", type=int, default=32)
+    parser.add_argument("--pushes", type=int, default=2_000)
+    args = parser.parse_args()
+
+    rnd = random.Random(0)
+    pushes = [
+        build_push(rnd.randrange(args.modules), rnd.randrange(args.ports))
+        for _ in range(args.pushes)
+    ]
+    print(f"{args.modules * args.ports} subscribed ports, {args.pushes} pushes")
+    for scoped in (False, True):
+        elapsed, counters = asyncio.run(run(scoped, args.modules, args.ports, pushes))
+        print(
+            f"{'indexed' if scoped else 'any-port':9s} "
+            f"{counters.invoked / args.pushes:8.1f} callbacks/push "
+            f"{counters.accepted:8d} accepted "
+            f"{elapsed * 1e3:10.2f} ms {args.pushes / elapsed:12,.0f} pushes/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
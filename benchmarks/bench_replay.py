@@ -0,0 +1,73 @@
+"""
+Benchmark of the session recorder and of the replay of the recorded session.
+
+Records a session against the tester emulator of ``emulator.py``: the bootstrap of the tester and
+the polling of the port statistics. Compares the time of the polling with and without the recorder,
+then replays the recording through the stream reader and the packets processor, with and without
+decoding the values of the responses.
+
+Usage: python benchmarks/bench_replay.py [--modules 12] [--cycles 200] [--repeat 5] [--path session.xrec]
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from xoa_driver import testers
+from xoa_driver import utils
+from emulator import (
+    Inventory,
+    TesterEmulator,
+)
+
+FAMILIES = (utils.StatsFamily.RX_TOTAL, utils.StatsFamily.TX_TOTAL, utils.StatsFamily.RX_EXTRA, utils.StatsFamily.TX_EXTRA)
+
+
+async def poll(emulator: TesterEmulator, cycles: int, recorder: utils.SessionRecorder | None) -> float:
+    tester = await testers.L23Tester(emulator.host, "bench", port=emulator.port, recorder=recorder)
+    collector = utils.StatsCollector([port for module in tester.modules for port in module.ports], FAMILIES)
+    await collector.prepare()
+    begin = time.perf_counter()
+    for _ in range(cycles):
+        await collector.collect()
+    elapsed = time.perf_counter() - begin
+    await tester.session.logoff()
+    return elapsed
+
+
+async def main(args: argparse.Namespace) -> None:
+    path = args.path or os.path.join(tempfile.mkdtemp(), "session.xrec")
+    async with TesterEmulator(Inventory.of(*["Odin-1G-3S-6P"] * args.modules), port=0) as emulator:
+        plain = min([await poll(emulator, args.cycles, None) for _ in range(args.repeat)])
+        recorded = float("inf")
+        for _ in range(args.repeat):
+            with utils.SessionRecorder(path, capacity=args.capacity) as recorder:
+                recorded = min(recorded, await poll(emulator, args.cycles, recorder))
+                records, dropped = recorder.records, recorder.dropped
+    print(f"polling {args.cycles} cycles   {plain * 1e3:8.1f} ms without recorder  {recorded * 1e3:8.1f} ms with recorder ({(recorded / plain - 1) * 100:+.1f}%)")
+    print(f"recording            {records:>8} records  {dropped} dropped  {os.path.getsize(path) / 2 ** 20:.1f} MiB file")
+    replayer = utils.SessionReplayer(path)
+    for decode in (False, True):
+        best = None
+        for _ in range(args.repeat):
+            stats = await replayer.replay(decode=decode)
+            if best is None or stats.seconds < best.seconds:
+                best = stats
+        assert best is not None
+        print(
+            f"replay decode={decode!s:<5}  {best.responses + best.pushes:>8} packets  {best.seconds * 1e3:8.1f} ms  "
+            f"{best.packets_per_second:>10,.0f} packets/s  {best.received_bytes / best.seconds / 2 ** 20:6.1f} MiB/s  "
+            f"{best.errors} errors  (recorded in {best.recorded_seconds * 1e3:.1f} ms)"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modules", type=int, default=12)
+    parser.add_argument("--cycles", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--capacity", type=int, default=64 * 2 ** 20, help="size of the ring buffer in bytes")
+    parser.add_argument("--path", help="file of the recording, a temporary one by default")
+    asyncio.run(main(parser.parse_args()))
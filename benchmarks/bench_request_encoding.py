@@ -0,0 +1,95 @@
+"""
+Benchmark of the request body encoding across all registered commands.
+
+For every command with a SetDataAttr, random valid field values are encoded with
+the field by field path (a descriptor per field writing in to a BytesIO, the
+padding and ``getvalue``) and with the struct constructor, which packs static
+structures, padding included, with a single precompiled ``Struct.pack``. The bodies are compared for equality.
+
+Usage: python benchmarks/bench_request_encoding.py [--rounds 50] [--repeat 5]
+"""
+from __future__ import annotations
+import argparse
+import inspect
+import random
+import time
+from io import BytesIO
+
+from xoa_driver.internals import commands
+from xoa_driver.internals.core.transporter.protocol.payload import RequestBodyStruct
+from _synthetic import sample_kwargs
+
+
+def per_field_body(struct_type: type[RequestBodyStruct], **kwargs) -> bytes:
+    """The same steps as the struct constructor did before the precompiled codecs."""
+    inst = struct_type.__new__(struct_type)
+    inst._buffer = BytesIO()
+    for name in struct_type._order.field_names:
+        if name not in kwargs:
+            raise AttributeError(f"[{name}] is required!")
+        setattr(inst, name, kwargs[name])
+    nbytes = inst._buffer.getbuffer().nbytes
+    inst._buffer.write(bytes(4 - (nbytes % 4) if nbytes % 4 else 0))
+    return inst._buffer.getvalue()
+
+
+def encode_per_field(struct_type: type[RequestBodyStruct], kwargs: dict) -> bytes:
+    return per_field_body(struct_type, **kwargs)
+
+
+def encode_struct(struct_type: type[RequestBodyStruct], kwargs: dict) -> bytes:
+    return struct_type(**kwargs).to_bytes()
+
+
+def measure(encode, cases: list, rounds: int) -> float:
+    begin = time.perf_counter()
+    for _ in range(rounds):
+        for struct_type, kwargs in cases:
+            encode(struct_type, kwargs)
+    return time.perf_counter() - begin
+
+
+def best_of(repeat: int, cases: list, rounds: int) -> dict[str, float]:
+    """Interleave the methods and keep the best time of each, to reduce the noise of a busy machine."""
+    methods = {"per-field": encode_per_field, "struct": encode_struct}
+    best = dict.fromkeys(methods, float("inf"))
+    for _ in range(repeat):
+        for title, encode in methods.items():
+            best[title] = min(best[title], measure(encode, cases, rounds))
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rnd = random.Random(0)
+    groups: dict[str, list] = {}
+    for name in sorted(dir(commands)):
+        cmd = getattr(commands, name)
+        if not inspect.isclass(cmd) or not hasattr(cmd, "SetDataAttr"):
+            continue
+        struct_type = cmd.SetDataAttr
+        case = (struct_type, sample_kwargs(rnd, struct_type))
+        assert encode_per_field(*case) == encode_struct(*case), name
+        if struct_type._order.codec is None:
+            title = "dynamic"
+        else:
+            fields = len(struct_type._order.names)
+            title = "static 1" if fields == 1 else "static 2-3" if fields < 4 else "static 4+"
+        groups.setdefault(title, []).append(case)
+
+    print(f"best of {args.repeat} x {args.rounds} rounds over {sum(map(len, groups.values()))} request structs")
+    for title in ("static 1", "static 2-3", "static 4+", "dynamic"):
+        cases = groups.get(title, [])
+        count = len(cases) * args.rounds
+        if not count:
+            continue
+        for method, elapsed in best_of(args.repeat, cases, args.rounds).items():
+            print(f"{title:10s} ({len(cases):3d}) {method:10s} {elapsed * 1e3:10.2f} ms {elapsed / count * 1e6:8.2f} us/body")
+
+
+if __name__ == "__main__":
+    main()
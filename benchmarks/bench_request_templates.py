@@ -0,0 +1,60 @@
+"""
+Benchmark of the request encoding for repeated GET queries.
+
+Compares building and encoding a fresh ``Request`` for every ``PR_TOTAL(...).get()``
+against patching the request identifier of the pre-encoded ``get_template()``.
+
+Usage: python benchmarks/bench_request_templates.py [--requests 200000]
+"""
+from __future__ import annotations
+import argparse
+import time
+
+from xoa_driver.internals.commands import PR_TOTAL
+
+
+def encode_fresh(cmd: PR_TOTAL, count: int) -> float:
+    begin = time.perf_counter()
+    for req_id in range(1, count + 1):
+        request = cmd.get().request
+        request.update_identifier(req_id)
+        bytes(request)
+    return time.perf_counter() - begin
+
+
+def encode_template(cmd: PR_TOTAL, count: int) -> float:
+    begin = time.perf_counter()
+    for req_id in range(1, count + 1):
+        request = cmd.get_template().request
+        request.update_identifier(req_id)
+        bytes(request)
+    return time.perf_counter() - begin
+
+
+def encode_template_reused(cmd: PR_TOTAL, count: int) -> float:
+    begin = time.perf_counter()
+    request = cmd.get_template().request
+    for req_id in range(1, count + 1):
+        request.update_identifier(req_id)
+        bytes(request)
+    return time.perf_counter() - begin
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200_000)
+    args = parser.parse_args()
+
+    cmd = PR_TOTAL(None, 0, 0)  # type: ignore[arg-type]
+    cases = (
+        ("get()", encode_fresh),
+        ("get_template()", encode_template),
+        ("reused template", encode_template_reused),
+    )
+    for name, func in cases:
+        elapsed = func(cmd, args.requests)
+        print(f"{name:16s} {args.requests:8d} requests {elapsed * 1e3:10.2f} ms {elapsed / args.requests * 1e9:8.0f} ns/request")
+
+
+if __name__ == "__main__":
+    main()
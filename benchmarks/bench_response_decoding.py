@@ -0,0 +1,57 @@
+"""
+Benchmark of the response body decoding.
+
+Builds PR_TPLDLATENCY reply bodies and measures the time of reading every field
+several times (the way dashboards do), of ``to_tuple`` and of ``to_dict``.
+The per-field column forces the per-field descriptor path of the same struct.
+
+Usage: python benchmarks/bench_response_decoding.py [--replies 20000] [--reads 3]
+"""
+from __future__ import annotations
+import argparse
+import time
+
+from xoa_driver.internals.commands import PR_TPLDLATENCY
+
+
+def read_fields(structs: list, names: tuple[str, ...], reads: int) -> None:
+    for inst in structs:
+        for _ in range(reads):
+            for name in names:
+                getattr(inst, name)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--replies", type=int, default=20_000)
+    parser.add_argument("--reads", type=int, default=3, help="how many times every field is read")
+    args = parser.parse_args()
+
+    struct_type = PR_TPLDLATENCY.GetDataAttr
+    names = struct_type._order.names
+    bodies = [
+        i.to_bytes(4, "big") * (struct_type._order.codec.size // 4)
+        for i in range(args.replies)
+    ]
+
+    def per_field() -> None:
+        structs = [struct_type(body) for body in bodies]
+        for inst in structs:
+            inst._values = ()
+        read_fields(structs, names, args.reads)
+
+    cases = {
+        "per-field": per_field,
+        "decode-once": lambda: read_fields([struct_type(body) for body in bodies], names, args.reads),
+        "to_tuple": lambda: [struct_type(body).to_tuple() for body in bodies],
+        "to_dict": lambda: [struct_type(body).to_dict() for body in bodies],
+    }
+    for title, case in cases.items():
+        begin = time.perf_counter()
+        case()
+        elapsed = time.perf_counter() - begin
+        print(f"{title:12s} {args.replies:8d} replies {elapsed * 1e3:10.2f} ms {elapsed / args.replies * 1e6:8.2f} us/reply")
+
+
+if __name__ == "__main__":
+    main()
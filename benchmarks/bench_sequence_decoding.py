@@ -0,0 +1,95 @@
+"""
+Benchmark of the sequences of a single numeric type, like the samples of an eye diagram.
+
+Decodes the sequence fields of PL1_GET_DATA, PP_EYEREAD and PD_SAMPLES reply bodies
+and encodes the same values, comparing the chunks of ``struct.iter_unpack`` and ``struct.pack``
+used for the sequences of mixed types with the ``array.array`` of the sequences of a single numeric type.
+``to_array`` is the compact decoding of ``utils.to_array``, which doesn't build the list.
+
+Usage: python benchmarks/bench_sequence_decoding.py [--values 2006] [--replies 2000] [--repeat 5]
+"""
+from __future__ import annotations
+import argparse
+import random
+import struct
+import time
+from typing import Any, Callable
+
+from xoa_driver import utils
+from xoa_driver.internals.commands import (
+    PD_SAMPLES,
+    PL1_GET_DATA,
+    PP_EYEREAD,
+)
+from xoa_driver.internals.core.transporter.protocol.payload.field import (
+    FMT_ORDER_NETWORK,
+    SequenceSpec,
+    _prepare_client_chunks,
+)
+from xoa_driver.internals.core.transporter.protocol.payload.utils import flatten
+
+
+def chunks_decode(spec: SequenceSpec, body: memoryview, offset: int) -> list[int]:
+    """The path of the sequences of mixed types: one tuple per value, converted by the chunk types."""
+    to_py = _prepare_client_chunks(int, spec.xmp_type.types_chunk)
+    fmt = spec.format()
+    buff_ = body[offset:]
+    limit = len(buff_) % struct.calcsize(fmt)
+    return to_py(list(struct.iter_unpack(fmt, buff_[:-limit] if limit else buff_)))
+
+
+def chunks_encode(spec: SequenceSpec, values: list[int]) -> bytes:
+    return struct.pack(f"{FMT_ORDER_NETWORK}{spec.xmp_type.data_format * len(values)}", *flatten(values))
+
+
+def best_of(repeat: int, case: Callable[[], Any]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        begin = time.perf_counter()
+        case()
+        best = min(best, time.perf_counter() - begin)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--values", type=int, default=2006, help="values of the sequence in every reply")
+    parser.add_argument("--replies", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rnd = random.Random(0)
+    for cmd, name in ((PL1_GET_DATA, "value"), (PP_EYEREAD, "values"), (PD_SAMPLES, "packet_counts")):
+        struct_type = cmd.GetDataAttr
+        descr = getattr(struct_type, name)
+        spec: SequenceSpec = descr.specs
+        size = struct.calcsize(spec.format())
+        header = bytes(sum(struct.calcsize(c.spec.format()) for c in struct_type._order if c.name != name))
+        bodies = [header + rnd.randbytes(size * args.values) for _ in range(args.replies)]
+        offset = len(header)
+        replies = [struct_type(body) for body in bodies]
+        values = getattr(replies[0], name)
+        assert chunks_decode(spec, replies[0]._buffer, offset) == values == utils.to_array(replies[0], name).tolist()
+        assert chunks_encode(spec, values) == spec.pack_array(values)
+
+        cases = {
+            "chunks decode": lambda: [chunks_decode(spec, r._buffer, offset) for r in replies],
+            "array decode": lambda: [descr.to_py_context(spec.unpack("", r._buffer, offset)) for r in replies],
+            "to_array": lambda: [utils.to_array(r, name) for r in replies],
+            "chunks encode": lambda: [chunks_encode(spec, values) for _ in replies],
+            "array encode": lambda: [spec.pack_array(values) for _ in replies],
+        }
+        print(f"{cmd.__name__}.{name}: {args.values} x {spec.xmp_type.data_format!r}")
+        baseline = {}
+        for title, case in cases.items():
+            elapsed = best_of(args.repeat, case)
+            kind = title.split()[-1] if title != "to_array" else "decode"
+            baseline.setdefault(kind, elapsed)
+            print(
+                f"  {title:14s} {args.replies:6d} replies {elapsed * 1e3:9.2f} ms {elapsed / args.replies * 1e6:9.2f} us/reply"
+                f" {baseline[kind] / elapsed:6.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Microbenchmark of the transport stream readers.
+
+Feeds synthetic multi-packet bursts of PR_TOTAL replies into the legacy ``StreamReader``
+and the ``FramedStreamReader`` and measures the time required to frame every packet.
+
+Usage: python benchmarks/bench_stream_framing.py [--packets 20000] [--segment 65536]
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import time
+
+from xoa_driver.internals.core.transporter._stream import (
+    StreamReader,
+    FramedStreamReader,
+)
+from xoa_driver.internals.core.transporter.protocol.struct_header import ResponseHeader
+from _synthetic import build_burst, split_segments
+
+
+async def drain(reader_type: type, segments: list[bytes]) -> tuple[int, float]:
+    """Deliver one segment per loop iteration, the same way ``data_received`` is called."""
+    reader = reader_type(header_struct=ResponseHeader)
+
+    async def consume() -> int:
+        count = 0
+        async for _ in reader:
+            count += 1
+        return count
+
+    begin = time.perf_counter()
+    consumer = asyncio.create_task(consume())
+    for segment in segments:
+        reader.feed_data(segment)
+        await asyncio.sleep(0)
+    reader.feed_eof()
+    count = await consumer
+    return count, time.perf_counter() - begin
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--packets", type=int, default=20_000)
+    parser.add_argument("--segment", type=int, default=65_536, help="size of a single TCP read in bytes")
+    args = parser.parse_args()
+
+    segments = split_segments(build_burst(args.packets), args.segment)
+    for reader_type in (StreamReader, FramedStreamReader):
+        count, elapsed = asyncio.run(drain(reader_type, segments))
+        print(f"{reader_type.__name__:20s} {count:8d} packets {elapsed * 1e3:10.2f} ms {count / elapsed:14,.0f} pkt/s")
+
+
+if __name__ == "__main__":
+    main()
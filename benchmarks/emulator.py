@@ -0,0 +1,272 @@
+"""
+Emulator of a tester which speaks the binary protocol, the load target of the offline benchmarks.
+
+Every command of the registry is answered: a query with its ``GetDataAttr`` payload, and any other
+request with the OK status. A value which is set is answered to the following queries of the same
+command and indices, if the command sets and gets the same fields. The other payloads are zero filled,
+with the first member in the enum fields without the 0 member, except for the inventory:
+the port counts, the module revisions, the version and the port interfaces.
+The replies are delayed by the ``latency``, and push notifications can be sent to all sessions.
+The revisions which resolve their ports by a queried value, like the Combi modules, need that value in ``values``.
+
+Usage: python benchmarks/emulator.py [--port 22606] [--module Odin-1G-3S-6P] [--latency 0.0] [--push P_TRAFFIC=10]
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import functools
+import re
+import struct
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import Callable
+
+import xoa_driver.modules  # noqa: F401, registers the module revisions
+from xoa_driver.internals import commands
+from xoa_driver.internals.core.transporter import registry
+from xoa_driver.internals.core.transporter.protocol import _constants as const
+from xoa_driver.internals.core.transporter.protocol.struct_header import (
+    ProtocolHeader,
+    ResponseHeader,
+)
+
+from _synthetic import (
+    build_reply,
+    default_payload,
+)
+
+MAX_MODULES = 12
+"""Number of the slots in the port counts of the tester."""
+
+Key = tuple[int, int, int, tuple[int, ...]]
+"""Command code, module index, port index and the indices of a value."""
+
+
+@dataclass
+class Inventory:
+    """Modules of the emulated tester, by the slot."""
+
+    modules: dict[int, str] = field(default_factory=lambda: {0: "Odin-1G-3S-6P"})
+    """Revision of the module in every slot, the number of the ports is taken from the revision."""
+    version: int = 460
+    """Major version of the tester firmware."""
+    interface: str = "SFP+"
+    """Physical interface of all ports."""
+
+    @classmethod
+    def of(cls, *revisions: str, **kwargs) -> Inventory:
+        """Modules in the slots from 0, in the order of the revisions."""
+        return cls(dict(enumerate(revisions)), **kwargs)
+
+    def ports(self, slot: int) -> int:
+        revision = self.modules.get(slot)
+        if revision is None:
+            return 0
+        match = re.search(r"-(\d+)P", revision)
+        return int(match.group(1)) if match else 1
+
+    def defaults(self) -> dict[str, Callable[[int, int], bytes]]:
+        """Payloads of the commands which describe the inventory, by the command name."""
+        return {
+            "C_PORTCOUNTS": lambda m, p: bytes(self.ports(slot) for slot in range(MAX_MODULES)),
+            "C_VERSIONNO": lambda m, p: struct.pack("!ii", self.version, 1),
+            "C_VERSIONNO_MINOR": lambda m, p: struct.pack("!i", 0),
+            "M_REVISION": lambda m, p: self.modules.get(m, "").encode(),
+            "P_INTERFACE": lambda m, p: self.interface.encode(),
+        }
+
+
+def build_status(request_id: int, status: const.CommandStatus, *, module: int, port: int) -> bytes:
+    """Build a COMMAND_STATUS reply packet."""
+    return bytes(
+        ProtocolHeader(
+            magic_word=const.MAGIC_WORD,
+            number_of_indices=0,
+            number_of_value_bytes=0,
+            command_parameter=(const.CommandType.COMMAND_STATUS << 8) | status,
+            module_index=module,
+            port_index=port,
+            request_identifier=request_id,
+        )
+    )
+
+
+_default_payload = functools.lru_cache(maxsize=None)(default_payload)
+"""Payloads of the queries which are not set, by the response body struct."""
+
+
+def _same_fields(cmd_type: type) -> bool:
+    """Whether the set request carries the same fields as the reply of the query."""
+    set_struct = getattr(cmd_type, "SetDataAttr", None)
+    get_struct = getattr(cmd_type, "GetDataAttr", None)
+    return bool(set_struct and get_struct and set_struct._order.names == get_struct._order.names)
+
+
+class _Session(asyncio.Protocol):
+    def __init__(self, emulator: TesterEmulator) -> None:
+        self.emulator = emulator
+        self.buffer = bytearray()
+        self.transport: asyncio.Transport | None = None
+
+    def connection_made(self, transport: asyncio.Transport) -> None:  # type: ignore[override]
+        self.transport = transport
+        self.emulator.sessions.add(self)
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        self.emulator.sessions.discard(self)
+        self.transport = None
+
+    def data_received(self, data: bytes) -> None:
+        self.buffer.extend(data)
+        replies = []
+        offset = 0
+        size = ResponseHeader.size
+        while len(self.buffer) - offset >= size:
+            header = ProtocolHeader.from_buffer_copy(self.buffer, offset)
+            end = offset + size + header.body_size
+            if end > len(self.buffer):
+                break
+            body = bytes(self.buffer[offset + size:end])
+            offset = end
+            replies.append(self.emulator.answer(header, body))
+        del self.buffer[:offset]
+        if replies:
+            self.emulator.send(self, b"".join(replies))
+
+    def write(self, data: bytes) -> None:
+        if self.transport is not None and not self.transport.is_closing():
+            self.transport.write(data)
+
+
+class TesterEmulator:
+    """
+    TCP server which emulates a tester.
+
+    ``requests`` counts the received requests, ``values`` holds the payloads which override the defaults,
+    by the command code, module, port and indices.
+    """
+
+    def __init__(self, inventory: Inventory | None = None, *, latency: float = 0.0, host: str = "127.0.0.1", port: int = 22606) -> None:
+        self.inventory = inventory or Inventory()
+        self.latency = latency
+        self.host = host
+        self.port = port
+        self.requests = 0
+        self.values: dict[Key, bytes] = {}
+        self.sessions: set[_Session] = set()
+        self.__defaults = self.inventory.defaults()
+        self.__server: asyncio.Server | None = None
+        self.__pushers: list[asyncio.Task] = []
+
+    async def start(self) -> int:
+        """Start listening, return the listening port, a free one if the ``port`` is 0."""
+        loop = asyncio.get_running_loop()
+        self.__server = await loop.create_server(lambda: _Session(self), self.host, self.port)
+        self.port = self.__server.sockets[0].getsockname()[1]
+        return self.port
+
+    async def close(self) -> None:
+        for task in self.__pushers:
+            task.cancel()
+        for session in list(self.sessions):
+            if session.transport is not None:
+                session.transport.close()
+        if self.__server is not None:
+            self.__server.close()
+            await self.__server.wait_closed()
+            self.__server = None
+
+    async def __aenter__(self) -> TesterEmulator:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def payload(self, cmd_code: int, module: int, port: int, indices: tuple[int, ...]) -> bytes:
+        """Payload of the reply of the query."""
+        if (value := self.values.get((cmd_code, module, port, indices))) is not None:
+            return value
+        cmd_type = registry.get_command(cmd_code)
+        if default := self.__defaults.get(cmd_type.__name__):
+            return default(module, port)
+        return _default_payload(cmd_type.GetDataAttr)
+
+    def answer(self, header: ProtocolHeader, body: bytes) -> bytes:
+        """Reply packet of the request."""
+        self.requests += 1
+        cmd_code, module, port, request_id = header.cmd_code, header.module_index, header.port_index, header.request_identifier
+        indices = struct.unpack_from(const.indices_format(header.number_of_indices), body)
+        try:
+            cmd_type = registry.get_command(cmd_code)
+        except registry.XmpCmdNotImplemented:
+            return build_status(request_id, const.CommandStatus.BADCOMMAND, module=module, port=port)
+        if header.cmd_type == const.CommandType.COMMAND_QUERY:
+            if not hasattr(cmd_type, "GetDataAttr"):
+                return build_status(request_id, const.CommandStatus.NOTREADABLE, module=module, port=port)
+            return build_reply(cmd_code, request_id, self.payload(cmd_code, module, port, indices), module=module, port=port, indices=indices)
+        if _same_fields(cmd_type):
+            self.values[(cmd_code, module, port, indices)] = body[header.number_of_indices * 4:][:header.number_of_value_bytes]
+        return build_status(request_id, const.CommandStatus.OK, module=module, port=port)
+
+    def send(self, session: _Session, data: bytes) -> None:
+        if self.latency:
+            asyncio.get_running_loop().call_later(self.latency, session.write, data)
+        else:
+            session.write(data)
+
+    def push(self, cmd_code: int, payload: bytes | None = None, *, module: int = 0, port: int = 0) -> None:
+        """Send the push notification of the command to all sessions, with its current payload by default."""
+        payload = self.payload(cmd_code, module, port, ()) if payload is None else payload
+        packet = build_reply(cmd_code, 0, payload, module=module, port=port)
+        for session in self.sessions:
+            session.write(packet)
+
+    def start_pushes(self, cmd_code: int, rate: float, *, module: int = 0, port: int = 0) -> asyncio.Task:
+        """Send ``rate`` push notifications of the command per second, until the emulator is closed."""
+        async def pushing() -> None:
+            while True:
+                await asyncio.sleep(1 / rate)
+                self.push(cmd_code, module=module, port=port)
+
+        task = asyncio.create_task(pushing())
+        self.__pushers.append(task)
+        return task
+
+
+def _parse_push(value: str) -> tuple[int, float]:
+    name, _, rate = value.partition("=")
+    return getattr(commands, name).code, float(rate or 1)
+
+
+async def serve(args: argparse.Namespace) -> None:
+    inventory = Inventory.of(*args.module) if args.module else Inventory()
+    emulator = TesterEmulator(inventory, latency=args.latency, host=args.host, port=args.port)
+    await emulator.start()
+    for cmd_code, rate in args.push:
+        emulator.start_pushes(cmd_code, rate)
+    print(f"Emulating {len(inventory.modules)} modules on {emulator.host}:{emulator.port}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await emulator.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=22606)
+    parser.add_argument("--module", action="append", default=[], metavar="REVISION", help="revision of the next slot, can be repeated")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds the replies are delayed by")
+    parser.add_argument("--push", type=_parse_push, action="append", default=[], metavar="COMMAND=RATE", help="push notifications per second")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
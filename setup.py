@@ -33,6 +33,9 @@ def main():
             "Programming Language :: Python :: 3.14",
         ],
         python_requires=">=3.11",
+        extras_require={
+            "numpy": ["numpy"],
+        },
     )
 
 
@@ -36,9 +36,13 @@ from .internals.core.exceptions import (
     XmpXlsFailedError,
     XmpXlsInvalidError,
     XoaConnectionError,
+    XoaConnectionLostError,
     XoaConnectionTimeoutError,
     XoaException,
     XoaLostFuture,
+    XoaRequestNotReplayedError,
+    XoaRequestTimeoutError,
+    XoaStreamCorruptedError,
 )
 
 __all__ = (
@@ -73,7 +77,11 @@ __all__ = (
     "XmpXlsFailedError",
     "XmpXlsInvalidError",
     "XoaConnectionError",
+    "XoaConnectionLostError",
     "XoaConnectionTimeoutError",
     "XoaException",
     "XoaLostFuture",
+    "XoaRequestNotReplayedError",
+    "XoaRequestTimeoutError",
+    "XoaStreamCorruptedError",
 )
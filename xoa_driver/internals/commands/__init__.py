@@ -3,32 +3,26 @@ Definition of BXMP commands.
 
 All commands in this module are only a stateless declaration of there structures which
 define how they will be converted to binary protocol.
+
+The commands modules are imported only when one of their commands is accessed,
+the generated ``_index`` maps every command to its module.
 """
+from __future__ import annotations
+from importlib import import_module
+from typing import Any
+
+from ._index import NAMES
+
+__all__ = tuple(NAMES)
+
+
+def __getattr__(name: str) -> Any:
+    if (module_name := NAMES.get(name)) is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    command = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = command
+    return command
+
 
-# importing commands subsets
-from .c_commands import *  # noqa: F403,F401
-from .m_commands import *  # noqa: F403,F401
-from .m4_commands import *  # noqa: F403,F401
-from .m4e_commands import *  # noqa: F403,F401
-from .p_commands import *  # noqa: F403,F401
-from .p_macsec_commands import *  # noqa: F403,F401
-from .p_lldp_commands import *  # noqa: F403,F401
-from .p_ue_commands import *  # noqa: F403,F401
-from .p4_commands import *  # noqa: F403,F401
-from .p4e_commands import *  # noqa: F403,F401
-from .p4g_commands import *  # noqa: F403,F401
-from .pc_commands import *  # noqa: F403,F401
-from .pd_commands import *  # noqa: F403,F401
-from .pe_commands import *  # noqa: F403,F401
-from .pec_commands import *  # noqa: F403,F401
-from .ped_commands import *  # noqa: F403,F401
-from .pef_commands import *  # noqa: F403,F401
-from .pf_commands import *  # noqa: F403,F401
-from .pl_commands import *  # noqa: F403,F401
-from .pm_commands import *  # noqa: F403,F401
-from .pp_commands import *  # noqa: F403,F401
-from .pr_commands import *  # noqa: F403,F401
-from .ps_commands import *  # noqa: F403,F401
-from .pt_commands import *  # noqa: F403,F401
-from .px_commands import *  # noqa: F403,F401
-from .pl1_commands import *  # noqa: F403,F401
\ No newline at end of file
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(NAMES))
@@ -0,0 +1,75 @@
+"""
+Generator of the lazy commands index ``_index.py``.
+
+Imports every commands module and writes the name and code of every exported command.
+Run it after a command is added, removed or moved:
+
+    python -m xoa_driver.internals.commands._generate_index
+
+With ``--check`` the index is only compared with the modules, and the exit code is 1 if it is outdated.
+"""
+from __future__ import annotations
+import argparse
+import importlib
+import pathlib
+import sys
+
+from . import _index
+
+INDEX_PATH = pathlib.Path(__file__).with_name("_index.py")
+
+HEADER = '''"""
+Index of the commands, used for importing the commands modules only when a command is accessed.
+
+Generated by ``python -m xoa_driver.internals.commands._generate_index``, do not edit.
+"""
+'''
+
+
+def collect() -> tuple[dict[str, str], dict[int, tuple[str, str]]]:
+    names: dict[str, str] = {}
+    codes: dict[int, tuple[str, str]] = {}
+    for module_name in _index.MODULES:
+        module = importlib.import_module(f"{__package__}.{module_name}")
+        for name in module.__all__:
+            names[name] = module_name
+            codes[getattr(module, name).code] = (module_name, name)
+    return names, codes
+
+
+def render(names: dict[str, str], codes: dict[int, tuple[str, str]]) -> str:
+    lines = [HEADER, ""]
+    lines.append("MODULES = (")
+    lines.extend(f'    "{module_name}",' for module_name in _index.MODULES)
+    lines.append(")")
+    lines.append('"""Modules of the commands."""')
+    lines.append("")
+    lines.append("NAMES: dict[str, str] = {")
+    lines.extend(f'    "{name}": "{module_name}",' for name, module_name in names.items())
+    lines.append("}")
+    lines.append('"""Map the command name to the name of its module."""')
+    lines.append("")
+    lines.append("CODES: dict[int, tuple[str, str]] = {")
+    lines.extend(f'    {code}: ("{module_name}", "{name}"),' for code, (module_name, name) in sorted(codes.items()))
+    lines.append("}")
+    lines.append('"""Map the command code to the name of its module and the command name."""')
+    return "\n".join(lines) + "\n"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--check", action="store_true", help="only check if the index is up to date")
+    args = parser.parse_args()
+
+    content = render(*collect())
+    if args.check:
+        if INDEX_PATH.read_text(encoding="utf-8") != content:
+            print(f"{INDEX_PATH} is outdated, run: python -m {__spec__.name}", file=sys.stderr)
+            return 1
+        return 0
+    INDEX_PATH.write_text(content, encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1636 @@
+"""
+Index of the commands, used for importing the commands modules only when a command is accessed.
+
+Generated by ``python -m xoa_driver.internals.commands._generate_index``, do not edit.
+"""
+
+
+MODULES = (
+    "c_commands",
+    "m_commands",
+    "m4_commands",
+    "m4e_commands",
+    "p_commands",
+    "p_macsec_commands",
+    "p_lldp_commands",
+    "p_ue_commands",
+    "p4_commands",
+    "p4e_commands",
+    "p4g_commands",
+    "pc_commands",
+    "pd_commands",
+    "pe_commands",
+    "pec_commands",
+    "ped_commands",
+    "pef_commands",
+    "pf_commands",
+    "pl_commands",
+    "pm_commands",
+    "pp_commands",
+    "pr_commands",
+    "ps_commands",
+    "pt_commands",
+    "px_commands",
+    "pl1_commands",
+)
+"""Modules of the commands."""
+
+NAMES: dict[str, str] = {
+    "C_BUILDSTRING": "c_commands",
+    "C_CAPABILITIES": "c_commands",
+    "C_COMMENT": "c_commands",
+    "C_DEBUGCMD": "c_commands",
+    "C_DEBUGLOGS": "c_commands",
+    "C_DHCP": "c_commands",
+    "C_DOWN": "c_commands",
+    "C_FILEDATA": "c_commands",
+    "C_FILEFINISH": "c_commands",
+    "C_FILESTART": "c_commands",
+    "C_FLASH": "c_commands",
+    "C_HEALTH": "c_commands",
+    "C_HOSTNAME": "c_commands",
+    "C_INDICES": "c_commands",
+    "C_IPADDRESS": "c_commands",
+    "C_KEEPALIVE": "c_commands",
+    "C_LOG": "c_commands",
+    "C_LOGOFF": "c_commands",
+    "C_LOGON": "c_commands",
+    "C_MACADDRESS": "c_commands",
+    "C_MODEL": "c_commands",
+    "C_MODEL_NAME": "c_commands",
+    "C_MODEL_NUMBER": "c_commands",
+    "C_MULTIUSER": "c_commands",
+    "C_NAME": "c_commands",
+    "C_OWNER": "c_commands",
+    "C_PASSWORD": "c_commands",
+    "C_PORTCOUNTS": "c_commands",
+    "C_PORTERRORS": "c_commands",
+    "C_REMOTEPORTCOUNTS": "c_commands",
+    "C_RESERVATION": "c_commands",
+    "C_RESERVEDBY": "c_commands",
+    "C_RESTCONTROL": "c_commands",
+    "C_RESTENABLE": "c_commands",
+    "C_RESTPORT": "c_commands",
+    "C_RESTSTATUS": "c_commands",
+    "C_SCRIPT": "c_commands",
+    "C_SERIALNO": "c_commands",
+    "C_STATSESSION": "c_commands",
+    "C_TEMPERATURE": "c_commands",
+    "C_TIME": "c_commands",
+    "C_TIMEOUT": "c_commands",
+    "C_TKCONFIG": "c_commands",
+    "C_TKGPSSTATE": "c_commands",
+    "C_TKLICFILE": "c_commands",
+    "C_TKLICSTATE": "c_commands",
+    "C_TKSTATUS": "c_commands",
+    "C_TKSTATUSEXT": "c_commands",
+    "C_TKSVCSTATE": "c_commands",
+    "C_TRAFFIC": "c_commands",
+    "C_TRAFFICSYNC": "c_commands",
+    "C_USED_TPLDID": "c_commands",
+    "C_VERSIONNO": "c_commands",
+    "C_VERSIONNO_MINOR": "c_commands",
+    "C_VERSIONSTR": "c_commands",
+    "C_WATCHDOG": "c_commands",
+    "M_CAPABILITIES": "m_commands",
+    "M_CFPCONFIG": "m_commands",
+    "M_CFPCONFIGEXT": "m_commands",
+    "M_CFPTYPE": "m_commands",
+    "M_CLOCKPPB": "m_commands",
+    "M_CLOCKPPBSWEEP": "m_commands",
+    "M_CLOCKSWEEPSTATUS": "m_commands",
+    "M_CLOCKSYNCSTATUS": "m_commands",
+    "M_COMMENT": "m_commands",
+    "M_EMULBYPASS": "m_commands",
+    "M_FPGAREIMAGE": "m_commands",
+    "M_HEALTH": "m_commands",
+    "M_LATENCYMODE": "m_commands",
+    "M_LICENSE_CWB_DETECTED": "m_commands",
+    "M_LICENSE_DEMO_INFO": "m_commands",
+    "M_LICENSE_LIST_BSON": "m_commands",
+    "M_LICENSE_MAINTENANCE_INFO": "m_commands",
+    "M_LICENSE_ONLINE": "m_commands",
+    "M_LICENSE_UPDATE": "m_commands",
+    "M_LICENSE_UPDATE_STATUS": "m_commands",
+    "M_MEDIA": "m_commands",
+    "M_MEDIASUPPORT": "m_commands",
+    "M_MODEL": "m_commands",
+    "M_MODEL_NAME": "m_commands",
+    "M_MULTIUSER": "m_commands",
+    "M_NAME": "m_commands",
+    "M_PORTCOUNT": "m_commands",
+    "M_RECONFIG_STATUS": "m_commands",
+    "M_RESERVATION": "m_commands",
+    "M_RESERVEDBY": "m_commands",
+    "M_REVISION": "m_commands",
+    "M_SERIALNO": "m_commands",
+    "M_SMAINPUT": "m_commands",
+    "M_SMAOUTPUT": "m_commands",
+    "M_SMASTATUS": "m_commands",
+    "M_STATUS": "m_commands",
+    "M_TIMEADJUSTMENT": "m_commands",
+    "M_TIMESYNC": "m_commands",
+    "M_TXCLOCKFILTER_NEW": "m_commands",
+    "M_TXCLOCKSOURCE_NEW": "m_commands",
+    "M_TXCLOCKSTATUS_NEW": "m_commands",
+    "M_UPGRADE": "m_commands",
+    "M_UPGRADEPAR": "m_commands",
+    "M_UPGRADEPROGRESS": "m_commands",
+    "M_VERSIONNO": "m_commands",
+    "M_VERSIONSTR": "m_commands",
+    "M_SOLUTION_TRACK_INDICES": "m_commands",
+    "M_SOLUTION_TRACK": "m_commands",
+    "M_SOLUTION_TRACK_ENABLE": "m_commands",
+    "M_SOLUTION_TRACK_DEMO_EXP": "m_commands",
+    "M4_CAPTURE_FILE_DELETE": "m4_commands",
+    "M4_CAPTURE_FILE_LIST": "m4_commands",
+    "M4_CAPTURE_FILE_LIST_BSON": "m4_commands",
+    "M4_CAPTURE_SIZE": "m4_commands",
+    "M4_COMPATIBLE_CLIENT_VERSION": "m4_commands",
+    "M4_LICENSE_INFO": "m4_commands",
+    "M4_MEM_INFO": "m4_commands",
+    "M4_REPLAY_FILE_DELETE": "m4_commands",
+    "M4_REPLAY_FILE_LIST": "m4_commands",
+    "M4_REPLAY_FILE_LIST_BSON": "m4_commands",
+    "M4_REPLAY_PARSER_PARAMS": "m4_commands",
+    "M4_REPLAY_PARSE_START": "m4_commands",
+    "M4_REPLAY_PARSE_STATE": "m4_commands",
+    "M4_REPLAY_PARSE_STOP": "m4_commands",
+    "M4_SYSTEMID": "m4_commands",
+    "M4_SYSTEM_STATUS": "m4_commands",
+    "M4_SYSTEM_TIME": "m4_commands",
+    "M4_TIME": "m4_commands",
+    "M4_TLS_CIPHER_SUITES": "m4_commands",
+    "M4_VERSIONNO": "m4_commands",
+    "M4E_MODE": "m4e_commands",
+    "M4E_RESERVE": "m4e_commands",
+    "P_ARPREPLY": "p_commands",
+    "P_ARPRXTABLE": "p_commands",
+    "P_ARPV6REPLY": "p_commands",
+    "P_AUTONEGSELECTION": "p_commands",
+    "P_AUTOTRAIN": "p_commands",
+    "P_BRRMODE": "p_commands",
+    "P_BRRSTATUS": "p_commands",
+    "P_CAPABILITIES": "p_commands",
+    "P_CAPABILITIES_EXT": "p_commands",
+    "P_CAPTURE": "p_commands",
+    "P_CHECKSUM": "p_commands",
+    "P_COMMENT": "p_commands",
+    "P_DYNAMIC": "p_commands",
+    "P_EMULATE": "p_commands",
+    "P_ERRORS": "p_commands",
+    "P_FAULTSIGNALING": "p_commands",
+    "P_FAULTSTATUS": "p_commands",
+    "P_FLASH": "p_commands",
+    "P_GAPMONITOR": "p_commands",
+    "P_IGMPV3_GROUP_RECORD_BUNDLE": "p_commands",
+    "P_INTERFACE": "p_commands",
+    "P_INTERFRAMEGAP": "p_commands",
+    "P_IPADDRESS": "p_commands",
+    "P_IPV6ADDRESS": "p_commands",
+    "P_LATENCYMODE": "p_commands",
+    "P_LATENCYOFFSET": "p_commands",
+    "P_LOADMODE": "p_commands",
+    "P_LOOPBACK": "p_commands",
+    "P_LPENABLE": "p_commands",
+    "P_LPPARTNERAUTONEG": "p_commands",
+    "P_LPRXPOWER": "p_commands",
+    "P_LPSNRMARGIN": "p_commands",
+    "P_LPSTATUS": "p_commands",
+    "P_LPSUPPORT": "p_commands",
+    "P_LPTXMODE": "p_commands",
+    "P_MACADDRESS": "p_commands",
+    "P_MAXHEADERLENGTH": "p_commands",
+    "P_MCSRCLIST": "p_commands",
+    "P_MDIXMODE": "p_commands",
+    "P_MIXLENGTH": "p_commands",
+    "P_MIXWEIGHTS": "p_commands",
+    "P_MULTICAST": "p_commands",
+    "P_MULTICASTEXT": "p_commands",
+    "P_MULTICASTHDR": "p_commands",
+    "P_NDPRXTABLE": "p_commands",
+    "P_PAUSE": "p_commands",
+    "P_PAYLOADMODE": "p_commands",
+    "P_PFCENABLE": "p_commands",
+    "P_PINGREPLY": "p_commands",
+    "P_PINGV6REPLY": "p_commands",
+    "P_RANDOMSEED": "p_commands",
+    "P_RATEFRACTION": "p_commands",
+    "P_RATEL2BPS": "p_commands",
+    "P_RATEPPS": "p_commands",
+    "P_RECEIVESYNC": "p_commands",
+    "P_RESERVATION": "p_commands",
+    "P_RESERVEDBY": "p_commands",
+    "P_RESET": "p_commands",
+    "P_RXPREAMBLE_INSERT": "p_commands",
+    "P_RXRUNTLENGTH": "p_commands",
+    "P_RXRUNTLEN_ERRS": "p_commands",
+    "P_SPEED": "p_commands",
+    "P_SPEEDREDUCTION": "p_commands",
+    "P_SPEEDSELECTION": "p_commands",
+    "P_SPEEDS_SUPPORTED": "p_commands",
+    "P_STATUS": "p_commands",
+    "P_TCVRSTATUS": "p_commands",
+    "P_TPLDMODE": "p_commands",
+    "P_TRAFFIC": "p_commands",
+    "P_TRAFFICERR": "p_commands",
+    "P_TXBURSTPERIOD": "p_commands",
+    "P_TXDELAY": "p_commands",
+    "P_TXENABLE": "p_commands",
+    "P_TXMODE": "p_commands",
+    "P_TXPACKETLIMIT": "p_commands",
+    "P_TXPREAMBLE_REMOVE": "p_commands",
+    "P_TXPREPARE": "p_commands",
+    "P_TXRUNTLENGTH": "p_commands",
+    "P_TXTIME": "p_commands",
+    "P_TXTIMELIMIT": "p_commands",
+    "P_UAT_FLR": "p_commands",
+    "P_UAT_MODE": "p_commands",
+    "P_USED_TPLDID": "p_commands",
+    "P_XMITONE": "p_commands",
+    "P_XMITONETIME": "p_commands",
+    "P_FAULTCNT": "p_commands",
+    "P_EDUN_RX_STATUS": "p_commands",
+    "P_TPLDOFFSET": "p_commands",
+    "P_MACSEC_TXSC_CREATE": "p_macsec_commands",
+    "P_MACSEC_TXSC_INDICES": "p_macsec_commands",
+    "P_MACSEC_TXSC_DELETE": "p_macsec_commands",
+    "P_MACSEC_TXSC_CONF_OFFSET": "p_macsec_commands",
+    "P_MACSEC_TXSC_DESCR": "p_macsec_commands",
+    "P_MACSEC_TXSC_SCI_MODE": "p_macsec_commands",
+    "P_MACSEC_TXSC_SCI": "p_macsec_commands",
+    "P_MACSEC_TXSC_CIPHERSUITE": "p_macsec_commands",
+    "P_MACSEC_TXSC_STARTING_PN": "p_macsec_commands",
+    "P_MACSEC_TXSC_REKEY_MODE": "p_macsec_commands",
+    "P_MACSEC_TXSC_ENCRYPT": "p_macsec_commands",
+    "P_MACSEC_TXSC_SAK_VALUE": "p_macsec_commands",
+    "P_MACSEC_TXSC_XPN_SSCI": "p_macsec_commands",
+    "P_MACSEC_TXSC_XPN_SALT": "p_macsec_commands",
+    "P_MACSEC_RXSC_CREATE": "p_macsec_commands",
+    "P_MACSEC_RXSC_INDICES": "p_macsec_commands",
+    "P_MACSEC_RXSC_DELETE": "p_macsec_commands",
+    "P_MACSEC_RXSC_DESCR": "p_macsec_commands",
+    "P_MACSEC_RXSC_SCI": "p_macsec_commands",
+    "P_MACSEC_RXSC_CONF_OFFSET": "p_macsec_commands",
+    "P_MACSEC_RXSC_CIPHERSUITE": "p_macsec_commands",
+    "P_MACSEC_RXSC_LOWEST_PN": "p_macsec_commands",
+    "P_MACSEC_RXSC_TPLDID": "p_macsec_commands",
+    "P_MACSEC_RXSC_SAK_VALUE": "p_macsec_commands",
+    "P_MACSEC_RXSC_XPN_SSCI": "p_macsec_commands",
+    "P_MACSEC_RXSC_XPN_SALT": "p_macsec_commands",
+    "P_MACSEC_TX_STATS": "p_macsec_commands",
+    "P_MACSEC_TXSC_STATS": "p_macsec_commands",
+    "P_MACSEC_TX_CLEAR": "p_macsec_commands",
+    "P_MACSEC_RX_STATS": "p_macsec_commands",
+    "P_MACSEC_RXSC_STATS": "p_macsec_commands",
+    "P_MACSEC_RX_CLEAR": "p_macsec_commands",
+    "P_MACSEC_RX_ENABLE": "p_macsec_commands",
+    "P_MACSEC_RXSC_AN": "p_macsec_commands",
+    "P_MACSEC_RXSC_NEXT_PN": "p_macsec_commands",
+    "P_MACSEC_TXSC_NEXT_PN": "p_macsec_commands",
+    "P_MACSEC_RXSC_PN": "p_macsec_commands",
+    "P_MACSEC_TXSC_NEXT_AN": "p_macsec_commands",
+    "P_LLDP_CLEAR": "p_lldp_commands",
+    "P_LLDP_CONFIG": "p_lldp_commands",
+    "P_LLDP_CREATE": "p_lldp_commands",
+    "P_LLDP_DATA": "p_lldp_commands",
+    "P_LLDP_DELETE": "p_lldp_commands",
+    "P_LLDP_HEADER": "p_lldp_commands",
+    "P_LLDP_INDICES": "p_lldp_commands",
+    "P_LLDP_NEIGHBORS": "p_lldp_commands",
+    "P_LLDP_OPMODE": "p_lldp_commands",
+    "P_LLDP_STATS": "p_lldp_commands",
+    "P_UE_CTLOS_CLEAR": "p_ue_commands",
+    "P_UE_CTLOS_RX_STATS": "p_ue_commands",
+    "P_UE_CTLOS_TX_STATS": "p_ue_commands",
+    "P_UE_CTLOS_SPACING": "p_ue_commands",
+    "P_UE_CTLOS_TX_INTERVAL": "p_ue_commands",
+    "P_UE_CTLOS_RX_INTERVAL": "p_ue_commands",
+    "P_UE_CTLOS_RX_ERRORS": "p_ue_commands",
+    "P_UE_LINKNEG_OPTIONS": "p_ue_commands",
+    "P_UE_LINKNEG_OPTIONS_STATUS": "p_ue_commands",
+    "P_UE_LLR_MODE": "p_ue_commands",
+    "P_UE_LLR_RX_STATS": "p_ue_commands",
+    "P_UE_LLR_TX_STATS": "p_ue_commands",
+    "P_UE_LLR_REPLAY": "p_ue_commands",
+    "P_UE_LLR_BEHAVIOR": "p_ue_commands",
+    "P_UE_LLR_INIT": "p_ue_commands",
+    "P_UE_LLR_INIT_ECHO": "p_ue_commands",
+    "P_UE_LLR_ACKNACK": "p_ue_commands",
+    "P_UE_LLR_INJECT_ERR": "p_ue_commands",
+    "P_UE_LLR_POISONFCS": "p_ue_commands",
+    "P_UE_LLR_INIT_ECHO_CHK": "p_ue_commands",
+    "P_UE_LLR_TXFSM_STATE": "p_ue_commands",
+    "P_UE_LLR_RXFSM_STATE": "p_ue_commands",
+    "P_UE_LLR_STATUS": "p_ue_commands",
+    "P4_APTITUDES": "p4_commands",
+    "P4_ARP_CONFIG": "p4_commands",
+    "P4_ARP_COUNTERS": "p4_commands",
+    "P4_ARP_RX_COUNTERS": "p4_commands",
+    "P4_ARP_TX_COUNTERS": "p4_commands",
+    "P4_CAPABILITIES": "p4_commands",
+    "P4_CAPTURE": "p4_commands",
+    "P4_CAPTURE_GET_FIRST": "p4_commands",
+    "P4_CAPTURE_GET_NEXT": "p4_commands",
+    "P4_CLEAR": "p4_commands",
+    "P4_CLEAR_COUNTERS": "p4_commands",
+    "P4_DEV_NAME": "p4_commands",
+    "P4_DHCP_CONFIG": "p4_commands",
+    "P4_DHCP_RESULT": "p4_commands",
+    "P4_DHCP_RUN": "p4_commands",
+    "P4_DHCP_STATE": "p4_commands",
+    "P4_DHCP_VLAN": "p4_commands",
+    "P4_ETH_COUNTERS": "p4_commands",
+    "P4_ETH_QUEUE_COUNTERS": "p4_commands",
+    "P4_ETH_RX_COUNTERS": "p4_commands",
+    "P4_ETH_TX_COUNTERS": "p4_commands",
+    "P4_FW_VER": "p4_commands",
+    "P4_ICMP_COUNTERS": "p4_commands",
+    "P4_ICMP_RX_COUNTERS": "p4_commands",
+    "P4_ICMP_TX_COUNTERS": "p4_commands",
+    "P4_IPV4_COUNTERS": "p4_commands",
+    "P4_IPV4_RX_COUNTERS": "p4_commands",
+    "P4_IPV4_TX_COUNTERS": "p4_commands",
+    "P4_IPV6_COUNTERS": "p4_commands",
+    "P4_IPV6_RX_COUNTERS": "p4_commands",
+    "P4_IPV6_TX_COUNTERS": "p4_commands",
+    "P4_LICENSE_INFO": "p4_commands",
+    "P4_MAX_PACKET_RATE": "p4_commands",
+    "P4_NDP_CONFIG": "p4_commands",
+    "P4_NDP_COUNTERS": "p4_commands",
+    "P4_NDP_RX_COUNTERS": "p4_commands",
+    "P4_NDP_TX_COUNTERS": "p4_commands",
+    "P4_PCI_INFO": "p4_commands",
+    "P4_PORT_COUNTERS": "p4_commands",
+    "P4_PORT_RX_COUNTERS": "p4_commands",
+    "P4_PORT_TX_COUNTERS": "p4_commands",
+    "P4_PORT_TYPE": "p4_commands",
+    "P4_RX_MTU": "p4_commands",
+    "P4_RX_PACKET_SIZE": "p4_commands",
+    "P4_SPEEDSELECTION": "p4_commands",
+    "P4_STATE": "p4_commands",
+    "P4_STATE_STATUS": "p4_commands",
+    "P4_TCP_COUNTERS": "p4_commands",
+    "P4_TCP_RX_COUNTERS": "p4_commands",
+    "P4_TCP_TX_COUNTERS": "p4_commands",
+    "P4_TRAFFIC": "p4_commands",
+    "P4_TX_MTU": "p4_commands",
+    "P4_TX_PACKET_SIZE": "p4_commands",
+    "P4_UDP_COUNTERS": "p4_commands",
+    "P4_UDP_RX_COUNTERS": "p4_commands",
+    "P4_UDP_TX_COUNTERS": "p4_commands",
+    "P4_VLAN_OFFLOAD": "p4_commands",
+    "P4E_ALLOCATE": "p4e_commands",
+    "P4E_ALLOCATION_INFO": "p4e_commands",
+    "P4E_ASSIGN": "p4e_commands",
+    "P4E_AVAILABLE": "p4e_commands",
+    "P4G_APP_REPLAY_COUNTERS": "p4g_commands",
+    "P4G_APP_TRANSACTION_COUNTERS": "p4g_commands",
+    "P4G_APP_TRANSACTION_HIST": "p4g_commands",
+    "P4G_CLEAR_COUNTERS": "p4g_commands",
+    "P4G_CLEAR_POST_STAT": "p4g_commands",
+    "P4G_CLIENT_RANGE": "p4g_commands",
+    "P4G_COMMENT": "p4g_commands",
+    "P4G_CREATE": "p4g_commands",
+    "P4G_DELETE": "p4g_commands",
+    "P4G_ENABLE": "p4g_commands",
+    "P4G_INDICES": "p4g_commands",
+    "P4G_IPV4_CLIENT_ADDRESS_POOL": "p4g_commands",
+    "P4G_IPV4_SERVER_ADDRESS_POOL": "p4g_commands",
+    "P4G_IPV6_CLIENT_RANGE": "p4g_commands",
+    "P4G_IPV6_FLOW_LABEL": "p4g_commands",
+    "P4G_IPV6_SERVER_RANGE": "p4g_commands",
+    "P4G_IPV6_TRAFFIC_CLASS": "p4g_commands",
+    "P4G_IP_DS_MASK": "p4g_commands",
+    "P4G_IP_DS_MINMAX": "p4g_commands",
+    "P4G_IP_DS_STEP": "p4g_commands",
+    "P4G_IP_DS_TYPE": "p4g_commands",
+    "P4G_IP_DS_VALUE": "p4g_commands",
+    "P4G_IP_VERSION": "p4g_commands",
+    "P4G_L2_CLIENT_MAC": "p4g_commands",
+    "P4G_L2_GW": "p4g_commands",
+    "P4G_L2_IPV6_GW": "p4g_commands",
+    "P4G_L2_SERVER_MAC": "p4g_commands",
+    "P4G_L2_USE_ADDRESS_RES": "p4g_commands",
+    "P4G_L2_USE_GW": "p4g_commands",
+    "P4G_L4_PROTOCOL": "p4g_commands",
+    "P4G_LP_SHAPE": "p4g_commands",
+    "P4G_LP_TIME_SCALE": "p4g_commands",
+    "P4G_NAT": "p4g_commands",
+    "P4G_PAYLOAD_HIST_CONF": "p4g_commands",
+    "P4G_RAW_BURSTY_CONF": "p4g_commands",
+    "P4G_RAW_BURSTY_TX": "p4g_commands",
+    "P4G_RAW_CLOSE_CONN": "p4g_commands",
+    "P4G_RAW_CONN_INCARNATION": "p4g_commands",
+    "P4G_RAW_CONN_LIFETIME": "p4g_commands",
+    "P4G_RAW_CONN_REPETITIONS": "p4g_commands",
+    "P4G_RAW_DOWNLOAD_REQUEST": "p4g_commands",
+    "P4G_RAW_HAS_DOWNLOAD_REQ": "p4g_commands",
+    "P4G_RAW_PAYLOAD": "p4g_commands",
+    "P4G_RAW_PAYLOAD_REPEAT_LEN": "p4g_commands",
+    "P4G_RAW_PAYLOAD_TOTAL_LEN": "p4g_commands",
+    "P4G_RAW_PAYLOAD_TYPE": "p4g_commands",
+    "P4G_RAW_REQUEST_REPEAT": "p4g_commands",
+    "P4G_RAW_RX_PAYLOAD_LEN": "p4g_commands",
+    "P4G_RAW_TEST_SCENARIO": "p4g_commands",
+    "P4G_RAW_TX_DURING_RAMP": "p4g_commands",
+    "P4G_RAW_TX_TIME_OFFSET": "p4g_commands",
+    "P4G_RAW_UTILIZATION": "p4g_commands",
+    "P4G_RECALC_PAYLOAD_HIST": "p4g_commands",
+    "P4G_RECALC_TIME_HIST": "p4g_commands",
+    "P4G_RECALC_TRANSACTION_HIST": "p4g_commands",
+    "P4G_REPLAY_FILE_CLEAR": "p4g_commands",
+    "P4G_REPLAY_FILE_INDICES": "p4g_commands",
+    "P4G_REPLAY_FILE_NAME": "p4g_commands",
+    "P4G_REPLAY_USER_INCARNATION": "p4g_commands",
+    "P4G_REPLAY_USER_REPETITIONS": "p4g_commands",
+    "P4G_REPLAY_UTILIZATION": "p4g_commands",
+    "P4G_ROLE": "p4g_commands",
+    "P4G_SERVER_RANGE": "p4g_commands",
+    "P4G_TCP_ACK_FREQUENCY": "p4g_commands",
+    "P4G_TCP_ACK_TIMEOUT": "p4g_commands",
+    "P4G_TCP_CLOSE_HIST": "p4g_commands",
+    "P4G_TCP_CONGESTION_MODE": "p4g_commands",
+    "P4G_TCP_DUP_THRES": "p4g_commands",
+    "P4G_TCP_ERROR_COUNTERS": "p4g_commands",
+    "P4G_TCP_ESTABLISH_HIST": "p4g_commands",
+    "P4G_TCP_ICWND_CALC_METHOD": "p4g_commands",
+    "P4G_TCP_ISSTHRESH": "p4g_commands",
+    "P4G_TCP_MSS_MINMAX": "p4g_commands",
+    "P4G_TCP_MSS_TYPE": "p4g_commands",
+    "P4G_TCP_MSS_VALUE": "p4g_commands",
+    "P4G_TCP_RETRANSMIT_COUNTERS": "p4g_commands",
+    "P4G_TCP_RTO": "p4g_commands",
+    "P4G_TCP_RTO_MINMAX": "p4g_commands",
+    "P4G_TCP_RTO_PROLONGED_MODE": "p4g_commands",
+    "P4G_TCP_RTT_VALUE": "p4g_commands",
+    "P4G_TCP_RX_GOOD_BYTES_HIST": "p4g_commands",
+    "P4G_TCP_RX_PACKET_COUNTERS": "p4g_commands",
+    "P4G_TCP_RX_PAYLOAD_COUNTERS": "p4g_commands",
+    "P4G_TCP_RX_TOTAL_BYTES_HIST": "p4g_commands",
+    "P4G_TCP_STATE_CURRENT": "p4g_commands",
+    "P4G_TCP_STATE_RATE": "p4g_commands",
+    "P4G_TCP_STATE_TOTAL": "p4g_commands",
+    "P4G_TCP_SYN_RTO": "p4g_commands",
+    "P4G_TCP_TX_GOOD_BYTES_HIST": "p4g_commands",
+    "P4G_TCP_TX_PACKET_COUNTERS": "p4g_commands",
+    "P4G_TCP_TX_PAYLOAD_COUNTERS": "p4g_commands",
+    "P4G_TCP_TX_TOTAL_BYTES_HIST": "p4g_commands",
+    "P4G_TCP_WINDOW_SCALING": "p4g_commands",
+    "P4G_TCP_WINDOW_SIZE": "p4g_commands",
+    "P4G_TEST_APPLICATION": "p4g_commands",
+    "P4G_TIME_HIST_CONF": "p4g_commands",
+    "P4G_TLS_ALERT_FATAL_COUNTERS": "p4g_commands",
+    "P4G_TLS_ALERT_WARNING_COUNTERS": "p4g_commands",
+    "P4G_TLS_CERTIFICATE_FILENAME": "p4g_commands",
+    "P4G_TLS_CIPHER_SUITES": "p4g_commands",
+    "P4G_TLS_CLOSE_NOTIFY": "p4g_commands",
+    "P4G_TLS_DHPARAMS_FILENAME": "p4g_commands",
+    "P4G_TLS_ENABLE": "p4g_commands",
+    "P4G_TLS_HANDSHAKE_HIST": "p4g_commands",
+    "P4G_TLS_MAX_RECORD_SIZE": "p4g_commands",
+    "P4G_TLS_MIN_REQ_PROTOCOL_VER": "p4g_commands",
+    "P4G_TLS_PRIVATE_KEY_FILENAME": "p4g_commands",
+    "P4G_TLS_PROTOCOL_VER": "p4g_commands",
+    "P4G_TLS_RX_PAYLOAD_BYTES_HIST": "p4g_commands",
+    "P4G_TLS_RX_PAYLOAD_COUNTERS": "p4g_commands",
+    "P4G_TLS_SERVER_NAME": "p4g_commands",
+    "P4G_TLS_STATE_CURRENT": "p4g_commands",
+    "P4G_TLS_STATE_RATE": "p4g_commands",
+    "P4G_TLS_STATE_TOTAL": "p4g_commands",
+    "P4G_TLS_TX_PAYLOAD_BYTES_HIST": "p4g_commands",
+    "P4G_TLS_TX_PAYLOAD_COUNTERS": "p4g_commands",
+    "P4G_TRANSACTION_HIST_CONF": "p4g_commands",
+    "P4G_UDP_PACKET_SIZE_MINMAX": "p4g_commands",
+    "P4G_UDP_PACKET_SIZE_TYPE": "p4g_commands",
+    "P4G_UDP_PACKET_SIZE_VALUE": "p4g_commands",
+    "P4G_UDP_RX_BYTES_HIST": "p4g_commands",
+    "P4G_UDP_RX_PACKET_COUNTERS": "p4g_commands",
+    "P4G_UDP_RX_PAYLOAD_COUNTERS": "p4g_commands",
+    "P4G_UDP_STATE_CURRENT": "p4g_commands",
+    "P4G_UDP_STATE_RATE": "p4g_commands",
+    "P4G_UDP_STATE_TOTAL": "p4g_commands",
+    "P4G_UDP_TX_BYTES_HIST": "p4g_commands",
+    "P4G_UDP_TX_PACKET_COUNTERS": "p4g_commands",
+    "P4G_UDP_TX_PAYLOAD_COUNTERS": "p4g_commands",
+    "P4G_USER_STATE_CURRENT": "p4g_commands",
+    "P4G_USER_STATE_RATE": "p4g_commands",
+    "P4G_USER_STATE_TOTAL": "p4g_commands",
+    "P4G_VLAN_ENABLE": "p4g_commands",
+    "P4G_VLAN_TCI": "p4g_commands",
+    "PC_EXTRA": "pc_commands",
+    "PC_KEEP": "pc_commands",
+    "PC_PACKET": "pc_commands",
+    "PC_STATS": "pc_commands",
+    "PC_TRIGGER": "pc_commands",
+    "PD_CREATE": "pd_commands",
+    "PD_DELETE": "pd_commands",
+    "PD_ENABLE": "pd_commands",
+    "PD_INDICES": "pd_commands",
+    "PD_RANGE": "pd_commands",
+    "PD_SAMPLES": "pd_commands",
+    "PD_SOURCE": "pd_commands",
+    "PE_BANDPOLICER": "pe_commands",
+    "PE_BANDSHAPER": "pe_commands",
+    "PE_CLEAR": "pe_commands",
+    "PE_COMMENT": "pe_commands",
+    "PE_CORRUPT": "pe_commands",
+    "PE_CORTOTAL": "pe_commands",
+    "PE_DROPTOTAL": "pe_commands",
+    "PE_DUPTOTAL": "pe_commands",
+    "PE_FCSDROP": "pe_commands",
+    "PE_FLOWCLEAR": "pe_commands",
+    "PE_FLOWCORTOTAL": "pe_commands",
+    "PE_FLOWDROPTOTAL": "pe_commands",
+    "PE_FLOWDUPTOTAL": "pe_commands",
+    "PE_FLOWJITTERTOTAL": "pe_commands",
+    "PE_FLOWLATENCYTOTAL": "pe_commands",
+    "PE_FLOWMISTOTAL": "pe_commands",
+    "PE_INDICES": "pe_commands",
+    "PE_JITTERTOTAL": "pe_commands",
+    "PE_LATENCYRANGE": "pe_commands",
+    "PE_LATENCYTOTAL": "pe_commands",
+    "PE_MISORDER": "pe_commands",
+    "PE_MISTOTAL": "pe_commands",
+    "PE_TPLDMODE": "pe_commands",
+    "PEC_COMMENT": "pec_commands",
+    "PEC_DELETE": "pec_commands",
+    "PEC_DISTTYPE": "pec_commands",
+    "PEC_INDICES": "pec_commands",
+    "PEC_VAL": "pec_commands",
+    "PED_ACCBURST": "ped_commands",
+    "PED_BER": "ped_commands",
+    "PED_CONST": "ped_commands",
+    "PED_CUST": "ped_commands",
+    "PED_ENABLE": "ped_commands",
+    "PED_FIXED": "ped_commands",
+    "PED_FIXEDBURST": "ped_commands",
+    "PED_GAMMA": "ped_commands",
+    "PED_GAUSS": "ped_commands",
+    "PED_GE": "ped_commands",
+    "PED_OFF": "ped_commands",
+    "PED_ONESHOTSTATUS": "ped_commands",
+    "PED_POISSON": "ped_commands",
+    "PED_RANDOM": "ped_commands",
+    "PED_RANDOMBURST": "ped_commands",
+    "PED_SCHEDULE": "ped_commands",
+    "PED_STEP": "ped_commands",
+    "PED_UNI": "ped_commands",
+    "PEF_ANYCONFIG": "pef_commands",
+    "PEF_ANYSETTINGS": "pef_commands",
+    "PEF_APPLY": "pef_commands",
+    "PEF_CANCEL": "pef_commands",
+    "PEF_ENABLE": "pef_commands",
+    "PEF_ETHDESTADDR": "pef_commands",
+    "PEF_ETHSETTINGS": "pef_commands",
+    "PEF_ETHSRCADDR": "pef_commands",
+    "PEF_INIT": "pef_commands",
+    "PEF_IPV4DESTADDR": "pef_commands",
+    "PEF_IPV4DSCP": "pef_commands",
+    "PEF_IPV4SETTINGS": "pef_commands",
+    "PEF_IPV4SRCADDR": "pef_commands",
+    "PEF_IPV6DESTADDR": "pef_commands",
+    "PEF_IPV6SETTINGS": "pef_commands",
+    "PEF_IPV6SRCADDR": "pef_commands",
+    "PEF_IPV6TC": "pef_commands",
+    "PEF_ISSHADOWDIRTY": "pef_commands",
+    "PEF_L2PUSE": "pef_commands",
+    "PEF_L3USE": "pef_commands",
+    "PEF_MASK": "pef_commands",
+    "PEF_MODE": "pef_commands",
+    "PEF_MPLSLABEL": "pef_commands",
+    "PEF_MPLSSETTINGS": "pef_commands",
+    "PEF_MPLSTOC": "pef_commands",
+    "PEF_PROTOCOL": "pef_commands",
+    "PEF_TCPDESTPORT": "pef_commands",
+    "PEF_TCPSETTINGS": "pef_commands",
+    "PEF_TCPSRCPORT": "pef_commands",
+    "PEF_TPLDCONFIG": "pef_commands",
+    "PEF_TPLDSETTINGS": "pef_commands",
+    "PEF_UDPDESTPORT": "pef_commands",
+    "PEF_UDPSETTINGS": "pef_commands",
+    "PEF_UDPSRCPORT": "pef_commands",
+    "PEF_VALUE": "pef_commands",
+    "PEF_VLANPCP": "pef_commands",
+    "PEF_VLANSETTINGS": "pef_commands",
+    "PEF_VLANTAG": "pef_commands",
+    "PF_COMMENT": "pf_commands",
+    "PF_CONDITION": "pf_commands",
+    "PF_CREATE": "pf_commands",
+    "PF_DELETE": "pf_commands",
+    "PF_ENABLE": "pf_commands",
+    "PF_INDICES": "pf_commands",
+    "PF_STRING": "pf_commands",
+    "PL_CREATE": "pl_commands",
+    "PL_DELETE": "pl_commands",
+    "PL_INDICES": "pl_commands",
+    "PL_LENGTH": "pl_commands",
+    "PM_CREATE": "pm_commands",
+    "PM_DELETE": "pm_commands",
+    "PM_INDICES": "pm_commands",
+    "PM_MATCH": "pm_commands",
+    "PM_POSITION": "pm_commands",
+    "PM_PROTOCOL": "pm_commands",
+    "PP_ALARMS_ERRORS": "pp_commands",
+    "PP_AUTONEG": "pp_commands",
+    "PP_AUTONEGSTATUS": "pp_commands",
+    "PP_EYEBER": "pp_commands",
+    "PP_EYEDWELLBITS": "pp_commands",
+    "PP_EYEINFO": "pp_commands",
+    "PP_EYEMEASURE": "pp_commands",
+    "PP_EYEREAD": "pp_commands",
+    "PP_EYERESOLUTION": "pp_commands",
+    "PP_FECMODE": "pp_commands",
+    "PP_GRAYCODING": "pp_commands",
+    "PP_LINKFLAP_ENABLE": "pp_commands",
+    "PP_LINKFLAP_PARAMS": "pp_commands",
+    "PP_LINKTRAIN": "pp_commands",
+    "PP_LINKTRAINSTATUS": "pp_commands",
+    "PP_PHYAUTONEG": "pp_commands",
+    "PP_PHYAUTOTUNE": "pp_commands",
+    "PP_PHYRETUNE": "pp_commands",
+    "PP_PHYRXEQ": "pp_commands",
+    "PP_PHYRXEQSTATUS_EXT": "pp_commands",
+    "PP_PHYRXEQ_EXT": "pp_commands",
+    "PP_PHYSETTINGS": "pp_commands",
+    "PP_PHYSIGNALSTATUS": "pp_commands",
+    "PP_PHYTXEQ": "pp_commands",
+    "PP_PMAERRPUL_ENABLE": "pp_commands",
+    "PP_PMAERRPUL_PARAMS": "pp_commands",
+    "PP_PRBSTYPE": "pp_commands",
+    "PP_PRECODING": "pp_commands",
+    "PP_PRECODINGSTATUS": "pp_commands",
+    "PP_RXCLEAR": "pp_commands",
+    "PP_RXFECSTATS": "pp_commands",
+    "PP_RXLANEERRORS": "pp_commands",
+    "PP_RXLANELOCK": "pp_commands",
+    "PP_RXLANESTATUS": "pp_commands",
+    "PP_RXLASERPOWER": "pp_commands",
+    "PP_RXPRBSSTATUS": "pp_commands",
+    "PP_RXPRBSTYPE": "pp_commands",
+    "PP_RXTOTALSTATS": "pp_commands",
+    "PP_TXERRORRATE": "pp_commands",
+    "PP_TXINJECTONE": "pp_commands",
+    "PP_TXLANECONFIG": "pp_commands",
+    "PP_TXLANEINJECT": "pp_commands",
+    "PP_TXLASERPOWER": "pp_commands",
+    "PP_TXPRBSCONFIG": "pp_commands",
+    "PP_TXPRBSTYPE": "pp_commands",
+    "PR_CALIBRATE": "pr_commands",
+    "PR_CLEAR": "pr_commands",
+    "PR_EXTRA": "pr_commands",
+    "PR_FILTER": "pr_commands",
+    "PR_FILTEREXT": "pr_commands",
+    "PR_FLOWCLEAR": "pr_commands",
+    "PR_FLOWTOTAL": "pr_commands",
+    "PR_NOTPLD": "pr_commands",
+    "PR_NOTPLDEXT": "pr_commands",
+    "PR_PFCSTATS": "pr_commands",
+    "PR_TOTAL": "pr_commands",
+    "PR_TOTALEXT": "pr_commands",
+    "PR_TPLDERRORS": "pr_commands",
+    "PR_TPLDJITTER": "pr_commands",
+    "PR_TPLDLATENCY": "pr_commands",
+    "PR_TPLDS": "pr_commands",
+    "PR_TPLDTRAFFIC": "pr_commands",
+    "PR_TPLDTRAFFICEXT": "pr_commands",
+    "PR_UAT_STATUS": "pr_commands",
+    "PR_UAT_TIME": "pr_commands",
+    "PS_ARPREQUEST": "ps_commands",
+    "PS_AUTOADJUST": "ps_commands",
+    "PS_BURST": "ps_commands",
+    "PS_BURSTGAP": "ps_commands",
+    "PS_CDFCOUNT": "ps_commands",
+    "PS_CDFDATA": "ps_commands",
+    "PS_CDFOFFSET": "ps_commands",
+    "PS_COMMENT": "ps_commands",
+    "PS_CREATE": "ps_commands",
+    "PS_DELETE": "ps_commands",
+    "PS_ENABLE": "ps_commands",
+    "PS_EXTPAYLOAD": "ps_commands",
+    "PS_HEADERPROTOCOL": "ps_commands",
+    "PS_INDICES": "ps_commands",
+    "PS_INJECTFCSERR": "ps_commands",
+    "PS_INJECTMISERR": "ps_commands",
+    "PS_INJECTPLDERR": "ps_commands",
+    "PS_INJECTSEQERR": "ps_commands",
+    "PS_INJECTTPLDERR": "ps_commands",
+    "PS_INSERTFCS": "ps_commands",
+    "PS_IPV4GATEWAY": "ps_commands",
+    "PS_IPV6GATEWAY": "ps_commands",
+    "PS_MACSEC_ASSIGN": "ps_commands",
+    "PS_MACSEC_ENABLE": "ps_commands",
+    "PS_MODIFIER": "ps_commands",
+    "PS_MODIFIERCOUNT": "ps_commands",
+    "PS_MODIFIEREXT": "ps_commands",
+    "PS_MODIFIEREXTCOUNT": "ps_commands",
+    "PS_MODIFIEREXTRANGE": "ps_commands",
+    "PS_MODIFIERRANGE": "ps_commands",
+    "PS_MODIFIER_ENDIAN": "ps_commands",
+    "PS_OPTIONS": "ps_commands",
+    "PS_PACKETHEADER": "ps_commands",
+    "PS_PACKETLENGTH": "ps_commands",
+    "PS_PACKETLIMIT": "ps_commands",
+    "PS_PAYLOAD": "ps_commands",
+    "PS_PFCPRIORITY": "ps_commands",
+    "PS_PINGREQUEST": "ps_commands",
+    "PS_RATEFRACTION": "ps_commands",
+    "PS_RATEL2BPS": "ps_commands",
+    "PS_RATEPPS": "ps_commands",
+    "PS_TPLDID": "ps_commands",
+    "PS_UE_LLR_DESIRE": "ps_commands",
+    "PT_CLEAR": "pt_commands",
+    "PT_EXTRA": "pt_commands",
+    "PT_FLOWCLEAR": "pt_commands",
+    "PT_FLOWTOTAL": "pt_commands",
+    "PT_NOTPLD": "pt_commands",
+    "PT_NOTPLDEXT": "pt_commands",
+    "PT_STREAM": "pt_commands",
+    "PT_STREAMEXT": "pt_commands",
+    "PT_TOTAL": "pt_commands",
+    "PT_TOTALEXT": "pt_commands",
+    "PX_CDB_ABORT_FW_DOWNLOAD": "px_commands",
+    "PX_CDB_ABORT_PROCESSING": "px_commands",
+    "PX_CDB_CHANGE_PASSWORD": "px_commands",
+    "PX_CDB_COMMIT_FW_IMAGE": "px_commands",
+    "PX_CDB_COMPLETE_FW_DOWNLOAD": "px_commands",
+    "PX_CDB_COPY_FW_IMAGE": "px_commands",
+    "PX_CDB_ENTER_PASSWORD": "px_commands",
+    "PX_CDB_EXTERNAL_FEATURES": "px_commands",
+    "PX_CDB_FW_MGMT_FEATURES": "px_commands",
+    "PX_CDB_GET_APP_ATTRIBUTES": "px_commands",
+    "PX_CDB_GET_FW_INFO": "px_commands",
+    "PX_CDB_GET_IF_CODE_DESCR": "px_commands",
+    "PX_CDB_MODULE_FEATURES": "px_commands",
+    "PX_CDB_QUERY_STATUS": "px_commands",
+    "PX_CDB_READ_FW_BLOCK_EPL": "px_commands",
+    "PX_CDB_READ_FW_BLOCK_LPL": "px_commands",
+    "PX_CDB_RUN_FW_IMAGE": "px_commands",
+    "PX_CDB_SEC_FEAT_CAPABILITIES": "px_commands",
+    "PX_CDB_START_FW_DOWNLOAD": "px_commands",
+    "PX_CDB_SUPPORT": "px_commands",
+    "PX_CDB_WRITE_FW_BLOCK_EPL": "px_commands",
+    "PX_CDB_WRITE_FW_BLOCK_LPL": "px_commands",
+    "PX_CUST_CMD": "px_commands",
+    "PX_I2C_CONFIG": "px_commands",
+    "PX_MII": "px_commands",
+    "PX_RW": "px_commands",
+    "PX_RW_SEQ": "px_commands",
+    "PX_RW_SEQ_BANK": "px_commands",
+    "PX_TEMPERATURE": "px_commands",
+    "PL1_ANLT": "pl1_commands",
+    "PL1_AUTONEGINFO": "pl1_commands",
+    "PL1_AUTONEG_ABILITIES": "pl1_commands",
+    "PL1_AUTONEG_CONFIG": "pl1_commands",
+    "PL1_AUTONEG_STATUS": "pl1_commands",
+    "PL1_CFG_TMP": "pl1_commands",
+    "PL1_CTRL": "pl1_commands",
+    "PL1_CWE_BIT_ERR_MASK": "pl1_commands",
+    "PL1_CWE_CONTROL": "pl1_commands",
+    "PL1_CWE_CYCLE": "pl1_commands",
+    "PL1_CWE_ERR_SYM_INDICES": "pl1_commands",
+    "PL1_CWE_FEC_ENGINE": "pl1_commands",
+    "PL1_CWE_FEC_STATS": "pl1_commands",
+    "PL1_CWE_FEC_STATS_CLEAR": "pl1_commands",
+    "PL1_GET_DATA": "pl1_commands",
+    "PL1_LINKTRAININFO": "pl1_commands",
+    "PL1_LINKTRAIN_CMD": "pl1_commands",
+    "PL1_LINKTRAIN_CONFIG": "pl1_commands",
+    "PL1_LINKTRAIN_STATUS": "pl1_commands",
+    "PL1_LOG": "pl1_commands",
+    "PL1_LT_PHYTXEQ_RANGE": "pl1_commands",
+    "PL1_LT_PHYTXEQ_RANGE_COEFF": "pl1_commands",
+    "PL1_PCS_VARIANT": "pl1_commands",
+    "PL1_PHYTXEQ": "pl1_commands",
+    "PL1_PHYTXEQ_COEFF": "pl1_commands",
+    "PL1_PHYTXEQ_LEVEL": "pl1_commands",
+    "PL1_PNSWAP_RX": "pl1_commands",
+    "PL1_PNSWAP_TX": "pl1_commands",
+    "PL1_PRESET_CONFIG": "pl1_commands",
+    "PL1_PRESET_CONFIG_COEFF": "pl1_commands",
+    "PL1_PRESET_CONFIG_LEVEL": "pl1_commands",
+    "PL1_PRESET_RESET": "pl1_commands",
+    "PL1_CDRLOL_STATUS": "pl1_commands",
+    "PL1_LOA_STATUS": "pl1_commands",
+    "PL1_HIBER_STATUS": "pl1_commands",
+    "PL1_HISER_STATUS": "pl1_commands",
+    "PL1_HISER_ALARM": "pl1_commands",
+    "PL1_DEGSER_STATUS": "pl1_commands",
+    "PL1_DEGSER_THRESH": "pl1_commands",
+    "PL1_LINKDOWN_STATUS": "pl1_commands",
+    "PL1_RX_CNT": "pl1_commands",
+    "PL1_INJECT_ERR": "pl1_commands",
+    "PL1_CLEAR": "pl1_commands",
+    "PL1_RX_FREQ": "pl1_commands",
+    "PL1_TX_FREQ": "pl1_commands",
+    "PL1_RX_DATARATE": "pl1_commands",
+    "PL1_TX_DATARATE": "pl1_commands",
+    "PL1_RX_PPM": "pl1_commands",
+    "PL1_TX_PPM": "pl1_commands",
+    "PL1_INJECT_ERR_CNT": "pl1_commands",
+    "PL1_PCSL_LOA_STATUS": "pl1_commands",
+    "PL1_PCSL_AM_CORR": "pl1_commands",
+    "PL1_PCSL_INJECT_ERR": "pl1_commands",
+    "PL1_PCSL_INJECT_ERR_CNT": "pl1_commands",
+}
+"""Map the command name to the name of its module."""
+
+CODES: dict[int, tuple[str, str]] = {
+    1: ("c_commands", "C_LOGON"),
+    2: ("c_commands", "C_OWNER"),
+    3: ("c_commands", "C_KEEPALIVE"),
+    4: ("c_commands", "C_TIMEOUT"),
+    5: ("c_commands", "C_RESERVATION"),
+    6: ("c_commands", "C_RESERVEDBY"),
+    7: ("c_commands", "C_LOGOFF"),
+    8: ("c_commands", "C_DOWN"),
+    9: ("c_commands", "C_CAPABILITIES"),
+    10: ("c_commands", "C_MODEL"),
+    11: ("c_commands", "C_SERIALNO"),
+    12: ("c_commands", "C_VERSIONNO"),
+    13: ("c_commands", "C_PORTCOUNTS"),
+    16: ("c_commands", "C_PORTERRORS"),
+    17: ("c_commands", "C_REMOTEPORTCOUNTS"),
+    19: ("c_commands", "C_BUILDSTRING"),
+    20: ("c_commands", "C_NAME"),
+    21: ("c_commands", "C_COMMENT"),
+    22: ("c_commands", "C_PASSWORD"),
+    23: ("c_commands", "C_VERSIONSTR"),
+    24: ("c_commands", "C_IPADDRESS"),
+    25: ("c_commands", "C_DHCP"),
+    26: ("c_commands", "C_MACADDRESS"),
+    27: ("c_commands", "C_HOSTNAME"),
+    28: ("c_commands", "C_FLASH"),
+    30: ("c_commands", "C_DEBUGLOGS"),
+    31: ("c_commands", "C_TEMPERATURE"),
+    32: ("c_commands", "C_RESTPORT"),
+    33: ("c_commands", "C_RESTENABLE"),
+    34: ("c_commands", "C_RESTCONTROL"),
+    35: ("c_commands", "C_RESTSTATUS"),
+    36: ("c_commands", "C_WATCHDOG"),
+    37: ("c_commands", "C_DEBUGCMD"),
+    40: ("c_commands", "C_INDICES"),
+    41: ("c_commands", "C_STATSESSION"),
+    44: ("c_commands", "C_USED_TPLDID"),
+    47: ("c_commands", "C_HEALTH"),
+    49: ("c_commands", "C_TKLICFILE"),
+    50: ("c_commands", "C_TKLICSTATE"),
+    51: ("c_commands", "C_FILESTART"),
+    52: ("c_commands", "C_FILEDATA"),
+    53: ("c_commands", "C_FILEFINISH"),
+    55: ("c_commands", "C_TRAFFIC"),
+    56: ("c_commands", "C_VERSIONNO_MINOR"),
+    62: ("c_commands", "C_MULTIUSER"),
+    63: ("c_commands", "C_LOG"),
+    64: ("c_commands", "C_SCRIPT"),
+    65: ("c_commands", "C_TKSTATUS"),
+    66: ("c_commands", "C_TKSVCSTATE"),
+    67: ("c_commands", "C_TKCONFIG"),
+    68: ("c_commands", "C_TKGPSSTATE"),
+    69: ("c_commands", "C_TIME"),
+    70: ("c_commands", "C_TRAFFICSYNC"),
+    71: ("c_commands", "C_TKSTATUSEXT"),
+    72: ("m_commands", "M_RESERVATION"),
+    73: ("m_commands", "M_RESERVEDBY"),
+    75: ("m_commands", "M_MODEL"),
+    76: ("m_commands", "M_SERIALNO"),
+    77: ("m_commands", "M_VERSIONNO"),
+    79: ("m_commands", "M_STATUS"),
+    80: ("m_commands", "M_PORTCOUNT"),
+    81: ("m_commands", "M_UPGRADE"),
+    82: ("m_commands", "M_UPGRADEPROGRESS"),
+    83: ("m_commands", "M_TIMESYNC"),
+    84: ("m_commands", "M_CFPTYPE"),
+    85: ("m_commands", "M_CFPCONFIG"),
+    86: ("m_commands", "M_COMMENT"),
+    87: ("m_commands", "M_UPGRADEPAR"),
+    88: ("m_commands", "M_TIMEADJUSTMENT"),
+    89: ("m_commands", "M_CAPABILITIES"),
+    90: ("m_commands", "M_MEDIASUPPORT"),
+    91: ("m_commands", "M_FPGAREIMAGE"),
+    92: ("m_commands", "M_MULTIUSER"),
+    93: ("m_commands", "M_CFPCONFIGEXT"),
+    94: ("m_commands", "M_CLOCKPPB"),
+    95: ("m_commands", "M_SMAINPUT"),
+    96: ("m_commands", "M_SMAOUTPUT"),
+    97: ("m_commands", "M_SMASTATUS"),
+    99: ("m_commands", "M_NAME"),
+    100: ("m_commands", "M_REVISION"),
+    101: ("m_commands", "M_VERSIONSTR"),
+    102: ("p_commands", "P_RESERVATION"),
+    103: ("p_commands", "P_RESERVEDBY"),
+    104: ("p_commands", "P_RESET"),
+    106: ("p_commands", "P_CAPABILITIES"),
+    107: ("p_commands", "P_INTERFACE"),
+    109: ("p_commands", "P_SPEEDSELECTION"),
+    110: ("p_commands", "P_SPEED"),
+    111: ("p_commands", "P_RECEIVESYNC"),
+    112: ("p_commands", "P_COMMENT"),
+    113: ("p_commands", "P_SPEEDREDUCTION"),
+    114: ("p_commands", "P_INTERFRAMEGAP"),
+    116: ("p_commands", "P_MACADDRESS"),
+    117: ("p_commands", "P_IPADDRESS"),
+    118: ("p_commands", "P_ARPREPLY"),
+    119: ("p_commands", "P_PINGREPLY"),
+    120: ("p_commands", "P_PAUSE"),
+    121: ("p_commands", "P_RANDOMSEED"),
+    122: ("p_commands", "P_LOOPBACK"),
+    123: ("p_commands", "P_FLASH"),
+    124: ("p_commands", "P_TRAFFIC"),
+    125: ("p_commands", "P_CAPTURE"),
+    126: ("p_commands", "P_XMITONE"),
+    127: ("p_commands", "P_LATENCYOFFSET"),
+    128: ("p_commands", "P_LATENCYMODE"),
+    129: ("p_commands", "P_AUTOTRAIN"),
+    138: ("p_commands", "P_UAT_MODE"),
+    139: ("p_commands", "P_UAT_FLR"),
+    140: ("pd_commands", "PD_INDICES"),
+    141: ("pd_commands", "PD_CREATE"),
+    142: ("pd_commands", "PD_DELETE"),
+    143: ("pd_commands", "PD_ENABLE"),
+    144: ("pd_commands", "PD_SOURCE"),
+    145: ("pd_commands", "PD_RANGE"),
+    146: ("pd_commands", "PD_SAMPLES"),
+    150: ("ps_commands", "PS_INDICES"),
+    151: ("ps_commands", "PS_CREATE"),
+    152: ("ps_commands", "PS_DELETE"),
+    153: ("ps_commands", "PS_ENABLE"),
+    154: ("ps_commands", "PS_PACKETLIMIT"),
+    155: ("ps_commands", "PS_COMMENT"),
+    157: ("ps_commands", "PS_TPLDID"),
+    158: ("ps_commands", "PS_INSERTFCS"),
+    159: ("ps_commands", "PS_AUTOADJUST"),
+    161: ("ps_commands", "PS_ARPREQUEST"),
+    162: ("ps_commands", "PS_PINGREQUEST"),
+    166: ("ps_commands", "PS_MODIFIER_ENDIAN"),
+    167: ("ps_commands", "PS_MODIFIEREXTRANGE"),
+    168: ("ps_commands", "PS_MODIFIERRANGE"),
+    169: ("ps_commands", "PS_RATEFRACTION"),
+    170: ("ps_commands", "PS_RATEPPS"),
+    171: ("ps_commands", "PS_RATEL2BPS"),
+    174: ("ps_commands", "PS_BURST"),
+    175: ("ps_commands", "PS_PACKETHEADER"),
+    176: ("ps_commands", "PS_HEADERPROTOCOL"),
+    177: ("ps_commands", "PS_MODIFIERCOUNT"),
+    178: ("ps_commands", "PS_MODIFIER"),
+    179: ("ps_commands", "PS_PACKETLENGTH"),
+    180: ("ps_commands", "PS_PAYLOAD"),
+    181: ("ps_commands", "PS_IPV4GATEWAY"),
+    182: ("ps_commands", "PS_IPV6GATEWAY"),
+    183: ("ps_commands", "PS_BURSTGAP"),
+    185: ("ps_commands", "PS_INJECTFCSERR"),
+    186: ("ps_commands", "PS_INJECTSEQERR"),
+    187: ("ps_commands", "PS_INJECTMISERR"),
+    188: ("ps_commands", "PS_INJECTPLDERR"),
+    189: ("ps_commands", "PS_INJECTTPLDERR"),
+    190: ("ps_commands", "PS_MODIFIEREXT"),
+    191: ("ps_commands", "PS_MODIFIEREXTCOUNT"),
+    192: ("p_commands", "P_MIXWEIGHTS"),
+    194: ("p_commands", "P_MDIXMODE"),
+    195: ("ps_commands", "PS_CDFOFFSET"),
+    196: ("ps_commands", "PS_CDFCOUNT"),
+    197: ("ps_commands", "PS_CDFDATA"),
+    198: ("p_commands", "P_TRAFFICERR"),
+    199: ("ps_commands", "PS_EXTPAYLOAD"),
+    200: ("pm_commands", "PM_INDICES"),
+    201: ("pm_commands", "PM_CREATE"),
+    202: ("pm_commands", "PM_DELETE"),
+    203: ("pm_commands", "PM_PROTOCOL"),
+    204: ("pm_commands", "PM_POSITION"),
+    205: ("pm_commands", "PM_MATCH"),
+    207: ("pl_commands", "PL_INDICES"),
+    208: ("pl_commands", "PL_CREATE"),
+    209: ("pl_commands", "PL_DELETE"),
+    210: ("pl_commands", "PL_LENGTH"),
+    211: ("pf_commands", "PF_INDICES"),
+    212: ("pf_commands", "PF_CREATE"),
+    213: ("pf_commands", "PF_DELETE"),
+    214: ("pf_commands", "PF_ENABLE"),
+    215: ("pf_commands", "PF_COMMENT"),
+    216: ("pf_commands", "PF_CONDITION"),
+    217: ("pf_commands", "PF_STRING"),
+    219: ("ps_commands", "PS_PFCPRIORITY"),
+    220: ("ps_commands", "PS_OPTIONS"),
+    221: ("pc_commands", "PC_TRIGGER"),
+    222: ("pc_commands", "PC_KEEP"),
+    224: ("pc_commands", "PC_STATS"),
+    225: ("pc_commands", "PC_EXTRA"),
+    226: ("pc_commands", "PC_PACKET"),
+    230: ("pt_commands", "PT_TOTAL"),
+    231: ("pt_commands", "PT_NOTPLD"),
+    232: ("pt_commands", "PT_STREAM"),
+    233: ("pt_commands", "PT_CLEAR"),
+    235: ("pt_commands", "PT_EXTRA"),
+    236: ("pt_commands", "PT_TOTALEXT"),
+    237: ("pt_commands", "PT_NOTPLDEXT"),
+    238: ("pt_commands", "PT_STREAMEXT"),
+    239: ("pr_commands", "PR_TPLDJITTER"),
+    240: ("pr_commands", "PR_TOTAL"),
+    241: ("pr_commands", "PR_NOTPLD"),
+    242: ("pr_commands", "PR_EXTRA"),
+    243: ("pr_commands", "PR_TPLDS"),
+    244: ("pr_commands", "PR_TPLDTRAFFIC"),
+    245: ("pr_commands", "PR_TPLDERRORS"),
+    246: ("pr_commands", "PR_TPLDLATENCY"),
+    247: ("pr_commands", "PR_FILTER"),
+    248: ("pr_commands", "PR_CLEAR"),
+    249: ("pr_commands", "PR_CALIBRATE"),
+    252: ("pr_commands", "PR_UAT_STATUS"),
+    256: ("pr_commands", "PR_UAT_TIME"),
+    257: ("pr_commands", "PR_TOTALEXT"),
+    258: ("pr_commands", "PR_NOTPLDEXT"),
+    259: ("pr_commands", "PR_TPLDTRAFFICEXT"),
+    260: ("pr_commands", "PR_FILTEREXT"),
+    270: ("pp_commands", "PP_RXTOTALSTATS"),
+    271: ("pp_commands", "PP_RXLANEERRORS"),
+    272: ("pp_commands", "PP_ALARMS_ERRORS"),
+    280: ("pp_commands", "PP_TXLANECONFIG"),
+    281: ("pp_commands", "PP_TXLANEINJECT"),
+    282: ("pp_commands", "PP_TXPRBSCONFIG"),
+    283: ("pp_commands", "PP_TXERRORRATE"),
+    284: ("pp_commands", "PP_TXINJECTONE"),
+    286: ("pp_commands", "PP_RXFECSTATS"),
+    287: ("pp_commands", "PP_LINKFLAP_PARAMS"),
+    288: ("pp_commands", "PP_LINKFLAP_ENABLE"),
+    289: ("pp_commands", "PP_PMAERRPUL_PARAMS"),
+    290: ("pp_commands", "PP_RXLANELOCK"),
+    291: ("pp_commands", "PP_RXLANESTATUS"),
+    293: ("pp_commands", "PP_RXPRBSSTATUS"),
+    294: ("pp_commands", "PP_RXCLEAR"),
+    295: ("pp_commands", "PP_RXLASERPOWER"),
+    296: ("pp_commands", "PP_TXLASERPOWER"),
+    300: ("pp_commands", "PP_PMAERRPUL_ENABLE"),
+    301: ("p_commands", "P_GAPMONITOR"),
+    302: ("p_commands", "P_CHECKSUM"),
+    303: ("p_commands", "P_STATUS"),
+    304: ("p_commands", "P_AUTONEGSELECTION"),
+    305: ("p_commands", "P_MIXLENGTH"),
+    308: ("p_commands", "P_ARPRXTABLE"),
+    309: ("p_commands", "P_NDPRXTABLE"),
+    311: ("p_commands", "P_MULTICAST"),
+    312: ("p_commands", "P_MULTICASTEXT"),
+    313: ("p_commands", "P_MCSRCLIST"),
+    314: ("p_commands", "P_MULTICASTHDR"),
+    315: ("p_commands", "P_IGMPV3_GROUP_RECORD_BUNDLE"),
+    319: ("p_commands", "P_USED_TPLDID"),
+    320: ("p_commands", "P_TXMODE"),
+    321: ("p_commands", "P_RATEFRACTION"),
+    322: ("p_commands", "P_RATEPPS"),
+    323: ("p_commands", "P_RATEL2BPS"),
+    324: ("p_commands", "P_PAYLOADMODE"),
+    326: ("p_commands", "P_BRRMODE"),
+    327: ("p_commands", "P_TXENABLE"),
+    328: ("p_commands", "P_MAXHEADERLENGTH"),
+    329: ("p_commands", "P_TXTIMELIMIT"),
+    330: ("p_commands", "P_TXTIME"),
+    331: ("p_commands", "P_XMITONETIME"),
+    332: ("p_commands", "P_IPV6ADDRESS"),
+    333: ("p_commands", "P_ARPV6REPLY"),
+    334: ("p_commands", "P_PINGV6REPLY"),
+    335: ("p_commands", "P_ERRORS"),
+    336: ("p_commands", "P_TXPREPARE"),
+    337: ("p_commands", "P_TXDELAY"),
+    338: ("p_commands", "P_FAULTCNT"),
+    339: ("p_commands", "P_TPLDOFFSET"),
+    340: ("p_commands", "P_LPENABLE"),
+    341: ("p_commands", "P_LPTXMODE"),
+    342: ("m_commands", "M_MEDIA"),
+    343: ("p_commands", "P_LPSTATUS"),
+    345: ("p_commands", "P_LPPARTNERAUTONEG"),
+    346: ("p_commands", "P_LPSNRMARGIN"),
+    347: ("p_commands", "P_LPRXPOWER"),
+    348: ("p_commands", "P_FAULTSIGNALING"),
+    349: ("p_commands", "P_FAULTSTATUS"),
+    350: ("p_commands", "P_TPLDMODE"),
+    351: ("p_commands", "P_LPSUPPORT"),
+    352: ("p_commands", "P_TXPACKETLIMIT"),
+    353: ("pp_commands", "PP_EYEMEASURE"),
+    354: ("pp_commands", "PP_EYERESOLUTION"),
+    355: ("pp_commands", "PP_EYEREAD"),
+    356: ("pp_commands", "PP_EYEINFO"),
+    357: ("p_commands", "P_TCVRSTATUS"),
+    358: ("pp_commands", "PP_PHYTXEQ"),
+    359: ("pp_commands", "PP_PHYRETUNE"),
+    360: ("pp_commands", "PP_PHYAUTOTUNE"),
+    361: ("pp_commands", "PP_EYEBER"),
+    362: ("pp_commands", "PP_PHYAUTONEG"),
+    364: ("pp_commands", "PP_TXPRBSTYPE"),
+    365: ("pp_commands", "PP_RXPRBSTYPE"),
+    366: ("pp_commands", "PP_FECMODE"),
+    367: ("pp_commands", "PP_EYEDWELLBITS"),
+    368: ("p_commands", "P_DYNAMIC"),
+    370: ("m_commands", "M_CLOCKSYNCSTATUS"),
+    373: ("p_commands", "P_PFCENABLE"),
+    374: ("pr_commands", "PR_PFCSTATS"),
+    375: ("pp_commands", "PP_PHYSIGNALSTATUS"),
+    377: ("p_commands", "P_TXBURSTPERIOD"),
+    378: ("pp_commands", "PP_PRBSTYPE"),
+    379: ("pp_commands", "PP_PHYSETTINGS"),
+    380: ("pp_commands", "PP_PHYRXEQ"),
+    381: ("pp_commands", "PP_AUTONEG"),
+    382: ("pp_commands", "PP_AUTONEGSTATUS"),
+    383: ("pp_commands", "PP_LINKTRAIN"),
+    384: ("pp_commands", "PP_LINKTRAINSTATUS"),
+    385: ("pl1_commands", "PL1_AUTONEGINFO"),
+    386: ("pl1_commands", "PL1_LINKTRAININFO"),
+    387: ("pl1_commands", "PL1_LOG"),
+    388: ("pl1_commands", "PL1_CFG_TMP"),
+    389: ("pl1_commands", "PL1_LINKTRAIN_CMD"),
+    390: ("p_commands", "P_TXRUNTLENGTH"),
+    391: ("p_commands", "P_RXRUNTLENGTH"),
+    392: ("p_commands", "P_RXRUNTLEN_ERRS"),
+    393: ("p_commands", "P_TXPREAMBLE_REMOVE"),
+    394: ("p_commands", "P_RXPREAMBLE_INSERT"),
+    395: ("p_commands", "P_LOADMODE"),
+    396: ("p_commands", "P_SPEEDS_SUPPORTED"),
+    397: ("pp_commands", "PP_PHYRXEQ_EXT"),
+    398: ("pp_commands", "PP_PHYRXEQSTATUS_EXT"),
+    399: ("m_commands", "M_RECONFIG_STATUS"),
+    400: ("m_commands", "M_LICENSE_DEMO_INFO"),
+    401: ("m_commands", "M_LICENSE_MAINTENANCE_INFO"),
+    402: ("m_commands", "M_LICENSE_CWB_DETECTED"),
+    403: ("m_commands", "M_LICENSE_UPDATE"),
+    404: ("m_commands", "M_LICENSE_UPDATE_STATUS"),
+    405: ("m_commands", "M_LICENSE_LIST_BSON"),
+    406: ("m_commands", "M_LICENSE_ONLINE"),
+    410: ("m_commands", "M_TXCLOCKSOURCE_NEW"),
+    411: ("m_commands", "M_TXCLOCKSTATUS_NEW"),
+    412: ("m_commands", "M_TXCLOCKFILTER_NEW"),
+    413: ("m_commands", "M_CLOCKPPBSWEEP"),
+    414: ("m_commands", "M_CLOCKSWEEPSTATUS"),
+    417: ("pl1_commands", "PL1_LT_PHYTXEQ_RANGE"),
+    419: ("pl1_commands", "PL1_LT_PHYTXEQ_RANGE_COEFF"),
+    420: ("pp_commands", "PP_PRECODING"),
+    421: ("pp_commands", "PP_GRAYCODING"),
+    422: ("pp_commands", "PP_PRECODINGSTATUS"),
+    423: ("p_commands", "P_CAPABILITIES_EXT"),
+    424: ("pl1_commands", "PL1_CTRL"),
+    425: ("pl1_commands", "PL1_GET_DATA"),
+    426: ("pl1_commands", "PL1_PRESET_CONFIG"),
+    427: ("pl1_commands", "PL1_PRESET_RESET"),
+    428: ("pl1_commands", "PL1_PRESET_CONFIG_LEVEL"),
+    429: ("pl1_commands", "PL1_PRESET_CONFIG_COEFF"),
+    430: ("pl1_commands", "PL1_PHYTXEQ_LEVEL"),
+    431: ("pl1_commands", "PL1_PHYTXEQ_COEFF"),
+    432: ("pl1_commands", "PL1_AUTONEG_STATUS"),
+    433: ("pl1_commands", "PL1_AUTONEG_ABILITIES"),
+    434: ("pl1_commands", "PL1_PCS_VARIANT"),
+    435: ("pl1_commands", "PL1_CWE_CYCLE"),
+    436: ("pl1_commands", "PL1_CWE_ERR_SYM_INDICES"),
+    437: ("pl1_commands", "PL1_CWE_BIT_ERR_MASK"),
+    438: ("pl1_commands", "PL1_CWE_FEC_ENGINE"),
+    439: ("pl1_commands", "PL1_CWE_FEC_STATS"),
+    440: ("pl1_commands", "PL1_AUTONEG_CONFIG"),
+    441: ("pl1_commands", "PL1_ANLT"),
+    442: ("pl1_commands", "PL1_PHYTXEQ"),
+    443: ("pl1_commands", "PL1_LINKTRAIN_CONFIG"),
+    444: ("pl1_commands", "PL1_LINKTRAIN_STATUS"),
+    445: ("pl1_commands", "PL1_CWE_CONTROL"),
+    446: ("pl1_commands", "PL1_CWE_FEC_STATS_CLEAR"),
+    450: ("m_commands", "M_LATENCYMODE"),
+    454: ("m_commands", "M_EMULBYPASS"),
+    456: ("m_commands", "M_HEALTH"),
+    457: ("c_commands", "C_MODEL_NAME"),
+    458: ("c_commands", "C_MODEL_NUMBER"),
+    459: ("m_commands", "M_MODEL_NAME"),
+    460: ("p_commands", "P_BRRSTATUS"),
+    461: ("px_commands", "PX_CDB_QUERY_STATUS"),
+    462: ("px_commands", "PX_CDB_ENTER_PASSWORD"),
+    463: ("px_commands", "PX_CDB_CHANGE_PASSWORD"),
+    464: ("px_commands", "PX_CDB_ABORT_PROCESSING"),
+    465: ("px_commands", "PX_CDB_MODULE_FEATURES"),
+    466: ("px_commands", "PX_CDB_FW_MGMT_FEATURES"),
+    467: ("px_commands", "PX_CDB_SEC_FEAT_CAPABILITIES"),
+    468: ("px_commands", "PX_CDB_EXTERNAL_FEATURES"),
+    469: ("px_commands", "PX_CDB_GET_APP_ATTRIBUTES"),
+    470: ("px_commands", "PX_CDB_GET_IF_CODE_DESCR"),
+    471: ("px_commands", "PX_CDB_GET_FW_INFO"),
+    472: ("px_commands", "PX_CDB_START_FW_DOWNLOAD"),
+    473: ("px_commands", "PX_CDB_ABORT_FW_DOWNLOAD"),
+    474: ("px_commands", "PX_CDB_WRITE_FW_BLOCK_LPL"),
+    475: ("px_commands", "PX_CDB_WRITE_FW_BLOCK_EPL"),
+    476: ("px_commands", "PX_CDB_READ_FW_BLOCK_LPL"),
+    477: ("px_commands", "PX_CDB_READ_FW_BLOCK_EPL"),
+    478: ("px_commands", "PX_CDB_COMPLETE_FW_DOWNLOAD"),
+    479: ("px_commands", "PX_CDB_COPY_FW_IMAGE"),
+    482: ("px_commands", "PX_CDB_RUN_FW_IMAGE"),
+    483: ("px_commands", "PX_CDB_COMMIT_FW_IMAGE"),
+    485: ("px_commands", "PX_CDB_SUPPORT"),
+    486: ("px_commands", "PX_CUST_CMD"),
+    490: ("m_commands", "M_SOLUTION_TRACK_INDICES"),
+    491: ("m_commands", "M_SOLUTION_TRACK"),
+    492: ("m_commands", "M_SOLUTION_TRACK_ENABLE"),
+    493: ("m_commands", "M_SOLUTION_TRACK_DEMO_EXP"),
+    501: ("px_commands", "PX_RW"),
+    503: ("px_commands", "PX_RW_SEQ"),
+    504: ("px_commands", "PX_RW_SEQ_BANK"),
+    505: ("p_macsec_commands", "P_MACSEC_TXSC_CREATE"),
+    506: ("p_macsec_commands", "P_MACSEC_TXSC_INDICES"),
+    507: ("p_macsec_commands", "P_MACSEC_TXSC_DESCR"),
+    508: ("p_macsec_commands", "P_MACSEC_TXSC_SCI"),
+    509: ("p_macsec_commands", "P_MACSEC_TXSC_CIPHERSUITE"),
+    510: ("p_macsec_commands", "P_MACSEC_TXSC_CONF_OFFSET"),
+    511: ("p_macsec_commands", "P_MACSEC_RXSC_LOWEST_PN"),
+    512: ("p_macsec_commands", "P_MACSEC_TXSC_ENCRYPT"),
+    513: ("p_macsec_commands", "P_MACSEC_TXSC_SCI_MODE"),
+    514: ("p_macsec_commands", "P_MACSEC_TXSC_STARTING_PN"),
+    515: ("p_macsec_commands", "P_MACSEC_TXSC_REKEY_MODE"),
+    516: ("p_macsec_commands", "P_MACSEC_TX_CLEAR"),
+    517: ("p_macsec_commands", "P_MACSEC_TX_STATS"),
+    518: ("p_macsec_commands", "P_MACSEC_RXSC_CREATE"),
+    519: ("p_macsec_commands", "P_MACSEC_RXSC_INDICES"),
+    520: ("p_macsec_commands", "P_MACSEC_RXSC_DESCR"),
+    521: ("p_macsec_commands", "P_MACSEC_RXSC_CIPHERSUITE"),
+    522: ("p_macsec_commands", "P_MACSEC_RXSC_CONF_OFFSET"),
+    523: ("p_macsec_commands", "P_MACSEC_RXSC_SCI"),
+    524: ("p_macsec_commands", "P_MACSEC_RX_CLEAR"),
+    525: ("p_macsec_commands", "P_MACSEC_RX_STATS"),
+    526: ("ps_commands", "PS_MACSEC_ENABLE"),
+    527: ("ps_commands", "PS_MACSEC_ASSIGN"),
+    528: ("p_macsec_commands", "P_MACSEC_TXSC_STATS"),
+    529: ("p_macsec_commands", "P_MACSEC_RXSC_STATS"),
+    530: ("p_macsec_commands", "P_MACSEC_TXSC_DELETE"),
+    531: ("p_macsec_commands", "P_MACSEC_RXSC_DELETE"),
+    532: ("pl1_commands", "PL1_PNSWAP_TX"),
+    533: ("pl1_commands", "PL1_PNSWAP_RX"),
+    534: ("p_macsec_commands", "P_MACSEC_TXSC_SAK_VALUE"),
+    535: ("p_macsec_commands", "P_MACSEC_RXSC_TPLDID"),
+    537: ("px_commands", "PX_MII"),
+    538: ("px_commands", "PX_TEMPERATURE"),
+    539: ("px_commands", "PX_I2C_CONFIG"),
+    540: ("p_macsec_commands", "P_MACSEC_TXSC_XPN_SSCI"),
+    541: ("p_macsec_commands", "P_MACSEC_TXSC_XPN_SALT"),
+    542: ("p_macsec_commands", "P_MACSEC_RXSC_SAK_VALUE"),
+    544: ("p_macsec_commands", "P_MACSEC_RXSC_XPN_SSCI"),
+    545: ("p_macsec_commands", "P_MACSEC_RX_ENABLE"),
+    546: ("p_macsec_commands", "P_MACSEC_RXSC_XPN_SALT"),
+    547: ("p_macsec_commands", "P_MACSEC_TXSC_NEXT_PN"),
+    548: ("p_macsec_commands", "P_MACSEC_RXSC_NEXT_PN"),
+    549: ("p_macsec_commands", "P_MACSEC_TXSC_NEXT_AN"),
+    550: ("p_macsec_commands", "P_MACSEC_RXSC_AN"),
+    551: ("p_macsec_commands", "P_MACSEC_RXSC_PN"),
+    553: ("pl1_commands", "PL1_RX_FREQ"),
+    554: ("pl1_commands", "PL1_RX_PPM"),
+    555: ("pl1_commands", "PL1_TX_PPM"),
+    556: ("pl1_commands", "PL1_CDRLOL_STATUS"),
+    557: ("pl1_commands", "PL1_LOA_STATUS"),
+    558: ("pl1_commands", "PL1_HIBER_STATUS"),
+    559: ("pl1_commands", "PL1_HISER_STATUS"),
+    560: ("pl1_commands", "PL1_HISER_ALARM"),
+    561: ("pl1_commands", "PL1_DEGSER_STATUS"),
+    562: ("pl1_commands", "PL1_DEGSER_THRESH"),
+    563: ("pl1_commands", "PL1_LINKDOWN_STATUS"),
+    564: ("pl1_commands", "PL1_RX_CNT"),
+    565: ("pl1_commands", "PL1_INJECT_ERR"),
+    566: ("pl1_commands", "PL1_CLEAR"),
+    567: ("pl1_commands", "PL1_TX_FREQ"),
+    568: ("pl1_commands", "PL1_RX_DATARATE"),
+    569: ("pl1_commands", "PL1_TX_DATARATE"),
+    570: ("pl1_commands", "PL1_INJECT_ERR_CNT"),
+    571: ("pl1_commands", "PL1_PCSL_LOA_STATUS"),
+    572: ("pl1_commands", "PL1_PCSL_AM_CORR"),
+    574: ("pl1_commands", "PL1_PCSL_INJECT_ERR"),
+    575: ("pl1_commands", "PL1_PCSL_INJECT_ERR_CNT"),
+    598: ("p_commands", "P_EDUN_RX_STATUS"),
+    600: ("p4g_commands", "P4G_INDICES"),
+    601: ("p4g_commands", "P4G_CREATE"),
+    602: ("p4g_commands", "P4G_DELETE"),
+    603: ("p4g_commands", "P4G_ENABLE"),
+    604: ("p4g_commands", "P4G_COMMENT"),
+    605: ("p4g_commands", "P4G_CLEAR_COUNTERS"),
+    606: ("p4g_commands", "P4G_ROLE"),
+    607: ("p4g_commands", "P4G_CLIENT_RANGE"),
+    608: ("p4g_commands", "P4G_SERVER_RANGE"),
+    609: ("p4g_commands", "P4G_LP_TIME_SCALE"),
+    610: ("p4g_commands", "P4G_LP_SHAPE"),
+    611: ("p4g_commands", "P4G_NAT"),
+    612: ("p4g_commands", "P4G_TCP_RTT_VALUE"),
+    613: ("p4g_commands", "P4G_TCP_STATE_CURRENT"),
+    614: ("p4g_commands", "P4G_TCP_STATE_TOTAL"),
+    615: ("p4g_commands", "P4G_TCP_STATE_RATE"),
+    616: ("p4g_commands", "P4G_TCP_RX_PAYLOAD_COUNTERS"),
+    617: ("p4g_commands", "P4G_TCP_TX_PAYLOAD_COUNTERS"),
+    618: ("p4g_commands", "P4G_TCP_RETRANSMIT_COUNTERS"),
+    619: ("p4g_commands", "P4G_TCP_ERROR_COUNTERS"),
+    620: ("p4g_commands", "P4G_IP_DS_TYPE"),
+    621: ("p4g_commands", "P4G_IP_DS_VALUE"),
+    622: ("p4g_commands", "P4G_IP_DS_MASK"),
+    623: ("p4g_commands", "P4G_IP_DS_MINMAX"),
+    624: ("p4g_commands", "P4G_IP_DS_STEP"),
+    625: ("p4g_commands", "P4G_TCP_MSS_TYPE"),
+    626: ("p4g_commands", "P4G_TCP_MSS_MINMAX"),
+    627: ("p4g_commands", "P4G_TCP_MSS_VALUE"),
+    628: ("p4g_commands", "P4G_TCP_WINDOW_SIZE"),
+    629: ("p4g_commands", "P4G_TCP_DUP_THRES"),
+    630: ("p4g_commands", "P4G_TCP_SYN_RTO"),
+    631: ("p4g_commands", "P4G_TCP_RTO"),
+    632: ("p4g_commands", "P4G_UDP_PACKET_SIZE_TYPE"),
+    633: ("p4g_commands", "P4G_UDP_PACKET_SIZE_MINMAX"),
+    634: ("p4g_commands", "P4G_UDP_PACKET_SIZE_VALUE"),
+    635: ("p4g_commands", "P4G_TCP_CONGESTION_MODE"),
+    636: ("p4g_commands", "P4G_TCP_WINDOW_SCALING"),
+    637: ("p4g_commands", "P4G_TCP_RTO_MINMAX"),
+    638: ("p4g_commands", "P4G_TCP_RTO_PROLONGED_MODE"),
+    639: ("p4g_commands", "P4G_TCP_ICWND_CALC_METHOD"),
+    640: ("p4g_commands", "P4G_TCP_ISSTHRESH"),
+    641: ("p4g_commands", "P4G_TCP_ACK_FREQUENCY"),
+    642: ("p4g_commands", "P4G_TCP_ACK_TIMEOUT"),
+    644: ("p4g_commands", "P4G_L2_CLIENT_MAC"),
+    645: ("p4g_commands", "P4G_L2_SERVER_MAC"),
+    646: ("p4g_commands", "P4G_L2_USE_ADDRESS_RES"),
+    647: ("p4g_commands", "P4G_L2_USE_GW"),
+    648: ("p4g_commands", "P4G_L2_GW"),
+    649: ("p4g_commands", "P4G_L2_IPV6_GW"),
+    650: ("p4g_commands", "P4G_TEST_APPLICATION"),
+    651: ("p4g_commands", "P4G_RAW_TEST_SCENARIO"),
+    652: ("p4g_commands", "P4G_RAW_PAYLOAD_TYPE"),
+    653: ("p4g_commands", "P4G_RAW_PAYLOAD_TOTAL_LEN"),
+    654: ("p4g_commands", "P4G_RAW_PAYLOAD"),
+    655: ("p4g_commands", "P4G_RAW_PAYLOAD_REPEAT_LEN"),
+    656: ("p4g_commands", "P4G_RAW_HAS_DOWNLOAD_REQ"),
+    657: ("p4g_commands", "P4G_RAW_CLOSE_CONN"),
+    658: ("p4g_commands", "P4G_RAW_UTILIZATION"),
+    659: ("p4g_commands", "P4G_RAW_DOWNLOAD_REQUEST"),
+    660: ("p4g_commands", "P4G_RAW_TX_DURING_RAMP"),
+    661: ("p4g_commands", "P4G_RAW_TX_TIME_OFFSET"),
+    662: ("p4g_commands", "P4G_RAW_BURSTY_TX"),
+    663: ("p4g_commands", "P4G_RAW_BURSTY_CONF"),
+    664: ("p4g_commands", "P4G_VLAN_ENABLE"),
+    665: ("p4g_commands", "P4G_VLAN_TCI"),
+    666: ("p4g_commands", "P4G_TIME_HIST_CONF"),
+    667: ("p4g_commands", "P4G_PAYLOAD_HIST_CONF"),
+    668: ("p4g_commands", "P4G_TRANSACTION_HIST_CONF"),
+    669: ("p4g_commands", "P4G_RAW_RX_PAYLOAD_LEN"),
+    670: ("p4g_commands", "P4G_RAW_REQUEST_REPEAT"),
+    671: ("p4g_commands", "P4G_RAW_CONN_INCARNATION"),
+    672: ("p4g_commands", "P4G_RAW_CONN_REPETITIONS"),
+    673: ("p4g_commands", "P4G_RAW_CONN_LIFETIME"),
+    675: ("p4e_commands", "P4E_ASSIGN"),
+    676: ("p4e_commands", "P4E_AVAILABLE"),
+    677: ("p4e_commands", "P4E_ALLOCATE"),
+    678: ("p4e_commands", "P4E_ALLOCATION_INFO"),
+    684: ("p4g_commands", "P4G_IP_VERSION"),
+    685: ("p4g_commands", "P4G_IPV6_CLIENT_RANGE"),
+    686: ("p4g_commands", "P4G_IPV6_SERVER_RANGE"),
+    687: ("p4g_commands", "P4G_IPV6_TRAFFIC_CLASS"),
+    688: ("p4g_commands", "P4G_IPV6_FLOW_LABEL"),
+    689: ("p4g_commands", "P4G_L4_PROTOCOL"),
+    690: ("p4g_commands", "P4G_IPV4_CLIENT_ADDRESS_POOL"),
+    691: ("p4g_commands", "P4G_IPV4_SERVER_ADDRESS_POOL"),
+    700: ("p4_commands", "P4_TRAFFIC"),
+    701: ("p4_commands", "P4_STATE"),
+    702: ("p4_commands", "P4_CAPABILITIES"),
+    703: ("p4_commands", "P4_STATE_STATUS"),
+    704: ("p4_commands", "P4_VLAN_OFFLOAD"),
+    705: ("p4_commands", "P4_ARP_CONFIG"),
+    706: ("p4_commands", "P4_NDP_CONFIG"),
+    707: ("p4_commands", "P4_CAPTURE"),
+    708: ("p4_commands", "P4_CAPTURE_GET_FIRST"),
+    709: ("p4_commands", "P4_CAPTURE_GET_NEXT"),
+    710: ("p4_commands", "P4_ETH_TX_COUNTERS"),
+    711: ("p4_commands", "P4_ETH_RX_COUNTERS"),
+    712: ("p4_commands", "P4_PORT_TX_COUNTERS"),
+    713: ("p4_commands", "P4_PORT_RX_COUNTERS"),
+    714: ("p4_commands", "P4_PORT_COUNTERS"),
+    715: ("p4_commands", "P4_TX_PACKET_SIZE"),
+    716: ("p4_commands", "P4_RX_PACKET_SIZE"),
+    717: ("p4_commands", "P4_TX_MTU"),
+    718: ("p4_commands", "P4_RX_MTU"),
+    719: ("p4_commands", "P4_IPV4_RX_COUNTERS"),
+    720: ("p4_commands", "P4_IPV4_TX_COUNTERS"),
+    721: ("p4_commands", "P4_IPV4_COUNTERS"),
+    722: ("p4_commands", "P4_IPV6_RX_COUNTERS"),
+    723: ("p4_commands", "P4_IPV6_TX_COUNTERS"),
+    724: ("p4_commands", "P4_IPV6_COUNTERS"),
+    725: ("p4_commands", "P4_ARP_RX_COUNTERS"),
+    726: ("p4_commands", "P4_ARP_TX_COUNTERS"),
+    727: ("p4_commands", "P4_ARP_COUNTERS"),
+    728: ("p4_commands", "P4_NDP_RX_COUNTERS"),
+    729: ("p4_commands", "P4_NDP_TX_COUNTERS"),
+    730: ("p4_commands", "P4_NDP_COUNTERS"),
+    731: ("p4_commands", "P4_ICMP_RX_COUNTERS"),
+    732: ("p4_commands", "P4_ICMP_TX_COUNTERS"),
+    733: ("p4_commands", "P4_ICMP_COUNTERS"),
+    734: ("p4_commands", "P4_TCP_RX_COUNTERS"),
+    735: ("p4_commands", "P4_TCP_TX_COUNTERS"),
+    736: ("p4_commands", "P4_TCP_COUNTERS"),
+    737: ("p4_commands", "P4_UDP_RX_COUNTERS"),
+    738: ("p4_commands", "P4_UDP_TX_COUNTERS"),
+    739: ("p4_commands", "P4_UDP_COUNTERS"),
+    740: ("p4_commands", "P4_CLEAR_COUNTERS"),
+    741: ("p4g_commands", "P4G_TCP_ESTABLISH_HIST"),
+    742: ("p4g_commands", "P4G_TCP_CLOSE_HIST"),
+    743: ("p4g_commands", "P4G_TCP_RX_TOTAL_BYTES_HIST"),
+    744: ("p4g_commands", "P4G_TCP_RX_GOOD_BYTES_HIST"),
+    745: ("p4g_commands", "P4G_TCP_TX_TOTAL_BYTES_HIST"),
+    746: ("p4g_commands", "P4G_TCP_TX_GOOD_BYTES_HIST"),
+    747: ("p4g_commands", "P4G_APP_REPLAY_COUNTERS"),
+    753: ("p4g_commands", "P4G_APP_TRANSACTION_COUNTERS"),
+    754: ("p4g_commands", "P4G_APP_TRANSACTION_HIST"),
+    756: ("p4g_commands", "P4G_UDP_STATE_CURRENT"),
+    757: ("p4g_commands", "P4G_UDP_STATE_TOTAL"),
+    758: ("p4g_commands", "P4G_UDP_STATE_RATE"),
+    759: ("p4g_commands", "P4G_UDP_RX_PAYLOAD_COUNTERS"),
+    760: ("p4g_commands", "P4G_UDP_TX_PAYLOAD_COUNTERS"),
+    761: ("p4g_commands", "P4G_UDP_RX_BYTES_HIST"),
+    762: ("p4g_commands", "P4G_UDP_TX_BYTES_HIST"),
+    765: ("p4_commands", "P4_ETH_COUNTERS"),
+    766: ("p4_commands", "P4_CLEAR"),
+    767: ("p4_commands", "P4_SPEEDSELECTION"),
+    770: ("p4g_commands", "P4G_TCP_RX_PACKET_COUNTERS"),
+    771: ("p4g_commands", "P4G_TCP_TX_PACKET_COUNTERS"),
+    772: ("p4g_commands", "P4G_UDP_RX_PACKET_COUNTERS"),
+    773: ("p4g_commands", "P4G_UDP_TX_PACKET_COUNTERS"),
+    775: ("p4_commands", "P4_ETH_QUEUE_COUNTERS"),
+    780: ("p4_commands", "P4_DHCP_CONFIG"),
+    781: ("p4_commands", "P4_DHCP_RUN"),
+    782: ("p4_commands", "P4_DHCP_STATE"),
+    783: ("p4_commands", "P4_DHCP_RESULT"),
+    784: ("p4_commands", "P4_DHCP_VLAN"),
+    790: ("p4g_commands", "P4G_CLEAR_POST_STAT"),
+    791: ("p4g_commands", "P4G_RECALC_TIME_HIST"),
+    792: ("p4g_commands", "P4G_RECALC_PAYLOAD_HIST"),
+    793: ("p4g_commands", "P4G_RECALC_TRANSACTION_HIST"),
+    803: ("m4_commands", "M4_SYSTEMID"),
+    804: ("m4_commands", "M4_VERSIONNO"),
+    805: ("m4_commands", "M4_SYSTEM_STATUS"),
+    806: ("m4_commands", "M4_COMPATIBLE_CLIENT_VERSION"),
+    807: ("m4_commands", "M4_TIME"),
+    808: ("m4_commands", "M4_SYSTEM_TIME"),
+    809: ("m4_commands", "M4_MEM_INFO"),
+    810: ("m4_commands", "M4_CAPTURE_SIZE"),
+    820: ("m4_commands", "M4_LICENSE_INFO"),
+    830: ("m4_commands", "M4_REPLAY_PARSE_START"),
+    831: ("m4_commands", "M4_REPLAY_PARSE_STOP"),
+    832: ("m4_commands", "M4_REPLAY_PARSE_STATE"),
+    833: ("m4_commands", "M4_REPLAY_PARSER_PARAMS"),
+    840: ("m4_commands", "M4_REPLAY_FILE_LIST_BSON"),
+    841: ("m4_commands", "M4_REPLAY_FILE_LIST"),
+    842: ("m4_commands", "M4_CAPTURE_FILE_LIST_BSON"),
+    843: ("m4_commands", "M4_CAPTURE_FILE_LIST"),
+    845: ("m4_commands", "M4_REPLAY_FILE_DELETE"),
+    846: ("m4_commands", "M4_CAPTURE_FILE_DELETE"),
+    850: ("m4e_commands", "M4E_MODE"),
+    851: ("m4e_commands", "M4E_RESERVE"),
+    852: ("m4_commands", "M4_TLS_CIPHER_SUITES"),
+    900: ("p4g_commands", "P4G_REPLAY_FILE_INDICES"),
+    901: ("p4g_commands", "P4G_REPLAY_FILE_NAME"),
+    902: ("p4g_commands", "P4G_REPLAY_FILE_CLEAR"),
+    903: ("p4g_commands", "P4G_REPLAY_UTILIZATION"),
+    904: ("p4g_commands", "P4G_REPLAY_USER_INCARNATION"),
+    905: ("p4g_commands", "P4G_REPLAY_USER_REPETITIONS"),
+    910: ("p4g_commands", "P4G_USER_STATE_CURRENT"),
+    911: ("p4g_commands", "P4G_USER_STATE_TOTAL"),
+    912: ("p4g_commands", "P4G_USER_STATE_RATE"),
+    950: ("p4_commands", "P4_MAX_PACKET_RATE"),
+    960: ("p4_commands", "P4_PCI_INFO"),
+    961: ("p4_commands", "P4_FW_VER"),
+    962: ("p4_commands", "P4_DEV_NAME"),
+    963: ("p4_commands", "P4_PORT_TYPE"),
+    964: ("p4_commands", "P4_LICENSE_INFO"),
+    1000: ("p_lldp_commands", "P_LLDP_CREATE"),
+    1001: ("p_lldp_commands", "P_LLDP_INDICES"),
+    1002: ("p_lldp_commands", "P_LLDP_DELETE"),
+    1003: ("p_lldp_commands", "P_LLDP_OPMODE"),
+    1004: ("p_lldp_commands", "P_LLDP_DATA"),
+    1005: ("p_lldp_commands", "P_LLDP_HEADER"),
+    1006: ("p_lldp_commands", "P_LLDP_CONFIG"),
+    1007: ("p_lldp_commands", "P_LLDP_NEIGHBORS"),
+    1008: ("p_lldp_commands", "P_LLDP_STATS"),
+    1009: ("p_lldp_commands", "P_LLDP_CLEAR"),
+    1010: ("p_ue_commands", "P_UE_CTLOS_SPACING"),
+    1011: ("p_ue_commands", "P_UE_CTLOS_TX_STATS"),
+    1012: ("p_ue_commands", "P_UE_CTLOS_RX_STATS"),
+    1013: ("p_ue_commands", "P_UE_LLR_MODE"),
+    1014: ("p_ue_commands", "P_UE_LLR_REPLAY"),
+    1015: ("p_ue_commands", "P_UE_LLR_BEHAVIOR"),
+    1016: ("p_ue_commands", "P_UE_LINKNEG_OPTIONS"),
+    1017: ("p_ue_commands", "P_UE_LLR_INIT"),
+    1018: ("p_ue_commands", "P_UE_LLR_INIT_ECHO"),
+    1019: ("p_ue_commands", "P_UE_LLR_ACKNACK"),
+    1020: ("p_ue_commands", "P_UE_CTLOS_CLEAR"),
+    1021: ("p_ue_commands", "P_UE_LLR_TXFSM_STATE"),
+    1022: ("p_ue_commands", "P_UE_LLR_RXFSM_STATE"),
+    1023: ("p_ue_commands", "P_UE_LLR_TX_STATS"),
+    1024: ("p_ue_commands", "P_UE_LLR_RX_STATS"),
+    1025: ("p_ue_commands", "P_UE_LLR_INJECT_ERR"),
+    1027: ("ps_commands", "PS_UE_LLR_DESIRE"),
+    1028: ("p_ue_commands", "P_UE_LLR_POISONFCS"),
+    1029: ("p_ue_commands", "P_UE_LINKNEG_OPTIONS_STATUS"),
+    1030: ("p_ue_commands", "P_UE_LLR_STATUS"),
+    1031: ("p_ue_commands", "P_UE_LLR_INIT_ECHO_CHK"),
+    1032: ("p_ue_commands", "P_UE_CTLOS_TX_INTERVAL"),
+    1033: ("p_ue_commands", "P_UE_CTLOS_RX_INTERVAL"),
+    1034: ("p_ue_commands", "P_UE_CTLOS_RX_ERRORS"),
+    1100: ("p4g_commands", "P4G_TLS_ENABLE"),
+    1101: ("p4g_commands", "P4G_TLS_CIPHER_SUITES"),
+    1102: ("p4g_commands", "P4G_TLS_MAX_RECORD_SIZE"),
+    1103: ("p4g_commands", "P4G_TLS_CERTIFICATE_FILENAME"),
+    1104: ("p4g_commands", "P4G_TLS_PRIVATE_KEY_FILENAME"),
+    1105: ("p4g_commands", "P4G_TLS_DHPARAMS_FILENAME"),
+    1106: ("p4g_commands", "P4G_TLS_CLOSE_NOTIFY"),
+    1107: ("p4g_commands", "P4G_TLS_ALERT_WARNING_COUNTERS"),
+    1108: ("p4g_commands", "P4G_TLS_ALERT_FATAL_COUNTERS"),
+    1109: ("p4g_commands", "P4G_TLS_STATE_CURRENT"),
+    1110: ("p4g_commands", "P4G_TLS_STATE_TOTAL"),
+    1111: ("p4g_commands", "P4G_TLS_STATE_RATE"),
+    1112: ("p4g_commands", "P4G_TLS_RX_PAYLOAD_COUNTERS"),
+    1113: ("p4g_commands", "P4G_TLS_TX_PAYLOAD_COUNTERS"),
+    1114: ("p4g_commands", "P4G_TLS_RX_PAYLOAD_BYTES_HIST"),
+    1115: ("p4g_commands", "P4G_TLS_TX_PAYLOAD_BYTES_HIST"),
+    1116: ("p4g_commands", "P4G_TLS_HANDSHAKE_HIST"),
+    1117: ("p4g_commands", "P4G_TLS_SERVER_NAME"),
+    1118: ("p4g_commands", "P4G_TLS_PROTOCOL_VER"),
+    1119: ("p4g_commands", "P4G_TLS_MIN_REQ_PROTOCOL_VER"),
+    1200: ("p4_commands", "P4_APTITUDES"),
+    1600: ("p_commands", "P_EMULATE"),
+    1601: ("pe_commands", "PE_FCSDROP"),
+    1602: ("pe_commands", "PE_TPLDMODE"),
+    1605: ("pe_commands", "PE_COMMENT"),
+    1608: ("pe_commands", "PE_INDICES"),
+    1610: ("pec_commands", "PEC_INDICES"),
+    1611: ("ped_commands", "PED_SCHEDULE"),
+    1612: ("ped_commands", "PED_ONESHOTSTATUS"),
+    1620: ("ped_commands", "PED_OFF"),
+    1621: ("ped_commands", "PED_FIXED"),
+    1622: ("ped_commands", "PED_RANDOM"),
+    1623: ("ped_commands", "PED_BER"),
+    1624: ("ped_commands", "PED_FIXEDBURST"),
+    1625: ("ped_commands", "PED_RANDOMBURST"),
+    1626: ("ped_commands", "PED_GE"),
+    1627: ("ped_commands", "PED_UNI"),
+    1628: ("ped_commands", "PED_GAUSS"),
+    1629: ("ped_commands", "PED_POISSON"),
+    1630: ("ped_commands", "PED_GAMMA"),
+    1631: ("ped_commands", "PED_CUST"),
+    1640: ("ped_commands", "PED_CONST"),
+    1641: ("ped_commands", "PED_ACCBURST"),
+    1642: ("ped_commands", "PED_STEP"),
+    1644: ("ped_commands", "PED_ENABLE"),
+    1646: ("pe_commands", "PE_LATENCYRANGE"),
+    1660: ("pe_commands", "PE_CORRUPT"),
+    1661: ("pe_commands", "PE_MISORDER"),
+    1662: ("pe_commands", "PE_BANDPOLICER"),
+    1663: ("pe_commands", "PE_BANDSHAPER"),
+    1680: ("pec_commands", "PEC_VAL"),
+    1681: ("pec_commands", "PEC_COMMENT"),
+    1682: ("pec_commands", "PEC_DELETE"),
+    1683: ("pec_commands", "PEC_DISTTYPE"),
+    1700: ("pef_commands", "PEF_INIT"),
+    1701: ("pef_commands", "PEF_APPLY"),
+    1702: ("pef_commands", "PEF_ENABLE"),
+    1703: ("pef_commands", "PEF_ETHSETTINGS"),
+    1704: ("pef_commands", "PEF_ETHSRCADDR"),
+    1705: ("pef_commands", "PEF_ETHDESTADDR"),
+    1706: ("pef_commands", "PEF_L2PUSE"),
+    1707: ("pef_commands", "PEF_VLANSETTINGS"),
+    1708: ("pef_commands", "PEF_VLANTAG"),
+    1709: ("pef_commands", "PEF_VLANPCP"),
+    1710: ("pef_commands", "PEF_MPLSSETTINGS"),
+    1711: ("pef_commands", "PEF_MPLSLABEL"),
+    1712: ("pef_commands", "PEF_MPLSTOC"),
+    1713: ("pef_commands", "PEF_L3USE"),
+    1714: ("pef_commands", "PEF_IPV4SETTINGS"),
+    1715: ("pef_commands", "PEF_IPV4SRCADDR"),
+    1716: ("pef_commands", "PEF_IPV4DESTADDR"),
+    1717: ("pef_commands", "PEF_IPV4DSCP"),
+    1718: ("pef_commands", "PEF_IPV6SETTINGS"),
+    1719: ("pef_commands", "PEF_IPV6SRCADDR"),
+    1720: ("pef_commands", "PEF_IPV6DESTADDR"),
+    1721: ("pef_commands", "PEF_IPV6TC"),
+    1722: ("pef_commands", "PEF_UDPSETTINGS"),
+    1723: ("pef_commands", "PEF_UDPSRCPORT"),
+    1724: ("pef_commands", "PEF_UDPDESTPORT"),
+    1725: ("pef_commands", "PEF_TCPSETTINGS"),
+    1726: ("pef_commands", "PEF_TCPSRCPORT"),
+    1727: ("pef_commands", "PEF_TCPDESTPORT"),
+    1728: ("pef_commands", "PEF_ANYSETTINGS"),
+    1729: ("pef_commands", "PEF_ANYCONFIG"),
+    1730: ("pef_commands", "PEF_TPLDSETTINGS"),
+    1731: ("pef_commands", "PEF_TPLDCONFIG"),
+    1734: ("pef_commands", "PEF_ISSHADOWDIRTY"),
+    1735: ("pef_commands", "PEF_CANCEL"),
+    1740: ("pt_commands", "PT_FLOWTOTAL"),
+    1741: ("pr_commands", "PR_FLOWTOTAL"),
+    1742: ("pt_commands", "PT_FLOWCLEAR"),
+    1743: ("pr_commands", "PR_FLOWCLEAR"),
+    1750: ("pe_commands", "PE_DROPTOTAL"),
+    1751: ("pe_commands", "PE_LATENCYTOTAL"),
+    1752: ("pe_commands", "PE_DUPTOTAL"),
+    1753: ("pe_commands", "PE_MISTOTAL"),
+    1754: ("pe_commands", "PE_CORTOTAL"),
+    1755: ("pe_commands", "PE_JITTERTOTAL"),
+    1756: ("pe_commands", "PE_CLEAR"),
+    1770: ("pe_commands", "PE_FLOWDROPTOTAL"),
+    1771: ("pe_commands", "PE_FLOWLATENCYTOTAL"),
+    1772: ("pe_commands", "PE_FLOWDUPTOTAL"),
+    1773: ("pe_commands", "PE_FLOWMISTOTAL"),
+    1774: ("pe_commands", "PE_FLOWCORTOTAL"),
+    1775: ("pe_commands", "PE_FLOWJITTERTOTAL"),
+    1776: ("pe_commands", "PE_FLOWCLEAR"),
+    1777: ("pef_commands", "PEF_VALUE"),
+    1778: ("pef_commands", "PEF_MASK"),
+    1779: ("pef_commands", "PEF_PROTOCOL"),
+    1780: ("pef_commands", "PEF_MODE"),
+}
+"""Map the command code to the name of its module and the command name."""
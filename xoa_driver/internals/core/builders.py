@@ -1,5 +1,11 @@
 from __future__ import annotations
-from .transporter.protocol.struct_request import Request
+from collections import OrderedDict
+from typing import Any
+from .token import Token
+from .transporter.protocol.struct_request import (
+    Request,
+    RequestTemplate,
+)
 from .transporter.protocol._constants import CommandType
 from .transporter._typings import (
     ICmdOnlySet,
@@ -37,3 +43,37 @@ def build_get_request(cls: ICmdOnlyGet, **kwargs) -> Request:
         indices=indices,
         values=req_values
     )
+
+
+MAX_REQUEST_TEMPLATES = 16_384
+"""Number of the compiled GET requests kept, the least recently used ones are dropped above it."""
+
+REQUEST_TEMPLATES: OrderedDict[tuple[Any, ...], RequestTemplate] = OrderedDict()
+"""A global LRU cache of compiled GET requests, keyed by the command type and its module, port and indices."""
+
+
+def _template_key(cls: ICmdOnlyGet) -> tuple[Any, ...]:
+    values = (
+        getattr(cls, name)
+        for name in cls.__dataclass_fields__  # type: ignore[attr-defined]
+        if name != "_connection"
+    )
+    return (type(cls),) + tuple(tuple(v) if isinstance(v, list) else v for v in values)
+
+
+def get_template(cls: ICmdOnlyGet) -> Token:
+    """
+    Get the token of the pre-encoded GET request of the command.
+
+    The request is compiled only once per command type, module, port and indices while it stays
+    in the cache, the token can be awaited or applied repeatedly.
+    """
+    key = _template_key(cls)
+    template = REQUEST_TEMPLATES.get(key, None)
+    if template is None:
+        template = REQUEST_TEMPLATES[key] = RequestTemplate(cls.get().request)
+        if len(REQUEST_TEMPLATES) > MAX_REQUEST_TEMPLATES:
+            REQUEST_TEMPLATES.popitem(last=False)
+    else:
+        REQUEST_TEMPLATES.move_to_end(key)
+    return Token(cls._connection, template)  # type: ignore[attr-defined]
@@ -31,7 +31,11 @@ from .transporter.exceptions import (
     XoaConnectionTimeoutError,
     XoaConnectionError,
     RepeatedRequestID,
-    XoaLostFuture
+    XoaLostFuture,
+    XoaRequestNotReplayedError,
+    XoaConnectionLostError,
+    XoaRequestTimeoutError,
+    XoaStreamCorruptedError,
 )
 
 __all__ = (
@@ -66,4 +70,8 @@ __all__ = (
     "XoaConnectionError",
     "RepeatedRequestID",
     "XoaLostFuture",
+    "XoaRequestNotReplayedError",
+    "XoaConnectionLostError",
+    "XoaRequestTimeoutError",
+    "XoaStreamCorruptedError",
 )
@@ -1,7 +1,6 @@
 from __future__ import annotations
 import asyncio
 from asyncio.events import AbstractEventLoop
-import io
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -12,8 +11,15 @@ if TYPE_CHECKING:
     from . import interfaces
 
 from .token import Token
+from .pipeline import (
+    apply_pipelined,
+    prepare_batch,
+)
 from .transporter import exceptions
 
+MAX_AGGREGATION = 200
+"""Maximum number of the commands which are sent by <apply> as a single aggregation."""
+
 
 async def establish_connection(transporter: "TransportationHandler", host: str, port: int = 22606, *, seconds_timeout: int = 5, loop: AbstractEventLoop | None = None) -> None:
     """
@@ -39,18 +45,11 @@ async def apply_iter(*cmd_tokens: Token[Any], return_exceptions: bool = False, t
     if not cmd_tokens:
         return
     conn: "interfaces.IConnection" = cmd_tokens[0].connection
-    buffer_bytes = io.BytesIO()
-    queue: asyncio.Queue[asyncio.Future] = asyncio.Queue()
-    for t in cmd_tokens:
-        (data, fut) = await t.connection.prepare_data(t.request)
-        buffer_bytes.write(data)
-        queue.put_nowait(fut)
-    conn.send(buffer_bytes.getvalue())
-    buffer_bytes.close()
-    del buffer_bytes
+    (data, futures) = prepare_batch(cmd_tokens)
+    conn.send(data)
+    del data
 
-    while not queue.empty():
-        future = await queue.get()
+    for future in futures:
         try:
             result_ = await asyncio.wait_for(
                 asyncio.shield(future),
@@ -63,19 +62,17 @@ async def apply_iter(*cmd_tokens: Token[Any], return_exceptions: bool = False, t
                 raise e
         else:
             yield result_
-        queue.task_done()
-    await queue.join()
 
 
 async def apply(*cmd_tokens: Token[Any], return_exceptions: bool = False, token_timeout_sec: float | None = 5.0) -> list[Any]:
     """
     Main interface for chunking the commands which need to be send to one or multiple testers at the same time.
+
+    More than ``MAX_AGGREGATION`` commands are streamed with <apply_pipelined> instead of a single aggregation.
     """
-    assert len(cmd_tokens) <= 200, "Number of the commands is bigger then 200 for one aggregation, please use function <apply_iter> instead"
-    return [
-        f async for f in apply_iter(
-            *cmd_tokens, 
-            return_exceptions=return_exceptions, 
-            token_timeout_sec=token_timeout_sec
-        )
-    ]
+    results = (
+        apply_iter(*cmd_tokens, return_exceptions=return_exceptions, token_timeout_sec=token_timeout_sec)
+        if len(cmd_tokens) <= MAX_AGGREGATION else
+        apply_pipelined(cmd_tokens, return_exceptions=return_exceptions, token_timeout_sec=token_timeout_sec)
+    )
+    return [f async for f in results]
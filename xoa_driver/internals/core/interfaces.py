@@ -31,13 +31,22 @@ class IConnection(t.Protocol):
     def send(self, data: bytes | bytearray | memoryview) -> None:
         ...
 
+    def get_write_buffer_size(self) -> int:
+        ...
+
+    async def drain(self, write_buffer_limit: int | None = None) -> None:
+        ...
+
     def close(self) -> None:
         ...
 
     async def prepare_data(self, request: "Request") -> t.Tuple[bytes, "Future"]:
         ...
 
-    def subscribe(self, xmc_cls: "ICommand", callback: "t.Callable") -> None:
+    def prepare_data_batch(self, requests: t.Sequence["Request"]) -> t.Tuple[bytes, t.List["Future"]]:
+        ...
+
+    def subscribe(self, xmc_cls: "ICommand", callback: "t.Callable", *, module: int | None = None, port: int | None = None) -> None:
         ...
 
     def on_disconnected(self, callback: "t.Callable") -> None:
@@ -0,0 +1,137 @@
+from __future__ import annotations
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from itertools import (
+    groupby,
+    islice,
+)
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    Iterable,
+    Sequence,
+)
+if TYPE_CHECKING:
+    from . import interfaces
+
+from .token import Token
+
+
+@dataclass
+class PipelineStats:
+    """Throughput report of the pipelined execution, updated while the results are consumed."""
+
+    requests: int = 0
+    """Number of the requests sent to the tester."""
+    responses: int = 0
+    """Number of the results yielded to the caller, including errors."""
+    errors: int = 0
+    """Number of the results which are errors."""
+    bytes_sent: int = 0
+    """Number of the bytes written to the transport."""
+    backpressure_waits: int = 0
+    """How many times the sending was paused because of the full write buffer."""
+    started_at: float = 0.0
+    finished_at: float = 0.0
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds from the first sent request until the last yielded result."""
+        end = self.finished_at or time.perf_counter()
+        return end - self.started_at if self.started_at else 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Number of the results per second."""
+        elapsed = self.elapsed
+        return self.responses / elapsed if elapsed else 0.0
+
+
+def prepare_batch(cmd_tokens: Sequence[Token[Any]]) -> tuple[bytes, list[asyncio.Future]]:
+    """
+    Encode the requests of the commands of a single tester, to be sent through the connection of the first command.
+    Every command is prepared by its own connection, so the objects which are not valid anymore refuse their commands.
+    """
+    conn: "interfaces.IConnection" = cmd_tokens[0].connection
+    if all(t.connection is conn for t in cmd_tokens):
+        return conn.prepare_data_batch([t.request for t in cmd_tokens])
+    chunks = []
+    futures: list[asyncio.Future] = []
+    for connection, tokens in groupby(cmd_tokens, key=lambda t: t.connection):
+        data, batch_futures = connection.prepare_data_batch([t.request for t in tokens])
+        chunks.append(data)
+        futures.extend(batch_futures)
+    return b"".join(chunks), futures
+
+
+async def _await_result(future: asyncio.Future, timeout: float | None) -> Any:
+    if future.done():
+        return future.result()
+    return await asyncio.wait_for(asyncio.shield(future), timeout)
+
+
+async def apply_pipelined(
+    cmd_tokens: Iterable[Token[Any]],
+    *,
+    window: int = 1000,
+    batch_size: int = 100,
+    write_buffer_limit: int = 256 * 1024,
+    return_exceptions: bool = False,
+    token_timeout_sec: float | None = 5.0,
+    stats: PipelineStats | None = None,
+) -> AsyncGenerator[Any, None]:
+    """
+    Stream the commands of a single tester in to the transport and yield the results in the order of the commands.
+
+    At most ``window`` requests are waiting for the response at any time, they are sent in batches of ``batch_size``
+    and the sending is paused while the transport's write buffer is bigger than ``write_buffer_limit``.
+    The tokens are consumed lazily, so any iterable of any length can be used with bounded memory.
+    """
+    assert window > 0 and batch_size > 0, "<window> and <batch_size> must be positive"
+    stats = stats if stats is not None else PipelineStats()
+    tokens = iter(cmd_tokens)
+    in_flight: deque[asyncio.Future] = deque()
+    exhausted = False
+
+    while True:
+        while not exhausted and len(in_flight) < window:
+            batch = list(islice(tokens, min(batch_size, window - len(in_flight))))
+            if not batch:
+                exhausted = True
+                break
+            conn: "interfaces.IConnection" = batch[0].connection
+            while conn.get_write_buffer_size() > write_buffer_limit:
+                stats.backpressure_waits += 1
+                # The transport is paused above the limit, so the drain waits for it instead of spinning.
+                await conn.drain(write_buffer_limit)
+            (data, futures) = prepare_batch(batch)
+            if not stats.started_at:
+                stats.started_at = time.perf_counter()
+            conn.send(data)
+            stats.requests += len(futures)
+            stats.bytes_sent += len(data)
+            in_flight.extend(futures)
+
+        if not in_flight:
+            break
+
+        future = in_flight.popleft()
+        try:
+            result_ = await _await_result(
+                future,
+                token_timeout_sec if return_exceptions else None
+            )
+        except Exception as e:
+            stats.responses += 1
+            stats.errors += 1
+            if return_exceptions:
+                yield e
+            else:
+                raise e
+        else:
+            stats.responses += 1
+            yield result_
+    stats.finished_at = time.perf_counter()
@@ -9,7 +9,10 @@ from typing import (
 from dataclasses import dataclass
 
 from . import interfaces
-from .transporter.protocol.struct_request import Request
+from .transporter.protocol.struct_request import (
+    Request,
+    RequestTemplate,
+)
 
 
 AwaitableDataType = TypeVar("AwaitableDataType", covariant=True)
@@ -25,7 +28,7 @@ class Token(Awaitable[AwaitableDataType]):
     __slots__ = ('connection', 'request',)
 
     connection: interfaces.IConnection
-    request: Request
+    request: Request | RequestTemplate
 
     def __await__(self) -> Generator[Any, None, AwaitableDataType]:
         return self.__ask().__await__()
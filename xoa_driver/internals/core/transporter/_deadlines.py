@@ -0,0 +1,78 @@
+from __future__ import annotations
+import asyncio
+import math
+from collections import Counter
+from functools import partial
+from typing import Callable
+
+ExpiredCallback = Callable[[int, str], None]
+"""Called with the request identifier and the command name of the expired request."""
+
+
+class DeadlineWheel:
+    """
+    Timer wheel which expires the requests waiting for the response longer than the timeout.
+
+    A single timer of the connection ticks every ``resolution`` seconds while any request is waiting.
+    Every request is kept in the slot of the tick it expires at and is removed from it when it is resolved,
+    so the cost of a request doesn't depend on the number of the waiting requests.
+    """
+
+    __slots__ = ("timeout", "timeouts", "__resolution", "__slots", "__on_expired", "__origin", "__tick", "__timer")
+
+    def __init__(self, timeout: float, on_expired: ExpiredCallback, *, resolution: float = 0.1, size: int = 512) -> None:
+        assert timeout > 0 and resolution > 0, "<timeout> and <resolution> must be positive"
+        self.timeout = timeout
+        """Seconds a request waits for the response before it is expired."""
+        self.timeouts: Counter[int] = Counter()
+        """Number of the expired requests by the command code."""
+        self.__resolution = resolution
+        self.__slots: list[dict[int, tuple[int, str, int]]] = [{} for _ in range(size)]
+        self.__on_expired = on_expired
+        self.__origin: float | None = None
+        self.__tick = 0
+        self.__timer: asyncio.TimerHandle | None = None
+
+    def __len__(self) -> int:
+        return sum(map(len, self.__slots))
+
+    def __now(self, loop: asyncio.AbstractEventLoop) -> int:
+        if self.__origin is None:
+            self.__origin = loop.time()
+        return int((loop.time() - self.__origin) / self.__resolution)
+
+    def add(self, req_id: int, cmd_name: str, cmd_code: int, future: asyncio.Future) -> None:
+        """Expire the request after the timeout, unless its future is done before."""
+        loop = future.get_loop()
+        if self.__timer is None:
+            self.__tick = self.__now(loop)
+            self.__timer = loop.call_at(loop.time() + self.__resolution, self.__advance, loop)
+        # One more tick, the current tick is already partially passed and the request must not expire early.
+        expires_at = self.__now(loop) + math.ceil(self.timeout / self.__resolution) + 1
+        slot = self.__slots[expires_at % len(self.__slots)]
+        slot[req_id] = (expires_at, cmd_name, cmd_code)
+        future.add_done_callback(partial(slot.pop, req_id))
+
+    def __advance(self, loop: asyncio.AbstractEventLoop) -> None:
+        now = self.__now(loop)
+        while self.__tick < now:
+            self.__tick += 1
+            slot = self.__slots[self.__tick % len(self.__slots)]
+            # The deadline of a request can be more than one turn of the wheel away.
+            expired = [(req_id, entry) for req_id, entry in slot.items() if entry[0] <= self.__tick]
+            for req_id, (_, cmd_name, cmd_code) in expired:
+                del slot[req_id]
+                self.timeouts[cmd_code] += 1
+                self.__on_expired(req_id, cmd_name)
+        if any(self.__slots):
+            self.__timer = loop.call_at(loop.time() + self.__resolution, self.__advance, loop)
+        else:
+            self.__timer = None
+
+    def cancel(self) -> None:
+        """Stop the timer and forget all requests."""
+        if self.__timer is not None:
+            self.__timer.cancel()
+            self.__timer = None
+        for slot in self.__slots:
+            slot.clear()
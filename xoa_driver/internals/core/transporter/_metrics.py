@@ -0,0 +1,216 @@
+from __future__ import annotations
+import time
+from bisect import bisect_left
+from typing import Any
+
+from . import registry
+
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+"""Upper bounds of the latency histogram buckets in seconds, the last bucket has no upper bound."""
+
+
+class Histogram:
+    """Latency histogram with the preallocated buckets of ``LATENCY_BUCKETS``."""
+
+    __slots__ = ("counts", "sum")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        """Number of the observations in every bucket, not cumulative."""
+        self.sum = 0.0
+        """Sum of all observations in seconds."""
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.sum += seconds
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        """Cumulative counts by the upper bound, the last one is "+Inf"."""
+        total = 0
+        result = []
+        for bound, count in zip((*map(str, LATENCY_BUCKETS), "+Inf"), self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+    def as_dict(self) -> dict[str, Any]:
+        count = self.count
+        return {
+            "count": count,
+            "sum": self.sum,
+            "mean": self.sum / count if count else 0.0,
+            "buckets": dict(self.cumulative()),
+        }
+
+
+class CommandMetrics:
+    """Counters and the round trip time histogram of a single command."""
+
+    __slots__ = ("requests", "responses", "pushes", "rtt")
+
+    def __init__(self) -> None:
+        self.requests = 0
+        """Number of the requests sent."""
+        self.responses = 0
+        """Number of the responses received."""
+        self.pushes = 0
+        """Number of the push notifications received."""
+        self.rtt = Histogram()
+        """Time from preparing the request until its response is received."""
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "responses": self.responses,
+            "pushes": self.pushes,
+            "rtt": self.rtt.as_dict(),
+        }
+
+
+def _command_name(cmd_code: int) -> str:
+    try:
+        return registry.get_command(cmd_code).__name__
+    except Exception:
+        return str(cmd_code)
+
+
+def _labels(**labels: Any) -> str:
+    return ",".join(f'{name}="{value}"' for name, value in labels.items())
+
+
+class TransportMetrics:
+    """
+    Counters of a single connection: requests, responses and push events by the command code,
+    round trip time histograms by the command code, requests waiting for the response,
+    bytes sent and received and the latency of the dispatch of the received packets.
+
+    Only counters and preallocated histograms are updated on the way of the requests and responses,
+    the names of the commands are resolved at the export.
+    """
+
+    __slots__ = (
+        "connection",
+        "started_at",
+        "commands",
+        "dispatch_latency",
+        "bytes_sent",
+        "bytes_received",
+        "__sent_at",
+    )
+
+    def __init__(self, connection: str = "") -> None:
+        self.connection = connection
+        """Identity of the connection, used as the label of the exported metrics."""
+        self.started_at = time.time()
+        """Wall clock time the metrics are collected since, in seconds since the epoch."""
+        self.commands: dict[int, CommandMetrics] = {}
+        """Metrics of every command, by the command code."""
+        self.dispatch_latency = Histogram()
+        """Time from receiving the data from the socket until the packet is published."""
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.__sent_at: dict[int, tuple[CommandMetrics, float]] = {}
+
+    @property
+    def in_flight(self) -> int:
+        """Number of the requests which are waiting for the response."""
+        return len(self.__sent_at)
+
+    def __command(self, cmd_code: int) -> CommandMetrics:
+        if (command := self.commands.get(cmd_code)) is None:
+            command = self.commands[cmd_code] = CommandMetrics()
+        return command
+
+    def on_request(self, req_id: int, cmd_code: int) -> None:
+        command = self.__command(cmd_code)
+        command.requests += 1
+        self.__sent_at[req_id] = (command, time.perf_counter())
+
+    def on_response(self, req_id: int, cmd_code: int) -> None:
+        if (sent := self.__sent_at.pop(req_id, None)) is None:
+            self.__command(cmd_code).responses += 1
+            return None
+        command, sent_at = sent
+        command.responses += 1
+        command.rtt.observe(time.perf_counter() - sent_at)
+
+    def on_push(self, cmd_code: int) -> None:
+        self.__command(cmd_code).pushes += 1
+
+    def forget(self, req_id: int) -> None:
+        """The request will never get the response."""
+        self.__sent_at.pop(req_id, None)
+
+    def forget_all(self) -> None:
+        self.__sent_at.clear()
+
+    @property
+    def pushes(self) -> int:
+        """Number of the push notifications received, of all commands."""
+        return sum(command.pushes for command in self.commands.values())
+
+    def push_rate(self) -> float:
+        """
+        Push notifications per second since ``started_at``.
+        The rate of an interval is the difference of ``pushes`` of two snapshots, divided by the time between them.
+        """
+        elapsed = time.time() - self.started_at
+        return self.pushes / elapsed if elapsed > 0 else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Snapshot of the metrics, the commands are keyed by their names."""
+        return {
+            "connection": self.connection,
+            "started_at": self.started_at,
+            "in_flight": self.in_flight,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "pushes": self.pushes,
+            "push_rate": self.push_rate(),
+            "dispatch_latency": self.dispatch_latency.as_dict(),
+            "commands": {_command_name(code): command.as_dict() for code, command in sorted(self.commands.items())},
+        }
+
+    def to_prometheus(self, prefix: str = "xoa") -> str:
+        """Metrics in the Prometheus text exposition format."""
+        conn = {"connection": self.connection}
+        lines = []
+
+        def family(name: str, kind: str, description: str) -> str:
+            lines.append(f"# HELP {prefix}_{name} {description}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            return f"{prefix}_{name}"
+
+        def histogram(metric: str, hist: Histogram, **labels: Any) -> None:
+            for bound, count in hist.cumulative():
+                lines.append(f"{metric}_bucket{{{_labels(**labels, le=bound)}}} {count}")
+            lines.append(f"{metric}_sum{{{_labels(**labels)}}} {hist.sum}")
+            lines.append(f"{metric}_count{{{_labels(**labels)}}} {hist.count}")
+
+        commands = [(_command_name(code), command) for code, command in sorted(self.commands.items())]
+        for name, attr, description in (
+            ("requests_total", "requests", "Requests sent, by command."),
+            ("responses_total", "responses", "Responses received, by command."),
+            ("push_events_total", "pushes", "Push notifications received, by command."),
+        ):
+            metric = family(name, "counter", description)
+            for command_name, command in commands:
+                if value := getattr(command, attr):
+                    lines.append(f"{metric}{{{_labels(**conn, command=command_name)}}} {value}")
+        metric = family("request_rtt_seconds", "histogram", "Round trip time of the requests, by command.")
+        for command_name, command in commands:
+            if command.requests:
+                histogram(metric, command.rtt, **conn, command=command_name)
+        metric = family("dispatch_latency_seconds", "histogram", "Time from receiving the data until the packet is published.")
+        histogram(metric, self.dispatch_latency, **conn)
+        metric = family("in_flight_requests", "gauge", "Requests waiting for the response.")
+        lines.append(f"{metric}{{{_labels(**conn)}}} {self.in_flight}")
+        metric = family("sent_bytes_total", "counter", "Bytes written to the transport.")
+        lines.append(f"{metric}{{{_labels(**conn)}}} {self.bytes_sent}")
+        metric = family("received_bytes_total", "counter", "Bytes received from the transport.")
+        lines.append(f"{metric}{{{_labels(**conn)}}} {self.bytes_received}")
+        return "\n".join(lines) + "\n"
@@ -1,83 +1,200 @@
 from __future__ import annotations
 import asyncio
+import time
 from typing import (
-    AsyncIterator,
     Callable,
     Type,
 )
 from collections import UserDict
+from enum import (
+    IntEnum,
+    auto,
+)
 from . import registry
 from . import exceptions
 from ._typings import XoaCommandType
+from ._stream import FramedStreamReader
+from ._metrics import TransportMetrics
 from .protocol.struct_header import ResponseHeader
 from .protocol.struct_response import Response
 
 
-def create_response_obj(cmd: Type[XoaCommandType], header: ResponseHeader, data: bytes) -> Response:
+def create_response_obj(cmd: Type[XoaCommandType], header: ResponseHeader, data: bytes | memoryview, raw_hex: bool = False) -> Response:
     """Parse bytes retrieved from server to Response structure."""
     return Response(
         class_name=cmd.__name__,
         header=header,
         buffer=data,
-        response_struct=getattr(cmd, "GetDataAttr", None)
+        response_struct=getattr(cmd, "GetDataAttr", None),
+        raw_hex=raw_hex,
     )
 
 
+MAX_EXPIRED = 10_000
+"""Number of the expired request identifiers remembered, the late responses of these are dropped."""
+
+
 class CommandsCodeMapper(UserDict):
     data: dict[int, int]
 
+    def __init__(self) -> None:
+        super().__init__()
+        self.expired: dict[int, None] = {}
+
     def add_code(self, req_id: int, cmd_code: int) -> None:
         self.data[req_id] = cmd_code
 
-    def pop_code(self, req_id: int) -> int:
+    def pop_code(self, req_id: int) -> int | None:
+        """Command code of the request, None for the late response of an expired request."""
         if command_idx := self.data.pop(req_id, None):
             return command_idx
+        if req_id in self.expired:
+            del self.expired[req_id]
+            return None
         raise exceptions.RepeatedRequestID(req_id)
 
+    def expire(self, req_id: int) -> None:
+        if self.data.pop(req_id, None) is None:
+            return None
+        self.expired[req_id] = None
+        if len(self.expired) > MAX_EXPIRED:
+            del self.expired[next(iter(self.expired))]
+
 
 Publisher = Callable[[Response], None]
+ErrorCallback = Callable[[Exception], None]
+
+
+class DispatchMode(IntEnum):
+    """The way how received packets are turned in to the responses"""
+
+    INLINE = auto()
+    """Decode and publish the packets synchronously, right after the data is received."""
+    TASK = auto()
+    """Decode and publish every packet in its own task, consumed from the stream asynchronously."""
 
 
 class PacketsProcessor:
     """Process reading packets from he stream and create a response object for each packet"""
 
-    __slots__ = ("__stream", "__cm_mapper", "__evt_do_job", "__consumer", "__publish",)
-
-    def __init__(self, stream: AsyncIterator[tuple[ResponseHeader, bytes]], publish_func: Publisher) -> None:
+    __slots__ = ("__stream", "__cm_mapper", "__evt_do_job", "__consumer", "__publish", "__mode", "__metrics", "__raw_hex", "__on_error",)
+
+    def __init__(
+        self,
+        stream: FramedStreamReader[ResponseHeader],
+        publish_func: Publisher,
+        mode: DispatchMode = DispatchMode.INLINE,
+        metrics: TransportMetrics | None = None,
+        raw_hex: bool = False,
+        on_error: ErrorCallback | None = None,
+    ) -> None:
         self.__stream = stream
         self.__cm_mapper = CommandsCodeMapper()
         self.__evt_do_job = asyncio.Event()
         self.__consumer: asyncio.Task | None = None
         self.__publish = publish_func
+        self.__mode = mode
+        self.__metrics = metrics
+        self.__raw_hex = raw_hex
+        self.__on_error = on_error
+
+    @property
+    def mode(self) -> DispatchMode:
+        return self.__mode
 
     @property
     def is_running(self) -> bool:
+        if self.__mode is DispatchMode.INLINE:
+            return self.__evt_do_job.is_set()
         return not (self.__consumer is None or self.__consumer.done())
 
     def start(self) -> None:
         if self.is_running:
             return None
         self.__evt_do_job.set()
-        self.__consumer = asyncio.create_task(self.__consume())
+        if self.__mode is DispatchMode.TASK:
+            self.__consumer = asyncio.create_task(self.__consume())
 
     def stop(self) -> None:
         if not self.is_running:
             return None
         self.__evt_do_job.clear()
-        self.__consumer.cancel()  # type: ignore[ReportOptionalMemberAccess]
-        self.__consumer = None
+        if self.__consumer is not None:
+            self.__consumer.cancel()
+            self.__consumer = None
 
     def register(self, req_id: int, cmd_code: int) -> None:
         self.__cm_mapper.add_code(req_id=req_id, cmd_code=cmd_code)
 
-    async def __task(self, header: ResponseHeader, body_bytes: bytes) -> None:
+    def unregister(self, req_id: int) -> None:
+        self.__cm_mapper.pop(req_id, None)
+
+    def expire(self, req_id: int) -> None:
+        """Forget the request which is not waiting for the response anymore, its late response is dropped."""
+        self.__cm_mapper.expire(req_id)
+
+    def clear(self) -> None:
+        """Forget all requests which are waiting for the response."""
+        self.__cm_mapper.clear()
+
+    def dispatch(self, received_at: float = 0.0) -> None:
+        """
+        Decode and publish all packets which are already framed by the stream. Only used in INLINE mode.
+        ``received_at`` is the ``time.perf_counter()`` of receiving the data, for the dispatch latency metric.
+        """
+        if self.__mode is not DispatchMode.INLINE or not self.__evt_do_job.is_set():
+            return None
+        for header, body_bytes in self.__stream.pop_frames():
+            try:
+                self.__process(header, body_bytes, received_at)
+            except Exception as e:
+                # Same as an exception of the task in TASK mode, it must not break the processing of the next packets.
+                asyncio.get_running_loop().call_exception_handler(
+                    {
+                        "message": "Exception in processing of the received packet",
+                        "exception": e,
+                    }
+                )
+        if (error := self.__stream._error) is not None:
+            self.__fail(error)
+
+    def __fail(self, error: Exception) -> None:
+        """The stream can't be framed anymore, no packet is processed after the error."""
+        self.__evt_do_job.clear()
+        asyncio.get_running_loop().call_exception_handler(
+            {
+                "message": "Invalid data received, the processing of the packets is stopped",
+                "exception": error,
+            }
+        )
+        if self.__on_error is not None:
+            self.__on_error(error)
+
+    def __process(self, header: ResponseHeader, body_bytes: bytes | memoryview, received_at: float = 0.0) -> None:
         command_idx = header.cmd_code if header.is_pushed else self.__cm_mapper.pop_code(header.request_identifier)
+        if command_idx is None:
+            return None
+        if (metrics := self.__metrics) is not None:
+            if header.is_pushed:
+                metrics.on_push(command_idx)
+            else:
+                metrics.on_response(header.request_identifier, command_idx)
         xmc_type = registry.get_command(command_idx)
-        response = create_response_obj(xmc_type, header, body_bytes)
+        response = create_response_obj(xmc_type, header, body_bytes, self.__raw_hex)
         self.__publish(response)
+        if metrics is not None and received_at:
+            metrics.dispatch_latency.observe(time.perf_counter() - received_at)
+
+    async def __task(self, header: ResponseHeader, body_bytes: bytes | memoryview, received_at: float) -> None:
+        self.__process(header, body_bytes, received_at)
 
     async def __consume(self) -> None:
-        async for header, body_bytes in self.__stream:
-            asyncio.create_task(self.__task(header, body_bytes))
-            if not self.__evt_do_job.is_set():
-                return None
+        try:
+            async for header, body_bytes in self.__stream:
+                # In TASK mode the latency is measured from reading the packet out of the stream.
+                received_at = time.perf_counter() if self.__metrics is not None else 0.0
+                asyncio.create_task(self.__task(header, body_bytes, received_at))
+                if not self.__evt_do_job.is_set():
+                    return None
+        except ValueError as e:
+            self.__fail(e)
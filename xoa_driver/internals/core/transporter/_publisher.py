@@ -16,6 +16,7 @@ from . import exceptions
 from .protocol.struct_response import Response
 
 ON_EVT_DISCONNECTED: Final[int] = -1
+ON_EVT_RECONNECTED: Final[int] = -2
 
 CB = Callable[..., Coroutine[Any, None, None]]
 
@@ -34,15 +35,39 @@ class FuturesMapper(UserDict):
             raise exceptions.XoaLostFuture(req_id, cmd_name)
         return fut
 
+    def fail_future(self, req_id: int, cmd_name: str, exception: Exception) -> None:
+        fut = self.data.pop((req_id, cmd_name), None)
+        if fut and not fut.done():
+            fut.set_exception(exception)
+
+    def fail_all(self, exception: Exception) -> None:
+        for fut in self.data.values():
+            if not fut.done():
+                fut.set_exception(exception)
+        self.data.clear()
+
+
+EventKey = tuple[int, int | None, int | None]
+"""Subscription key of the event code, module index and port index, where None is matching any index."""
+
 
 class EventsObserver:
     __slots__ = ("__events",)
 
     def __init__(self) -> None:
-        self.__events: dict[int, list[CB]] = defaultdict(list)
+        self.__events: dict[EventKey, list[CB]] = defaultdict(list)
 
     def dispatch(self, evt: int, *args, **kwargs) -> None:
-        for evt_func in self.__events.get(evt, []):
+        self.__dispatch_key((evt, None, None), *args, **kwargs)
+
+    def dispatch_scoped(self, evt: int, module: int, port: int, *args, **kwargs) -> None:
+        """Dispatch the event only to the callbacks which are subscribed on any, or on the same module and port."""
+        self.__dispatch_key((evt, None, None), *args, **kwargs)
+        self.__dispatch_key((evt, module, None), *args, **kwargs)
+        self.__dispatch_key((evt, module, port), *args, **kwargs)
+
+    def __dispatch_key(self, key: EventKey, *args, **kwargs) -> None:
+        for evt_func in self.__events.get(key, ()):
             asyncio.create_task(
                 evt_func(*args, **kwargs)
             ).add_done_callback(self.__handle_exceptions)
@@ -53,8 +78,9 @@ class EventsObserver:
         elif e := fut.exception():
             raise e
 
-    def subscribe(self, evt: int, func: CB) -> None:
-        self.__events[evt].append(func)
+    def subscribe(self, evt: int, func: CB, module: int | None = None, port: int | None = None) -> None:
+        assert module is not None or port is None, "Port index can be subscribed only together with the module index."
+        self.__events[(evt, module, port)].append(func)
 
 
 class ResponsePublisher:
@@ -68,10 +94,19 @@ class ResponsePublisher:
     def register_request(self, req_id: int, cmd_name: str) -> asyncio.Future:
         return self.__futures_mapper.make_future(req_id, cmd_name)
 
-    def subscribe(self, evt: int, func: CB) -> None:
-        self.__observer.subscribe(evt, func)
+    def subscribe(self, evt: int, func: CB, module: int | None = None, port: int | None = None) -> None:
+        self.__observer.subscribe(evt, func, module, port)
 
     subscribe_connection_lost = partialmethod(subscribe, ON_EVT_DISCONNECTED)
+    subscribe_reconnected = partialmethod(subscribe, ON_EVT_RECONNECTED)
+
+    def fail_request(self, req_id: int, cmd_name: str, exception: Exception) -> None:
+        """Resolve the future of the request which will never get the response."""
+        self.__futures_mapper.fail_future(req_id, cmd_name, exception)
+
+    def fail_all(self, exception: Exception) -> None:
+        """Resolve the futures of all requests, none of them will get the response."""
+        self.__futures_mapper.fail_all(exception)
 
     def publish(self, response: Response) -> None:
         if response.is_pushed:
@@ -82,9 +117,14 @@ class ResponsePublisher:
     def publish_connection_lost(self, info) -> None:
         self.__observer.dispatch(ON_EVT_DISCONNECTED, info)
 
+    def publish_reconnected(self, info) -> None:
+        self.__observer.dispatch(ON_EVT_RECONNECTED, info)
+
     def __publish_push_response(self, response: Response) -> None:
-        self.__observer.dispatch(
+        self.__observer.dispatch_scoped(
             response.cmd_code,
+            response.header.module_index,
+            response.header.port_index,
             response
         )
         self.__logger.debug_push(response)
@@ -0,0 +1,76 @@
+from __future__ import annotations
+import asyncio
+from dataclasses import dataclass
+from typing import Iterator
+
+
+@dataclass(frozen=True)
+class ReconnectPolicy:
+    """
+    Restoring of the lost connection, with exponential backoff between the attempts.
+
+    After the connection is restored, the session is logged on again, the queries which were waiting
+    for the response are sent again, and the other requests which were waiting fail with ``XoaRequestNotReplayedError``.
+    """
+
+    attempts: int = 10
+    """Maximum number of the connection attempts, before the connection is considered lost."""
+    initial_delay: float = 0.5
+    """Seconds before the first attempt."""
+    max_delay: float = 30.0
+    """Maximum seconds between two attempts."""
+    factor: float = 2.0
+    """Multiplier of the delay after every failed attempt."""
+    connect_timeout: float = 5.0
+    """Seconds to wait for a single attempt."""
+
+    def __post_init__(self) -> None:
+        assert self.attempts > 0, "<attempts> must be positive"
+        assert self.initial_delay >= 0 and self.max_delay >= self.initial_delay, "<max_delay> must not be less than <initial_delay>"
+        assert self.factor >= 1, "<factor> must be at least 1"
+
+    def delays(self) -> Iterator[float]:
+        """Seconds to wait before every attempt."""
+        delay = self.initial_delay
+        for _ in range(self.attempts):
+            yield delay
+            delay = min(delay * self.factor, self.max_delay)
+
+
+class InFlightRequests:
+    """
+    Requests which are sent and are waiting for the response, by the request identifier.
+
+    Only the encoded queries are kept, they can be sent again with the same identifier.
+    """
+
+    __slots__ = ("__requests",)
+
+    def __init__(self) -> None:
+        self.__requests: dict[int, tuple[str, bytes | None]] = {}
+
+    def __len__(self) -> int:
+        return len(self.__requests)
+
+    def add(self, req_id: int, cmd_name: str, data: bytes | None, future: asyncio.Future) -> None:
+        """Keep the request until its future is done, ``data`` is None for the request which can't be sent again."""
+        self.__requests[req_id] = (cmd_name, data)
+        future.add_done_callback(lambda _: self.__requests.pop(req_id, None))
+
+    def pop_not_replayable(self) -> list[tuple[int, str]]:
+        """Remove the requests which can't be sent again, return their identifiers and command names."""
+        popped = [(req_id, cmd_name) for req_id, (cmd_name, data) in self.__requests.items() if data is None]
+        for req_id, _ in popped:
+            del self.__requests[req_id]
+        return popped
+
+    def replayable(self) -> list[int]:
+        """Identifiers of the requests which can be sent again, in the order they were sent."""
+        return [req_id for req_id, (_, data) in self.__requests.items() if data is not None]
+
+    def encoded(self, req_ids: list[int]) -> list[bytes]:
+        """Encoded requests of the identifiers which are still waiting for the response."""
+        return [data for req_id in req_ids if (request := self.__requests.get(req_id)) and (data := request[1])]
+
+    def clear(self) -> None:
+        self.__requests.clear()
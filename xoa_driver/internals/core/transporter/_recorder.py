@@ -0,0 +1,248 @@
+from __future__ import annotations
+import asyncio
+import mmap
+import os
+import struct
+import time
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import (
+    Iterator,
+    NamedTuple,
+)
+
+from ._stream import FramedStreamReader
+from ._processor import PacketsProcessor
+from .protocol.struct_header import ResponseHeader
+from .protocol.struct_response import Response
+from .protocol._constants import MAGIC_WORD
+
+MAGIC = b"XOAREC01"
+FILE_HEADER = struct.Struct("<8s7Q")
+"""Magic, capacity, head, tail, used bytes, number of the records, number of the dropped records, start time in ns."""
+RECORD_HEADER = struct.Struct("<BQI")
+"""Direction, nanoseconds since the start of the recording and the length of the data."""
+
+
+class Direction(IntEnum):
+    """Direction of the recorded data."""
+
+    SENT = 0
+    """Written to the tester."""
+    RECEIVED = 1
+    """Received from the tester."""
+
+
+class Record(NamedTuple):
+    direction: Direction
+    timestamp: float
+    """Seconds since the start of the recording, of the monotonic clock."""
+    data: bytes
+
+
+class SessionRecorder:
+    """
+    Recorder of the raw bytes sent to and received from a tester, in the order and the chunks they were written and received.
+
+    The records are appended to the memory mapped file of a fixed ``capacity`` in bytes, used as a ring buffer:
+    when the file is full, the oldest records are dropped. The recording is read by :class:`SessionReplayer`.
+    """
+
+    __slots__ = ("path", "capacity", "__file", "__map", "__head", "__tail", "__used", "__records", "__dropped", "__started_ns")
+
+    def __init__(self, path: str | os.PathLike, capacity: int = 64 * 1024 * 1024) -> None:
+        assert capacity > RECORD_HEADER.size, "<capacity> must be larger than a record header"
+        self.path = path
+        self.capacity = capacity
+        """Size of the ring buffer in bytes, without the file header."""
+        self.__file = open(path, "w+b")
+        self.__file.truncate(FILE_HEADER.size + capacity)
+        self.__map = mmap.mmap(self.__file.fileno(), FILE_HEADER.size + capacity)
+        self.__head = 0
+        self.__tail = 0
+        self.__used = 0
+        self.__records = 0
+        self.__dropped = 0
+        self.__started_ns = time.monotonic_ns()
+        self.__write_header()
+
+    def __enter__(self) -> SessionRecorder:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def records(self) -> int:
+        """Number of the records kept in the file."""
+        return self.__records
+
+    @property
+    def dropped(self) -> int:
+        """Number of the oldest records overwritten, and of the records larger than the capacity."""
+        return self.__dropped
+
+    def sent(self, data: bytes | bytearray | memoryview) -> None:
+        self.__append(Direction.SENT, data)
+
+    def received(self, data: bytes | bytearray | memoryview) -> None:
+        self.__append(Direction.RECEIVED, data)
+
+    def __append(self, direction: Direction, data: bytes | bytearray | memoryview) -> None:
+        if self.__map.closed:
+            return None
+        length = len(data)
+        size = RECORD_HEADER.size + length
+        if size > self.capacity:
+            self.__dropped += 1
+            return None
+        while self.capacity - self.__used < size:
+            self.__drop_oldest()
+        header = RECORD_HEADER.pack(direction, time.monotonic_ns() - self.__started_ns, length)
+        self.__write(self.__head, header)
+        self.__write((self.__head + RECORD_HEADER.size) % self.capacity, data)
+        self.__head = (self.__head + size) % self.capacity
+        self.__used += size
+        self.__records += 1
+        self.__write_header()
+
+    def __drop_oldest(self) -> None:
+        _, _, length = RECORD_HEADER.unpack(_read(self.__map, self.capacity, self.__tail, RECORD_HEADER.size))
+        size = RECORD_HEADER.size + length
+        self.__tail = (self.__tail + size) % self.capacity
+        self.__used -= size
+        self.__records -= 1
+        self.__dropped += 1
+
+    def __write(self, position: int, data: bytes | bytearray | memoryview) -> None:
+        """Write at the position of the ring, the data which doesn't fit before the end continues from the start."""
+        start = FILE_HEADER.size + position
+        first = min(len(data), self.capacity - position)
+        self.__map[start:start + first] = data[:first]
+        if first < len(data):
+            self.__map[FILE_HEADER.size:FILE_HEADER.size + len(data) - first] = data[first:]
+
+    def __write_header(self) -> None:
+        FILE_HEADER.pack_into(
+            self.__map, 0, MAGIC, self.capacity, self.__head, self.__tail, self.__used, self.__records, self.__dropped, self.__started_ns
+        )
+
+    def flush(self) -> None:
+        if not self.__map.closed:
+            self.__map.flush()
+
+    def close(self) -> None:
+        if self.__map.closed:
+            return None
+        self.__map.flush()
+        self.__map.close()
+        self.__file.close()
+
+
+def _read(buffer: mmap.mmap, capacity: int, position: int, size: int) -> bytes:
+    """Read from the position of the ring which starts after the file header."""
+    start = FILE_HEADER.size + position
+    first = min(size, capacity - position)
+    data = buffer[start:start + first]
+    if first < size:
+        data += buffer[FILE_HEADER.size:FILE_HEADER.size + size - first]
+    return data
+
+
+@dataclass
+class ReplayStats:
+    """Result of replaying a recording."""
+
+    records: int = 0
+    """Number of the records replayed."""
+    received_bytes: int = 0
+    """Bytes fed in to the stream reader."""
+    responses: int = 0
+    """Number of the decoded responses."""
+    pushes: int = 0
+    """Number of the decoded push notifications."""
+    errors: int = 0
+    """Number of the packets which failed, the responses of the requests dropped from the ring buffer included."""
+    recorded_seconds: float = 0.0
+    """Time between the first and the last record."""
+    seconds: float = 0.0
+    """Time of the replay."""
+
+    @property
+    def packets_per_second(self) -> float:
+        return (self.responses + self.pushes) / self.seconds if self.seconds else 0.0
+
+
+class SessionReplayer:
+    """
+    Reader of the recording of :class:`SessionRecorder`, which replays the received data
+    through the stream reader and the packets processor of the connection, as fast as possible.
+
+    The command of every response is known from the recorded request with the same identifier.
+    """
+
+    __slots__ = ("path", "dropped")
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        self.path = path
+        self.dropped = 0
+        """Number of the records dropped by the recorder."""
+
+    def records(self) -> Iterator[Record]:
+        """Records from the oldest one."""
+        with open(self.path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            magic, capacity, _, position, _, records, self.dropped, _ = FILE_HEADER.unpack_from(buffer, 0)
+            if magic != MAGIC:
+                raise ValueError(f"{self.path} is not a session recording")
+            for _ in range(records):
+                direction, timestamp_ns, length = RECORD_HEADER.unpack(_read(buffer, capacity, position, RECORD_HEADER.size))
+                data = _read(buffer, capacity, (position + RECORD_HEADER.size) % capacity, length)
+                position = (position + RECORD_HEADER.size + length) % capacity
+                yield Record(Direction(direction), timestamp_ns / 1e9, data)
+
+    async def replay(self, *, decode: bool = True) -> ReplayStats:
+        """
+        Replay the recording, the values of every response are decoded unless ``decode`` is False.
+        The records are read before the replay starts, only the stream reader, the processor and the decoding are timed.
+        """
+        records = list(self.records())
+        stats = ReplayStats(records=len(records))
+        if records:
+            stats.recorded_seconds = records[-1].timestamp - records[0].timestamp
+
+        def publish(response: Response) -> None:
+            if response.is_pushed:
+                stats.pushes += 1
+            else:
+                stats.responses += 1
+            if decode and response.values is not None:
+                response.values.to_tuple()
+
+        def count_error(loop: asyncio.AbstractEventLoop, context: dict) -> None:
+            stats.errors += 1
+
+        requests = FramedStreamReader(header_struct=ResponseHeader)
+        stream = FramedStreamReader(header_struct=ResponseHeader)
+        processor = PacketsProcessor(stream=stream, publish_func=publish)
+        processor.start()
+        loop = asyncio.get_running_loop()
+        exception_handler = loop.get_exception_handler()
+        loop.set_exception_handler(count_error)
+        try:
+            # After the oldest records are dropped, the first received data can start in the middle of a packet.
+            synced = False
+            begin = time.perf_counter()
+            for direction, _, data in records:
+                if direction is Direction.SENT:
+                    requests.feed_data(data)
+                    for header, _ in requests.pop_frames():
+                        processor.register(req_id=header.request_identifier, cmd_code=header.cmd_code)
+                elif synced or (synced := data.startswith(MAGIC_WORD)):
+                    stats.received_bytes += len(data)
+                    stream.feed_data(data)
+                    processor.dispatch()
+            stats.seconds = time.perf_counter() - begin
+        finally:
+            loop.set_exception_handler(exception_handler)
+            processor.stop()
+        return stats
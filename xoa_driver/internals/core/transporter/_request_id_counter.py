@@ -1,4 +1,3 @@
-import asyncio
 from enum import IntEnum
 
 
@@ -12,17 +11,29 @@ class ReservedRequestID(IntEnum):
 
 
 class RequestIdCounter:
-    """Aggregator of request ID."""
-    __slots__ = ("__req_id", "__lock",)
+    """
+    Aggregator of request ID.
+
+    All requests of the connection are prepared inside of the same event loop,
+    so the allocation is done without any lock.
+    """
+    __slots__ = ("__req_id",)
 
     def __init__(self) -> None:
         self.__req_id = ReservedRequestID.started()
-        self.__lock = asyncio.Lock()
+
+    def reserve(self, count: int) -> range:
+        """Reserve a contiguous block of request IDs, the block is never split by the wrap around of the counter."""
+        if count < 1:
+            raise ValueError(f"Number of the reserved request IDs must be positive, got: {count}")
+        first = self.__req_id + 1
+        if first + count - 1 > ReservedRequestID.REQUEST_ID_LIMIT:
+            first = ReservedRequestID.started() + 1
+        self.__req_id = first + count - 1
+        return range(first, first + count)
+
+    def next_number(self) -> int:
+        return self.reserve(1).start
 
     async def get_number(self) -> int:
-        async with self.__lock:
-            if self.__req_id >= ReservedRequestID.REQUEST_ID_LIMIT:
-                self.__req_id = ReservedRequestID.started()
-            else:
-                self.__req_id += 1
-            return self.__req_id
+        return self.next_number()
@@ -1,8 +1,11 @@
 from __future__ import annotations
 from asyncio import Future
+from collections import deque
 from typing import Generic
+from typing import Iterator
 from typing import Self
 from ._typings import HeaderType
+from .protocol._constants import MAGIC_WORD
 
 
 class StreamReader(Generic[HeaderType]):
@@ -97,3 +100,131 @@ class StreamReader(Generic[HeaderType]):
             raise ValueError("Invalid Header")
         body_bytes = await self.readexactly(header.body_size)
         return (header, body_bytes)
+
+
+class FramedStreamReader(Generic[HeaderType]):
+    """
+    Stream reader which frames all complete packets of a received chunk in one pass.
+
+    Packets are located with a read offset over the received chunk and the bodies are
+    handed out as zero-copy ``memoryview`` slices of it. Only the incomplete tail of a chunk
+    is copied into the pending buffer, which is compacted once the packet it holds is complete.
+    """
+
+    __slots__ = ("_pending", "_required", "_frames", "_error", "_eof", "_waiter", "__header_struct")
+
+    def __init__(self, header_struct: type[HeaderType]) -> None:
+        self._pending = bytearray()
+        self._required = header_struct.size  # Number of bytes required for framing the next packet.
+        self._frames: deque[tuple[HeaderType, memoryview]] = deque()
+        self._error: Exception | None = None
+        self._eof = False  # Whether we're done.
+        self._waiter = None  # A future used by _wait_for_data()
+        self.__header_struct = header_struct
+
+    def __aiter__(self) -> Self:
+        return self
+
+    async def __anext__(self) -> tuple[HeaderType, memoryview]:
+        try:
+            val = await self.read_pkt()
+        except EOFError:
+            raise StopAsyncIteration
+        else:
+            return val
+
+    def _wakeup_waiter(self) -> None:
+        waiter = self._waiter
+        if waiter is not None:
+            self._waiter = None
+            if not waiter.cancelled():
+                waiter.set_result(None)
+
+    async def _wait_for_data(self, func_name: str) -> None:
+        """Wait until feed_data() or feed_eof() is called."""
+        if self._waiter is not None:
+            raise RuntimeError(
+                f'{func_name}() called while another coroutine is '
+                f'already waiting for incoming data'
+            )
+
+        assert not self._eof, '_wait_for_data after EOF'
+
+        self._waiter = Future()
+        try:
+            await self._waiter
+        finally:
+            self._waiter = None
+
+    def feed_eof(self) -> None:
+        self._eof = True
+        self._wakeup_waiter()
+
+    def at_eof(self) -> bool:
+        """Return True if there are no framed packets left and 'feed_eof' was called."""
+        return self._eof and not self._frames
+
+    def feed_data(self, data: bytes) -> None:
+        assert not self._eof, 'feed_data after feed_eof'
+
+        if not data or self._error is not None:
+            return None
+
+        if self._pending:
+            self._pending.extend(data)
+            if len(self._pending) < self._required:
+                return None
+            data = bytes(self._pending)
+            self._pending.clear()
+
+        try:
+            self.__frame(data)
+        except ValueError as e:
+            self._error = e
+        self._wakeup_waiter()
+
+    def __frame(self, data: bytes) -> None:
+        """Frame every complete packet of the chunk and keep the incomplete tail as pending."""
+        view = memoryview(data)
+        size = len(view)
+        header_size = self.__header_struct.size
+        from_buffer_copy = self.__header_struct.from_buffer_copy
+        offset = 0
+        while size - offset >= header_size:
+            if not data.startswith(MAGIC_WORD, offset):
+                raise ValueError("Invalid Header")
+            header = from_buffer_copy(data, offset)
+            body_size = header.number_of_value_bytes + header.number_of_indices * 4
+            end = offset + header_size + ((body_size + 3) & ~3)
+            if end > size:
+                self._required = end - offset
+                break
+            self._frames.append((header, view[offset + header_size:end]))
+            offset = end
+        else:
+            self._required = header_size
+        if offset < size:
+            self._pending.extend(view[offset:])
+
+    def reset(self) -> None:
+        """Drop the incomplete and the framed packets, the stream is reading a new connection."""
+        self._pending.clear()
+        self._required = self.__header_struct.size
+        self._frames.clear()
+        self._error = None
+        self._eof = False
+
+    def pop_frames(self) -> Iterator[tuple[HeaderType, memoryview]]:
+        """Drain the packets which are already framed, without waiting for more data."""
+        frames = self._frames
+        while frames:
+            yield frames.popleft()
+
+    async def read_pkt(self) -> tuple[HeaderType, memoryview]:
+        while not self._frames:
+            if self._error is not None:
+                raise self._error
+            if self._eof:
+                raise EOFError(bytes(self._pending), self._required)
+            await self._wait_for_data('read_pkt')
+        return self._frames.popleft()
@@ -38,6 +38,7 @@ class ICmdOnlyGet(ICommand, t.Protocol):
     """A template class which provide only <cmd_get> method."""
     GetDataAttr: t.Type[GetStructType]  # type: ignore
     get: t.Callable[[], Token[GetStructType]]  # type: ignore
+    get_template: t.Callable[[], Token[GetStructType]]  # type: ignore
 
 
 XoaCommandType = t.Union[ICmdOnlySet, ICmdOnlyGet]
@@ -42,3 +42,40 @@ class XoaLostFuture(XoaException):
         self.cls_name = cls_name
         self.msg = f"Command was sent but the response handler was not registered {req_id} {cls_name}."
         super().__init__(self.msg)
+
+
+class XoaRequestNotReplayedError(TransporterException):
+    def __init__(self, req_id: int, cls_name: str) -> None:
+        self.req_id = req_id
+        self.cls_name = cls_name
+        self.msg = (
+            f"Connection was lost before the response of {cls_name} (request {req_id}) was received. "
+            "The request may change the tester, it is not sent again, check the tester and repeat it."
+        )
+        super().__init__(self.msg)
+
+
+class XoaConnectionLostError(TransporterException):
+    def __init__(self, host: str, port: int, attempts: int) -> None:
+        self.host = host
+        self.port = port
+        self.attempts = attempts
+        self.msg = f"Connection to {host}:{port} was lost and not restored in {attempts} attempts."
+        super().__init__(self.msg)
+
+
+class XoaRequestTimeoutError(TransporterException, TimeoutError):
+    def __init__(self, req_id: int, cls_name: str, seconds_timeout: float) -> None:
+        self.req_id = req_id
+        self.cls_name = cls_name
+        self.seconds_timeout = seconds_timeout
+        self.msg = f"No response of {cls_name} (request {req_id}) in {seconds_timeout} sec."
+        super().__init__(self.msg)
+
+
+class XoaStreamCorruptedError(TransporterException):
+    def __init__(self, peername: tuple[str, int] | None, reason: Exception) -> None:
+        self.peername = peername
+        self.reason = reason
+        self.msg = f"The data received from {peername} can't be framed ({reason}), the connection is closed."
+        super().__init__(self.msg)
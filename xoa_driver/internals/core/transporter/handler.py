@@ -1,18 +1,42 @@
 from __future__ import annotations
 import asyncio
-from typing import Callable
+import time
+from typing import (
+    Callable,
+    Sequence,
+)
+from collections import Counter
 from uuid import uuid4
 from .logger import (
     TransportationLogger,
-    CustomLogger
+    CustomLogger,
+    DeferredLogging,
+)
+from .protocol.struct_request import (
+    Request,
+    RequestTemplate,
 )
-from .protocol.struct_request import Request
 from .protocol.struct_header import ResponseHeader
+from .protocol._constants import CommandType
 from ._request_id_counter import RequestIdCounter
-from ._stream import StreamReader
-from ._processor import PacketsProcessor
+from ._stream import FramedStreamReader
+from ._processor import (
+    PacketsProcessor,
+    DispatchMode,
+)
 from ._publisher import ResponsePublisher
+from ._reconnect import (
+    ReconnectPolicy,
+    InFlightRequests,
+)
+from ._deadlines import DeadlineWheel
+from ._metrics import TransportMetrics
+from ._recorder import SessionRecorder
 from ._typings import ICommand
+from . import exceptions
+
+ResumeRequests = Callable[[], Sequence[Request]]
+"""Requests which restore the session on the restored connection, before any other request."""
 
 
 class TransportationHandler(asyncio.Protocol):
@@ -21,43 +45,111 @@ class TransportationHandler(asyncio.Protocol):
     __slots__ = (
         "identity",
         "peername",
+        "metrics",
         "__log",
         "__transport",
         "__id_counter",
         "__stream",
         "__resp_publisher",
-        "__pkt_processor"
+        "__pkt_processor",
+        "__can_write",
+        "__reconnect",
+        "__in_flight",
+        "__resume_requests",
+        "__reconnecting",
+        "__backlog",
+        "__replay",
+        "__address",
+        "__closing",
+        "__deadlines",
+        "__recorder",
     )
 
-    def __init__(self, *, enable_logging: bool = False, custom_logger: CustomLogger | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        enable_logging: bool = False,
+        custom_logger: CustomLogger | None = None,
+        dispatch_mode: DispatchMode = DispatchMode.INLINE,
+        reconnect: ReconnectPolicy | None = None,
+        request_timeout: float | None = None,
+        enable_metrics: bool = False,
+        recorder: SessionRecorder | None = None,
+        deferred_logging: DeferredLogging | None = None,
+        raw_hex: bool = False,
+    ) -> None:
         self.identity = uuid4().hex[:6]
         self.peername: tuple[str, int] | None = None
+        self.metrics = TransportMetrics(self.identity) if enable_metrics else None
+        """Counters and latency histograms of the connection, None unless ``enable_metrics`` is True."""
         self.__transport: asyncio.Transport | None = None
         self.__id_counter = RequestIdCounter()
         self.__log = TransportationLogger(
             cid=self.identity,
             enabled=enable_logging,
-            logger=custom_logger
+            logger=custom_logger,
+            deferred=deferred_logging,
         )
-        self.__stream = StreamReader(header_struct=ResponseHeader)
+        self.__stream = FramedStreamReader(header_struct=ResponseHeader)
         self.__resp_publisher = ResponsePublisher(logger=self.__log)
         self.__pkt_processor = PacketsProcessor(
             stream=self.__stream,
-            publish_func=self.__resp_publisher.publish
+            publish_func=self.__resp_publisher.publish,
+            mode=dispatch_mode,
+            metrics=self.metrics,
+            raw_hex=raw_hex,
+            on_error=self.__on_stream_error,
         )
+        self.__can_write = asyncio.Event()
+        self.__can_write.set()
+        self.__reconnect = reconnect
+        self.__in_flight = InFlightRequests() if reconnect else None
+        self.__resume_requests: ResumeRequests | None = None
+        self.__reconnecting: asyncio.Task | None = None
+        self.__backlog: list[bytes] = []
+        self.__replay: list[int] = []
+        self.__address: tuple[str, int] | None = None
+        self.__closing = False
+        self.__deadlines = DeadlineWheel(request_timeout, self.__expire) if request_timeout else None
+        self.__recorder = recorder
 
     @property
     def is_connected(self) -> bool:
         return not (self.__transport is None or self.__transport.is_closing())
 
+    @property
+    def is_reconnecting(self) -> bool:
+        """The connection is lost and is being restored, the requests are sent after it is restored."""
+        return self.__reconnecting is not None
+
+    @property
+    def timeouts(self) -> Counter[int]:
+        """Number of the requests expired by the ``request_timeout``, by the command code."""
+        return self.__deadlines.timeouts if self.__deadlines is not None else Counter()
+
+    def resume_with(self, requests: ResumeRequests) -> None:
+        """Register the factory of the requests which log on again, they are sent first on the restored connection."""
+        self.__resume_requests = requests
+
     def connection_made(self, transport: asyncio.Transport) -> None:
         self.__transport = transport
         self.peername = transport.get_extra_info("peername")
+        self.__closing = False
         self.__pkt_processor.start()
         self.__log.info(f"Connected to {self.peername}")
+        if self.__reconnecting is not None:
+            self.__resume()
+        elif self.peername:
+            self.__address = self.peername[:2]
 
     def data_received(self, data: bytes) -> None:
         """Process received data from xenaserver."""
+        received_at = 0.0
+        if self.metrics is not None:
+            received_at = time.perf_counter()
+            self.metrics.bytes_received += len(data)
+        if self.__recorder is not None:
+            self.__recorder.received(data)
         try:
             self.__stream.feed_data(data)
         except AssertionError:
@@ -66,19 +158,110 @@ class TransportationHandler(asyncio.Protocol):
                 self.__stream.feed_data(data)
             else:
                 self.close()
+                return None
+        self.__pkt_processor.dispatch(received_at)
 
     def eof_received(self) -> None:
         self.__stream.feed_eof()
         self.__log.info("EOF received")
 
+    def pause_writing(self) -> None:
+        self.__can_write.clear()
+
+    def resume_writing(self) -> None:
+        self.__can_write.set()
+
     def connection_lost(self, exc: Exception | None) -> None:
-        self.__resp_publisher.publish_connection_lost(self.peername)
         self.__transport = None
+        self.__can_write.set()
         self.__pkt_processor.stop()
         if exc:
             self.__log.error(exc)
         else:
             self.__log.info(f"The server {self.peername} closed the connection")
+        if self.__reconnect is not None and self.__address is not None and not self.__closing:
+            self.__suspend()
+        else:
+            self.__resp_publisher.publish_connection_lost(self.peername)
+            self.__log.close()
+
+    def __suspend(self) -> None:
+        """Fail the requests which can't be sent again and start restoring the connection."""
+        self.__stream.reset()
+        for req_id, cmd_name in self.__in_flight.pop_not_replayable():  # type: ignore[reportOptionalMemberAccess]
+            self.__pkt_processor.unregister(req_id)
+            if self.metrics is not None:
+                self.metrics.forget(req_id)
+            self.__resp_publisher.fail_request(req_id, cmd_name, exceptions.XoaRequestNotReplayedError(req_id, cmd_name))
+        # The requests made while reconnecting are kept in the backlog, only these are sent again.
+        self.__replay = self.__in_flight.replayable()  # type: ignore[reportOptionalMemberAccess]
+        self.__reconnecting = asyncio.create_task(self.__reconnect_loop())
+
+    async def __reconnect_loop(self) -> None:
+        policy: ReconnectPolicy = self.__reconnect  # type: ignore[assignment]
+        loop = asyncio.get_running_loop()
+        for attempt, delay in enumerate(policy.delays(), start=1):
+            await asyncio.sleep(delay)
+            self.__log.info(f"Reconnecting to {self.__address}, attempt {attempt} of {policy.attempts}")
+            try:
+                await asyncio.wait_for(
+                    loop.create_connection(lambda: self, *self.__address),  # type: ignore[misc]
+                    policy.connect_timeout
+                )
+            except (OSError, asyncio.TimeoutError) as e:
+                self.__log.error(f"Reconnection to {self.__address} failed: {e!r}")
+            else:
+                return None
+        self.__abandon()
+
+    def __resume(self) -> None:
+        """Log on again and send the queries which were waiting, and the requests made while reconnecting."""
+        self.__reconnecting = None
+        data, futures = self.prepare_data_batch(self.__resume_requests() if self.__resume_requests else ())
+        for fut_ in futures:
+            fut_.add_done_callback(self.__check_resumed)
+        replay = self.__in_flight.encoded(self.__replay)  # type: ignore[reportOptionalMemberAccess]
+        data = b"".join((data, *replay, *self.__backlog))
+        self.__transport.write(data)  # type: ignore[reportOptionalMemberAccess]
+        if self.metrics is not None:
+            self.metrics.bytes_sent += len(data)
+        if self.__recorder is not None:
+            self.__recorder.sent(data)
+        self.__backlog.clear()
+        self.__replay.clear()
+        self.__log.info(f"Connection to {self.peername} is restored, {len(replay)} queries are sent again")
+        self.__resp_publisher.publish_reconnected(self.peername)
+
+    def __check_resumed(self, fut_: asyncio.Future) -> None:
+        if not fut_.cancelled() and (e := fut_.exception()):
+            self.__log.error(f"Session is not restored: {e!r}")
+
+    def __on_stream_error(self, error: Exception) -> None:
+        """The received data can't be framed, fail all requests which are waiting and close the connection."""
+        self.__log.error(f"Invalid data received from {self.peername}: {error!r}")
+        if self.__in_flight is not None:
+            self.__in_flight.clear()
+        self.__pkt_processor.clear()
+        if self.metrics is not None:
+            self.metrics.forget_all()
+        self.__resp_publisher.fail_all(exceptions.XoaStreamCorruptedError(self.peername, error))
+        self.close()
+
+    def __abandon(self) -> None:
+        """Fail all requests which are waiting, the connection is not restored."""
+        self.__reconnecting = None
+        self.__backlog.clear()
+        self.__replay.clear()
+        self.__in_flight.clear()  # type: ignore[reportOptionalMemberAccess]
+        self.__pkt_processor.clear()
+        if self.metrics is not None:
+            self.metrics.forget_all()
+        host, port = self.__address  # type: ignore[misc]
+        self.__resp_publisher.fail_all(exceptions.XoaConnectionLostError(host, port, self.__reconnect.attempts))  # type: ignore[reportOptionalMemberAccess]
+        if self.__deadlines is not None:
+            self.__deadlines.cancel()
+        self.__resp_publisher.publish_connection_lost(self.peername)
+        self.__log.close()
 
     def send(self, data: bytes | bytearray | memoryview) -> None:
         """
@@ -86,18 +269,80 @@ class TransportationHandler(asyncio.Protocol):
         xenaserver and liberate the sending queue.
         """
         if not self.is_connected:
-            raise BrokenPipeError("No socket!")
+            if self.__reconnecting is None:
+                raise BrokenPipeError("No socket!")
+            self.__backlog.append(bytes(data))
+            return None
         self.__transport.write(data)  # type: ignore[reportOptionalMemberAccess]
+        if self.metrics is not None:
+            self.metrics.bytes_sent += len(data)
+        if self.__recorder is not None:
+            self.__recorder.sent(data)
+
+    def get_write_buffer_size(self) -> int:
+        """Return the number of bytes which are waiting in the transport's write buffer."""
+        if not self.is_connected:
+            return 0
+        return self.__transport.get_write_buffer_size()  # type: ignore[reportOptionalMemberAccess]
+
+    async def drain(self, write_buffer_limit: int | None = None) -> None:
+        """
+        Wait until the transport is ready to accept more data.
+        With ``write_buffer_limit`` the transport pauses the writing above that many bytes,
+        so the waiting lasts until the transport drained its write buffer.
+        """
+        if write_buffer_limit is not None and self.is_connected:
+            self.__transport.set_write_buffer_limits(high=write_buffer_limit)  # type: ignore[reportOptionalMemberAccess]
+        if self.__can_write.is_set():
+            await asyncio.sleep(0)
+        else:
+            await self.__can_write.wait()
 
     def close(self) -> None:
         """Close connection with xenaserver."""
+        self.__closing = True
+        if self.__reconnecting is not None:
+            self.__reconnecting.cancel()
+            self.__abandon()
         if self.is_connected:
             self.__transport.close()  # type: ignore[reportOptionalMemberAccess]
         self.__transport = None
+        # The responses can't arrive anymore, the requests which are waiting fail instead of expiring.
+        self.__resp_publisher.fail_all(ConnectionAbortedError("The connection is closed."))
+        if self.__deadlines is not None:
+            self.__deadlines.cancel()
+
+    async def prepare_data(self, request: Request | RequestTemplate) -> tuple[bytes, asyncio.Future]:
+        assert self.is_connected or self.is_reconnecting, "Cannot add command because Socket is disconnected"
+        request_id_ = self.__id_counter.next_number()
+        fut_ = self.__register_request(request, request_id_)
+        data = bytes(request)
+        if self.__in_flight is not None:
+            self.__track(request, request_id_, data, fut_)
+        return data, fut_
+
+    def prepare_data_batch(self, requests: Sequence[Request | RequestTemplate]) -> tuple[bytes, list[asyncio.Future]]:
+        """Prepare multiple requests at once, the request identifiers are reserved as a single block."""
+        assert self.is_connected or self.is_reconnecting, "Cannot add command because Socket is disconnected"
+        if not requests:
+            return b"", []
+        chunks = []
+        futures = []
+        for request, request_id_ in zip(requests, self.__id_counter.reserve(len(requests))):
+            fut_ = self.__register_request(request, request_id_)
+            # Encoded right away, the same template can be used by more than one request of the batch.
+            chunks.append(data := bytes(request))
+            futures.append(fut_)
+            if self.__in_flight is not None:
+                self.__track(request, request_id_, data, fut_)
+        return b"".join(chunks), futures
 
-    async def prepare_data(self, request: Request) -> tuple[bytes, asyncio.Future]:
-        assert self.is_connected, "Cannot add command because Socket is disconnected"
-        request_id_ = await self.__id_counter.get_number()
+    def __track(self, request: Request | RequestTemplate, request_id_: int, data: bytes, fut_: asyncio.Future) -> None:
+        """Keep the request until the response, only the queries are sent again after reconnection."""
+        is_query = request.header.cmd_type == CommandType.COMMAND_QUERY
+        self.__in_flight.add(request_id_, request.class_name, data if is_query else None, fut_)  # type: ignore[reportOptionalMemberAccess]
+
+    def __register_request(self, request: Request | RequestTemplate, request_id_: int) -> asyncio.Future:
         request.update_identifier(request_id_)
         self.__pkt_processor.register(
             req_id=request_id_,
@@ -107,21 +352,45 @@ class TransportationHandler(asyncio.Protocol):
             req_id=request_id_,
             cmd_name=request.class_name
         )
+        if self.metrics is not None:
+            self.metrics.on_request(request_id_, request.cmd_code)
+        if self.__deadlines is not None:
+            self.__deadlines.add(request_id_, request.class_name, request.cmd_code, fut_)
         self.__log.debug_request(request)
-        return bytes(request), fut_
+        return fut_
 
-    def subscribe(self, xmc_cls: ICommand, callback: Callable) -> None:
-        """Register the callback on the command which supports Server PUSH notification."""
+    def __expire(self, request_id_: int, cmd_name: str) -> None:
+        """Fail the request which didn't get the response in time, its late response is dropped."""
+        self.__pkt_processor.expire(request_id_)
+        if self.metrics is not None:
+            self.metrics.forget(request_id_)
+        self.__resp_publisher.fail_request(
+            request_id_,
+            cmd_name,
+            exceptions.XoaRequestTimeoutError(request_id_, cmd_name, self.__deadlines.timeout)  # type: ignore[reportOptionalMemberAccess]
+        )
+
+    def subscribe(self, xmc_cls: ICommand, callback: Callable, *, module: int | None = None, port: int | None = None) -> None:
+        """
+        Register the callback on the command which supports Server PUSH notification.
+        When module or port index is provided, the callback is called only on the events of that module or port.
+        """
         assert xmc_cls.pushed, "Command is not subscribable."
         assert callback, "Callback function is required."
         self.__resp_publisher.subscribe(
             evt=xmc_cls.code,
-            func=callback
+            func=callback,
+            module=module,
+            port=port,
         )
 
     def on_disconnected(self, callback: Callable) -> None:
         """Regiser users callback which will be called after connection was terminated."""
         self.__resp_publisher.subscribe_connection_lost(callback)
 
+    def on_reconnected(self, callback: Callable) -> None:
+        """Register users callback which will be called after the lost connection was restored."""
+        self.__resp_publisher.subscribe_reconnected(callback)
+
     def set_outdated(self) -> None:
         pass
\ No newline at end of file
@@ -2,9 +2,11 @@ from .__logger import (
     TransportationLogger,
     CustomLogger
 )
+from .__state_on_deferred import DeferredLogging
 
 
 __all__ = (
     "TransportationLogger",
     "CustomLogger",
+    "DeferredLogging",
 )
@@ -6,19 +6,31 @@ from .__state_off import StateOff
 from .__state_on_default import StateOnDefault
 from .__state_on_loguru import StateOnLoguru
 from .__state_on_user import StateOnUser
+from .__state_on_deferred import (
+    StateOnDeferred,
+    DeferredLogger,
+    DeferredLogging,
+)
 
 
 class TransportationLogger:
     __slots__ = ("enabled", "identity_name", "_logger", "__state")
 
-    def __init__(self, cid: str, enabled: bool = False, logger: CustomLogger | None = None) -> None:
-        self.enabled = enabled
+    def __init__(self, cid: str, enabled: bool = False, logger: CustomLogger | None = None, deferred: DeferredLogging | None = None) -> None:
+        self.enabled = enabled or deferred is not None
         self.identity_name = f"{cid}"
-        self.__state = self.__select_state(logger)
+        self.__state = self.__select_state(logger, deferred)
         self._logger = self.__state.setup(self.identity_name, logger)
-
-    def __select_state(self, logger) -> t.Type[LoggerState]:
-        if not self.enabled:
+        if deferred is not None:
+            # The packets are emitted by the thread to the logger the messages would be logged to.
+            if logger is None or isinstance(logger, logging.Logger):
+                logger = StateOnDefault.setup(self.identity_name, logger)
+            self._logger = DeferredLogger(logger, deferred)
+
+    def __select_state(self, logger, deferred: DeferredLogging | None) -> t.Type[LoggerState]:
+        if deferred is not None:
+            return StateOnDeferred
+        elif not self.enabled:
             return StateOff
         elif self.enabled and logger is None:
             return StateOnDefault
@@ -48,6 +60,10 @@ class TransportationLogger:
     def debug_push(self, response: object) -> None:
         self.__state.debug_push(self, response)
 
+    def close(self) -> None:
+        """The logger is not used anymore, the deferred messages are still emitted by the background thread."""
+        self.__state.close(self)
+
 
 class CustomLogger(t.Protocol):
     """
@@ -92,3 +108,7 @@ class LoggerState(t.Protocol):
     @staticmethod
     def debug_push(inst: "TransportationLogger", response: object) -> None:
         ...
+
+    @staticmethod
+    def close(inst: "TransportationLogger") -> None:
+        ...
@@ -30,3 +30,7 @@ class StateOff:
     @staticmethod
     def debug_push(inst: "TransportationLogger", response: object) -> None:
         return None
+
+    @staticmethod
+    def close(inst: "TransportationLogger") -> None:
+        return None
@@ -68,3 +68,7 @@ class StateOnDefault:
         _logger = t.cast(logging.Logger, inst._logger)
         if _logger.isEnabledFor(logging.DEBUG):
             _logger.debug(f"{SYMBOL_PUSH} {response!r}")
+
+    @staticmethod
+    def close(inst: "TransportationLogger") -> None:
+        return None
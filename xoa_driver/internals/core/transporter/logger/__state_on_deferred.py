@@ -0,0 +1,216 @@
+from __future__ import annotations
+import time
+import typing as t
+import atexit
+import logging
+import threading
+import weakref
+from queue import SimpleQueue
+from dataclasses import (
+    dataclass,
+    field,
+)
+
+from ..protocol import _utils
+
+if t.TYPE_CHECKING:
+    from .__logger import TransportationLogger
+
+
+RESET = "\x1b[0m"
+YELLOW = "\x1b[30;43m"
+GREEN = "\x1b[30;42m"
+MAGENTA = "\x1b[1;45m"
+
+SYMBOL_REQUEST = f"{GREEN} -> {RESET}"
+SYMBOL_PUSH = f"{MAGENTA} -P {RESET}"
+SYMBOL_RESPONSE = f"{YELLOW} <- {RESET}"
+
+
+@dataclass(frozen=True)
+class DeferredLogging:
+    """
+    Debug logging of the packets, which is formatted and emitted by a background thread.
+
+    Only the references of the packets are queued on the way of the requests and responses.
+    Every n-th request or push of a command is sampled, the response follows the decision of its request.
+    """
+
+    sample_rate: float = 1.0
+    """Fraction of the packets logged, of the commands without their own rate."""
+    command_rates: t.Mapping[str, float] = field(default_factory=dict)
+    """Fraction of the packets logged by the command name, 0.0 turns the command off."""
+    commands: t.Collection[str] | None = None
+    """Names of the only commands logged, all commands by default."""
+    queue_size: int = 10_000
+    """Maximum number of the packets waiting for the formatting, the packets above it are dropped."""
+
+    def __post_init__(self) -> None:
+        assert 0.0 <= self.sample_rate <= 1.0, "<sample_rate> must be between 0.0 and 1.0"
+        assert all(0.0 <= rate <= 1.0 for rate in self.command_rates.values()), "<command_rates> must be between 0.0 and 1.0"
+        assert self.queue_size > 0, "<queue_size> must be positive"
+
+
+MAX_SAMPLED = 10_000
+"""Number of the identifiers of the sampled requests remembered, for the requests which never get the response."""
+
+
+def _interval(rate: float) -> int:
+    """Every n-th packet is logged, 0 means none."""
+    return round(1 / rate) if rate > 0 else 0
+
+
+class _Deferred:
+    """Message of the packet, formatted only when the record is emitted."""
+
+    __slots__ = ("symbol", "packet", "request_identifier")
+
+    def __init__(self, symbol: str, packet: t.Any, request_identifier: int) -> None:
+        self.symbol = symbol
+        self.packet = packet
+        # The header of a request template is reused by its next sending.
+        self.request_identifier = request_identifier
+
+    def __str__(self) -> str:
+        return f"{self.symbol} {_utils.format_repr(self.packet, self.request_identifier)}"
+
+
+def _format(message: _Deferred) -> str:
+    try:
+        return str(message)
+    except Exception as e:
+        # A value which can't be decoded must not stop the thread.
+        return f"{message.symbol} {message.packet.class_name} can't be formatted: {e!r}"
+
+
+class DeferredLogger:
+    """Samples the packets and queues them for the thread which formats and emits them to the logger."""
+
+    __slots__ = ("logger", "dropped", "__options", "__default", "__intervals", "__counts", "__sampled", "__queue", "__thread", "__closing", "__weakref__")
+
+    def __init__(self, logger: t.Any, options: DeferredLogging) -> None:
+        self.logger = logger
+        self.dropped = 0
+        """Number of the sampled packets dropped because the queue was full."""
+        self.__options = options
+        self.__default = 0 if options.commands is not None else _interval(options.sample_rate)
+        self.__intervals = {name: _interval(options.sample_rate) for name in options.commands or ()}
+        self.__intervals.update((name, _interval(rate)) for name, rate in options.command_rates.items())
+        self.__counts: dict[str, int] = {}
+        self.__sampled: dict[int, None] = {}
+        self.__queue: SimpleQueue[tuple[float, _Deferred] | None] = SimpleQueue()
+        self.__thread: threading.Thread | None = None
+        self.__closing: list[threading.Thread] = []
+
+    def packet(self, symbol: str, packet: t.Any) -> None:
+        class_name = packet.class_name
+        interval = self.__intervals.get(class_name, self.__default)
+        if not interval:
+            return None
+        request_identifier = packet.header.request_identifier
+        if request_identifier and symbol is SYMBOL_RESPONSE:
+            if request_identifier not in self.__sampled:
+                return None
+            del self.__sampled[request_identifier]
+        else:
+            # Counted by the command, the identifiers are consecutive and would alias with a polling cycle.
+            count = self.__counts.get(class_name, 0)
+            self.__counts[class_name] = count + 1
+            if count % interval:
+                return None
+            if request_identifier:
+                self.__sampled[request_identifier] = None
+                if len(self.__sampled) > MAX_SAMPLED:
+                    del self.__sampled[next(iter(self.__sampled))]
+        if self.__queue.qsize() >= self.__options.queue_size:
+            self.dropped += 1
+            return None
+        if self.__thread is None:
+            self.__thread = threading.Thread(target=self.__emit, args=(self.__queue,), name="xoa-deferred-logging", daemon=True)
+            self.__thread.start()
+            _LOGGERS.add(self)
+        self.__queue.put((time.time(), _Deferred(symbol, packet, request_identifier)))
+
+    def __emit(self, queue: SimpleQueue[tuple[float, _Deferred] | None]) -> None:
+        logger = self.logger
+        if not isinstance(logger, (logging.Logger, logging.LoggerAdapter)):
+            # Loguru and the custom loggers are only given the formatted message.
+            while (item := queue.get()) is not None:
+                logger.debug(_format(item[1]))
+            return None
+        adapter = logger if isinstance(logger, logging.LoggerAdapter) else None
+        target = adapter.logger if adapter else logger
+        while (item := queue.get()) is not None:
+            if not target.isEnabledFor(logging.DEBUG):
+                continue
+            created, message = item
+            msg = _format(message)
+            if adapter is not None:
+                msg = adapter.process(msg, {})[0]
+            record = target.makeRecord(target.name, logging.DEBUG, __file__, 0, msg, (), None)
+            # The time the packet was sent or received, not the time it is emitted.
+            record.created = created
+            record.msecs = (created - int(created)) * 1000
+            target.handle(record)
+
+    def close(self) -> None:
+        """
+        Stop the thread after it emitted the queued packets, without waiting for it.
+        It is called on the event loop, which must not be blocked by the formatting, ``flush`` waits for the thread.
+        """
+        if self.__thread is None:
+            return None
+        self.__queue.put(None)
+        # The packets logged after closing are emitted by a new thread, in the order of the closed one.
+        self.__queue = SimpleQueue()
+        self.__closing = [thread for thread in self.__closing if thread.is_alive()]
+        self.__closing.append(self.__thread)
+        self.__thread = None
+
+    def flush(self) -> None:
+        """Stop the thread and wait until the queued packets are emitted, it must not be called on the event loop."""
+        self.close()
+        while self.__closing:
+            self.__closing.pop().join()
+
+
+_LOGGERS: weakref.WeakSet[DeferredLogger] = weakref.WeakSet()
+"""Loggers which have started the thread, it keeps the logger alive until the queued packets are emitted."""
+
+
+@atexit.register
+def _flush_all() -> None:
+    # The daemon threads are stopped at the exit, with the packets still queued.
+    for logger in list(_LOGGERS):
+        logger.flush()
+
+
+class StateOnDeferred:
+    @staticmethod
+    def setup(connid: str, logger: t.Any) -> t.Any:
+        # Replaced by the DeferredLogger of the options, which are not known to the state.
+        return logger
+
+    @staticmethod
+    def info(inst: "TransportationLogger", msg: t.Any) -> None:
+        t.cast(DeferredLogger, inst._logger).logger.info(msg)
+
+    @staticmethod
+    def error(inst: "TransportationLogger", msg: t.Any) -> None:
+        t.cast(DeferredLogger, inst._logger).logger.error(msg)
+
+    @staticmethod
+    def debug_request(inst: "TransportationLogger", request: object) -> None:
+        t.cast(DeferredLogger, inst._logger).packet(SYMBOL_REQUEST, request)
+
+    @staticmethod
+    def debug_response(inst: "TransportationLogger", response: object) -> None:
+        t.cast(DeferredLogger, inst._logger).packet(SYMBOL_RESPONSE, response)
+
+    @staticmethod
+    def debug_push(inst: "TransportationLogger", response: object) -> None:
+        t.cast(DeferredLogger, inst._logger).packet(SYMBOL_PUSH, response)
+
+    @staticmethod
+    def close(inst: "TransportationLogger") -> None:
+        t.cast(DeferredLogger, inst._logger).close()
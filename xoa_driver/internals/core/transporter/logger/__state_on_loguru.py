@@ -49,3 +49,7 @@ class StateOnLoguru:
     def debug_push(inst: "TransportationLogger", response: object) -> None:
         _loger = t.cast("Logger", inst._logger)
         _loger.opt(lazy=True, colors=True).debug(f"{SYMBOL_PUSH} {response!r}")
+
+    @staticmethod
+    def close(inst: "TransportationLogger") -> None:
+        return None
@@ -45,4 +45,8 @@ class StateOnUser:
     @staticmethod
     def debug_push(inst: "TransportationLogger", response: object) -> None:
         _logger = t.cast("CustomLogger", inst._logger)
-        _logger.debug(f"{SYMBOL_PUSH} {response!r}")
\ No newline at end of file
+        _logger.debug(f"{SYMBOL_PUSH} {response!r}")
+
+    @staticmethod
+    def close(inst: "TransportationLogger") -> None:
+        return None
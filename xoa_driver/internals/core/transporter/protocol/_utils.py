@@ -19,10 +19,12 @@ def get_code_str(x) -> Generator[int | str, None, None]:
         yield code
 
 
-def format_repr(obj) -> str:
+def format_repr(obj, request_identifier: int | None = None) -> str:
     ty_str, code_str = get_code_str(obj)
+    if request_identifier is None:
+        request_identifier = obj.header.request_identifier
     return (
-        f"{str(obj.header.request_identifier):5s} "
+        f"{str(request_identifier):5s} "
         f"{str(obj.header.module_index):3s} "
         f"{str(obj.header.port_index):3s} "
         f"{str(obj.index_values):10s} "
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import struct
 from functools import (
     cached_property,
     partial,
@@ -7,12 +8,13 @@ from functools import (
 from io import BytesIO
 from typing import (
     Any,
+    Callable,
     ClassVar,
     Generator,
     Iterator,
+    Sequence,
     NamedTuple,
     Type,
-    cast,
 )
 from typing import (
     Self,
@@ -22,8 +24,11 @@ from typing import (
 from . import utils
 from .field import (
     FieldSpecs,
+    HexSpec,
+    SequenceSpec,
     field,
 )
+from .types import FMT_ORDER_NETWORK
 from .descriptor import (
     ResponseFieldDescr,
     RequestFieldDescr
@@ -72,12 +77,62 @@ class Cell:
         return self.spec.is_dynamic
 
 
+class StaticCodec:
+    """Precompiled struct of a static length structure, which pack or unpack all fields in one call."""
+
+    __slots__ = ("struct", "padded_struct", "layout", "is_flat")
+
+    def __init__(self, fmt: str, layout: tuple[tuple[int, int, int], ...]) -> None:
+        self.struct = struct.Struct(fmt)
+        self.padded_struct = struct.Struct(f"{fmt}{-self.struct.size % 4}x")
+        """The same struct followed by the zero padding up to the 4 bytes boundary."""
+        self.layout = layout
+        """Per field (start, stop, width) slice of the unpacked values, width is 0 for the single value fields."""
+        self.is_flat = not any(width for *_, width in layout)
+
+    @property
+    def size(self) -> int:
+        return self.struct.size
+
+    def unpack(self, buffer: memoryview) -> Sequence[Any]:
+        """Unpack raw values of all fields, the sequences are grouped in to chunks the same way as ``SequenceSpec.unpack``."""
+        flat = self.struct.unpack_from(buffer)
+        if self.is_flat:
+            return flat
+        return [
+            flat[start] if not width else [flat[i:i + width] for i in range(start, stop, width)]
+            for start, stop, width in self.layout
+        ]
+
+    def pack(self, values: Sequence[Any]) -> bytes:
+        """Pack server values of all fields followed by the padding."""
+        return self.padded_struct.pack(*(values if self.is_flat else self.__flatten(values)))
+
+    def pack_into(self, buffer: bytearray | memoryview, offset: int, values: Sequence[Any]) -> None:
+        """Pack server values of all fields followed by the padding in to the preallocated buffer."""
+        self.padded_struct.pack_into(buffer, offset, *(values if self.is_flat else self.__flatten(values)))
+
+    def __flatten(self, values: Sequence[Any]) -> list[Any]:
+        """Flatten the sequences the same way as ``SequenceSpec.pack``, the fixed length of each sequence is validated."""
+        flat: list[Any] = []
+        for val, (start, stop, width) in zip(values, self.layout):
+            if not width:
+                flat.append(val)
+                continue
+            items = list(utils.flatten(val))
+            if len(items) != stop - start:
+                raise struct.error(f"pack expected {stop - start} items for the sequence (got {len(items)})")
+            flat.extend(items)
+        return flat
+
+
 class Order:
     __slots__ = (
         "__start",
         "__head",
         "__head_idx",
         "__stencil",
+        "__codec",
         "__dict__",
     )
 
@@ -86,6 +141,7 @@ class Order:
         self.__head: Cell | None = None
         self.__head_idx: int = -1
         self.__stencil: tuple[tuple[str, int], ...] = ()
+        self.__codec: StaticCodec | None = None
 
     def __iter__(self):
         temp = self.__start
@@ -109,6 +165,16 @@ class Order:
         """Get iterator of ordered fields names"""
         return iter(itm.name for itm in self)
 
+    @cached_property
+    def names(self) -> tuple[str, ...]:
+        """Computed only once, tuple of ordered fields names"""
+        return tuple(self.field_names)
+
+    @property
+    def codec(self) -> StaticCodec | None:
+        """Precompiled codec of the static length structure, None if the structure is dynamic."""
+        return self.__codec
+
     def append(self, name: str, data: FieldSpecs) -> int:
         """Append field structure"""
         self.__head_idx += 1
@@ -126,6 +192,7 @@ class Order:
         if self.is_dynamic:
             return None
         self.__stencil = tuple(self.__construct_stencil(None))
+        self.__codec = self.__construct_codec()
 
     def get_stencil(self, buffer: memoryview) -> tuple[tuple[str, int], ...]:
         """Get offsets for the instance. If struct is static get baked offsets, otherwise compute them for the individual instance"""
@@ -144,6 +211,27 @@ class Order:
             cumulative_sum += info_tuple.bsize or 0
             current_node = current_node._next
 
+    def __construct_codec(self) -> StaticCodec | None:
+        """Join the baked stencil in to the single struct format, the network byte order has no padding between fields."""
+        formats = [FMT_ORDER_NETWORK]
+        layout = []
+        position = 0
+        for cell, (fmt_, offset_) in zip(self, self.__stencil):
+            chunk_fmt = fmt_.removeprefix(FMT_ORDER_NETWORK)
+            if struct.calcsize(FMT_ORDER_NETWORK + "".join(formats[1:])) != offset_:
+                return None
+            if isinstance(cell.spec, SequenceSpec):
+                length = cell.spec.xmp_type.length or 0
+                width = len(struct.unpack(fmt_, bytes(struct.calcsize(fmt_))))
+                formats.append(chunk_fmt * length)
+                layout.append((position, position + width * length, width))
+                position += width * length
+            else:
+                formats.append(chunk_fmt)
+                layout.append((position, position + 1, 0))
+                position += 1
+        return StaticCodec("".join(formats), tuple(layout))
+
 
 class OrderedMeta(type):
     def __new__(cls: Type[OrderedMeta], clsname: str, bases: tuple[Type], clsdict: dict[str, Any]) -> OrderedMeta:
@@ -167,17 +255,22 @@ class OrderedMeta(type):
     @staticmethod
     def _prepare_order(annotations: dict[str, Any], clsdict: dict[str, Any], is_response: bool) -> dict[str, Any]:
         clsdict["_order"] = order = Order()
+        converters = []
         for field_name, client_type in annotations.items():
             field_specs = clsdict.get(field_name, None)
             if not isinstance(field_specs, FieldSpecs):
                 raise FieldDeclarationError(field_name)
             position_idx = order.append(field_name, field_specs)
             descriptor = ResponseFieldDescr if is_response else RequestFieldDescr
-            clsdict[field_name] = descriptor(
+            clsdict[field_name] = descr = descriptor(
                 idx=position_idx,
                 specs=field_specs,
                 user_type=client_type,
             )
+            to_context = descr.to_py_context if is_response else descr.to_xmp_context
+            converters.append(None if field_specs.is_passthrough(client_type, is_response) else to_context)
+        clsdict["_converters"] = tuple(converters)
+        clsdict["_hex_fields"] = tuple(idx for idx, cell in enumerate(order) if isinstance(cell.spec, HexSpec))
         order.bake()
         return clsdict
 
@@ -189,15 +282,39 @@ class RequestBodyStruct(metaclass=OrderedMeta):
     __slots__ = ("_buffer", "_order", "__stored", "__nbytes")
 
     def __init__(self, **kwargs) -> None:
+        order: Order = self._order
+        if (codec := order.codec) is not None:
+            self.__pack_static(codec, order, kwargs)
+        else:
+            self.__pack_dynamic(order, kwargs)
+        self.__stored = kwargs
+
+    def __pack_static(self, codec: StaticCodec, order: Order, kwargs: dict[str, Any]) -> None:
+        """Pack the whole body of the static length structure with the padding in a single call."""
+        try:
+            values = [
+                kwargs[name] if to_xmp is None else to_xmp(kwargs[name])
+                for name, to_xmp in zip(order.names, self._converters)
+            ]
+        except KeyError:
+            missing = next((name for name in order.names if name not in kwargs), None)
+            if missing is None:
+                raise
+            raise AttributeError(f"[{missing}] is required!") from None
+        self._buffer = codec.pack(values)
+        self.__nbytes = codec.size
+
+    def __pack_dynamic(self, order: Order, kwargs: dict[str, Any]) -> None:
+        """Write fields one by one, the offsets of the dynamic structure are known only after the previous field is written."""
         self._buffer = BytesIO()
-        for name in cast(Order, self._order).field_names:
+        for name in order.field_names:
             if name not in kwargs:
                 raise AttributeError(f"[{name}] is required!")
             setattr(self, name, kwargs[name])
-        self.__stored = kwargs
         self.__nbytes = self._buffer.getbuffer().nbytes
         padding = bytes(4 - (self.__nbytes % 4) if self.__nbytes % 4 else 0)
         self._buffer.write(padding)
+        self._buffer = self._buffer.getvalue()
 
     def __repr__(self) -> str:
         cls_name = f"{self.__class__.__qualname__}"
@@ -211,7 +328,7 @@ class RequestBodyStruct(metaclass=OrderedMeta):
         return self.__nbytes
 
     def nbytes_with_padding(self) -> int:
-        return self._buffer.getbuffer().nbytes
+        return len(self._buffer)
 
     def to_dict(self) -> dict[str, Any]:
         """Get Dict representation of the object"""
@@ -223,7 +340,7 @@ class RequestBodyStruct(metaclass=OrderedMeta):
 
     def to_bytes(self) -> bytes:
         """Get buffer as bytes"""
-        return self._buffer.getvalue()
+        return bytes(self._buffer)
 
 
 def get_val(inst: object, fn: str) -> Any:
@@ -244,17 +361,63 @@ def get_val(inst: object, fn: str) -> Any:
 class ResponseBodyStruct(metaclass=OrderedMeta):
     """Response Body class"""
 
-    __slots__ = ("_buffer", "_order", "_stencil")
+    __slots__ = ("_buffer", "_order", "_stencil", "_values", "_raw_hex")
     _order: ClassVar[Order]
+    _converters: ClassVar[tuple[Callable[[Any], Any] | None, ...]]
+    _hex_fields: ClassVar[tuple[int, ...]]
 
-    def __init__(self, packet_body: bytes | bytearray | memoryview) -> None:
+    def __init__(self, packet_body: bytes | bytearray | memoryview, *, raw_hex: bool = False) -> None:
         self._buffer = memoryview(packet_body).toreadonly()
         self._stencil = self._order.get_stencil(self._buffer)
+        self._values: tuple[Any, ...] | None = None
+        self._raw_hex = raw_hex
+        """Hex fields are zero-copy ``memoryview`` slices of the buffer instead of the hex strings."""
+
+    def raw(self) -> Self:
+        """The same response with the Hex fields as zero-copy ``memoryview`` slices of the buffer instead of the hex strings."""
+        if self._raw_hex:
+            return self
+        # The twin shares the buffer and the stencil, so the dynamic structure is not measured again.
+        twin = object.__new__(type(self))
+        twin._buffer = self._buffer
+        twin._stencil = self._stencil
+        twin._values = None
+        twin._raw_hex = True
+        return twin
+
+    def _decode(self) -> tuple[Any, ...]:
+        """
+        Decode all fields of the static length structure at once and cache them in the instance.
+        Empty tuple means the fields are decoded one by one, when structure is dynamic,
+        the buffer is shorter than expected (older firmware) or one of the values can't be converted.
+        """
+        codec = self._order.codec
+        values: tuple[Any, ...] = ()
+        if codec is not None and self._buffer.nbytes >= codec.size:
+            try:
+                values = tuple(
+                    raw if to_py is None else to_py(raw)
+                    for to_py, raw in zip(self._converters, codec.unpack(self._buffer))
+                )
+            except (ValueError, TypeError):
+                values = ()
+            if values and self._raw_hex and self._hex_fields:
+                values = self.__with_views(values)
+        self._values = values
+        return values
+
+    def __with_views(self, values: tuple[Any, ...]) -> tuple[Any, ...]:
+        """Replace the hex strings of the decoded values with the views of the raw bytes."""
+        values_ = list(values)
+        for idx in self._hex_fields:
+            format_, offset_ = self._stencil[idx]
+            values_[idx] = self._buffer[offset_:offset_ + struct.calcsize(format_)]
+        return tuple(values_)
 
     def __repr__(self) -> str:
         cls_name = self.__class__.__qualname__
         vals = ", ".join(
-            f"{n}={v!r}" for n, v in self.to_dict().items()
+            f"{n}={(v.tobytes() if isinstance(v, memoryview) else v)!r}" for n, v in self.to_dict().items()
         )
         return f"{cls_name}({vals})"
 
@@ -264,11 +427,15 @@ class ResponseBodyStruct(metaclass=OrderedMeta):
 
     def to_tuple(self) -> tuple:
         """Get py values as tuple"""
+        if values := (self._values if self._values is not None else self._decode()):
+            return values
         get_val_ = partial(get_val, self)
         return tuple(map(get_val_, self._order.field_names))
 
     def to_dict(self) -> dict[str, Any]:
         """Get Dict representation of the object"""
+        if values := (self._values if self._values is not None else self._decode()):
+            return dict(zip(self._order.names, values))
         return {
             name: get_val(self, name)
             for name in self._order.field_names
@@ -0,0 +1,169 @@
+from __future__ import annotations
+import re
+from array import array
+from functools import cache
+from types import ModuleType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Iterable,
+    Sequence,
+)
+
+from .base_struct import (
+    Order,
+    ResponseBodyStruct,
+    StaticCodec,
+)
+from .field import SequenceSpec
+from .types import FMT_ORDER_NETWORK
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+
+NUMPY_TYPES = {
+    "b": "i1",
+    "B": "u1",
+    "h": ">i2",
+    "H": ">u2",
+    "i": ">i4",
+    "I": ">u4",
+    "q": ">i8",
+    "Q": ">u8",
+}
+"""Big-endian NumPy equivalents of the struct format letters."""
+
+_FORMAT_ITEM = re.compile(r"(\d*)([a-zA-Z])")
+
+
+@cache
+def numpy_module() -> ModuleType | None:
+    """Import NumPy at the first use, it is an optional extra: pip install tdl-xoa-driver[numpy]."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _item_dtypes(fmt: str) -> list[str]:
+    items = []
+    for count, letter in _FORMAT_ITEM.findall(fmt.removeprefix(FMT_ORDER_NETWORK)):
+        if letter == "s":
+            items.append(f"V{count or 1}")
+        else:
+            items.extend([NUMPY_TYPES[letter]] * int(count or 1))
+    return items
+
+
+def _static_codec(struct_type: type[ResponseBodyStruct]) -> tuple[Order, StaticCodec]:
+    order = struct_type._order
+    if order.codec is None:
+        raise TypeError(f"{struct_type.__qualname__} has dynamic length fields and can't be decoded in to columns.")
+    return order, order.codec
+
+
+def _join_records(replies: Sequence[ResponseBodyStruct], size: int) -> bytes:
+    """Concatenate the fixed size records of the replies of the same type."""
+    struct_type = type(replies[0])
+    records = []
+    for reply in replies:
+        if type(reply) is not struct_type:
+            raise TypeError(f"Expected replies of {struct_type.__qualname__}, got {type(reply).__qualname__}.")
+        record = reply._buffer
+        if record.nbytes != size:
+            if record.nbytes < size:
+                raise ValueError(f"Reply of {struct_type.__qualname__} is shorter than {size} bytes, the firmware doesn't support all fields.")
+            record = record[:size]
+        records.append(record)
+    return b"".join(records)
+
+
+def numpy_dtype(struct_type: type[ResponseBodyStruct]) -> "np.dtype":
+    """
+    Build the NumPy structured dtype of the static length response struct from its baked stencil.
+
+    Integer fields are big-endian integers, the Hex and address fields are fixed size raw bytes (void),
+    which keep the trailing zero bytes.
+    The fixed length sequences are sub-arrays, of records if a sequence item has more than one value.
+    """
+    if (np_ := numpy_module()) is None:
+        raise ImportError("NumPy is required, install it with: pip install tdl-xoa-driver[numpy]")
+    order, codec = _static_codec(struct_type)
+    names, formats, offsets = [], [], []
+    for cell, (fmt_, offset_), (start, stop, width) in zip(order, order.get_stencil(memoryview(b"")), codec.layout):
+        items = _item_dtypes(fmt_)
+        if not isinstance(cell.spec, SequenceSpec):
+            dtype_ = items[0]
+        elif width == 1:
+            dtype_ = (items[0], ((stop - start) // width,))
+        else:
+            dtype_ = (list(zip((f"f{i}" for i in range(width)), items)), ((stop - start) // width,))
+        names.append(cell.name)
+        formats.append(dtype_)
+        offsets.append(offset_)
+    return np_.dtype({"names": names, "formats": formats, "offsets": offsets, "itemsize": codec.size})
+
+
+def to_structured_array(replies: Iterable[ResponseBodyStruct]) -> "npt.NDArray[np.void]":
+    """
+    Decode the replies of the same command in to the NumPy structured array, one record per reply.
+
+    The values are the raw server values: enums are integers and Hex fields are bytes.
+    The array is read-only and shares the memory with a single buffer of all records.
+    """
+    replies = list(replies)
+    if not replies:
+        raise ValueError("At least one reply is required.")
+    dtype_ = numpy_dtype(type(replies[0]))
+    data = _join_records(replies, dtype_.itemsize)
+    return numpy_module().frombuffer(data, dtype=dtype_)
+
+
+def to_columns(replies: Iterable[ResponseBodyStruct], *, use_numpy: bool | None = None) -> dict[str, Any]:
+    """
+    Decode the replies of the same command in to the dict of columns, by the field name.
+
+    The columns are NumPy arrays if NumPy is installed, or lists otherwise. ``use_numpy`` forces the choice.
+    The values are the raw server values: enums are integers and Hex fields are bytes.
+    """
+    replies = list(replies)
+    if not replies:
+        return {}
+    use_numpy = numpy_module() is not None if use_numpy is None else use_numpy
+    if use_numpy:
+        array = to_structured_array(replies)
+        return {name: array[name] for name in array.dtype.names}
+
+    order, codec = _static_codec(type(replies[0]))
+    data = _join_records(replies, codec.size)
+    flat_columns = list(zip(*codec.struct.iter_unpack(data)))
+    columns = {}
+    for name, (start, stop, width) in zip(order.names, codec.layout):
+        if not width:
+            columns[name] = list(flat_columns[start])
+            continue
+        rows = zip(*flat_columns[start:stop])
+        if width == 1:
+            # Same as the sub-array of the NumPy path, the items of a single value are not tuples.
+            columns[name] = [list(row) for row in rows]
+            continue
+        columns[name] = [[row[i:i + width] for i in range(0, stop - start, width)] for row in rows]
+    return columns
+
+
+def to_array(reply: ResponseBodyStruct, field_name: str) -> array:
+    """
+    Decode the sequence field of a single numeric type of the reply in to an ``array.array``, e.g. the samples of ``PL1_GET_DATA``.
+
+    The values are copied from the buffer in one call, without creating a Python object per value,
+    the array can be sent back as the value of the same field of a request.
+    """
+    descr = getattr(type(reply), field_name, None)
+    spec = getattr(descr, "specs", None)
+    if not isinstance(spec, SequenceSpec) or spec.array_type is None:
+        raise TypeError(f"{type(reply).__qualname__}.{field_name} is not a sequence of a single numeric type.")
+    _, offset_ = reply._stencil[descr.idx]
+    return spec.unpack_array(reply._buffer, offset_)
@@ -14,6 +14,7 @@ from typing import (
     Protocol,
     Type,
     TypeVar,
+    cast,
 )
 
 from typing import (
@@ -21,7 +22,10 @@ from typing import (
     Self,
 )
 
-from .field import FieldSpecs
+from .field import (
+    FieldSpecs,
+    HexSpec,
+)
 from .exceptions import FirmwareVersionError
 
 # region Types
@@ -36,6 +40,11 @@ class SetInstance(Protocol):
 class GetInstance(Protocol):
     _buffer: memoryview
     _stencil: tuple[tuple[str, int], ...]
+    _values: tuple[Any, ...] | None
+    _raw_hex: bool
+
+    def _decode(self) -> tuple[Any, ...]:
+        ...
 
 # endregion
 
@@ -87,11 +96,12 @@ class RequestFieldDescr(FieldDescriptor[GenericType]):
 
 
 class ResponseFieldDescr(FieldDescriptor[GenericType]):
-    __slots__ = ("to_py_context",)
+    __slots__ = ("to_py_context", "is_hex")
 
     def __init__(self: Self, idx: int, specs: FieldSpecs, user_type: Type[Any]) -> None:
         super().__init__(idx, specs)
         self.to_py_context: Callable[[Any], Any] = self.specs.get_context_formatter(user_type, True)
+        self.is_hex = isinstance(specs, HexSpec)
 
     def __set__(self: Self, instance: GetInstance, value: GenericType) -> NoReturn:
         # Executed at the runtimne
@@ -102,8 +112,12 @@ class ResponseFieldDescr(FieldDescriptor[GenericType]):
         # Executed at the runtimne
         if instance is None:
             return self
+        if values := (instance._values if instance._values is not None else instance._decode()):
+            return values[self.idx]
         format_, offset_ = instance._stencil[self.idx]
         try:
+            if self.is_hex and instance._raw_hex:
+                return cast(HexSpec, self.specs).view(format_, instance._buffer, offset_)
             val_ = self.specs.unpack(
                 format=format_,
                 buffer=instance._buffer,
@@ -1,5 +1,7 @@
 from __future__ import annotations
+from array import array
 from functools import lru_cache
+import sys
 
 from ipaddress import (
     IPv4Address,
@@ -9,6 +11,7 @@ import struct
 from typing import (
     Any,
     Callable,
+    Iterable,
     List,
     Tuple,
     Type,
@@ -55,6 +58,21 @@ TYPES_COMBI = (XmpHex,)
 TYPES_DYNAMIC = (XmpStr,)
 TYPES_COMPOSED = (XmpSequence,)
 TYPES_JSON = (XmpJson,)
+TYPES_NUMERIC = (
+    XmpInt,
+    XmpLong,
+    XmpByte,
+    XmpShort,
+)
+
+ARRAY_TYPES = {
+    letter: letter
+    for letter in "bBhHiIqQ"
+    if array(letter).itemsize == struct.calcsize(f"{FMT_ORDER_NETWORK}{letter}")
+}
+"""Typecodes of ``array.array`` of the same size as the struct format letters in the network byte order."""
+
+IS_BIG_ENDIAN = sys.byteorder == "big"
 
 # Important: The instances of the FieldSpecs will live as a class variables
 # which mean wea are not able to update its attributes during runtime.
@@ -103,6 +121,14 @@ class FieldSpecs:
         format_ = self.format()
         return struct.calcsize(format_)
 
+    def is_passthrough(self, client_type: Type[Any], is_response: bool) -> bool:
+        """Check if the value is already of the expected type, so the conversion can be skipped."""
+        if client_type is not int:
+            return False
+        if is_response:
+            return type(self.xmp_type).client_format is XmpType.client_format
+        return type(self.xmp_type).server_format is XmpType.server_format
+
     def get_context_formatter(self, client_type: Type[Any], is_response: bool) -> Callable[[Any], Any]:
         if not isinstance(client_type, (int, IPv4Address, IPv6Address)):
             if is_response:
@@ -195,6 +221,13 @@ class HexSpec(FieldSpecs):
     def unpack(self, format: str, buffer: memoryview, offset: int) -> Any:
         return next(iter(struct.unpack_from(format, buffer, offset)), b"")
 
+    def view(self, format: str, buffer: memoryview, offset: int) -> memoryview:
+        """Zero-copy slice of the raw bytes of the field, used instead of the hex string in the raw mode."""
+        end = offset + struct.calcsize(format)
+        if end > buffer.nbytes:
+            raise struct.error(f"view requires a buffer of at least {end} bytes")
+        return buffer[offset:end]
+
 
 class JsonSpec(FieldSpecs):
     xmp_type: XmpJson
@@ -256,6 +289,16 @@ def _prepare_serv_chunks(client_type: Type[Any], xmp_types_chunks: tuple) -> Cal
     return lambda val: list(map(xmp_types_chunks[0].server_format, val))
 
 
+def _prepare_client_array(client_type: Type[Any]) -> Callable[[Any], List[Any]]:
+    """
+    Selecting the function for converting the homogeneous sequence to Python types.
+    The sequence is an array from ``SequenceSpec.unpack`` or the chunks of a single value from the ``StaticCodec``.
+    """
+    if client_type is int:
+        return lambda val: val.tolist() if isinstance(val, array) else [v for v, in val]
+    return lambda val: [client_type(v) for v in (val if isinstance(val, array) else (v for v, in val))]
+
+
 class SequenceSpec(FieldSpecs):
     xmp_type: XmpSequence
 
@@ -268,6 +311,16 @@ class SequenceSpec(FieldSpecs):
         deprecation_reason: str | None = None,
     ) -> None:
         super().__init__(xmp_type, min_version, max_version, deprecated, deprecation_reason)
+        self.array_type = self.__get_array_type()
+        """Typecode of the ``array.array`` of the sequence of a single numeric type, None for other sequences."""
+
+    def __get_array_type(self) -> str | None:
+        if len(self.xmp_type.types_chunk) != 1:
+            return None
+        chunk_type = self.xmp_type.types_chunk[0]
+        if not isinstance(chunk_type, TYPES_NUMERIC) or chunk_type.repetitions is not None:
+            return None
+        return ARRAY_TYPES.get(chunk_type.data_format)
 
     @property
     def is_dynamic(self) -> bool:
@@ -282,6 +335,9 @@ class SequenceSpec(FieldSpecs):
             client_type = get_args(client_type)[0]
         except IndexError as e:
             raise e
+        if self.array_type is not None:
+            # Numeric types have no conversion of the values, the array is packed as it is.
+            return _prepare_client_array(client_type) if is_response else lambda val: val
         if is_response:
             return _prepare_client_chunks(
                 client_type=client_type,
@@ -293,11 +349,44 @@ class SequenceSpec(FieldSpecs):
         )
 
     def pack(self, format: str, val: list[Any]) -> bytes:
+        if self.array_type is not None:
+            return self.pack_array(val)
         length = self.xmp_type.length or len(val)
         pack_fmt = f"{FMT_ORDER_NETWORK}{self.xmp_type.data_format * length}"
         return struct.pack(pack_fmt, *flatten(val))
 
-    def unpack(self, format: str, buffer: memoryview, offset: int) -> list[Any]:
+    def pack_array(self, val: Iterable[int]) -> bytes:
+        """Pack the sequence of a single numeric type in one call, ``val`` is any iterable of integers or an array."""
+        typecode = cast(str, self.array_type)
+        try:
+            values = val if isinstance(val, array) and val.typecode == typecode else array(typecode, val)
+        except OverflowError as e:
+            raise struct.error(str(e)) from None
+        if self.xmp_type.length is not None and len(values) != self.xmp_type.length:
+            raise struct.error(f"pack expected {self.xmp_type.length} items for the sequence (got {len(values)})")
+        if IS_BIG_ENDIAN:
+            return values.tobytes()
+        swapped = array(typecode, values)
+        swapped.byteswap()
+        return swapped.tobytes()
+
+    def unpack_array(self, buffer: memoryview, offset: int) -> array:
+        """Unpack the sequence of a single numeric type in to an array of the host byte order, without the chunks."""
+        typecode = cast(str, self.array_type)
+        values = array(typecode)
+        count = (buffer.nbytes - offset) // values.itemsize
+        if self.xmp_type.length is not None:
+            # The same as the chunks, a fixed length sequence is unpacked only as a whole.
+            count = self.xmp_type.length if count >= self.xmp_type.length else 0
+        if count > 0:
+            values.frombytes(buffer[offset:offset + count * values.itemsize])
+            if not IS_BIG_ENDIAN:
+                values.byteswap()
+        return values
+
+    def unpack(self, format: str, buffer: memoryview, offset: int) -> list[Any] | array:
+        if self.array_type is not None:
+            return self.unpack_array(buffer, offset)
         buff_ = buffer[offset:]
         limit = len(buff_) % cast(int, self.calc_bsize())
         buff_ = buff_[:-limit] if limit else buff_
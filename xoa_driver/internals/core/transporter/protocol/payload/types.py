@@ -95,7 +95,15 @@ class XmpHex(XmpType[Hex]):
     def client_format(self, val: bytes) -> Hex:
         return Hex(val.hex())
 
-    def server_format(self, val: Hex) -> bytes:
+    def server_format(self, val: Hex | bytes | bytearray | memoryview) -> bytes:
+        if isinstance(val, (bytes, bytearray, memoryview)):
+            # Raw bytes are taken as they are, without the hex string round trip.
+            raw = bytes(val)
+            if self.repetitions is not None:
+                if len(raw) > self.repetitions:
+                    raise ValueError(f"Expected Hex of size not bigger then {self.repetitions} bytes")
+                raw = bytes(self.repetitions - len(raw)) + raw
+            return raw
         if self.repetitions is not None:
             size_ = self.repetitions * 2
             if len(val) > size_:
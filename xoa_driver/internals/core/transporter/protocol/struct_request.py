@@ -7,6 +7,8 @@ from .struct_header import ProtocolHeader
 from .payload import RequestBodyStruct
 
 NOT_SET_IDENTIFIER = 0
+REQUEST_IDENTIFIER = struct.Struct("!I")
+REQUEST_IDENTIFIER_OFFSET = ProtocolHeader.request_identifier.offset
 
 
 class Request:
@@ -63,3 +65,54 @@ class Request:
     @property
     def cmd_code(self) -> int:
         return self.header.cmd_code
+
+
+class RequestTemplate:
+    """
+    Pre-encoded request, which is used in place of the Request it was compiled from.
+
+    The packet is encoded only once, for each sending only the request identifier is patched in place.
+    """
+
+    __slots__ = (
+        "__request",
+        "__buffer",
+    )
+
+    def __init__(self, request: Request) -> None:
+        self.__request = request
+        self.__buffer = bytearray(bytes(request))
+
+    def __str__(self) -> str:
+        return _utils.format_str(self)
+
+    def __repr__(self) -> str:
+        return _utils.format_repr(self)
+
+    def __bytes__(self) -> bytes:
+        return bytes(self.__buffer)
+
+    def update_identifier(self, request_id: int) -> None:
+        REQUEST_IDENTIFIER.pack_into(self.__buffer, REQUEST_IDENTIFIER_OFFSET, request_id)
+
+    @property
+    def class_name(self) -> str:
+        return self.__request.class_name
+
+    @property
+    def header(self) -> ProtocolHeader:
+        header = self.__request.header
+        header.request_identifier = REQUEST_IDENTIFIER.unpack_from(self.__buffer, REQUEST_IDENTIFIER_OFFSET)[0]
+        return header
+
+    @property
+    def index_values(self) -> list[int]:
+        return self.__request.index_values
+
+    @property
+    def values(self) -> RequestBodyStruct | None:
+        return self.__request.values
+
+    @property
+    def cmd_code(self) -> int:
+        return self.__request.cmd_code
@@ -21,7 +21,7 @@ class Response:
         "__buffer",
     )
 
-    def __init__(self, class_name: str, header: ResponseHeader, buffer: bytes, response_struct: type[ResponseBodyStruct] | None) -> None:
+    def __init__(self, class_name: str, header: ResponseHeader, buffer: bytes | memoryview, response_struct: type[ResponseBodyStruct] | None, raw_hex: bool = False) -> None:
         self.class_name = class_name
         self.header = header
         idces_fmt_ = const.indices_format(header.number_of_indices)
@@ -29,7 +29,7 @@ class Response:
         self.__buffer = memoryview(buffer)
         self.index_values = self.__parse_indices(idces_fmt_, self.__buffer[:idx_count_])
         payload_position = slice(idx_count_, idx_count_ + header.number_of_value_bytes)
-        self.values: Any = self.__parse_values(self.__buffer[payload_position], response_struct)
+        self.values: Any = self.__parse_values(self.__buffer[payload_position], response_struct, raw_hex)
 
     def __str__(self) -> str:
         return _utils.format_str(self)
@@ -43,9 +43,9 @@ class Response:
     def __parse_indices(self, fmt: str, buffer: memoryview) -> list[int]:
         return list(struct.unpack_from(fmt, buffer, 0))
 
-    def __parse_values(self, buffer: memoryview, struct_type: type[ResponseBodyStruct] | None) -> ResponseBodyStruct | None:
+    def __parse_values(self, buffer: memoryview, struct_type: type[ResponseBodyStruct] | None, raw_hex: bool) -> ResponseBodyStruct | None:
         if self.header.cmd_type == const.CommandType.COMMAND_VALUE:
-            return struct_type(buffer) if struct_type else None
+            return struct_type(buffer, raw_hex=raw_hex) if struct_type else None
         return None
 
     def get_error(self) -> XmpStatusException | None:
@@ -1,6 +1,9 @@
 from __future__ import annotations
+from importlib import import_module
 from typing import Type
 from ._typings import XoaCommandType
+from ..builders import get_template
+from ...commands import _index as commands_index
 
 
 class XmpRegistryException(Exception):
@@ -31,13 +34,22 @@ def register_command(xmc_cls: Type[XoaCommandType]) -> Type:
     if xmc_cls.code in COMMANDS_REGISTRY:
         raise XmpCmdDuplicatedDefenitionError(xmc_cls)
     COMMANDS_REGISTRY[xmc_cls.code] = xmc_cls
+    if hasattr(xmc_cls, "get"):
+        xmc_cls.get_template = get_template  # type: ignore[attr-defined]
     return xmc_cls
 
 
 def get_command(command_idx: int) -> Type[XoaCommandType]:
-    """Method allows to get a command class by the command code"""
+    """Method allows to get a command class by the command code, its module is imported at the first time"""
     global COMMANDS_REGISTRY
     xmc_type = COMMANDS_REGISTRY.get(command_idx, None)
     if not xmc_type:
-        raise XmpCmdNotImplemented(command_idx)
+        xmc_type = _load_command(command_idx)
     return xmc_type
+
+
+def _load_command(command_idx: int) -> Type[XoaCommandType]:
+    if (location := commands_index.CODES.get(command_idx)) is None:
+        raise XmpCmdNotImplemented(command_idx)
+    module_name, cmd_name = location
+    return getattr(import_module(f"{commands_index.__package__}.{module_name}"), cmd_name)
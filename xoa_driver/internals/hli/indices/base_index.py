@@ -9,6 +9,7 @@ if TYPE_CHECKING:
     from xoa_driver.internals.core import interfaces as itf
     from xoa_driver.internals.utils import kind
     from xoa_driver.internals.utils.indices import observer
+    from xoa_driver.internals.core.token import Token
 
 
 CT = TypeVar("CT")
@@ -33,6 +34,11 @@ class BaseIndex(abc.ABC):
     async def _fetch(cls, conn: "itf.IConnection", module_id: int, port_id: int) -> List[int]:
         raise NotImplementedError()
 
+    @classmethod
+    @abc.abstractmethod
+    def _create(cls, conn: "itf.IConnection", kind: "kind.IndicesKind") -> "Token[None]":
+        raise NotImplementedError()
+
     @classmethod
     @abc.abstractmethod
     async def _new(cls: Type[CT], conn: "itf.IConnection", kind: "kind.IndicesKind", observer: "observer.IndicesObserver") -> CT:
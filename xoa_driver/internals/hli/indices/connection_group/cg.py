@@ -22,6 +22,7 @@ from xoa_driver.internals.commands import (
 if TYPE_CHECKING:
     from xoa_driver.internals.core import interfaces as itf
     from xoa_driver.internals.utils import kind
+    from xoa_driver.internals.core.token import Token
 from xoa_driver.internals.utils.indices import observer as idx_obs
 from .tls import GTls
 from .l2 import GL2
@@ -180,7 +181,11 @@ class ConnectionGroupIdx(BaseIndex):
         resp = await P4G_INDICES(conn, module_id, port_id).get()
         return list(resp.group_identifiers)
 
+    @classmethod
+    def _create(cls, conn: "itf.IConnection", kind: "kind.IndicesKind") -> "Token[None]":
+        return P4G_CREATE(conn, *kind).set()
+
     @classmethod
     async def _new(cls: Type[CG], conn: "itf.IConnection", kind: "kind.IndicesKind", observer: "idx_obs.IndicesObserver") -> CG:
-        await P4G_CREATE(conn, *kind).set()
+        await cls._create(conn, kind)
         return cls(conn, kind, observer)
@@ -15,6 +15,7 @@ from xoa_driver.internals.commands import (
 if TYPE_CHECKING:
     from xoa_driver.internals.core import interfaces as itf
     from xoa_driver.internals.utils import kind
+    from xoa_driver.internals.core.token import Token
 
 from xoa_driver.internals.utils.indices import observer as idx_obs
 from ..base_index import BaseIndex
@@ -59,7 +60,11 @@ class BaseFilterIdx(BaseIndex):
         resp = await PF_INDICES(conn, module_id, port_id).get()
         return list(resp.filter_xindices)
 
+    @classmethod
+    def _create(cls, conn: "itf.IConnection", kind: "kind.IndicesKind") -> "Token[None]":
+        return PF_CREATE(conn, *kind).set()
+
     @classmethod
     async def _new(cls: Type[FT], conn: "itf.IConnection", kind: "kind.IndicesKind", observer: "idx_obs.IndicesObserver") -> FT:
-        await PF_CREATE(conn, *kind).set()
+        await cls._create(conn, kind)
         return cls(conn, kind, observer) # type: ignore
@@ -17,6 +17,7 @@ from xoa_driver.internals.commands import (
 if TYPE_CHECKING:
     from xoa_driver.internals.core import interfaces as itf
     from xoa_driver.internals.utils import kind
+    from xoa_driver.internals.core.token import Token
 
 from xoa_driver.internals.utils.indices import observer as idx_obs
 from ..base_index import BaseIndex
@@ -67,7 +68,11 @@ class LLDPAgentIdx(BaseIndex):
         resp = await P_LLDP_INDICES(conn, module_id, port_id).get()
         return list(resp.lldp_agent_indices)
 
+    @classmethod
+    def _create(cls, conn: "itf.IConnection", kind: "kind.IndicesKind") -> "Token[None]":
+        return P_LLDP_CREATE(conn, *kind).set()
+
     @classmethod
     async def _new(cls: Type[LA], conn: "itf.IConnection", kind: "kind.IndicesKind", observer: "idx_obs.IndicesObserver") -> LA:
-        await P_LLDP_CREATE(conn, *kind).set()
+        await cls._create(conn, kind)
         return cls(conn, kind, observer) # type: ignore
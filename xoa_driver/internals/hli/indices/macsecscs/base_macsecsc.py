@@ -40,6 +40,7 @@ from xoa_driver.internals.commands import (
 if TYPE_CHECKING:
     from xoa_driver.internals.core import interfaces as itf
     from xoa_driver.internals.utils import kind
+    from xoa_driver.internals.core.token import Token
 
 from xoa_driver.internals.utils.indices import observer as idx_obs
 from xoa_driver.internals.utils.indices import header_modifier_manager as hmm
@@ -226,9 +227,13 @@ class BaseMacSecTxScIdx(BaseIndex):
         resp = await P_MACSEC_TXSC_INDICES(conn, module_id, port_id).get()
         return list(resp.txsc_indices)
 
+    @classmethod
+    def _create(cls, conn: "itf.IConnection", kind: "kind.IndicesKind") -> "Token[None]":
+        return P_MACSEC_TXSC_CREATE(conn, *kind).set()
+
     @classmethod
     async def _new(cls: Type[MST], conn: "itf.IConnection", kind: "kind.IndicesKind", observer: "idx_obs.IndicesObserver") -> MST:
-        await P_MACSEC_TXSC_CREATE(conn, *kind).set()
+        await cls._create(conn, kind)
         return cls(conn, kind, observer) # type: ignore
 
 
@@ -257,7 +262,11 @@ class BaseMacSecRxScIdx(BaseIndex):
         resp = await P_MACSEC_RXSC_INDICES(conn, module_id, port_id).get()
         return list(resp.rxsc_indices)
 
+    @classmethod
+    def _create(cls, conn: "itf.IConnection", kind: "kind.IndicesKind") -> "Token[None]":
+        return P_MACSEC_RXSC_CREATE(conn, *kind).set()
+
     @classmethod
     async def _new(cls: Type[MSR], conn: "itf.IConnection", kind: "kind.IndicesKind", observer: "idx_obs.IndicesObserver") -> MSR:
-        await P_MACSEC_RXSC_CREATE(conn, *kind).set()
+        await cls._create(conn, kind)
         return cls(conn, kind, observer) # type: ignore
\ No newline at end of file
@@ -16,6 +16,7 @@ from xoa_driver.internals.commands import (
 if TYPE_CHECKING:
     from xoa_driver.internals.core import interfaces as itf
     from xoa_driver.internals.utils import kind
+    from xoa_driver.internals.core.token import Token
 
 from xoa_driver.internals.utils.indices import observer as idx_obs
 from .base_index import BaseIndex
@@ -59,7 +60,11 @@ class MatchTermIdx(BaseIndex):
         resp = await PM_INDICES(conn, module_id, port_id).get()
         return list(resp.match_term_xindices)
 
+    @classmethod
+    def _create(cls, conn: "itf.IConnection", kind: "kind.IndicesKind") -> "Token[None]":
+        return PM_CREATE(conn, *kind).set()
+
     @classmethod
     async def _new(cls: Type[MT], conn: "itf.IConnection", kind: "kind.IndicesKind", observer: "idx_obs.IndicesObserver") -> MT:
-        await PM_CREATE(conn, *kind).set()
+        await cls._create(conn, kind)
         return cls(conn, kind, observer) # type: ignore
@@ -48,6 +48,7 @@ from xoa_driver.internals.commands import (
 if TYPE_CHECKING:
     from xoa_driver.internals.core import interfaces as itf
     from xoa_driver.internals.utils import kind
+    from xoa_driver.internals.core.token import Token
 from xoa_driver.internals.utils.indices import observer as idx_obs
 from xoa_driver.internals.utils.indices import header_modifier_manager as hmm
 from ..base_index import BaseIndex
@@ -397,8 +398,12 @@ class BaseStreamIdx(BaseIndex):
         resp = await PS_INDICES(conn, module_id, port_id).get()
         return list(resp.stream_indices)
 
+    @classmethod
+    def _create(cls, conn: "itf.IConnection", kind: "kind.IndicesKind") -> "Token[None]":
+        return PS_CREATE(conn, *kind).set()
+
     @classmethod
     async def _new(cls: Type[BS], conn: "itf.IConnection", kind: "kind.IndicesKind", observer: "idx_obs.IndicesObserver") -> BS:
-        await PS_CREATE(conn, *kind).set()
+        await cls._create(conn, kind)
         return cls(conn, kind, observer) # type: ignore
 
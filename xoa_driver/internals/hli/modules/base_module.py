@@ -99,6 +99,10 @@ class BaseModule(ABC, Generic[T]):
     def _check_identity(self, request) -> bool:
         return self.module_id == request.header.module_index
 
+    def _subscribe(self, evt, callback) -> None:
+        """Register the callback on the push notifications of this module only."""
+        self._conn.subscribe(evt, callback, module=self.module_id)
+
     def __is_reservation(self, reserved_status: enums.ReservedStatus) -> bool:
         return self.info.reservation == reserved_status
 
@@ -80,6 +80,10 @@ class BasePort(ABC, Generic[PortStateStorage]):
         )
         return all(validators)
 
+    def _subscribe(self, evt, callback) -> None:
+        """Register the callback on the push notifications of this port only."""
+        self._conn.subscribe(evt, callback, module=self.kind.module_id, port=self.kind.port_id)
+
     def __is_reservation(self, reserved_status: enums.ReservedStatus) -> bool:
         return self.info.reservation == reserved_status
 
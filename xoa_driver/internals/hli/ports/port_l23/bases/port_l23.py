@@ -72,192 +72,185 @@ MatchTermIndices = idx_mgr.IndexManager[MatchTermIdx]
 class BasePortL23(base_port.BasePort[ports_state.PortL23LocalState]):
     """L23 port layout which is relevant to all L23 ports."""
 
-    def __init__(self, conn: "itf.IConnection", module_id: int, port_id: int) -> None:
-        super().__init__(conn, module_id, port_id)
-        self.capabilities = P_CAPABILITIES(conn, module_id, port_id)
-        """L23 Port capabilities
+    capabilities = utils.LazyAttribute(P_CAPABILITIES)
+    """L23 Port capabilities
 
-        :type: P_CAPABILITIES
-        """
+    :type: P_CAPABILITIES
+    """
 
-        self.capabilities_ext = P_CAPABILITIES_EXT(conn, module_id, port_id)
-        """L23 port capabilities ext.
+    capabilities_ext = utils.LazyAttribute(P_CAPABILITIES_EXT)
+    """L23 port capabilities ext.
 
-        :type: P_CAPABILITIES_EXT
-        """
+    :type: P_CAPABILITIES_EXT
+    """
 
-        self.pause = P_PAUSE(conn, module_id, port_id)
-        """L23 port response to Ethernet PAUSE frames.
+    pause = utils.LazyAttribute(P_PAUSE)
+    """L23 port response to Ethernet PAUSE frames.
 
-        :type: P_PAUSE
-        """
+    :type: P_PAUSE
+    """
 
-        self.loopback = P_LOOPBACK(conn, module_id, port_id)
-        """L23 port loopback mode.
+    loopback = utils.LazyAttribute(P_LOOPBACK)
+    """L23 port loopback mode.
 
-        :type: P_LOOPBACK
-        """
+    :type: P_LOOPBACK
+    """
 
-        self.errors_count = P_ERRORS(conn, module_id, port_id)
-        """L23 port errors.
+    errors_count = utils.LazyAttribute(P_ERRORS)
+    """L23 port errors.
 
-        :type: P_ERRORS
-        """
+    :type: P_ERRORS
+    """
 
-        self.interframe_gap = P_INTERFRAMEGAP(conn, module_id, port_id)
-        """L23 port interframe gap.
+    interframe_gap = utils.LazyAttribute(P_INTERFRAMEGAP)
+    """L23 port interframe gap.
 
-        :type: P_INTERFRAMEGAP
-        """
+    :type: P_INTERFRAMEGAP
+    """
 
-        self.max_header_length = P_MAXHEADERLENGTH(conn, module_id, port_id)
-        """L23 port maximum header length.
+    max_header_length = utils.LazyAttribute(P_MAXHEADERLENGTH)
+    """L23 port maximum header length.
 
-        :type: P_MAXHEADERLENGTH
-        """
+    :type: P_MAXHEADERLENGTH
+    """
 
-        self.tpld_mode = P_TPLDMODE(conn, module_id, port_id)
-        """L23 port test payload mode.
+    tpld_mode = utils.LazyAttribute(P_TPLDMODE)
+    """L23 port test payload mode.
 
-        :type: P_TPLDMODE
-        """
+    :type: P_TPLDMODE
+    """
 
-        self.pfc_enable = P_PFCENABLE(conn, module_id, port_id)
-        """L23 port Ethernet Priority Flow Control (PFC).
+    pfc_enable = utils.LazyAttribute(P_PFCENABLE)
+    """L23 port Ethernet Priority Flow Control (PFC).
 
-        :type: P_PFCENABLE
-        """
+    :type: P_PFCENABLE
+    """
 
-        self.random_seed = P_RANDOMSEED(conn, module_id, port_id)
-        """L23 port seed value.
+    random_seed = utils.LazyAttribute(P_RANDOMSEED)
+    """L23 port seed value.
 
-        :type: P_RANDOMSEED
-        """
+    :type: P_RANDOMSEED
+    """
 
-        self.payload_mode = P_PAYLOADMODE(conn, module_id, port_id)
-        """L23 port payload mode.
+    payload_mode = utils.LazyAttribute(P_PAYLOADMODE)
+    """L23 port payload mode.
 
-        :type: P_PAYLOADMODE
-        """
+    :type: P_PAYLOADMODE
+    """
 
-        self.gap_monitor = P_GAPMONITOR(conn, module_id, port_id)
-        """L23 port gap monitor.
+    gap_monitor = utils.LazyAttribute(P_GAPMONITOR)
+    """L23 port gap monitor.
 
-        :type: P_GAPMONITOR
-        """
+    :type: P_GAPMONITOR
+    """
 
-        self.checksum = P_CHECKSUM(conn, module_id, port_id)
-        """L23 port extra payload integrity checksum.
+    checksum = utils.LazyAttribute(P_CHECKSUM)
+    """L23 port extra payload integrity checksum.
 
-        :type: P_CHECKSUM
-        """
+    :type: P_CHECKSUM
+    """
 
-        self.arp_rx_table = P_ARPRXTABLE(conn, module_id, port_id)
-        """L23 port ARP table.
+    arp_rx_table = utils.LazyAttribute(P_ARPRXTABLE)
+    """L23 port ARP table.
 
-        :type: P_ARPRXTABLE
-        """
+    :type: P_ARPRXTABLE
+    """
 
-        self.ndp_rx_table = P_NDPRXTABLE(conn, module_id, port_id)
-        """L23 port NDP table.
+    ndp_rx_table = utils.LazyAttribute(P_NDPRXTABLE)
+    """L23 port NDP table.
 
-        :type: P_NDPRXTABLE
-        """
+    :type: P_NDPRXTABLE
+    """
 
-        self.capturer = PortCapture(conn, module_id, port_id)
-        """L23 port capturer configuration.
+    capturer = utils.LazyAttribute(PortCapture)
+    """L23 port capturer configuration.
 
-        :type: PortCapture
-        """
+    :type: PortCapture
+    """
 
-        self.speed = Speed(conn, module_id, port_id)
-        """L23 port speed configuration.
+    speed = utils.LazyAttribute(Speed)
+    """L23 port speed configuration.
 
-        :type: Speed
-        """
+    :type: Speed
+    """
 
-        self.traffic = Traffic(conn, module_id, port_id)
-        """L23 port traffic configuration.
+    traffic = utils.LazyAttribute(Traffic)
+    """L23 port traffic configuration.
 
-        :type: Traffic
-        """
+    :type: Traffic
+    """
 
-        self.mix = Mix(conn, module_id, port_id)
-        """L23 port IMIX configuration.
+    mix = utils.LazyAttribute(Mix)
+    """L23 port IMIX configuration.
 
-        :type: Mix
-        """
+    :type: Mix
+    """
 
-        self.latency_config = LatencyConfiguration(conn, module_id, port_id)
-        """L23 port latency configuration.
+    latency_config = utils.LazyAttribute(LatencyConfiguration)
+    """L23 port latency configuration.
 
-        self.latency_config = LatencyConfiguration(conn, module_id, port_id)
-        :type:
-        """
+    :type: LatencyConfiguration
+    """
 
-        self.rate = TxRate(conn, module_id, port_id)
-        """L23 port rate.
+    rate = utils.LazyAttribute(TxRate)
+    """L23 port rate.
 
-        :type: Rate
-        """
+    :type: Rate
+    """
 
-        self.tx_config = TxConfiguration(conn, module_id, port_id)
-        """L23 port TX configuration.
+    tx_config = utils.LazyAttribute(TxConfiguration)
+    """L23 port TX configuration.
 
-        :type: TxConfiguration
-        """
+    :type: TxConfiguration
+    """
 
-        self.tx_single_pkt = TxSinglePacket(conn, module_id, port_id)
-        """L23 port single-packet TX configuration.
+    tx_single_pkt = utils.LazyAttribute(TxSinglePacket)
+    """L23 port single-packet TX configuration.
 
-        :type: TxSinglePacket
-        """
+    :type: TxSinglePacket
+    """
 
-        self.multicast = Multicast(conn, module_id, port_id)
-        """L23 port multicast configuration.
+    multicast = utils.LazyAttribute(Multicast)
+    """L23 port multicast configuration.
 
-        :type: Multicast
-        """
+    :type: Multicast
+    """
 
-        self.net_config = NetConfig(conn, module_id, port_id)
-        """L23 port network configuration, including MAC and IP addresses.
+    net_config = utils.LazyAttribute(NetConfig)
+    """L23 port network configuration, including MAC and IP addresses.
 
-        :type: NetConfig
-        """
+    :type: NetConfig
+    """
 
+    length_terms: "utils.LazyAttribute[LengthTermIndices]" = utils.LazyAttribute(
+        lambda conn, module_id, port_id: idx_mgr.IndexManager(conn, LengthTermIdx, module_id, port_id)
+    )
+    """L23 port's length term index manager.
 
-        self.local_states = ports_state.PortL23LocalState()
-        """L23 port local states.
+    :type: LengthTermIndices
+    """
 
-        :type: PortL23LocalState
-        """
+    match_terms: "utils.LazyAttribute[MatchTermIndices]" = utils.LazyAttribute(
+        lambda conn, module_id, port_id: idx_mgr.IndexManager(conn, MatchTermIdx, module_id, port_id)
+    )
+    """L23 port's match term index manager.
 
-        self.length_terms: LengthTermIndices = idx_mgr.IndexManager(
-            conn,
-            LengthTermIdx,
-            module_id,
-            port_id
-        )
-        """L23 port's length term index manager.
+    :type: MatchTermIndices
+    """
 
-        :type: LengthTermIndices
-        """
+    used_tpld_ids = utils.LazyAttribute(P_USED_TPLDID)
+    """TG port's used TPLD IDs.
 
-        self.match_terms: MatchTermIndices = idx_mgr.IndexManager(
-            conn,
-            MatchTermIdx,
-            module_id,
-            port_id
-        )
-        """L23 port's match term index manager.
+    :type: P_USED_TPLDID
+    """
 
-        :type: MatchTermIndices
-        """
+    def __init__(self, conn: "itf.IConnection", module_id: int, port_id: int) -> None:
+        super().__init__(conn, module_id, port_id)
 
-        self.used_tpld_ids = P_USED_TPLDID(conn, module_id, port_id)
-        """TG port's used TPLD IDs.
+        self.local_states = ports_state.PortL23LocalState()
+        """L23 port local states.
 
-        :type: P_USED_TPLDID
+        :type: PortL23LocalState
         """
 
     on_speed_change = functools.partialmethod(utils.on_event, P_SPEED)
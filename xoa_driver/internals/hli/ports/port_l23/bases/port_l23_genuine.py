@@ -81,92 +81,82 @@ class PortStatistics:
 class BasePortL23Genuine(BasePortL23):
     """L23 port basic configuration."""
 
-    def __init__(self, conn: "itf.IConnection", module_id: int, port_id: int) -> None:
-        super().__init__(conn, module_id, port_id)
+    flash = utils.LazyAttribute(P_FLASH)
+    """L23 port flashes.
 
-        self._local_states = ports_state.PortL23GenuineLocalState()
+    :type: P_FLASH
+    """
 
-        self.flash = P_FLASH(conn, module_id, port_id)
-        """L23 port flashes.
+    status = utils.LazyAttribute(P_STATUS)
+    """L23 port's received optical signal level'.
 
-        :type: P_FLASH
-        """
+    :type: P_STATUS
+    """
 
-        self.status = P_STATUS(conn, module_id, port_id)
-        """L23 port's received optical signal level'.
+    config_load_mode = utils.LazyAttribute(P_LOADMODE)
+    """Chimera Port loading mode.
 
-        :type: P_STATUS
-        """
+    :type: P_LOADMODE
+    """
 
-        self.config_load_mode = P_LOADMODE(conn, module_id, port_id)
-        """Chimera Port loading mode.
+    tcvr_status = utils.LazyAttribute(P_TCVRSTATUS)
+    """L23 port transceiver status information.
 
-        :type: P_LOADMODE
-        """
-
-        self.tcvr_status = P_TCVRSTATUS(conn, module_id, port_id)
-        """L23 port transceiver status information.
+    :type: P_TCVRSTATUS
+    """
 
-        :type: P_TCVRSTATUS
-        """
+    speed = utils.LazyAttribute(GenuineSpeed)
+    """L23 port speed configuration.
 
-        self.speed = GenuineSpeed(conn, module_id, port_id)
-        """L23 port speed configuration.
+    :type: GenuineSpeed
+    """
 
-        :type: GenuineSpeed
-        """
+    uat = utils.LazyAttribute(UnAvailableTime)
+    """L23 port UnAvailable Time configuration.
 
-        self.uat = UnAvailableTime(conn, module_id, port_id)
-        """L23 port UnAvailable Time configuration.
+    :type: UnAvailableTime
+    """
 
-        :type: UnAvailableTime
-        """
+    transceiver = utils.LazyAttribute(Transceiver)
+    """L23 port transceiver configuration.
 
-        self.transceiver = Transceiver(conn, module_id, port_id)
-        """L23 port transceiver configuration.
+    :type: PortTransceiver
+    """
 
-        :type: PortTransceiver
-        """
+    statistics = utils.LazyAttribute(PortStatistics)
+    """L23 port statistics.
 
-        self.statistics = PortStatistics(conn, module_id, port_id)
-        """L23 port statistics.
+    :type: PortStatistics
+    """
 
-        :type: PortStatistics
-        """
+    streams: "utils.LazyAttribute[StreamIndices]" = utils.LazyAttribute(
+        lambda conn, module_id, port_id: idx_mgr.IndexManager(conn, GenuineStreamIdx, module_id, port_id)
+    )
+    """L23 port stream index manager.
 
-        self.streams: StreamIndices = idx_mgr.IndexManager(
-            conn,
-            GenuineStreamIdx,
-            module_id,
-            port_id
-        )
-        """L23 port stream index manager.
+    :type: StreamIndices
+    """
 
-        :type: StreamIndices
-        """
+    filters: "utils.LazyAttribute[FilterIndices]" = utils.LazyAttribute(
+        lambda conn, module_id, port_id: idx_mgr.IndexManager(conn, GenuineFilterIdx, module_id, port_id)
+    )
+    """L23 port filter index manager.
 
-        self.filters: FilterIndices = idx_mgr.IndexManager(
-            conn,
-            GenuineFilterIdx,
-            module_id,
-            port_id
-        )
-        """L23 port filter index manager.
+    :type: FilterIndices
+    """
 
-        :type: FilterIndices
-        """
+    datasets: "utils.LazyAttribute[PortDatasetIndices]" = utils.LazyAttribute(
+        lambda conn, module_id, port_id: idx_mgr.IndexManager(conn, PortDatasetIdx, module_id, port_id)
+    )
+    """L23 port histogram index manager.
 
-        self.datasets: PortDatasetIndices = idx_mgr.IndexManager(
-            conn,
-            PortDatasetIdx,
-            module_id,
-            port_id
-        )
-        """L23 port histogram index manager.
+    :type: PortDatasetIndices
+    """
 
-        :type: PortDatasetIndices
-        """
+    def __init__(self, conn: "itf.IConnection", module_id: int, port_id: int) -> None:
+        super().__init__(conn, module_id, port_id)
 
+        self._local_states = ports_state.PortL23GenuineLocalState()
 
     @property
     def info(self) -> ports_state.PortL23GenuineLocalState:
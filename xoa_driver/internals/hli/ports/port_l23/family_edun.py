@@ -12,9 +12,6 @@ from .layer1_adv.layer1 import Layer1Adv
 from .protocol.lldp import LLDP
 from .uec.ue import UltraEthernet
 
-if typing.TYPE_CHECKING:
-    from xoa_driver.internals.core import interfaces as itf
-
 __all__ = (
     "PEdun800G3S1PSMPX_a",
     "PEdun1600G4S1POSFP_a",
@@ -27,42 +24,39 @@ __all__ = (
 
 
 class FamilyEdun(BasePortL23Genuine):
-    def __init__(self, conn: "itf.IConnection", module_id: int, port_id: int) -> None:
-        super().__init__(conn, module_id, port_id)
-        self.dynamic = P_DYNAMIC(conn, module_id, port_id)
-        """L23 port's dynamic traffic change.
-        
-        :type: P_DYNAMIC
-        """
-
-        self.lldp = LLDP(conn, module_id, port_id)
-        """LLDP protocol support for the port.
-        
-        :type: LLDP
-        """
-        
-        self.uec = UltraEthernet(conn, module_id, port_id)
-        """Ultra Ethernet of the port.
-
-        :type: UltraEthernet
-        """
-        
-        self.tpld_offset = P_TPLDOFFSET(conn, module_id, port_id)
-        """L23 port test payload offset configuration.
-
-        :type: P_TPLDOFFSET
-        """
-
-    async def _setup(self) -> typing.Self:
-        await super()._setup()
-
-        self.layer1 = Layer1(self._conn, self)
-        """Layer 1"""
-
-        self.layer1_adv = Layer1Adv(self._conn, self)
-        """Layer 1 Advanced"""
-
-        return self
+    dynamic = utils.LazyAttribute(P_DYNAMIC)
+    """L23 port's dynamic traffic change.
+
+    :type: P_DYNAMIC
+    """
+
+    lldp = utils.LazyAttribute(LLDP)
+    """LLDP protocol support for the port.
+
+    :type: LLDP
+    """
+
+    uec = utils.LazyAttribute(UltraEthernet)
+    """Ultra Ethernet of the port.
+
+    :type: UltraEthernet
+    """
+
+    tpld_offset = utils.LazyAttribute(P_TPLDOFFSET)
+    """L23 port test payload offset configuration.
+
+    :type: P_TPLDOFFSET
+    """
+
+    @functools.cached_property
+    def layer1(self) -> Layer1:
+        """Layer 1, constructed at the first access."""
+        return Layer1(self._conn, self)
+
+    @functools.cached_property
+    def layer1_adv(self) -> Layer1Adv:
+        """Layer 1 Advanced, constructed at the first access."""
+        return Layer1Adv(self._conn, self)
 
     on_dynamic_change = functools.partialmethod(utils.on_event, P_DYNAMIC)
     """Register a callback to the event that the port's dynamic traffic setting changes."""
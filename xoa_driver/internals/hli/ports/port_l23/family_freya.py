@@ -12,9 +12,6 @@ from .layer1_adv.layer1 import Layer1Adv
 from .protocol.lldp import LLDP
 from .uec.ue import UltraEthernet
 
-if typing.TYPE_CHECKING:
-    from xoa_driver.internals.core import interfaces as itf
-
 __all__ = (
     "PFreya800G1S1P_a",
     "PFreya800G1S1P_b",
@@ -42,42 +39,39 @@ __all__ = (
 
 
 class FamilyFreya(BasePortL23Genuine):
-    def __init__(self, conn: "itf.IConnection", module_id: int, port_id: int) -> None:
-        super().__init__(conn, module_id, port_id)
-        self.dynamic = P_DYNAMIC(conn, module_id, port_id)
-        """Dynamic traffic change allows stream rate and packet size to be changed on the fly without stopping the traffic.
-        
-        :type: P_DYNAMIC
-        """
+    dynamic = utils.LazyAttribute(P_DYNAMIC)
+    """Dynamic traffic change allows stream rate and packet size to be changed on the fly without stopping the traffic.
 
-        self.lldp = LLDP(conn, module_id, port_id)
-        """LLDP protocol support for the port.
-        
-        :type: LLDP
-        """
+    :type: P_DYNAMIC
+    """
 
-        self.uec = UltraEthernet(conn, module_id, port_id)
-        """Ultra Ethernet of the port.
+    lldp = utils.LazyAttribute(LLDP)
+    """LLDP protocol support for the port.
 
-        :type: UltraEthernet
-        """
+    :type: LLDP
+    """
 
-        self.tpld_offset = P_TPLDOFFSET(conn, module_id, port_id)
-        """L23 port test payload offset configuration.
+    uec = utils.LazyAttribute(UltraEthernet)
+    """Ultra Ethernet of the port.
 
-        :type: P_TPLDOFFSET
-        """
+    :type: UltraEthernet
+    """
 
-    async def _setup(self) -> typing.Self:
-        await super()._setup()
+    tpld_offset = utils.LazyAttribute(P_TPLDOFFSET)
+    """L23 port test payload offset configuration.
 
-        self.layer1 = Layer1(self._conn, self)
-        """Layer 1"""
+    :type: P_TPLDOFFSET
+    """
 
-        self.layer1_adv = Layer1Adv(self._conn, self)
-        """Layer 1 Advanced"""
+    @functools.cached_property
+    def layer1(self) -> Layer1:
+        """Layer 1, constructed at the first access."""
+        return Layer1(self._conn, self)
 
-        return self
+    @functools.cached_property
+    def layer1_adv(self) -> Layer1Adv:
+        """Layer 1 Advanced, constructed at the first access."""
+        return Layer1Adv(self._conn, self)
 
     on_dynamic_change = functools.partialmethod(utils.on_event, P_DYNAMIC)
     """Register a callback to the event that the port's dynamic traffic setting changes."""
@@ -19,32 +19,29 @@ __all__ = (
 
 
 class FamilyLoki2(BasePortL23Genuine):
-    def __init__(self, conn: "itf.IConnection", module_id: int, port_id: int) -> None:
-        super().__init__(conn, module_id, port_id)
-        self.dynamic = P_DYNAMIC(conn, module_id, port_id)
-        """L23 port's dynamic traffic change.
-        
-        :type: P_DYNAMIC
-        """
-        
-        self.macsec = MacSec(conn, module_id, port_id)
-        """MACSec configuration and status.
-        
-        :type: MacSec
-        """
-        
-        self.tpld_offset = P_TPLDOFFSET(conn, module_id, port_id)
-        """L23 port test payload offset configuration.
-
-        :type: P_TPLDOFFSET
-        """
-        
-
-    async def _setup(self) -> typing.Self:
-        await super()._setup()
-        self.layer1 = Layer1(self._conn, self)
-        """Layer 1"""
-        return self
+    dynamic = utils.LazyAttribute(P_DYNAMIC)
+    """L23 port's dynamic traffic change.
+
+    :type: P_DYNAMIC
+    """
+
+    macsec = utils.LazyAttribute(MacSec)
+    """MACSec configuration and status.
+
+    :type: MacSec
+    """
+
+    tpld_offset = utils.LazyAttribute(P_TPLDOFFSET)
+    """L23 port test payload offset configuration.
+
+    :type: P_TPLDOFFSET
+    """
+
+
+    @functools.cached_property
+    def layer1(self) -> Layer1:
+        """Layer 1, constructed at the first access."""
+        return Layer1(self._conn, self)
 
     on_dynamic_change = functools.partialmethod(utils.on_event, P_DYNAMIC)
     """Register a callback to the event that the port's dynamic traffic setting changes."""
@@ -57,4 +54,3 @@ class PLoki100G5S4P_a(FamilyLoki2):
     def __init__(self, conn: "itf.IConnection", module_id: int, port_id: int) -> None:
         super().__init__(conn, module_id, port_id)
 
-        
\ No newline at end of file
@@ -13,9 +13,6 @@ from .trafficgen.runt import Runt
 from .layer1.preamble import Preamble
 from .layer1.brr import BroadrReach
 
-if typing.TYPE_CHECKING:
-    from xoa_driver.internals.core import interfaces as itf
-
 __all__ = (
     "POdin1G3S6P",
     "POdin1G3S6P_b",
@@ -49,20 +46,17 @@ __all__ = (
 class FamilyOdin(BasePortL23Genuine):
     """Base class for Odin-1G port"""
 
-    def __init__(self, conn: "itf.IConnection", module_id: int, port_id: int) -> None:
-        super().__init__(conn, module_id, port_id)
+    dynamic = utils.LazyAttribute(P_DYNAMIC)
+    """L23 port's dynamic traffic change.
+
+    :type: P_DYNAMIC
+    """
 
-        self.dynamic = P_DYNAMIC(conn, module_id, port_id)
-        """L23 port's dynamic traffic change.
-        
-        :type: P_DYNAMIC
-        """
+    autoneg_selection = utils.LazyAttribute(P_AUTONEGSELECTION)
+    """Auto-negotiation selection.
 
-        self.autoneg_selection = P_AUTONEGSELECTION(conn, module_id, port_id)
-        """Auto-negotiation selection.
-        
-        :type: P_AUTONEGSELECTION
-        """
+    :type: P_AUTONEGSELECTION
+    """
 
     on_dynamic_change = functools.partialmethod(utils.on_event, P_DYNAMIC)
     """Register a callback to the event that the port's dynamic traffic setting changes."""
@@ -71,13 +65,11 @@ class FamilyOdin(BasePortL23Genuine):
 class POdin1G3S6P(FamilyOdin):
     """L23 port on Odin-1G-3S-6P module.
     """
-    def __init__(self, conn: "itf.IConnection", module_id: int, port_id: int) -> None:
-        super().__init__(conn, module_id, port_id)
-        self.mdix_mode = P_MDIXMODE(conn, module_id, port_id)
-        """MDI/MDIX mode.
-        
-        :type: P_MDIXMODE
-        """
+    mdix_mode = utils.LazyAttribute(P_MDIXMODE)
+    """MDI/MDIX mode.
+
+    :type: P_MDIXMODE
+    """
 
 
 @typing.final
@@ -171,14 +163,11 @@ class POdin5G4S6PCU(FamilyOdin):
 class POdin10G5S6PCU(FamilyOdin):
     """L23 port on Odin-10G-5S-6P-CU module.
     """
-    def __init__(self, conn: "itf.IConnection", module_id: int, port_id: int) -> None:
-        super().__init__(conn, module_id, port_id)
+    eee = utils.LazyAttribute(LowPowerMode)
+    """L23 port Low Power mode settings.
 
-        self.eee = LowPowerMode(conn, module_id, port_id)
-        """L23 port Low Power mode settings.
-        
-        :type: LowPowerMode
-        """
+    :type: LowPowerMode
+    """
 
 
 @typing.final
@@ -206,20 +195,17 @@ class POdin10G3S2PCU(FamilyOdin):
 class POdin10G6S6P_a(FamilyOdin):
     """L23 port on Odin-10G-6S-6P[a] module.
     """
-    def __init__(self, conn: "itf.IConnection", module_id: int, port_id: int) -> None:
-        super().__init__(conn, module_id, port_id)
-        
-        self.runt = Runt(conn, module_id, port_id)
-        """Runt settings.
-        
-        :type: Runt
-        """
+    runt = utils.LazyAttribute(Runt)
+    """Runt settings.
+
+    :type: Runt
+    """
 
-        self.preamble = Preamble(conn, module_id, port_id)
-        """Preamble settings.
-        
-        :type: Preamble
-        """
+    preamble = utils.LazyAttribute(Preamble)
+    """Preamble settings.
+
+    :type: Preamble
+    """
 
 
 @typing.final
@@ -261,11 +247,9 @@ class POdin40G2S2PB(POdin40G2S2P):
 class POdin1G3S6PT1RJ45(FamilyOdin):
     """L23 port on Odin-1G-3S-6P-T1-RJ45 module.
     """
-    def __init__(self, conn: "itf.IConnection", module_id: int, port_id: int) -> None:
-        super().__init__(conn, module_id, port_id)
-        self.brr = BroadrReach(conn, module_id, port_id)
-        """BroadR-Reach settings.
-        """
+    brr = utils.LazyAttribute(BroadrReach)
+    """BroadR-Reach settings.
+    """
 
 @typing.final
 class POdin100G3S1P(FamilyOdin):
@@ -8,9 +8,6 @@ from xoa_driver.internals.utils import attributes as utils
 from .bases.port_l23_genuine import BasePortL23Genuine
 from .layer1.layer1_thor import Layer1
 
-if typing.TYPE_CHECKING:
-    from xoa_driver.internals.core import interfaces as itf
-
 __all__ = (
     "PThor100G5S4P",
     "PThor400G7S1P",
@@ -22,19 +19,16 @@ __all__ = (
 
 
 class FamilyThor(BasePortL23Genuine):
-    def __init__(self, conn: "itf.IConnection", module_id: int, port_id: int) -> None:
-        super().__init__(conn, module_id, port_id)
-        self.dynamic = P_DYNAMIC(conn, module_id, port_id)
-        """L23 port's dynamic traffic change.
-        
-        :type: P_DYNAMIC
-        """
-
-    async def _setup(self) -> typing.Self:
-        await super()._setup()
-        self.layer1 = Layer1(self._conn, self)
-        """Layer 1"""
-        return self
+    dynamic = utils.LazyAttribute(P_DYNAMIC)
+    """L23 port's dynamic traffic change.
+
+    :type: P_DYNAMIC
+    """
+
+    @functools.cached_property
+    def layer1(self) -> Layer1:
+        """Layer 1, constructed at the first access."""
+        return Layer1(self._conn, self)
 
     on_dynamic_change = functools.partialmethod(utils.on_event, P_DYNAMIC)
     """Register a callback to the event that the port's dynamic traffic setting changes."""
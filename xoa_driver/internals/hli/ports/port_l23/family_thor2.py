@@ -9,9 +9,6 @@ from xoa_driver.internals.utils import attributes as utils
 from .bases.port_l23_genuine import BasePortL23Genuine
 from .layer1.layer1_thor2 import Layer1
 
-if typing.TYPE_CHECKING:
-    from xoa_driver.internals.core import interfaces as itf
-
 __all__ = (
     "PThor400G7S2P_a",
     "PThor400G7S2P_c",
@@ -19,30 +16,22 @@ __all__ = (
 
 
 class FamilyThor2(BasePortL23Genuine):
-    def __init__(self, conn: "itf.IConnection", module_id: int, port_id: int) -> None:
-        super().__init__(conn, module_id, port_id)
-        self.dynamic = P_DYNAMIC(conn, module_id, port_id)
-        """L23 port's dynamic traffic change.
-        
-        :type: P_DYNAMIC
-        """
-        
-        self.tpld_offset = P_TPLDOFFSET(conn, module_id, port_id)
-        """L23 port test payload offset configuration.
-
-        :type: P_TPLDOFFSET
-        """
-
-    async def _setup(self) -> typing.Self:
-        await super()._setup()
-
-        self.layer1 = Layer1(self._conn, self)
-        """Layer 1
-        
-        :type: Layer1
-        """
-        
-        return self
+    dynamic = utils.LazyAttribute(P_DYNAMIC)
+    """L23 port's dynamic traffic change.
+
+    :type: P_DYNAMIC
+    """
+
+    tpld_offset = utils.LazyAttribute(P_TPLDOFFSET)
+    """L23 port test payload offset configuration.
+
+    :type: P_TPLDOFFSET
+    """
+
+    @functools.cached_property
+    def layer1(self) -> Layer1:
+        """Layer 1, constructed at the first access."""
+        return Layer1(self._conn, self)
 
     on_dynamic_change = functools.partialmethod(utils.on_event, P_DYNAMIC)
     """Register a callback to the event that the port's dynamic traffic setting changes."""
@@ -1,5 +1,7 @@
 from typing import (
     TYPE_CHECKING,
+    Awaitable,
+    Callable,
     Tuple,
 )
 from typing import Self
@@ -14,6 +16,11 @@ from xoa_driver.internals.commands import (
     PP_EYEDWELLBITS,
 )
 from xoa_driver import enums
+from xoa_driver.internals.utils.eye_acquisition import (
+    EyeAcquisition,
+    EyeColumn,
+    EyeData,
+)
 
 class EyeDiagram:
     """L23 high-speed port SerDes eye diagram."""
@@ -68,4 +75,31 @@ class EyeDiagram:
             )
             for x in range(resolution.x_resolution)
         )
-        return self
\ No newline at end of file
+        return self
+
+    async def acquire(
+        self,
+        on_column: Callable[[EyeColumn, EyeData], Awaitable[None] | None] | None = None,
+        *,
+        resolution: tuple[int, int] | None = None,
+        poll_interval: float = 0.05,
+        timeout: float | None = None,
+    ) -> EyeData:
+        """Measure the BER eye and read its columns as they become valid.
+
+        Use ``utils.EyeAcquisition`` to measure the eyes of many serdes at once.
+
+        :param on_column: called with every column which became valid and the partial eye
+        :type on_column: Callable[[EyeColumn, EyeData], Awaitable[None] | None] | None
+        :param resolution: x and y resolution applied before the measurement, the current one by default
+        :type resolution: tuple[int, int] | None
+        :param poll_interval: seconds between the reads while no new column is valid
+        :type poll_interval: float
+        :param timeout: seconds to wait for the whole eye
+        :type timeout: float | None
+        :return: the measured eye
+        :rtype: EyeData
+        """
+        acquisition = EyeAcquisition([self], resolution=resolution, poll_interval=poll_interval, timeout=timeout)
+        eyes = await acquisition.acquire(on_column)
+        return eyes[0]
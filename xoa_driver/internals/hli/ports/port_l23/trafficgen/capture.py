@@ -1,5 +1,7 @@
+import os
 from typing import (
     TYPE_CHECKING,
+    BinaryIO,
     List,
 )
 if TYPE_CHECKING:
@@ -12,6 +14,11 @@ from xoa_driver.internals.commands import (
     PC_EXTRA,
     PC_PACKET,
 )
+from xoa_driver.internals.utils.capture_export import (
+    CaptureExporter,
+    CaptureFormat,
+    CaptureReport,
+)
 
 
 class ObtainCaptured:
@@ -68,3 +75,19 @@ class PortCapture:
             ObtainCaptured(self.__conn, self.__module_id, self.__port_id, idx)
             for idx in range(stats.packets)
         ]
+
+    async def export(self, file: str | os.PathLike | BinaryIO, *, format: CaptureFormat = CaptureFormat.PCAPNG, chunk_size: int = 256) -> CaptureReport:
+        """Download the capture buffer in pipelined chunks and write it to a pcap or pcapng file.
+
+        Use ``utils.CaptureExporter`` to export the captures of many ports at once.
+
+        :param file: path or binary file object
+        :type file: str | os.PathLike | BinaryIO
+        :param format: file format
+        :type format: CaptureFormat
+        :param chunk_size: number of the packets read in one round
+        :type chunk_size: int
+        :return: number of the packets and bytes written
+        :rtype: CaptureReport
+        """
+        return await CaptureExporter([self], chunk_size=chunk_size).export(file, format=format)
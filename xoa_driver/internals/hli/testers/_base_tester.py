@@ -7,6 +7,7 @@ from typing import (
     Generator,
     Any
 )
+from collections import Counter
 from abc import (
     ABC,
     abstractmethod,
@@ -33,8 +34,15 @@ from xoa_driver.internals.commands import (
 )
 from xoa_driver.internals.core.funcs import establish_connection
 from xoa_driver.internals.core.transporter.handler import TransportationHandler
-from xoa_driver.internals.core.transporter.logger import CustomLogger
+from xoa_driver.internals.core.transporter._reconnect import ReconnectPolicy
+from xoa_driver.internals.core.transporter._recorder import SessionRecorder
+from xoa_driver.internals.core.transporter._metrics import TransportMetrics
+from xoa_driver.internals.core.transporter.logger import (
+    CustomLogger,
+    DeferredLogging,
+)
 from xoa_driver.internals.utils import session
+from xoa_driver.internals.utils import bootstrap
 from xoa_driver.internals.state_storage import testers_state
 
 
@@ -61,14 +69,48 @@ class BaseTester(ABC, Generic[TesterStateStorage]):
     :type enable_logging: CustomLogger | None
     :param session_timeout: `130` Session timeout in seconds
     :type session_timeout: int
+    :param reconnect: `None` restore the lost connection by the policy and keep the tester objects valid, instead of losing it
+    :type reconnect: ReconnectPolicy | None
+    :param request_timeout: `None` seconds a request waits for the response before it fails with ``XoaRequestTimeoutError``
+    :type request_timeout: float | None
+    :param enable_metrics: `True` if the transport metrics of the connection are collected, see ``tester.metrics``
+    :type enable_metrics: bool
+    :param recorder: `None` record the raw data sent to and received from the tester, for replaying it with ``SessionReplayer``
+    :type recorder: SessionRecorder | None
+    :param deferred_logging: `None` log the packets from a background thread, sampled and filtered by the command, instead of ``enable_logging``
+    :type deferred_logging: DeferredLogging | None
+    :param raw_hex: `False` return the Hex fields of the responses as zero-copy ``memoryview`` slices instead of the hex strings
+    :type raw_hex: bool
     """
 
-    def __init__(self, host: str, username: str, password: str = "xena", port: int = 22606, *, enable_logging: bool = False, custom_logger: CustomLogger | None = None, session_timeout: int = 130) -> None:
+    def __init__(
+        self,
+        host: str,
+        username: str,
+        password: str = "xena",
+        port: int = 22606,
+        *,
+        enable_logging: bool = False,
+        custom_logger: CustomLogger | None = None,
+        session_timeout: int = 130,
+        reconnect: ReconnectPolicy | None = None,
+        request_timeout: float | None = None,
+        enable_metrics: bool = False,
+        recorder: SessionRecorder | None = None,
+        deferred_logging: DeferredLogging | None = None,
+        raw_hex: bool = False,
+    ) -> None:
         self.__host = host
         self.__port = port
         self._conn = TransportationHandler(
             enable_logging=enable_logging,
-            custom_logger=custom_logger
+            custom_logger=custom_logger,
+            reconnect=reconnect,
+            request_timeout=request_timeout,
+            enable_metrics=enable_metrics,
+            recorder=recorder,
+            deferred_logging=deferred_logging,
+            raw_hex=raw_hex,
         )
         self.session = session.TesterSession(
             self._conn,
@@ -77,6 +119,7 @@ class BaseTester(ABC, Generic[TesterStateStorage]):
             timeout_seconds=session_timeout,
             keepalive=True,
         )
+        self._conn.resume_with(self.session.resume_requests)
         """
         Current management session
 
@@ -180,6 +223,12 @@ class BaseTester(ABC, Generic[TesterStateStorage]):
         :type: C_USED_TPLDID
         """
 
+        self.bootstrap_report = bootstrap.BootstrapReport()
+        """Time-to-ready of the tester, by the phases of its bootstrap.
+
+        :type: BootstrapReport
+        """
+
     async def __aenter__(self: Awaitable[T]) -> T:
         return await self
 
@@ -187,17 +236,40 @@ class BaseTester(ABC, Generic[TesterStateStorage]):
         await self.session.logoff()
 
     def __await__(self: T) -> Generator[Any, None, T]:
-        if self.session.is_online:
+        if self.session.is_online or self._conn.is_reconnecting:
             async def skip():
                 return self
             return skip().__await__()
         return self._setup().__await__()
 
     async def _setup(self: T) -> T:
-        await establish_connection(self._conn, self.__host, self.__port)
-        await self.session.logon()
+        with self.bootstrap_report.measure("connect"):
+            await establish_connection(self._conn, self.__host, self.__port)
+        with self.bootstrap_report.measure("logon"):
+            await self.session.logon()
         return self
 
+    @property
+    def request_timeouts(self) -> "Counter[int]":
+        """
+        Number of the requests which failed because of the ``request_timeout``, by the command code.
+
+        :type: Counter[int]
+        """
+
+        return self._conn.timeouts
+
+    @property
+    def metrics(self) -> "TransportMetrics | None":
+        """
+        Counters and latency histograms of the connection, exportable with ``as_dict()`` or ``to_prometheus()``.
+        None unless the tester is created with ``enable_metrics=True``.
+
+        :type: TransportMetrics | None
+        """
+
+        return self._conn.metrics
+
     def __is_reservation(self, reserved_status: enums.ReservedStatus) -> bool:
         return self.info.reservation == reserved_status
 
@@ -243,6 +315,17 @@ class BaseTester(ABC, Generic[TesterStateStorage]):
 
         self._conn.on_disconnected(callback)
 
+    def on_reconnected(self, callback: "Callable") -> None:
+        """
+        Register a callback function that will be called at the time when the lost connection is restored.
+        Only called if the tester is created with a ``reconnect`` policy.
+
+        :param callback: the callback function that can be called when the event happens.
+        :type callback: Callable
+        """
+
+        self._conn.on_reconnected(callback)
+
     def on_reservation_change(self, callback: "Callable") -> None:
         """
         Register an callback function that will be called when tester's reservation status is changed.
@@ -7,8 +7,14 @@ from xoa_driver.internals.commands import (
     C_TRAFFICSYNC,
     C_VERSIONNO_MINOR,
 )
-from xoa_driver.internals.core.transporter.logger import CustomLogger
+from xoa_driver.internals.core.transporter.logger import (
+    CustomLogger,
+    DeferredLogging,
+)
+from xoa_driver.internals.core.transporter._reconnect import ReconnectPolicy
+from xoa_driver.internals.core.transporter._recorder import SessionRecorder
 from xoa_driver.internals.utils.managers import modules_manager as mm
+from xoa_driver.internals.utils import bootstrap
 from ._base_tester import BaseTester
 
 
@@ -43,9 +49,37 @@ class L23VeTester(BaseTester["testers_state.TesterLocalState"]):
     :type enable_logging: CustomLogger | None
     :param session_timeout: `130` Session timeout in seconds
     :type session_timeout: int
+    :param reconnect: `None` restore the lost connection by the policy and keep the tester objects valid, instead of losing it
+    :type reconnect: ReconnectPolicy | None
+    :param request_timeout: `None` seconds a request waits for the response before it fails with ``XoaRequestTimeoutError``
+    :type request_timeout: float | None
+    :param enable_metrics: `True` if the transport metrics of the connection are collected, see ``tester.metrics``
+    :type enable_metrics: bool
+    :param recorder: `None` record the raw data sent to and received from the tester, for replaying it with ``SessionReplayer``
+    :type recorder: SessionRecorder | None
+    :param deferred_logging: `None` log the packets from a background thread, sampled and filtered by the command, instead of ``enable_logging``
+    :type deferred_logging: DeferredLogging | None
+    :param raw_hex: `False` return the Hex fields of the responses as zero-copy ``memoryview`` slices instead of the hex strings
+    :type raw_hex: bool
     """
 
-    def __init__(self, host: str, username: str, password: str = "xena", port: int = 22606, *, enable_logging: bool = False, custom_logger: CustomLogger | None = None, session_timeout: int = 130) -> None:
+    def __init__(
+        self,
+        host: str,
+        username: str,
+        password: str = "xena",
+        port: int = 22606,
+        *,
+        enable_logging: bool = False,
+        custom_logger: CustomLogger | None = None,
+        session_timeout: int = 130,
+        reconnect: ReconnectPolicy | None = None,
+        request_timeout: float | None = None,
+        enable_metrics: bool = False,
+        recorder: SessionRecorder | None = None,
+        deferred_logging: DeferredLogging | None = None,
+        raw_hex: bool = False,
+    ) -> None:
         super().__init__(
             host=host,
             username=username,
@@ -53,7 +87,13 @@ class L23VeTester(BaseTester["testers_state.TesterLocalState"]):
             port=port,
             enable_logging=enable_logging,
             custom_logger=custom_logger,
-            session_timeout=session_timeout
+            session_timeout=session_timeout,
+            reconnect=reconnect,
+            request_timeout=request_timeout,
+            enable_metrics=enable_metrics,
+            recorder=recorder,
+            deferred_logging=deferred_logging,
+            raw_hex=raw_hex,
         )
 
         self._local_states = testers_state.TesterLocalState(host, port)
@@ -105,10 +145,7 @@ class L23VeTester(BaseTester["testers_state.TesterLocalState"]):
 
     async def _setup(self):
         await super()._setup()
-        await self._local_states.initiate(self)
+        port_counts = await bootstrap.initiate_tester(self, C_PORTCOUNTS(self._conn).get(), self.bootstrap_report)
         self._local_states.register_subscriptions(self)
-
-        ft_pc = await C_PORTCOUNTS(self._conn).get()
-        port_counts = ft_pc.port_counts
-        await self.modules.fill_l23(port_counts)
+        await self.modules.fill_l23(port_counts, report=self.bootstrap_report)
         return self
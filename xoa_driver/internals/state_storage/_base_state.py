@@ -0,0 +1,47 @@
+from __future__ import annotations
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Iterator,
+)
+from xoa_driver.internals.core import funcs
+
+if TYPE_CHECKING:
+    from xoa_driver.internals.core.token import Token
+
+
+class BaseLocalState(ABC):
+    """
+    Local state which is initiated from the replies of a set of queries.
+
+    The queries of many states can be sent together, see ``utils.bootstrap``.
+    """
+    __slots__ = ("_preloaded",)
+
+    def __init__(self) -> None:
+        self._preloaded: bool = False
+
+    @abstractmethod
+    def queries(self, owner) -> list["Token"]:
+        """Queries the state is initiated from, the subclasses extend the list of the base class."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def load(self, owner, replies: Iterator[Any]) -> None:
+        """Consume the replies of the ``queries`` in the same order."""
+        raise NotImplementedError()
+
+    def preload(self, owner, replies: Iterator[Any]) -> None:
+        """Load the replies queried together with other states, the following ``initiate`` doesn't query them again."""
+        self.load(owner, replies)
+        self._preloaded = True
+
+    async def initiate(self, owner) -> None:
+        if self._preloaded:
+            self._preloaded = False
+            return None
+        self.load(owner, iter(await funcs.apply(*self.queries(owner))))
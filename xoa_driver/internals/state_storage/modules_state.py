@@ -1,10 +1,13 @@
-import asyncio
-from typing import List
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Iterator,
+    List,
+)
 from dataclasses import (
     dataclass,
     field,
 )
-from xoa_driver.internals.core import funcs
 from xoa_driver.internals.commands import enums
 from xoa_driver.internals.commands import (
     M_MODEL,
@@ -14,9 +17,13 @@ from xoa_driver.internals.commands import (
 )
 
 from xoa_driver.internals.utils import attributes as utils
+from ._base_state import BaseLocalState
+
+if TYPE_CHECKING:
+    from xoa_driver.internals.core.token import Token
 
 
-class ModuleLocalState:
+class ModuleLocalState(BaseLocalState):
     """Module local state.
     """
     __slots__ = (
@@ -30,6 +37,7 @@ class ModuleLocalState:
     )
 
     def __init__(self) -> None:
+        super().__init__()
         self.reservation: enums.ReservedStatus = enums.ReservedStatus.RELEASED
         self.reserved_by: str = ""
         self.model: str = ""
@@ -38,16 +46,8 @@ class ModuleLocalState:
         self.version_string: str = ""
         self.revision: str = ""
 
-    async def initiate(self, module) -> None:
-        (
-            reservation_r,
-            reserved_by_r,
-            model_r,
-            model_name_r,
-            serial_number_r,
-            version_string_r,
-            revision_r,
-        ) = await funcs.apply(
+    def queries(self, module) -> list["Token"]:
+        return [
             module.reservation.get(),
             module.reserved_by.get(),
             module.model.get(),
@@ -55,19 +55,21 @@ class ModuleLocalState:
             module.serial_number.get(),
             module.version_str.get(),
             module.revision.get(),
-        )
-        self.reservation = enums.ReservedStatus(reservation_r.operation)
-        self.reserved_by = reserved_by_r.username
-        self.model = model_r.model
-        self.model_name = enums.ModuleModelName(model_name_r.name).name
-        self.serial_number = serial_number_r.serial_number
-        self.version_string = version_string_r.version_str
-        self.revision = revision_r.revision
+        ]
+
+    def load(self, module, replies: Iterator[Any]) -> None:
+        self.reservation = enums.ReservedStatus(next(replies).operation)
+        self.reserved_by = next(replies).username
+        self.model = next(replies).model
+        self.model_name = enums.ModuleModelName(next(replies).name).name
+        self.serial_number = next(replies).serial_number
+        self.version_string = next(replies).version_str
+        self.revision = next(replies).revision
 
     def register_subscriptions(self, module) -> None:
-        module._conn.subscribe(M_RESERVEDBY, utils.Update(self, "reserved_by", "username", module._check_identity))
-        module._conn.subscribe(M_RESERVATION, utils.Update(self, "reservation", "operation", module._check_identity))
-        module._conn.subscribe(M_MODEL, utils.Update(self, "model", "model", module._check_identity))
+        module._subscribe(M_RESERVEDBY, utils.Update(self, "reserved_by", "username", module._check_identity))
+        module._subscribe(M_RESERVATION, utils.Update(self, "reservation", "operation", module._check_identity))
+        module._subscribe(M_MODEL, utils.Update(self, "model", "model", module._check_identity))
 
 
 @dataclass(frozen=True)
@@ -114,6 +116,7 @@ class ModuleL23LocalState(ModuleLocalState):
     __slots__ = ("__media_info_list",)
 
     def __init__(self) -> None:
+        super().__init__()
         self.__media_info_list: List["MediaInfo"] = []
 
     @property
@@ -136,13 +139,16 @@ class ModuleL23LocalState(ModuleLocalState):
             )
             self.__media_info_list.append(mi)
 
-    async def initiate(self, module) -> None:
-        m_support_resp, *_ = await asyncio.gather(
+    def queries(self, module) -> list["Token"]:
+        return [
+            *super().queries(module),
             M_MEDIASUPPORT(module._conn, module.module_id).get(),
-            super().initiate(module)
-        )
-        self.media_info_list = m_support_resp.media_info_list
+        ]
+
+    def load(self, module, replies: Iterator[Any]) -> None:
+        super().load(module, replies)
+        self.media_info_list = next(replies).media_info_list
 
     def register_subscriptions(self, module) -> None:
         super().register_subscriptions(module)
-        module._conn.subscribe(M_MEDIASUPPORT, utils.Update(self, "media_info_list", "media_info_list", module._check_identity))
+        module._subscribe(M_MEDIASUPPORT, utils.Update(self, "media_info_list", "media_info_list", module._check_identity))
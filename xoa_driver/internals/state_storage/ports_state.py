@@ -1,5 +1,9 @@
-import asyncio
-from typing import List
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Iterator,
+    List,
+)
 
 from xoa_driver.internals.commands import (
     P_CAPABILITIES,
@@ -11,14 +15,17 @@ from xoa_driver.internals.commands import (
     P_TRAFFIC,
     P4_STATE,
 )
-from xoa_driver.internals.core import funcs
 from xoa_driver.internals.commands import enums
 
 from xoa_driver.internals.utils import attributes as utils
+from ._base_state import BaseLocalState
 from ._speed_detector import SpeedDetector
 
+if TYPE_CHECKING:
+    from xoa_driver.internals.core.token import Token
+
 
-class PortLocalState:
+class PortLocalState(BaseLocalState):
     """Port local state
     """
     __slots__ = (
@@ -31,6 +38,7 @@ class PortLocalState:
     )
 
     def __init__(self) -> None:
+        super().__init__()
         self.model: str = ""
         self.serial_number: int = 0
         self.interface: str = ""
@@ -38,28 +46,25 @@ class PortLocalState:
         self.reserved_by: str = ""
         self.sync_status: "enums.SyncStatus" = enums.SyncStatus.NO_SYNC
 
-    async def initiate(self, port) -> None:
-        (
-            sync_status_r,
-            interface_r,
-            reservation_r,
-            reserved_by_r,
-        ) = await funcs.apply(
+    def queries(self, port) -> list["Token"]:
+        return [
             port.sync_status.get(),
             port.interface.get(),
             port.reservation.get(),
             port.reserved_by.get(),
-        )
-        self.sync_status = enums.SyncStatus(sync_status_r.sync_status)
-        self.interface = interface_r.interface
-        self.reservation = enums.ReservedStatus(reservation_r.status)
-        self.reserved_by = reserved_by_r.username
+        ]
+
+    def load(self, port, replies: Iterator[Any]) -> None:
+        self.sync_status = enums.SyncStatus(next(replies).sync_status)
+        self.interface = next(replies).interface
+        self.reservation = enums.ReservedStatus(next(replies).status)
+        self.reserved_by = next(replies).username
 
     def register_subscriptions(self, port) -> None:
-        port._conn.subscribe(P_RECEIVESYNC, utils.Update(self, "sync_status", "sync_status", port._check_identity))
-        port._conn.subscribe(P_RESERVEDBY, utils.Update(self, "reserved_by", "username", port._check_identity))
-        port._conn.subscribe(P_RESERVATION, utils.Update(self, "reservation", "status", port._check_identity))
-        port._conn.subscribe(P_INTERFACE, utils.Update(self, "interface", "interface", port._check_identity))
+        port._subscribe(P_RECEIVESYNC, utils.Update(self, "sync_status", "sync_status", port._check_identity))
+        port._subscribe(P_RESERVEDBY, utils.Update(self, "reserved_by", "username", port._check_identity))
+        port._subscribe(P_RESERVATION, utils.Update(self, "reservation", "status", port._check_identity))
+        port._subscribe(P_INTERFACE, utils.Update(self, "interface", "interface", port._check_identity))
 
 
 class PortChimeraLocalState(PortLocalState):
@@ -68,12 +73,12 @@ class PortChimeraLocalState(PortLocalState):
     __slots__ = ("capabilities",)
     capabilities: "P_CAPABILITIES.GetDataAttr"
 
-    async def initiate(self, port) -> None:
-        capabilities, _ = await asyncio.gather(
-            port.capabilities.get(),
-            super().initiate(port)
-        )
-        self.capabilities = capabilities
+    def queries(self, port) -> list["Token"]:
+        return [*super().queries(port), port.capabilities.get()]
+
+    def load(self, port, replies: Iterator[Any]) -> None:
+        super().load(port, replies)
+        self.capabilities = next(replies)
 
 
 class PortL23LocalState(PortLocalState):
@@ -86,20 +91,20 @@ class PortL23LocalState(PortLocalState):
     capabilities: "P_CAPABILITIES.GetDataAttr"
 
     def __init__(self) -> None:
+        super().__init__()
         self.traffic_state: "enums.TrafficOnOff" = enums.TrafficOnOff.OFF
 
-    async def initiate(self, port) -> None:
-        capabilities, traffic_state_r, _ = await asyncio.gather(
-            port.capabilities.get(),
-            port.traffic.state.get(),
-            super().initiate(port)
-        )
-        self.capabilities = capabilities
-        self.traffic_state = enums.TrafficOnOff(traffic_state_r.on_off)
+    def queries(self, port) -> list["Token"]:
+        return [*super().queries(port), port.capabilities.get(), port.traffic.state.get()]
+
+    def load(self, port, replies: Iterator[Any]) -> None:
+        super().load(port, replies)
+        self.capabilities = next(replies)
+        self.traffic_state = enums.TrafficOnOff(next(replies).on_off)
 
     def register_subscriptions(self, port) -> None:
         super().register_subscriptions(port)
-        port._conn.subscribe(P_TRAFFIC, utils.Update(self, "traffic_state", "on_off", port._check_identity))
+        port._subscribe(P_TRAFFIC, utils.Update(self, "traffic_state", "on_off", port._check_identity))
 
 
 class PortL23GenuineLocalState(PortL23LocalState):
@@ -108,10 +113,11 @@ class PortL23GenuineLocalState(PortL23LocalState):
     __slots__ = ("port_possible_speed_modes",)
 
     def __init__(self) -> None:
+        super().__init__()
         self.port_possible_speed_modes: List["enums.PortSpeedMode"] = []
 
-    async def initiate(self, port) -> None:
-        await super().initiate(port)
+    def load(self, port, replies: Iterator[Any]) -> None:
+        super().load(port, replies)
         speed_detector = SpeedDetector(
             self.capabilities,
             self.interface
@@ -138,17 +144,17 @@ class PortL47LocalState(PortLocalState):
     capabilities: "P4_CAPABILITIES.GetDataAttr"
 
     def __init__(self) -> None:
+        super().__init__()
         self.traffic_state: "enums.L47PortState" = enums.L47PortState.OFF
 
-    async def initiate(self, port) -> None:
-        capabilities, traffic_state_r, _ = await asyncio.gather(
-            port.capabilities.get(),
-            port.state.get(),
-            super().initiate(port)
-        )
-        self.capabilities = capabilities
-        self.traffic_state = enums.L47PortState(traffic_state_r.state)
+    def queries(self, port) -> list["Token"]:
+        return [*super().queries(port), port.capabilities.get(), port.state.get()]
+
+    def load(self, port, replies: Iterator[Any]) -> None:
+        super().load(port, replies)
+        self.capabilities = next(replies)
+        self.traffic_state = enums.L47PortState(next(replies).state)
 
     def register_subscriptions(self, port) -> None:
         super().register_subscriptions(port)
-        port._conn.subscribe(P4_STATE, utils.Update(self, "traffic_state", "state", port._check_identity))
+        port._subscribe(P4_STATE, utils.Update(self, "traffic_state", "state", port._check_identity))
@@ -1,9 +1,10 @@
-import asyncio
 from typing import (
+    TYPE_CHECKING,
+    Any,
+    Iterator,
     Optional,
     Final,
 )
-from xoa_driver.internals.core import funcs
 from xoa_driver.internals.commands import enums
 from xoa_driver.internals.commands import (
     C_RESERVATION,
@@ -12,11 +13,15 @@ from xoa_driver.internals.commands import (
 )
 from xoa_driver.internals.utils import attributes as utils
 from xoa_driver.internals.exceptions.testers import UnsupportedFirmwareError
+from ._base_state import BaseLocalState
+
+if TYPE_CHECKING:
+    from xoa_driver.internals.core.token import Token
 
 MIN_SUPPORTED_VERSION = 446.5
 
 
-class TesterLocalState:
+class TesterLocalState(BaseLocalState):
     """Tester local state
 
     :param host: tester's address/hostname
@@ -39,6 +44,7 @@ class TesterLocalState:
     )
 
     def __init__(self, host: str, port: int) -> None:
+        super().__init__()
         self.host: Final[str] = host
         self.port: Final[int] = port
         self.model: str = ""
@@ -51,17 +57,8 @@ class TesterLocalState:
         self.version_string: str = ""
         self.name: str = ""
 
-    async def initiate(self, tester) -> None:
-        (
-            capabilities_resp,
-            model_res,
-            v_major_res,
-            serial_res,
-            reserved_by_res,
-            reservation_resp,
-            version_string_res,
-            name_res,
-        ) = await funcs.apply(
+    def queries(self, tester) -> list["Token"]:
+        return [
             tester.capabilities.get(),
             tester.model.get(),
             tester.version_no.get(),
@@ -70,16 +67,19 @@ class TesterLocalState:
             tester.reservation.get(),
             tester.version_str.get(),
             tester.name.get(),
-        )
-        self.reserved_by = reserved_by_res.username
-        self.model = model_res.model
+        ]
+
+    def load(self, tester, replies: Iterator[Any]) -> None:
+        self.capabilities = next(replies)
+        self.model = next(replies).model
+        v_major_res = next(replies)
         self.driver_version = v_major_res.pci_driver_version
         self.version_major = v_major_res.chassis_major_version
-        self.serial_number = serial_res.serial_number
-        self.reservation = reservation_resp.operation
-        self.capabilities = capabilities_resp
-        self.version_string = version_string_res.version_str
-        self.name = name_res.chassis_name
+        self.serial_number = next(replies).serial_number
+        self.reserved_by = next(replies).username
+        self.reservation = next(replies).operation
+        self.version_string = next(replies).version_str
+        self.name = next(replies).chassis_name
 
     def register_subscriptions(self, tester) -> None:
         tester._conn.subscribe(C_RESERVEDBY, utils.Update(self, "reserved_by", "username"))
@@ -101,14 +101,17 @@ class GenuineTesterLocalState(TesterLocalState):
         self.build_string: str = ""
         self.version_minor: int = 0
 
-    async def initiate(self, tester) -> None:
-        bs, v_minor, _ = await asyncio.gather(
+    def queries(self, tester) -> list["Token"]:
+        return [
+            *super().queries(tester),
             tester.build_string.get(),
             tester.version_no_minor.get(),
-            super().initiate(tester)
-        )
-        self.build_string = bs.build_string
-        self.version_minor = v_minor.chassis_minor_version
+        ]
+
+    def load(self, tester, replies: Iterator[Any]) -> None:
+        super().load(tester, replies)
+        self.build_string = next(replies).build_string
+        self.version_minor = next(replies).chassis_minor_version
         current_version = float(f"{self.version_major}.{self.version_minor}")
         if current_version < MIN_SUPPORTED_VERSION:
             raise UnsupportedFirmwareError(current_version)
@@ -1,14 +1,21 @@
+from __future__ import annotations
 from dataclasses import dataclass
 from typing import (
+    Any,
     Callable,
+    Generic,
     Type,
+    TypeVar,
     TYPE_CHECKING,
+    overload,
 )
 if TYPE_CHECKING:
     from xoa_driver.internals.core.transporter.protocol.struct_response import Response
     from xoa_driver.internals.core.transporter._typings import XoaCommandType
     from xoa_driver.internals.core import interfaces as itf
 
+T = TypeVar("T")
+
 
 @dataclass
 class Update:
@@ -30,4 +37,35 @@ def on_event(self, evt: "XoaCommandType", callback: "itf.CallbackType") -> None:
         if not self._check_identity(response):
             return None
         await callback(self, response.values, *args, **kwargs)
-    self._conn.subscribe(evt, _f)
+    self._subscribe(evt, _f)
+
+
+class LazyAttribute(Generic[T]):
+    """
+    Attribute of a port which is constructed at the first access and cached in the port afterwards.
+
+    The factory is called with the connection, module and port index of the port,
+    like the constructors of the commands and of the port's sub-objects.
+    """
+    __slots__ = ("factory", "name")
+
+    def __init__(self, factory: Callable[["itf.IConnection", int, int], T]) -> None:
+        self.factory = factory
+        self.name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    @overload
+    def __get__(self, instance: None, owner: type | None = None) -> "LazyAttribute[T]": ...  # noqa: E704
+
+    @overload
+    def __get__(self, instance: Any, owner: type | None = None) -> T: ...  # noqa: E704
+
+    def __get__(self, instance: Any, owner: type | None = None) -> "T | LazyAttribute[T]":
+        if instance is None:
+            return self
+        value = self.factory(instance._conn, *instance.kind)
+        # Not a data descriptor, so the next access finds the value in the instance dict without calling this method.
+        instance.__dict__[self.name] = value
+        return value
@@ -0,0 +1,78 @@
+from __future__ import annotations
+import time
+from contextlib import contextmanager
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Iterable,
+    Iterator,
+)
+from xoa_driver.internals.core import funcs
+
+if TYPE_CHECKING:
+    from xoa_driver.internals.core.token import Token
+
+
+@dataclass
+class BootstrapReport:
+    """Time-to-ready of a tester, by the phases of its bootstrap."""
+
+    phases: dict[str, float] = field(default_factory=dict)
+    """Seconds spent in every phase, in the order of the phases."""
+    requests: dict[str, int] = field(default_factory=dict)
+    """Number of the requests sent in the bulk batch of the phase."""
+
+    @property
+    def time_to_ready(self) -> float:
+        """Seconds from the connection establishment until the tester, all modules and ports are ready."""
+        return sum(self.phases.values())
+
+    @contextmanager
+    def measure(self, phase: str, requests: int = 0) -> Iterator[None]:
+        """Add the time spent in the block to the phase."""
+        begin = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[phase] = self.phases.get(phase, 0.0) + time.perf_counter() - begin
+            if requests:
+                self.requests[phase] = self.requests.get(phase, 0) + requests
+
+
+async def initiate_tester(tester, port_counts: "Token[Any]", report: BootstrapReport) -> list[int]:
+    """
+    Initiate the local state of the tester and query the port counts of its modules in a single batch.
+    Return the port counts.
+    """
+    state = tester._local_states
+    tokens = [*state.queries(tester), port_counts]
+    with report.measure("tester", len(tokens)):
+        replies = iter(await funcs.apply(*tokens))
+        state.load(tester, replies)
+        return next(replies).port_counts
+
+
+def _with_ports(modules: Iterable[Any]) -> Iterator[Any]:
+    for module in modules:
+        yield module
+        if getattr(module, "ports", None) is not None:
+            # Ports of a PortsCombiManager are resolved in its <fill>, those are initiated one by one.
+            yield from module.ports
+
+
+async def preload_states(modules: Iterable[Any], report: BootstrapReport) -> None:
+    """
+    Query the local states of the modules and their ports in one pipelined batch and load the replies.
+    The ``initiate`` of the states called by ``_setup`` of the modules and ports doesn't query them again.
+    """
+    owners = list(_with_ports(modules))
+    queries = [owner._local_states.queries(owner) for owner in owners]
+    tokens = [token for owner_queries in queries for token in owner_queries]
+    with report.measure("states", len(tokens)):
+        replies = iter(await funcs.apply(*tokens))
+        for owner in owners:
+            owner._local_states.preload(owner, replies)
@@ -0,0 +1,219 @@
+from __future__ import annotations
+import os
+import struct
+from dataclasses import (
+    dataclass,
+    field,
+)
+from enum import IntEnum
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    BinaryIO,
+    Iterable,
+    NamedTuple,
+)
+
+from xoa_driver.internals.commands import (
+    PC_EXTRA,
+    PC_PACKET,
+)
+from xoa_driver.internals.utils.orchestrator import TesterOrchestrator
+
+if TYPE_CHECKING:
+    from xoa_driver.internals.hli.ports.port_l23.trafficgen.capture import PortCapture
+
+
+EPOCH_OFFSET_NS = 1_262_304_000 * 1_000_000_000
+"""Nanoseconds from the Unix epoch to 2010-01-01, the epoch of the capture timestamps of the tester."""
+
+LINKTYPE_ETHERNET = 1
+
+PCAP_HEADER = struct.Struct("<IHHiIII")
+PCAP_RECORD = struct.Struct("<IIII")
+PCAP_MAGIC_NS = 0xA1B23C4D
+"""Magic number of the pcap file with the nanosecond timestamps."""
+PCAP_SNAPLEN = 262_144
+
+PCAPNG_BLOCK = struct.Struct("<II")
+PCAPNG_SECTION_HEADER = 0x0A0D0D0A
+PCAPNG_INTERFACE = 0x00000001
+PCAPNG_ENHANCED_PACKET = 0x00000006
+PCAPNG_BYTE_ORDER_MAGIC = 0x1A2B3C4D
+PCAPNG_OPT_IF_NAME = 2
+PCAPNG_OPT_IF_TSRESOL = 9
+
+
+class CaptureFormat(IntEnum):
+    """File format of the exported capture."""
+
+    PCAP = 0
+    """Classic pcap with the nanosecond timestamps, the packets of all ports are merged in to one interface."""
+
+    PCAPNG = 1
+    """pcapng with an interface per port, named ``<module>/<port>``."""
+
+
+class CapturedPacket(NamedTuple):
+    """Captured packet with the extra information of ``PC_EXTRA``."""
+
+    capture: int
+    """Position of the port capture in the exporter."""
+    index: int
+    """Index of the packet in the capture buffer of the port."""
+    time_captured: int
+    """Time of capture, in nanoseconds since 2010-01-01."""
+    latency: int
+    """Nanoseconds since the packet was transmitted."""
+    length: int
+    """Real length of the packet on the wire."""
+    data: bytes
+    """Raw bytes kept for the packet."""
+
+    @property
+    def timestamp_ns(self) -> int:
+        """Time of capture, in nanoseconds since the Unix epoch."""
+        return self.time_captured + EPOCH_OFFSET_NS
+
+
+@dataclass
+class CaptureReport:
+    """Result of the export, by the port capture in the order of the exporter."""
+
+    packets: tuple[int, ...] = ()
+    """Number of the packets exported."""
+    overflowed: tuple[bool, ...] = ()
+    """The capture was stopped because the buffer was full."""
+    bytes_written: int = 0
+    """Size of the written file."""
+    interfaces: list[str] = field(default_factory=list)
+    """Names of the ports, ``<module>/<port>``."""
+
+
+def _pad(data: bytes) -> bytes:
+    return data + bytes(-len(data) % 4)
+
+
+def _pcapng_block(block_type: int, body: bytes) -> bytes:
+    size = PCAPNG_BLOCK.size + len(body) + 4
+    return PCAPNG_BLOCK.pack(block_type, size) + body + struct.pack("<I", size)
+
+
+def _pcapng_option(code: int, value: bytes) -> bytes:
+    return struct.pack("<HH", code, len(value)) + _pad(value)
+
+
+class _PcapWriter:
+    __slots__ = ("file", "written")
+
+    def __init__(self, file: BinaryIO) -> None:
+        self.file = file
+        self.written = file.write(PCAP_HEADER.pack(PCAP_MAGIC_NS, 2, 4, 0, 0, PCAP_SNAPLEN, LINKTYPE_ETHERNET))
+
+    def add_interface(self, name: str) -> int:
+        return 0
+
+    def write(self, interface: int, packet: CapturedPacket) -> None:
+        seconds, nanoseconds = divmod(packet.timestamp_ns, 1_000_000_000)
+        data = packet.data
+        self.written += self.file.write(PCAP_RECORD.pack(seconds, nanoseconds, len(data), max(packet.length, len(data))))
+        self.written += self.file.write(data)
+
+
+class _PcapngWriter:
+    __slots__ = ("file", "written", "interfaces")
+
+    def __init__(self, file: BinaryIO) -> None:
+        self.file = file
+        self.interfaces = 0
+        self.written = file.write(_pcapng_block(PCAPNG_SECTION_HEADER, struct.pack("<IHHq", PCAPNG_BYTE_ORDER_MAGIC, 1, 0, -1)))
+
+    def add_interface(self, name: str) -> int:
+        options = (
+            _pcapng_option(PCAPNG_OPT_IF_NAME, name.encode())
+            + _pcapng_option(PCAPNG_OPT_IF_TSRESOL, bytes((9,)))
+            + bytes(4)
+        )
+        self.written += self.file.write(_pcapng_block(PCAPNG_INTERFACE, struct.pack("<HHI", LINKTYPE_ETHERNET, 0, 0) + options))
+        self.interfaces += 1
+        return self.interfaces - 1
+
+    def write(self, interface: int, packet: CapturedPacket) -> None:
+        timestamp = packet.timestamp_ns
+        data = packet.data
+        body = struct.pack("<IIIII", interface, timestamp >> 32, timestamp & 0xFFFFFFFF, len(data), max(packet.length, len(data)))
+        self.written += self.file.write(_pcapng_block(PCAPNG_ENHANCED_PACKET, body + _pad(data)))
+
+
+class CaptureExporter:
+    """
+    Downloads the capture buffers of many ports and writes them to a pcap or pcapng file.
+
+    The ``PC_EXTRA`` and ``PC_PACKET`` of the next ``chunk_size`` packets of every port are read in one round,
+    pipelined in to the connection of every tester, all testers concurrently.
+    The packets are written as they arrive, so only a single round is held in the memory.
+    The packet data is taken from the raw bytes of the response, without the conversion to the hex string.
+    """
+
+    def __init__(
+        self,
+        captures: Iterable["PortCapture"],
+        *,
+        chunk_size: int = 256,
+        window: int = 1000,
+        batch_size: int = 100,
+    ) -> None:
+        assert chunk_size > 0, "<chunk_size> must be positive"
+        self.__captures = list(captures)
+        self.__chunk_size = chunk_size
+        self.__orchestrator = TesterOrchestrator(window=window, batch_size=batch_size)
+        self.__stats: list[Any] = []
+
+    @property
+    def interfaces(self) -> list[str]:
+        """Names of the ports, ``<module>/<port>``."""
+        return [f"{capture.stats._module}/{capture.stats._port}" for capture in self.__captures]
+
+    async def packets(self) -> AsyncGenerator[CapturedPacket, None]:
+        """Yield the captured packets of all ports, of every port in the order of the capture buffer."""
+        captures = self.__captures
+        self.__stats = await self.__orchestrator.apply(*(capture.stats.get() for capture in captures))
+        counts = [stats.packets for stats in self.__stats]
+        position = 0
+        while any(position < count for count in counts):
+            chunk = [
+                (idx, packet_idx)
+                for idx, count in enumerate(counts)
+                for packet_idx in range(position, min(count, position + self.__chunk_size))
+            ]
+            tokens = []
+            for idx, packet_idx in chunk:
+                stats = captures[idx].stats
+                conn, module_id, port_id = stats._connection, stats._module, stats._port
+                tokens.append(PC_EXTRA(conn, module_id, port_id, packet_idx).get())
+                tokens.append(PC_PACKET(conn, module_id, port_id, packet_idx).get())
+            replies = await self.__orchestrator.apply(*tokens)
+            for n, (idx, packet_idx) in enumerate(chunk):
+                extra, packet = replies[2 * n], replies[2 * n + 1]
+                yield CapturedPacket(idx, packet_idx, extra.time_captured, extra.latency, extra.length, bytes(packet._buffer))
+            position += self.__chunk_size
+
+    async def export(self, file: str | os.PathLike | BinaryIO, *, format: CaptureFormat = CaptureFormat.PCAPNG) -> CaptureReport:
+        """Write the captured packets of all ports to the file, a path or a binary file object."""
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, "wb") as opened:
+                return await self.export(opened, format=format)
+        writer = _PcapngWriter(file) if format == CaptureFormat.PCAPNG else _PcapWriter(file)
+        interfaces = self.interfaces
+        ids = [writer.add_interface(name) for name in interfaces]
+        packets = [0] * len(self.__captures)
+        async for packet in self.packets():
+            writer.write(ids[packet.capture], packet)
+            packets[packet.capture] += 1
+        return CaptureReport(
+            packets=tuple(packets),
+            overflowed=tuple(bool(stats.status) for stats in self.__stats),
+            bytes_written=writer.written,
+            interfaces=interfaces,
+        )
@@ -15,6 +15,14 @@ class Green:
     def send(inst: itf.IConnection, data: bytes | bytearray | memoryview) -> None:
         return inst.send(data)
 
+    @staticmethod
+    def get_write_buffer_size(inst: itf.IConnection) -> int:
+        return inst.get_write_buffer_size()
+
+    @staticmethod
+    async def drain(inst: itf.IConnection, write_buffer_limit: int | None) -> None:
+        return await inst.drain(write_buffer_limit)
+
     @staticmethod
     def close(inst: itf.IConnection) -> None:
         return inst.close()
@@ -24,8 +32,12 @@ class Green:
         return await inst.prepare_data(request)
 
     @staticmethod
-    def subscribe(inst: itf.IConnection, xmc_cls: "ICommand", callback: t.Callable) -> None:
-        return inst.subscribe(xmc_cls, callback)
+    def prepare_data_batch(inst: itf.IConnection, requests: t.Sequence["Request"]) -> tuple[bytes, list[asyncio.Future]]:
+        return inst.prepare_data_batch(requests)
+
+    @staticmethod
+    def subscribe(inst: itf.IConnection, xmc_cls: "ICommand", callback: t.Callable, module: int | None, port: int | None) -> None:
+        return inst.subscribe(xmc_cls, callback, module=module, port=port)
 
     @staticmethod
     def on_disconnected(inst: itf.IConnection, callback: t.Callable) -> None:
@@ -41,6 +53,14 @@ class Red:
     def send(inst: itf.IConnection, data: bytes | bytearray | memoryview) -> None:
         raise ConnectionRefusedError("The instance is not valid anymore, please obtain() a new one.")
 
+    @staticmethod
+    def get_write_buffer_size(inst: itf.IConnection) -> int:
+        return 0
+
+    @staticmethod
+    async def drain(inst: itf.IConnection, write_buffer_limit: int | None) -> None:
+        raise ConnectionRefusedError("The instance is not valid anymore, please obtain() a new one.")
+
     @staticmethod
     def close(inst) -> None:
         raise ConnectionRefusedError("The instance is not valid anymore, please obtain() a new one.")
@@ -50,7 +70,11 @@ class Red:
         raise ConnectionRefusedError("The instance is not valid anymore, please obtain() a new one.")
 
     @staticmethod
-    def subscribe(inst, xmc_cls: "ICommand", callback: t.Callable) -> None:
+    def prepare_data_batch(inst, requests: t.Sequence["Request"]) -> tuple[bytes, list[asyncio.Future]]:
+        raise ConnectionRefusedError("The instance is not valid anymore, please obtain() a new one.")
+
+    @staticmethod
+    def subscribe(inst, xmc_cls: "ICommand", callback: t.Callable, module: int | None, port: int | None) -> None:
         raise ConnectionRefusedError("The instance is not valid anymore, please obtain() a new one.")
 
     @staticmethod
@@ -68,6 +92,11 @@ class ConnectionTrafficLight:
     def set_outdated(self) -> None:
         self.state = Red
 
+    @property
+    def origin(self) -> itf.IConnection:
+        """The tester connection, which is shared by all objects of the tester."""
+        return self._conn
+
     @property
     def is_connected(self) -> bool:
         return self.state.is_connected(self._conn)
@@ -75,14 +104,28 @@ class ConnectionTrafficLight:
     def send(self, data: bytes | bytearray | memoryview) -> None:
         return self.state.send(self._conn, data)
 
+    def get_write_buffer_size(self) -> int:
+        return self.state.get_write_buffer_size(self._conn)
+
+    async def drain(self, write_buffer_limit: int | None = None) -> None:
+        return await self.state.drain(self._conn, write_buffer_limit)
+
     def close(self) -> None:
         return self.state.close(self._conn)
 
     async def prepare_data(self, request: "Request") -> tuple[bytes, asyncio.Future]:
         return await self.state.prepare_data(self._conn, request)
 
-    def subscribe(self, xmc_cls: "ICommand", callback: t.Callable) -> None:
-        return self.state.subscribe(self._conn, xmc_cls, callback)
+    def prepare_data_batch(self, requests: t.Sequence["Request"]) -> tuple[bytes, list[asyncio.Future]]:
+        return self.state.prepare_data_batch(self._conn, requests)
+
+    def subscribe(self, xmc_cls: "ICommand", callback: t.Callable, *, module: int | None = None, port: int | None = None) -> None:
+        return self.state.subscribe(self._conn, xmc_cls, callback, module, port)
 
     def on_disconnected(self, callback: t.Callable) -> None:
         return self.state.on_disconnected(self._conn, callback)
+
+
+def origin_of(connection: itf.IConnection) -> itf.IConnection:
+    """The tester connection of the connection of any tester, module or port object."""
+    return connection.origin if isinstance(connection, ConnectionTrafficLight) else connection
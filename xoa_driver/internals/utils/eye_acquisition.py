@@ -0,0 +1,171 @@
+from __future__ import annotations
+import asyncio
+import time
+from array import array
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Iterable,
+    NamedTuple,
+)
+
+from xoa_driver.internals.commands import PP_EYEREAD
+from xoa_driver.internals.core.transporter.protocol.payload import columnar
+from xoa_driver.internals.utils.orchestrator import TesterOrchestrator
+
+if TYPE_CHECKING:
+    from xoa_driver.internals.core.token import Token
+    from xoa_driver.internals.hli.ports.port_l23.layer1.eye_diagram import EyeDiagram
+
+
+@dataclass
+class EyeData:
+    """BER eye of a single serdes, filled column by column while it is measured."""
+
+    x_resolution: int
+    """Number of the columns."""
+    y_resolution: int
+    """Number of the sampling points of every column."""
+    values: Any
+    """
+    Bit errors out of 1M bits at every sampling point, ``values[x][y]``, preallocated with zeros.
+    A NumPy 2-D array of int32 if NumPy is used, otherwise a list of ``array.array`` columns.
+    """
+    columns: int = 0
+    """Number of the columns read, the columns are measured in the order: ``x_resolution - 1``, ``x_resolution - 2``, ... 0."""
+
+    @property
+    def complete(self) -> bool:
+        """All columns are read."""
+        return self.columns >= self.x_resolution
+
+
+class EyeColumn(NamedTuple):
+    """Column of an eye which became valid."""
+
+    eye: int
+    """Position of the eye diagram in the acquisition."""
+    x: int
+    """Index of the column."""
+    values: array
+    """Bit errors out of 1M bits at the sampling points of the column."""
+
+
+class _EyeState:
+    """Read commands of the columns of a single eye and the number of the columns known to be valid."""
+
+    __slots__ = ("eye", "data", "reads", "valid")
+
+    def __init__(self, eye: int, data: EyeData, reads: list["Token[PP_EYEREAD.GetDataAttr]"]) -> None:
+        self.eye = eye
+        self.data = data
+        self.reads = reads
+        self.valid = 0
+
+    def pending(self) -> range:
+        """Positions of the columns to read in the next round: the ones known to be valid and the next one."""
+        data = self.data
+        return range(data.columns, min(data.x_resolution, max(self.valid, data.columns + 1)))
+
+
+class EyeAcquisition:
+    """
+    Measures the BER eyes of many serdes at once.
+
+    The measurements are started on all serdes together, then every round reads the columns of all eyes
+    known to be valid, and the next column of every eye to learn how many columns became valid,
+    in one pipelined batch per tester. The columns are assembled in to the preallocated arrays of :class:`EyeData`.
+    """
+
+    def __init__(
+        self,
+        eye_diagrams: Iterable["EyeDiagram"],
+        *,
+        resolution: tuple[int, int] | None = None,
+        poll_interval: float = 0.05,
+        timeout: float | None = None,
+        use_numpy: bool | None = None,
+        window: int = 1000,
+        batch_size: int = 100,
+    ) -> None:
+        self.__eye_diagrams = list(eye_diagrams)
+        self.__resolution = resolution
+        self.__poll_interval = poll_interval
+        self.__timeout = timeout
+        self.__use_numpy = use_numpy
+        self.__orchestrator = TesterOrchestrator(window=window, batch_size=batch_size)
+        self.__states: list[_EyeState] = []
+
+    @property
+    def eyes(self) -> list[EyeData]:
+        """Eyes in the order of the eye diagrams, known after ``start``."""
+        return [state.data for state in self.__states]
+
+    def __allocate(self, x_resolution: int, y_resolution: int) -> Any:
+        use_numpy = columnar.numpy_module() is not None if self.__use_numpy is None else self.__use_numpy
+        if use_numpy:
+            return columnar.numpy_module().zeros((x_resolution, y_resolution), dtype="int32")
+        return [array("i", bytes(4 * y_resolution)) for _ in range(x_resolution)]
+
+    async def start(self) -> None:
+        """Apply the resolution if it is given, and start the measurements on all serdes."""
+        eye_diagrams = self.__eye_diagrams
+        if self.__resolution is not None:
+            await self.__orchestrator.apply(*(eye.resolution.set(*self.__resolution) for eye in eye_diagrams))
+        resolutions = await self.__orchestrator.apply(*(eye.resolution.get() for eye in eye_diagrams))
+        self.__states = []
+        for idx, (eye, resolution) in enumerate(zip(eye_diagrams, resolutions)):
+            x_resolution, y_resolution = resolution.x_resolution, resolution.y_resolution
+            measure = eye.measure
+            reads = [
+                PP_EYEREAD(measure._connection, measure._module, measure._port, measure._serdes_xindex, x_resolution - 1 - position).get_template()
+                for position in range(x_resolution)
+            ]
+            data = EyeData(x_resolution, y_resolution, self.__allocate(x_resolution, y_resolution))
+            self.__states.append(_EyeState(idx, data, reads))
+        await self.__orchestrator.apply(*(eye.measure.set_start() for eye in eye_diagrams))
+
+    async def stop(self) -> None:
+        """Stop the measurements on all serdes."""
+        await self.__orchestrator.apply(*(eye.measure.set_stop() for eye in self.__eye_diagrams))
+
+    async def columns(self) -> AsyncGenerator[EyeColumn, None]:
+        """
+        Yield the columns of all eyes as they become valid, until all eyes are complete.
+        ``start`` is called at the first time. ``TimeoutError`` is raised after the ``timeout`` seconds.
+        """
+        if not self.__states:
+            await self.start()
+        deadline = None if self.__timeout is None else time.monotonic() + self.__timeout
+        while pending := [(state, position) for state in self.__states for position in state.pending()]:
+            replies = await self.__orchestrator.apply(*(state.reads[position] for state, position in pending))
+            progress = False
+            for (state, position), reply in zip(pending, replies):
+                state.valid = max(state.valid, reply.valid_column_count)
+                if position >= reply.valid_column_count or position != state.data.columns:
+                    continue
+                data = state.data
+                values = columnar.to_array(reply, "values")
+                size = min(len(values), data.y_resolution)
+                data.values[data.x_resolution - 1 - position][:size] = values[:size]
+                data.columns += 1
+                progress = True
+                yield EyeColumn(state.eye, data.x_resolution - 1 - position, values)
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"The BER eyes are not measured in {self.__timeout} seconds.")
+            if not progress:
+                await asyncio.sleep(self.__poll_interval)
+
+    async def acquire(self, on_column: Callable[[EyeColumn, EyeData], Awaitable[None] | None] | None = None) -> list[EyeData]:
+        """
+        Measure all eyes and return them when they are complete.
+        ``on_column`` is called with every column which became valid and the partial eye, it can be a coroutine function.
+        """
+        async for column in self.columns():
+            if on_column is not None and (result := on_column(column, self.__states[column.eye].data)) is not None:
+                await result
+        return self.eyes
@@ -10,6 +10,7 @@ if TYPE_CHECKING:
     from xoa_driver.internals.core import interfaces as itf
     from .. import kind as kind_module
     from . import observer as idx_obs
+    from xoa_driver.internals.core.token import Token
 
 
 class IIndexType(Protocol):
@@ -27,6 +28,9 @@ class IIndexType(Protocol):
         module_id: int, 
         port_id: int) -> List[int]: ...  # noqa: E704
 
+    @classmethod
+    def _create(cls, conn: "itf.IConnection", kind: "kind_module.IndicesKind") -> "Token[None]": ...  # noqa: E704
+
     @classmethod
     async def _new(
         cls, 
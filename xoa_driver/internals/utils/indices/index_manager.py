@@ -1,6 +1,12 @@
 import asyncio
+import itertools
 from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
     List,
+    Optional,
     Type,
     Generic,
     TypeVar,
@@ -8,8 +14,10 @@ from typing import (
 )
 if TYPE_CHECKING:
     from xoa_driver.internals.core import interfaces as itf
+    from xoa_driver.internals.core.token import Token
     from ._interfaces import IIndexType
 
+from xoa_driver.internals.core.pipeline import apply_pipelined
 from . import observer
 from .. import kind
 
@@ -69,16 +77,13 @@ class IndexManager(Generic[IT]):
         """
         return tuple(self._indices[k] for k in keys)
 
+    def __empty_idx_slots(self) -> Iterator[int]:
+        """Free index slots in the ascending order, the gaps first."""
+        existing_indices = {i.idx for i in self._indices}
+        return (ele for ele in itertools.count() if ele not in existing_indices)
+
     def __detect_empty_idx_slot(self) -> int:
-        if len(self._indices) == 0:
-            return 0
-        existing_indices = [i.idx for i in self._indices]
-        empties = [
-            ele
-            for ele in range(max(existing_indices) + 1)
-            if ele not in existing_indices
-        ]
-        return min(empties) if empties else len(existing_indices)
+        return next(self.__empty_idx_slots())
 
     def __remove_from_slot(self, index_inst: IT) -> None:
         # throws ValueError if element is not exists in list of indices
@@ -97,6 +102,52 @@ class IndexManager(Generic[IT]):
             self._indices.append(index_inst)
             return index_inst
 
+    async def create_many(
+        self,
+        count: int,
+        config: Optional[Callable[[IT], Iterable["Token[Any]"]]] = None,
+        *,
+        window: int = 1000,
+        batch_size: int = 100,
+    ) -> List[IT]:
+        """Create multiple new indices on the port and return the index objects
+
+        The free index slots are allocated locally, then the create commands of all indices, every one followed by
+        the configuration commands of the index, are pipelined in to the connection.
+        An index is added to the manager when its create command succeeded, so if a command fails
+        the indices created before it stay in the manager.
+
+        :param count: number of the indices to create
+        :type count: int
+        :param config: returns the configuration commands of a new index object, e.g. ``lambda s: (s.enable.set_on(), s.tpld_id.set(s.idx))``
+        :type config: Callable[[IT], Iterable[Token]], optional
+        :param window: maximum number of the commands waiting for the response
+        :type window: int
+        :param batch_size: number of the commands sent at once
+        :type batch_size: int
+        :return: the new index objects, in the order of the index slots
+        :rtype: list[IT]
+        """
+        async with self._lock:
+            instances: List[IT] = []
+            created: List[Optional[IT]] = []
+            tokens: List["Token[Any]"] = []
+            for idx in itertools.islice(self.__empty_idx_slots(), count):
+                index_kind = kind.IndicesKind(self._module_id, self._port_id, idx)
+                index_inst: IT = self._idx_type(self._conn, index_kind, self._observer)
+                instances.append(index_inst)
+                created.append(index_inst)
+                tokens.append(self._idx_type._create(self._conn, index_kind))
+                for token in (config(index_inst) if config is not None else ()):
+                    created.append(None)
+                    tokens.append(token)
+            position = 0
+            async for _ in apply_pipelined(tokens, window=window, batch_size=batch_size):
+                if (index_inst := created[position]) is not None:
+                    self._indices.append(index_inst)
+                position += 1
+            return instances
+
     async def remove(self, position_idx: int) -> None:
         """Remove an index from the port"""
         await self._indices[position_idx].delete()
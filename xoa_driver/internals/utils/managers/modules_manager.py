@@ -16,11 +16,14 @@ from collections import OrderedDict
 
 if TYPE_CHECKING:
     from xoa_driver.internals.core import interfaces as itf
+    from xoa_driver.internals.core.token import Token
+from xoa_driver.internals.core import funcs
 from xoa_driver.internals.commands import (
     M_REVISION,
     M_MODEL,
     M_VERSIONSTR,
 )
+from .. import bootstrap
 from .abc import AbcResourcesManager
 from .exceptions import (
     NoSuchModuleError,
@@ -39,29 +42,45 @@ class ModuleData(NamedTuple):
 
 class L23ModuleData(ModuleData):
     """L23 module data"""
+    @staticmethod
+    def query(conn, mid: int) -> "Token":
+        """Query of the module name of the L23 module."""
+        return M_REVISION(conn, mid).get()
+
     @classmethod
-    async def create(cls, conn, mid: int, p_cnt: int) -> "L23ModuleData":
-        """Return the module name of the L23 module."""
-        r = await M_REVISION(conn, mid).get()
+    def from_reply(cls, mid: int, p_cnt: int, reply) -> "L23ModuleData":
         return cls(
             module_id=mid,
             ports_count=p_cnt,
-            revision=r.revision
+            revision=reply.revision
         )
 
+    @classmethod
+    async def create(cls, conn, mid: int, p_cnt: int) -> "L23ModuleData":
+        """Return the module name of the L23 module."""
+        return cls.from_reply(mid, p_cnt, await cls.query(conn, mid))
+
 
 class L47ModuleData(ModuleData):
     """L47 module data"""
+    @staticmethod
+    def query(conn, mid: int) -> "Token":
+        """Query of the module name of the L47 module."""
+        return M_MODEL(conn, mid).get()
+
     @classmethod
-    async def create(cls, conn, mid: int, p_cnt: int) -> "L47ModuleData":
-        """Return the module name of the L47 module."""
-        r = await M_MODEL(conn, mid).get()
+    def from_reply(cls, mid: int, p_cnt: int, reply) -> "L47ModuleData":
         return cls(
             module_id=mid,
             ports_count=p_cnt,
-            revision=r.model
+            revision=reply.model
         )
 
+    @classmethod
+    async def create(cls, conn, mid: int, p_cnt: int) -> "L47ModuleData":
+        """Return the module name of the L47 module."""
+        return cls.from_reply(mid, p_cnt, await cls.query(conn, mid))
+
 # endregion
 
 
@@ -92,27 +111,35 @@ class ModulesManager(AbcResourcesManager[MT]):
         except KeyError as err:
             raise NoSuchModuleError(err.args[0])
 
-    async def fill(self, ports_count: list[int], module_type: ModuleDataType) -> None:
-        """Method for create and fill in."""
-        assert not self._lock, "Method <fill> can be called only once."
-        module_builder = (
-            module_type.create(self._conn, slot_id, p_count)
-            for slot_id, p_count in enumerate(ports_count)
-            if p_count > 0
-        )
-        identities: Iterable[ModuleData] = await asyncio.gather(*module_builder)
+    async def fill(self, ports_count: list[int], module_type: ModuleDataType, report: bootstrap.BootstrapReport | None = None) -> None:
+        """
+        Method for create and fill in.
 
-        self._items = OrderedDict(
-            (
-                idnt.module_id,
-                self.__m_types_obtainer(idnt.revision)(self._conn, idnt)
+        The module names are queried in one batch, then the local states of all modules and ports in another one,
+        before the modules and ports are set up.
+        """
+        assert not self._lock, "Method <fill> can be called only once."
+        report = report if report is not None else bootstrap.BootstrapReport()
+        slots = [(slot_id, p_count) for slot_id, p_count in enumerate(ports_count) if p_count > 0]
+        with report.measure("modules", len(slots)):
+            replies = await funcs.apply(*(module_type.query(self._conn, slot_id) for slot_id, _ in slots))
+            identities: Iterable[ModuleData] = (
+                module_type.from_reply(slot_id, p_count, reply)
+                for (slot_id, p_count), reply in zip(slots, replies)
+            )
+            self._items = OrderedDict(
+                (
+                    idnt.module_id,
+                    self.__m_types_obtainer(idnt.revision)(self._conn, idnt)
+                )
+                for idnt in identities
             )
-            for idnt in identities
-        )
         if len(self) == 0:
             raise WrongTesterError()
+        await bootstrap.preload_states(self._items.values(), report)
         coros = cast(Iterable[Awaitable], self._items.values())
-        await asyncio.gather(*coros)
+        with report.measure("setup"):
+            await asyncio.gather(*coros)
 
     fill_l23 = functools.partialmethod(fill, module_type=L23ModuleData)
     fill_l47 = functools.partialmethod(fill, module_type=L47ModuleData)
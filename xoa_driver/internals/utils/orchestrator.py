@@ -0,0 +1,146 @@
+from __future__ import annotations
+import asyncio
+import time
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Iterable,
+)
+
+from xoa_driver.internals.core.pipeline import (
+    apply_pipelined,
+    prepare_batch,
+)
+from xoa_driver.internals.utils.con_traffic_light import origin_of
+
+if TYPE_CHECKING:
+    from xoa_driver.internals.core.token import Token
+
+
+@dataclass
+class SyncReport:
+    """
+    Timing of the synchronized commands, by the tester in the order of the first appearance of the tester in the commands.
+    The times are of ``time.perf_counter()``.
+    """
+
+    sent_at: tuple[float, ...] = ()
+    """Time the commands of every tester were written to its transport."""
+    acknowledged_at: tuple[float, ...] = ()
+    """Time the last response of every tester was received."""
+    results: list[Any] = field(default_factory=list)
+    """Results of the commands, in the order of the commands."""
+
+    @property
+    def send_skew(self) -> float:
+        """Seconds between writing the commands of the first and of the last tester."""
+        return max(self.sent_at) - min(self.sent_at) if self.sent_at else 0.0
+
+    @property
+    def ack_skew(self) -> float:
+        """Seconds between the responses of the first and of the last tester."""
+        return max(self.acknowledged_at) - min(self.acknowledged_at) if self.acknowledged_at else 0.0
+
+    @property
+    def max_skew(self) -> float:
+        """
+        Upper bound of the skew of executing the commands by the testers: every tester executed them
+        after they were sent to it and before it responded.
+        """
+        return max(self.acknowledged_at) - min(self.sent_at) if self.sent_at else 0.0
+
+
+def _group(cmd_tokens: Iterable["Token[Any]"]) -> tuple[int, list[tuple[list[int], list["Token[Any]"]]]]:
+    """Positions and tokens of every tester, in the order of the first appearance of the tester."""
+    groups: dict[int, tuple[list[int], list["Token[Any]"]]] = {}
+    count = 0
+    for position, token in enumerate(cmd_tokens):
+        positions, tokens = groups.setdefault(id(origin_of(token.connection)), ([], []))
+        positions.append(position)
+        tokens.append(token)
+        count += 1
+    return count, list(groups.values())
+
+
+async def _gather(coroutines: Iterable[Awaitable[Any]]) -> None:
+    """Wait for all, the others are cancelled when one fails."""
+    tasks = [asyncio.ensure_future(c) for c in coroutines]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+class TesterOrchestrator:
+    """
+    Sends the commands of any number of testers at once.
+
+    The commands are grouped by the tester, the group of every tester is pipelined in to its connection,
+    all testers concurrently, and the results are returned in the order of the commands.
+    """
+
+    __slots__ = ("window", "batch_size", "token_timeout_sec")
+
+    def __init__(self, *, window: int = 1000, batch_size: int = 100, token_timeout_sec: float | None = 5.0) -> None:
+        self.window = window
+        """Maximum number of the requests of a single tester waiting for the response."""
+        self.batch_size = batch_size
+        """Number of the requests written to the connection of a tester at once."""
+        self.token_timeout_sec = token_timeout_sec
+        """Seconds to wait for a single response, only when the exceptions are returned."""
+
+    async def apply(self, *cmd_tokens: "Token[Any]", return_exceptions: bool = False) -> list[Any]:
+        """Send the commands of all testers and return the results in the order of the commands."""
+        count, groups = _group(cmd_tokens)
+        results: list[Any] = [None] * count
+
+        async def apply_tester(positions: list[int], tokens: list["Token[Any]"]) -> None:
+            replies = apply_pipelined(
+                tokens,
+                window=self.window,
+                batch_size=self.batch_size,
+                return_exceptions=return_exceptions,
+                token_timeout_sec=self.token_timeout_sec,
+            )
+            idx = 0
+            async for reply in replies:
+                results[positions[idx]] = reply
+                idx += 1
+
+        await _gather(apply_tester(*group) for group in groups)
+        return results
+
+    async def synchronized(self, *cmd_tokens: "Token[Any]", return_exceptions: bool = False) -> SyncReport:
+        """
+        Execute the commands on all testers at the same time, like starting the traffic on the ports of all testers.
+
+        The commands of every tester are encoded in advance and written to all testers one after another
+        without yielding to the event loop. The skew between the testers is reported by the :class:`SyncReport`.
+        """
+        count, groups = _group(cmd_tokens)
+        prepared = [
+            (tokens[0].connection, *prepare_batch(tokens))
+            for _, tokens in groups
+        ]
+        acknowledged_at = [0.0] * len(groups)
+        sent_at = []
+        for idx, (conn, data, tester_futures) in enumerate(prepared):
+            tester_futures[-1].add_done_callback(lambda _, idx=idx: acknowledged_at.__setitem__(idx, time.perf_counter()))
+            conn.send(data)
+            sent_at.append(time.perf_counter())
+
+        results: list[Any] = [None] * count
+        # Shielded, the futures of the requests must not be cancelled with the caller.
+        futures = [asyncio.shield(f) for _, _, tester_futures in prepared for f in tester_futures]
+        replies = await asyncio.gather(*futures, return_exceptions=return_exceptions)
+        positions = (position for group_positions, _ in groups for position in group_positions)
+        for position, reply in zip(positions, replies):
+            results[position] = reply
+        return SyncReport(sent_at=tuple(sent_at), acknowledged_at=tuple(acknowledged_at), results=results)
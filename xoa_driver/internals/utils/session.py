@@ -2,10 +2,13 @@ import asyncio
 from contextlib import suppress
 from typing import (
     TYPE_CHECKING,
+    List,
     Tuple
 )
 if TYPE_CHECKING:
     from xoa_driver.internals.core import interfaces as itf
+    from xoa_driver.internals.core.token import Token
+    from xoa_driver.internals.core.transporter.protocol.struct_request import Request
 from xoa_driver.internals.core import funcs
 from xoa_driver.internals.core.exceptions import XmpBadValueError
 from xoa_driver.internals import exceptions
@@ -36,7 +39,7 @@ class TesterSession:
     :type keepalive: bool, optional
     """
 
-    __slots__ = ("_conn", "owner_name", "pwd", "timeout", "keepalive")
+    __slots__ = ("_conn", "owner_name", "pwd", "timeout", "keepalive", "__keepalive_task")
 
     def __init__(self, conn: "itf.IConnection", owner_name: str, password: str = "xena", timeout_seconds: int = 130, keepalive: bool = False) -> None:
         self._conn = conn
@@ -44,24 +47,42 @@ class TesterSession:
         self.pwd = password
         self.timeout = timeout_seconds
         self.keepalive = keepalive
+        self.__keepalive_task: asyncio.Task | None = None
 
-    async def logon(self) -> "TesterSession":
-        logon, *_ = await funcs.apply(
+    def __logon_tokens(self) -> List["Token"]:
+        return [
             C_LOGON(self._conn).set(self.pwd),
             C_OWNER(self._conn).set(self.owner_name),
             C_TIMEOUT(self._conn).set(self.timeout),
+        ]
+
+    async def logon(self) -> "TesterSession":
+        logon, *_ = await funcs.apply(
+            *self.__logon_tokens(),
             return_exceptions=True,
             token_timeout_sec=1.0
         )
         if isinstance(logon, XmpBadValueError):
             raise exceptions.WrongTesterPasswordError(self.pwd) from None
-
-        if self.keepalive:
-            asyncio.create_task(self.__do_keepalive(), name="keepalive").add_done_callback(
-                self.__handle_exceptions
-            )
+        self.__start_keepalive()
         return self
 
+    def resume_requests(self) -> List["Request"]:
+        """
+        Requests which log on again on the restored connection, the keepalive is restarted if it was stopped.
+
+        :return: the logon requests of the session
+        :rtype: List[Request]
+        """
+        self.__start_keepalive()
+        return [token.request for token in self.__logon_tokens()]
+
+    def __start_keepalive(self) -> None:
+        if not self.keepalive or (self.__keepalive_task is not None and not self.__keepalive_task.done()):
+            return None
+        self.__keepalive_task = asyncio.create_task(self.__do_keepalive(), name="keepalive")
+        self.__keepalive_task.add_done_callback(self.__handle_exceptions)
+
     async def chang_timeout(self, seconds: int = 130) -> None:
         """Modify session timeout, """
         if not self.is_online:
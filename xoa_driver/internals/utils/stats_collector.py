@@ -0,0 +1,291 @@
+from __future__ import annotations
+import asyncio
+import time
+from dataclasses import (
+    dataclass,
+    field,
+)
+from enum import IntEnum
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    Iterable,
+    NamedTuple,
+)
+
+from xoa_driver.internals.commands import (
+    PR_TOTAL,
+    PR_NOTPLD,
+    PR_EXTRA,
+    PR_TPLDS,
+    PR_TPLDTRAFFIC,
+    PR_TPLDLATENCY,
+    PR_TPLDJITTER,
+    PR_TPLDERRORS,
+    PT_TOTAL,
+    PT_NOTPLD,
+    PT_EXTRA,
+    PT_STREAM,
+    PS_INDICES,
+)
+from xoa_driver.internals.core.pipeline import apply_pipelined
+from xoa_driver.internals.core.transporter.protocol.payload import columnar
+from xoa_driver.internals.utils.con_traffic_light import origin_of
+
+if TYPE_CHECKING:
+    from xoa_driver.internals.core.token import Token
+    from xoa_driver.internals.hli.ports.base_port import BasePort
+
+
+class StatsFamily(IntEnum):
+    """Counter family collected by the StatsCollector."""
+
+    RX_TOTAL = 0
+    """Total RX traffic of the port, PR_TOTAL."""
+
+    RX_NO_TPLD = 1
+    """RX traffic without TPLD of the port, PR_NOTPLD."""
+
+    RX_EXTRA = 2
+    """Extra RX counters of the port, PR_EXTRA."""
+
+    TX_TOTAL = 3
+    """Total TX traffic of the port, PT_TOTAL."""
+
+    TX_NO_TPLD = 4
+    """TX traffic without TPLD of the port, PT_NOTPLD."""
+
+    TX_EXTRA = 5
+    """Extra TX counters of the port, PT_EXTRA."""
+
+    TPLD_TRAFFIC = 6
+    """RX traffic of every TPLD received by the port, PR_TPLDTRAFFIC."""
+
+    TPLD_LATENCY = 7
+    """Latency of every TPLD received by the port, PR_TPLDLATENCY."""
+
+    TPLD_JITTER = 8
+    """Jitter of every TPLD received by the port, PR_TPLDJITTER."""
+
+    TPLD_ERRORS = 9
+    """Errors of every TPLD received by the port, PR_TPLDERRORS."""
+
+    STREAM_TX = 10
+    """TX traffic of every stream of the port, PT_STREAM."""
+
+
+_PORT_FAMILIES = {
+    StatsFamily.RX_TOTAL: PR_TOTAL,
+    StatsFamily.RX_NO_TPLD: PR_NOTPLD,
+    StatsFamily.RX_EXTRA: PR_EXTRA,
+    StatsFamily.TX_TOTAL: PT_TOTAL,
+    StatsFamily.TX_NO_TPLD: PT_NOTPLD,
+    StatsFamily.TX_EXTRA: PT_EXTRA,
+}
+_TPLD_FAMILIES = {
+    StatsFamily.TPLD_TRAFFIC: PR_TPLDTRAFFIC,
+    StatsFamily.TPLD_LATENCY: PR_TPLDLATENCY,
+    StatsFamily.TPLD_JITTER: PR_TPLDJITTER,
+    StatsFamily.TPLD_ERRORS: PR_TPLDERRORS,
+}
+_STREAM_FAMILIES = {
+    StatsFamily.STREAM_TX: PT_STREAM,
+}
+
+
+class _Row(NamedTuple):
+    family: StatsFamily
+    module: int
+    port: int
+    index: int | None
+
+
+class _TesterPlan:
+    """Pre-encoded requests of a single tester and the rows of the tables they are filling."""
+
+    __slots__ = ("tokens", "rows")
+
+    def __init__(self) -> None:
+        self.tokens: list[Token] = []
+        self.rows: list[_Row] = []
+
+
+@dataclass
+class StatsSnapshot:
+    """Statistics of all ports collected in one cycle."""
+
+    cycle: int
+    """Sequence number of the cycle, starting from 0."""
+    timestamp: float
+    """Wall clock time of the start of the cycle, in seconds since the epoch."""
+    latency: float
+    """Seconds from sending the first request until the last response of all testers."""
+    lag: float = 0.0
+    """Seconds the cycle started after its scheduled time, 0.0 for a cycle not started by ``run``."""
+    tester_latency: tuple[float, ...] = ()
+    """Latency of every tester, in order of the first appearance of the tester in the ports."""
+    errors: int = 0
+    """Number of the counters which are failed and not present in the tables."""
+    tables: dict[StatsFamily, dict[str, Any]] = field(default_factory=dict)
+    """
+    Columns of every family by the field name, in the format of ``utils.to_columns``.
+    The ``module``, ``port`` columns and for TPLD and stream families the ``index`` column identify the row.
+    """
+
+
+class StatsCollector:
+    """
+    Collects the families of counters of many ports.
+
+    The counters are expanded once in to the pre-encoded requests,
+    which are sent every cycle in one pipelined batch per tester, all testers concurrently.
+    The responses are decoded in to the columns of a :class:`StatsSnapshot`.
+    """
+
+    def __init__(
+        self,
+        ports: Iterable["BasePort"],
+        families: Iterable[StatsFamily],
+        *,
+        window: int = 1000,
+        batch_size: int = 100,
+        use_numpy: bool | None = None,
+    ) -> None:
+        self.__ports = list(ports)
+        self.__families = tuple(dict.fromkeys(families))
+        self.__window = window
+        self.__batch_size = batch_size
+        self.__use_numpy = use_numpy
+        self.__plans: list[_TesterPlan] = []
+        self.__cycle = 0
+
+    @property
+    def requests_per_cycle(self) -> int:
+        """Number of the counters queried in every cycle, known after ``prepare``."""
+        return sum(len(plan.tokens) for plan in self.__plans)
+
+    def __group_ports(self) -> list[list["BasePort"]]:
+        testers: dict[int, list["BasePort"]] = {}
+        for port in self.__ports:
+            testers.setdefault(id(origin_of(port._conn)), []).append(port)
+        return list(testers.values())
+
+    async def __discover(self, ports: list["BasePort"]) -> tuple[dict[int, list[int]], dict[int, list[int]]]:
+        """Query TPLD identifiers and stream indices of the ports of a single tester, if the families need them."""
+        need_tplds = any(f in _TPLD_FAMILIES for f in self.__families)
+        need_streams = any(f in _STREAM_FAMILIES for f in self.__families)
+        tokens = []
+        for port in ports:
+            if need_tplds:
+                tokens.append(PR_TPLDS(port._conn, *port.kind).get())
+            if need_streams:
+                tokens.append(PS_INDICES(port._conn, *port.kind).get())
+        replies = iter([r async for r in apply_pipelined(tokens)])
+        tplds, streams = {}, {}
+        for idx, port in enumerate(ports):
+            if need_tplds:
+                tplds[idx] = list(next(replies).test_payload_identifiers)
+            if need_streams:
+                streams[idx] = list(next(replies).stream_indices)
+        return tplds, streams
+
+    async def __plan_tester(self, ports: list["BasePort"]) -> _TesterPlan:
+        tplds, streams = await self.__discover(ports)
+        plan = _TesterPlan()
+        for idx, port in enumerate(ports):
+            conn, (module_id, port_id) = port._conn, port.kind
+            for family in self.__families:
+                if cmd := _PORT_FAMILIES.get(family):
+                    expanded = [(cmd(conn, module_id, port_id), None)]
+                elif cmd := _TPLD_FAMILIES.get(family):
+                    expanded = [(cmd(conn, module_id, port_id, i), i) for i in tplds[idx]]
+                else:
+                    cmd = _STREAM_FAMILIES[family]
+                    expanded = [(cmd(conn, module_id, port_id, i), i) for i in streams[idx]]
+                for command, index in expanded:
+                    plan.tokens.append(command.get_template())
+                    plan.rows.append(_Row(family, module_id, port_id, index))
+        return plan
+
+    async def prepare(self) -> None:
+        """
+        Expand the families of all ports in to the requests.
+        TPLD identifiers and stream indices are queried from the testers, call it again after they are changed.
+        """
+        self.__plans = list(await asyncio.gather(*(self.__plan_tester(ports) for ports in self.__group_ports())))
+
+    async def __query_tester(self, plan: _TesterPlan) -> tuple[list[Any], float]:
+        begin = time.perf_counter()
+        replies = [
+            r
+            async for r in apply_pipelined(
+                plan.tokens,
+                window=self.__window,
+                batch_size=self.__batch_size,
+                return_exceptions=True,
+            )
+        ]
+        return replies, time.perf_counter() - begin
+
+    def __build_tables(self, results: list[tuple[list[Any], float]]) -> tuple[dict[StatsFamily, dict[str, Any]], int]:
+        collected: dict[StatsFamily, tuple[list[_Row], list[Any]]] = {f: ([], []) for f in self.__families}
+        errors = 0
+        for plan, (replies, _) in zip(self.__plans, results):
+            for row, reply in zip(plan.rows, replies):
+                if isinstance(reply, Exception):
+                    errors += 1
+                    continue
+                rows, values = collected[row.family]
+                rows.append(row)
+                values.append(reply)
+        tables = {}
+        for family, (rows, values) in collected.items():
+            keys = {"module": [r.module for r in rows], "port": [r.port for r in rows]}
+            if family not in _PORT_FAMILIES:
+                keys["index"] = [r.index for r in rows]
+            use_numpy = columnar.numpy_module() is not None if self.__use_numpy is None else self.__use_numpy
+            if use_numpy:
+                keys = {name: columnar.numpy_module().asarray(column, dtype=int) for name, column in keys.items()}
+            tables[family] = keys | columnar.to_columns(values, use_numpy=use_numpy)
+        return tables, errors
+
+    async def collect(self) -> StatsSnapshot:
+        """Query all counters once and return the snapshot. ``prepare`` is called at the first time."""
+        if not self.__plans:
+            await self.prepare()
+        timestamp = time.time()
+        begin = time.perf_counter()
+        results = await asyncio.gather(*(self.__query_tester(plan) for plan in self.__plans))
+        latency = time.perf_counter() - begin
+        tables, errors = self.__build_tables(results)
+        snapshot = StatsSnapshot(
+            cycle=self.__cycle,
+            timestamp=timestamp,
+            latency=latency,
+            tester_latency=tuple(elapsed for _, elapsed in results),
+            errors=errors,
+            tables=tables,
+        )
+        self.__cycle += 1
+        return snapshot
+
+    async def run(self, interval: float, *, cycles: int | None = None) -> AsyncGenerator[StatsSnapshot, None]:
+        """
+        Collect the snapshot every ``interval`` seconds, the schedule is fixed and doesn't drift.
+        If a cycle takes longer than the interval, the missed cycles are skipped.
+        """
+        assert interval > 0, "<interval> must be positive"
+        loop = asyncio.get_running_loop()
+        scheduled = loop.time()
+        done = 0
+        while cycles is None or done < cycles:
+            await asyncio.sleep(max(0.0, scheduled - loop.time()))
+            lag = loop.time() - scheduled
+            snapshot = await self.collect()
+            snapshot.lag = lag
+            yield snapshot
+            done += 1
+            scheduled += interval
+            if (now := loop.time()) > scheduled:
+                scheduled += (now - scheduled) // interval * interval + interval
@@ -6,9 +6,71 @@ from xoa_driver.internals.core.funcs import (
     apply,
     apply_iter,
 )
+from xoa_driver.internals.core.pipeline import (
+    apply_pipelined,
+    PipelineStats,
+)
+from xoa_driver.internals.core.transporter.protocol.payload.columnar import (
+    to_array,
+    to_columns,
+    to_structured_array,
+)
+from xoa_driver.internals.core.transporter._metrics import TransportMetrics
+from xoa_driver.internals.core.transporter._reconnect import ReconnectPolicy
+from xoa_driver.internals.core.transporter.logger import DeferredLogging
+from xoa_driver.internals.core.transporter._recorder import (
+    SessionRecorder,
+    SessionReplayer,
+    ReplayStats,
+)
+from xoa_driver.internals.utils.bootstrap import BootstrapReport
+from xoa_driver.internals.utils.capture_export import (
+    CaptureExporter,
+    CaptureFormat,
+    CapturedPacket,
+    CaptureReport,
+)
+from xoa_driver.internals.utils.eye_acquisition import (
+    EyeAcquisition,
+    EyeColumn,
+    EyeData,
+)
+from xoa_driver.internals.utils.orchestrator import (
+    TesterOrchestrator,
+    SyncReport,
+)
+from xoa_driver.internals.utils.stats_collector import (
+    StatsCollector,
+    StatsFamily,
+    StatsSnapshot,
+)
 
 
 __all__ = (
     "apply",
     "apply_iter",
+    "apply_pipelined",
+    "PipelineStats",
+    "to_array",
+    "to_columns",
+    "to_structured_array",
+    "StatsCollector",
+    "StatsFamily",
+    "StatsSnapshot",
+    "BootstrapReport",
+    "ReconnectPolicy",
+    "TransportMetrics",
+    "SessionRecorder",
+    "SessionReplayer",
+    "ReplayStats",
+    "DeferredLogging",
+    "TesterOrchestrator",
+    "SyncReport",
+    "EyeAcquisition",
+    "EyeColumn",
+    "EyeData",
+    "CaptureExporter",
+    "CaptureFormat",
+    "CapturedPacket",
+    "CaptureReport",
 )